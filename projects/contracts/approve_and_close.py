@@ -0,0 +1,117 @@
+"""Approve a submitted bounty, pay the worker and delete the app in one call."""
+
+import os
+import sys
+
+from algosdk import account, transaction
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+)
+from algosdk.logic import get_application_address
+from algosdk.mnemonic import to_private_key
+from algosdk.v2client import algod
+from dotenv import load_dotenv
+
+
+def _get_app_id() -> int:
+    app_id_value = sys.argv[1] if len(sys.argv) > 1 else os.getenv("APP_ID")
+    if not app_id_value:
+        raise ValueError("Set APP_ID in .env or pass it as the first argument.")
+    return int(app_id_value)
+
+
+# ==============================
+# LOAD ENV
+# ==============================
+
+load_dotenv()
+
+APP_ID = _get_app_id()
+
+CREATOR_MNEMONIC = os.getenv("CREATOR_MNEMONIC")
+WORKER_MNEMONIC = os.getenv("WORKER_MNEMONIC")
+
+if not CREATOR_MNEMONIC:
+    raise ValueError("Set CREATOR_MNEMONIC in .env")
+
+if not WORKER_MNEMONIC:
+    raise ValueError("Set WORKER_MNEMONIC in .env")
+
+
+# ==============================
+# SETUP CLIENT
+# ==============================
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN")
+
+client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_SERVER)
+
+print("Connected to:", ALGOD_SERVER)
+
+
+# ==============================
+# ACCOUNTS
+# ==============================
+
+creator_private_key = to_private_key(CREATOR_MNEMONIC)
+creator_address = account.address_from_private_key(creator_private_key)
+
+worker_private_key = to_private_key(WORKER_MNEMONIC)
+worker_address = account.address_from_private_key(worker_private_key)
+
+signer = AccountTransactionSigner(creator_private_key)
+
+print("Creator:", creator_address)
+print("Worker:", worker_address)
+print("App Address:", get_application_address(APP_ID))
+
+
+# ==============================
+# LOAD CONTRACT ABI
+# ==============================
+
+with open("smart_contracts/artifacts/bounty/Bounty.arc56.json") as f:
+    contract_json = f.read()
+
+contract = Contract.from_json(contract_json)
+method = contract.get_method_by_name("approve_and_close")
+
+
+# ==============================
+# BUILD TRANSACTION
+# ==============================
+
+sp = client.suggested_params()
+
+# 🔥 IMPORTANT: Increase fee for inner transaction execution
+sp.flat_fee = True
+sp.fee = 3000  # 1000 outer + 1000 payout + 1000 closing payment
+
+
+atc = AtomicTransactionComposer()
+
+atc.add_method_call(
+    app_id=APP_ID,
+    method=method,
+    sender=creator_address,
+    sp=sp,
+    signer=signer,
+    method_args=[],
+    on_complete=transaction.OnComplete.DeleteApplicationOC,
+    accounts=[worker_address],  # required for inner payment receiver
+)
+
+
+# ==============================
+# EXECUTE
+# ==============================
+
+print("Calling approve_and_close()...")
+
+result = atc.execute(client, 4)
+
+print("✅ Approved, paid out and deleted the app!")
+print("Tx ID:", result.tx_ids)
@@ -0,0 +1,115 @@
+"""
+End-to-end latency of launching a new Bounty app on LocalNet, sequential versus two-round.
+
+The sequential flow is the one create_new_bounty_app.py used to follow: create the app,
+pay its minimum balance, then send the create_bounty group, waiting for each to confirm.
+The two-round flow is smart_contracts._helpers.bounty_launch.launch_bounty, which sends the
+minimum balance payment in the create_bounty group. Each run reports the wall time from
+the first submission to the last confirmation, and the number of rounds that took.
+
+LocalNet may confirm a transaction as soon as it arrives, in which case the time saved is
+one algod round trip. On networks with regular block times each confirmation round saved
+is worth about one block time, which the rounds column shows.
+
+Run from the project root after building: poetry run python -m benchmarks.bounty_launch --runs 5
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts._helpers.bounty_launch import (
+    MIN_BALANCE,
+    create_bounty_app,
+    escrow_bounty,
+    launch_bounty,
+)
+from smart_contracts._helpers.templates import built_template, render_program
+from smart_contracts.bounty.deploy_config import template_values
+
+BOUNTY_AMOUNT = 1_000_000
+
+Launch = Callable[[AlgodClient, algokit_utils.SigningAccount, bytes, bytes], int]
+
+
+def _sequential(
+    algod: AlgodClient,
+    creator: algokit_utils.SigningAccount,
+    approval: bytes,
+    clear: bytes,
+) -> int:
+    app_id = create_bounty_app(algod, creator.address, creator.signer, approval, clear)
+    fund_txn = transaction.PaymentTxn(
+        sender=creator.address,
+        sp=algod.suggested_params(),
+        receiver=get_application_address(app_id),
+        amt=MIN_BALANCE,
+    )
+    transaction.wait_for_confirmation(
+        algod, algod.send_transaction(fund_txn.sign(creator.private_key)), 4
+    )
+    escrow_bounty(
+        algod, app_id, creator.address, creator.signer, "create_bounty", BOUNTY_AMOUNT
+    )
+    return app_id
+
+
+def _two_round(
+    algod: AlgodClient,
+    creator: algokit_utils.SigningAccount,
+    approval: bytes,
+    clear: bytes,
+) -> int:
+    return launch_bounty(
+        algod, creator.address, creator.signer, approval, clear, BOUNTY_AMOUNT
+    )
+
+
+FLOWS: dict[str, Launch] = {"sequential": _sequential, "two-round": _two_round}
+
+
+def _last_round(algod: AlgodClient) -> int:
+    return int(algod.status()["last-round"])  # type: ignore[call-overload, index]
+
+
+def main(runs: int) -> None:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    algod = algorand.client.algod
+    creator = algorand.account.localnet_dispenser()
+    template = built_template("bounty", "Bounty")
+    approval = render_program(template, "approval", template_values)
+    clear = render_program(template, "clear", template_values)
+
+    seconds: dict[str, list[float]] = {name: [] for name in FLOWS}
+    rounds: dict[str, list[int]] = {name: [] for name in FLOWS}
+    for _ in range(runs):
+        # Alternate the flows so that both see the same network conditions.
+        for name, launch in FLOWS.items():
+            first_round = _last_round(algod)
+            started = time.perf_counter()
+            launch(algod, creator, approval, clear)
+            seconds[name].append(time.perf_counter() - started)
+            rounds[name].append(_last_round(algod) - first_round)
+
+    print(f"\n{'flow':<12} {'median (s)':>11} {'mean (s)':>10} {'rounds':>7}")
+    for name in FLOWS:
+        print(
+            f"{name:<12} {statistics.median(seconds[name]):>11.2f} {statistics.mean(seconds[name]):>10.2f}"
+            f" {statistics.median(rounds[name]):>7g}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="launches per flow (default: 5)"
+    )
+    main(parser.parse_args().runs)
@@ -0,0 +1,83 @@
+"""
+Compares cold and warm build latency for the Bounty, Bank and Counter contracts.
+
+Cold builds shell out to the algokit CLI for every compile and client generation; warm
+builds reuse a single compiler worker. Artifacts are written to a temporary directory so
+smart_contracts/artifacts is left untouched.
+
+Run from the project root: poetry run python -m benchmarks.build_latency --rounds 3
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from smart_contracts.__main__ import SmartContract, build, contracts
+from smart_contracts._helpers.compiler_worker import CompilerWorker
+
+BENCHMARK_CONTRACTS = ["bounty", "bank", "counter"]
+
+
+def _time_build(
+    contract: SmartContract, output_root: Path, worker: CompilerWorker | None
+) -> float:
+    start = time.perf_counter()
+    build(output_root / contract.name, contract.path, force=True, worker=worker)
+    return time.perf_counter() - start
+
+
+def main(rounds: int) -> None:
+    selected = [
+        contract for contract in contracts if contract.name in BENCHMARK_CONTRACTS
+    ]
+    cold: dict[str, list[float]] = {contract.name: [] for contract in selected}
+    warm: dict[str, list[float]] = {contract.name: [] for contract in selected}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_root = Path(temp_dir)
+        for _ in range(rounds):
+            for contract in selected:
+                cold[contract.name].append(_time_build(contract, output_root, None))
+
+        start = time.perf_counter()
+        worker = CompilerWorker.start()
+        startup = time.perf_counter() - start
+        if worker is None:
+            raise SystemExit(
+                "Compiler worker unavailable, install puyapy and algokit-client-generator"
+            )
+        with worker:
+            for _ in range(rounds):
+                for contract in selected:
+                    warm[contract.name].append(
+                        _time_build(contract, output_root, worker)
+                    )
+
+    print(f"\n{'contract':<10} {'cold (s)':>10} {'warm (s)':>10} {'speedup':>9}")
+    for contract in selected:
+        cold_median = statistics.median(cold[contract.name])
+        warm_median = statistics.median(warm[contract.name])
+        print(
+            f"{contract.name:<10} {cold_median:>10.2f} {warm_median:>10.2f} {cold_median / warm_median:>8.1f}x"
+        )
+    total_cold = sum(statistics.median(times) for times in cold.values())
+    total_warm = sum(statistics.median(times) for times in warm.values())
+    print(
+        f"{'total':<10} {total_cold:>10.2f} {total_warm:>10.2f} {total_cold / total_warm:>8.1f}x"
+    )
+    print(f"worker startup: {startup:.2f}s (paid once per build run)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=3,
+        help="builds per contract and mode (default: 3)",
+    )
+    main(parser.parse_args().rounds)
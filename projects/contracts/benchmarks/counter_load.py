@@ -0,0 +1,184 @@
+"""
+Load generator for the Counter throughput probe on LocalNet.
+
+Creates a fresh Counter app and funds `--accounts` new accounts, then has every account
+call `incr_by` `--calls` times in a row, all accounts concurrently. Each call is sent and
+awaited before the account's next one, so the run measures confirmed throughput: confirmed
+increments per second over the whole run, and the latency from sending a call to seeing it
+confirmed. The app's global count is checked against the increments sent at the end.
+
+Run from the project root after building: poetry run python -m benchmarks.counter_load --accounts 64
+"""
+
+import argparse
+import base64
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import algokit_utils
+from algosdk import encoding, transaction
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.counter.counter_client import CounterFactory
+
+ACCOUNT_FUNDING = 1_000_000
+# Minimum balance of a sender's counter box: 2500 + 400 * (key "c" + address + uint64)
+BOX_COST = 2_500 + 400 * (1 + 32 + 8)
+# Payments per funding group, the most a group can hold.
+GROUP_SIZE = 16
+
+app_spec_path = (
+    Path(__file__).parent.parent
+    / "smart_contracts"
+    / "artifacts"
+    / "counter"
+    / "Counter.arc56.json"
+)
+
+
+def _fund(
+    algod: AlgodClient,
+    funder: algokit_utils.SigningAccount,
+    receivers: list[str],
+    amount: int,
+) -> None:
+    sp = algod.suggested_params()
+    txids: list[str] = []
+    for start in range(0, len(receivers), GROUP_SIZE):
+        payments = [
+            transaction.PaymentTxn(
+                sender=funder.address, sp=sp, receiver=receiver, amt=amount
+            )
+            for receiver in receivers[start : start + GROUP_SIZE]
+        ]
+        transaction.assign_group_id(payments)
+        txids.append(
+            algod.send_transactions(
+                [payment.sign(funder.private_key) for payment in payments]
+            )
+        )
+    for txid in txids:
+        transaction.wait_for_confirmation(algod, txid, 4)
+
+
+def _run_account(
+    algod: AlgodClient,
+    app_id: int,
+    contract: Contract,
+    sender: algokit_utils.SigningAccount,
+    calls: int,
+    increment: int,
+) -> list[float]:
+    """Sends the account's calls one after another and returns their latencies in seconds."""
+    sp = algod.suggested_params()
+    box_key = b"c" + encoding.decode_address(sender.address)
+    latencies: list[float] = []
+    for call in range(calls):
+        atc = AtomicTransactionComposer()
+        atc.add_method_call(
+            app_id=app_id,
+            method=contract.get_method_by_name("incr_by"),
+            sender=sender.address,
+            sp=sp,
+            signer=sender.signer,
+            method_args=[increment],
+            boxes=[(app_id, box_key)],
+            # Calls with the same arguments and validity would otherwise share a transaction id.
+            note=call.to_bytes(8, "big"),
+        )
+        sent = time.perf_counter()
+        atc.execute(algod, 4)
+        latencies.append(time.perf_counter() - sent)
+    return latencies
+
+
+def _global_count(algod: AlgodClient, app_id: int) -> int:
+    global_state = algod.application_info(app_id)["params"]["global-state"]
+    return next(
+        int(entry["value"]["uint"])
+        for entry in global_state
+        if base64.b64decode(entry["key"]) == b"count"
+    )
+
+
+def main(accounts: int, calls: int, increment: int) -> None:
+    algorand = algokit_utils.AlgorandClient.default_localnet()
+    algod = algorand.client.algod
+    dispenser = algorand.account.localnet_dispenser()
+
+    factory = algorand.client.get_typed_app_factory(
+        CounterFactory, default_sender=dispenser.address
+    )
+    app_client, _ = factory.send.create.bare()
+    app_id = app_client.app_id
+    senders = [algorand.account.random() for _ in range(accounts)]
+    _fund(algod, dispenser, [sender.address for sender in senders], ACCOUNT_FUNDING)
+    # The app pays for the counter boxes, one per sender on top of its own minimum balance.
+    _fund(
+        algod,
+        dispenser,
+        [get_application_address(app_id)],
+        100_000 + accounts * BOX_COST,
+    )
+    print(
+        f"Counter app {app_id}, {accounts} accounts x {calls} calls of incr_by({increment})"
+    )
+
+    contract = Contract.from_json(app_spec_path.read_text(encoding="utf-8"))
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=accounts) as executor:
+        runs = list(
+            executor.map(
+                lambda sender: _run_account(
+                    algod, app_id, contract, sender, calls, increment
+                ),
+                senders,
+            )
+        )
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for run in runs for latency in run)
+    confirmed = len(latencies) * increment
+    assert (
+        _global_count(algod, app_id) == confirmed
+    ), "Global count does not match the confirmed increments"
+
+    print(f"\n{'confirmed calls':<24} {len(latencies):>10}")
+    print(f"{'elapsed (s)':<24} {elapsed:>10.2f}")
+    print(f"{'calls / s':<24} {len(latencies) / elapsed:>10.1f}")
+    print(f"{'increments / s':<24} {confirmed / elapsed:>10.1f}")
+    quantiles = (
+        statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    )
+    for label, latency in [
+        ("latency p50 (s)", quantiles[49]),
+        ("latency p90 (s)", quantiles[89]),
+        ("latency p99 (s)", quantiles[98]),
+        ("latency max (s)", latencies[-1]),
+    ]:
+        print(f"{label:<24} {latency:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--accounts",
+        type=int,
+        default=16,
+        help="concurrent sending accounts (default: 16)",
+    )
+    parser.add_argument(
+        "--calls", type=int, default=10, help="incr_by calls per account (default: 10)"
+    )
+    parser.add_argument(
+        "--increment", type=int, default=1, help="n passed to incr_by (default: 1)"
+    )
+    arguments = parser.parse_args()
+    main(arguments.accounts, arguments.calls, arguments.increment)
@@ -0,0 +1,97 @@
+"""
+Measures how long `python -m smart_contracts build <contract>` takes to reach its first compile.
+
+Each run starts a fresh interpreter that imports smart_contracts.__main__ and builds one
+contract into a temporary directory, stopping at the moment compilation would start. The
+report shows interpreter start to import complete and to first compile, and which heavy
+SDK modules had been imported by then.
+
+Run from the project root: poetry run python -m benchmarks.startup counter --runs 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent
+
+_CHILD = """
+import json, sys, tempfile, time
+from pathlib import Path
+
+import smart_contracts.__main__ as entrypoint
+
+imported = time.time()
+first_compile = []
+
+
+class FirstCompile(Exception):
+    pass
+
+
+def stop(*args, **kwargs):
+    first_compile.append(time.time())
+    raise FirstCompile
+
+
+entrypoint._compile = stop
+contract = next(c for c in entrypoint.contracts if c.name == sys.argv[1])
+with tempfile.TemporaryDirectory() as temp_dir:
+    try:
+        entrypoint.build_contracts([contract], Path(temp_dir), force=True, use_worker=False)
+    except FirstCompile:
+        pass
+heavy = [name for name in ("algokit_utils", "algosdk", "dotenv") if name in sys.modules]
+print(json.dumps({"imported": imported, "first_compile": first_compile[0], "heavy_modules": heavy}))
+"""
+
+
+def _run_once(contract_name: str) -> tuple[float, float, list[str]]:
+    """Returns the seconds to import and to first compile, and the heavy modules imported."""
+    start = time.time()
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD, contract_name],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    return (
+        timings["imported"] - start,
+        timings["first_compile"] - start,
+        timings["heavy_modules"],
+    )
+
+
+def main(contract_name: str, runs: int) -> None:
+    results = [_run_once(contract_name) for _ in range(runs)]
+    import_times = [import_time for import_time, _, _ in results]
+    compile_times = [compile_time for _, compile_time, _ in results]
+    print(f"\nstartup for `build {contract_name}` over {runs} runs (median)")
+    print(
+        f"  interpreter start -> smart_contracts imported: {statistics.median(import_times) * 1000:8.1f} ms"
+    )
+    print(
+        f"  interpreter start -> first compile:            {statistics.median(compile_times) * 1000:8.1f} ms"
+    )
+    print(f"  heavy modules imported before compiling: {results[-1][2] or 'none'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("contract_name", nargs="?", default="counter")
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="number of fresh interpreters to time (default: 5)",
+    )
+    args = parser.parse_args()
+    main(args.contract_name, args.runs)
@@ -0,0 +1,86 @@
+"""Claim a bounty and submit the work in one call, for workers who already have the deliverable."""
+
+import os
+import sys
+
+from algokit_utils import AlgorandClient
+from algosdk import account
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+)
+from algosdk.mnemonic import to_private_key
+from dotenv import load_dotenv
+
+
+def _get_app_id() -> int:
+    app_id_value = sys.argv[1] if len(sys.argv) > 1 else os.getenv("APP_ID")
+    if not app_id_value:
+        raise ValueError("Set APP_ID in .env or pass it as the first argument.")
+    return int(app_id_value)
+
+
+# =========================
+# LOAD ENV
+# =========================
+
+load_dotenv()
+
+APP_ID = _get_app_id()
+
+WORKER_MNEMONIC = os.getenv("WORKER_MNEMONIC")
+if not WORKER_MNEMONIC:
+    raise ValueError("Set WORKER_MNEMONIC in .env file")
+
+
+# =========================
+# CLIENT SETUP
+# =========================
+
+algorand = AlgorandClient.from_environment()
+client = algorand.client.algod
+
+worker_private_key = to_private_key(WORKER_MNEMONIC)
+worker_address = account.address_from_private_key(worker_private_key)
+
+signer = AccountTransactionSigner(worker_private_key)
+
+print("Worker:", worker_address)
+
+
+# =========================
+# LOAD CONTRACT
+# =========================
+
+with open("smart_contracts/artifacts/bounty/Bounty.arc56.json") as f:
+    contract_json = f.read()
+
+contract = Contract.from_json(contract_json)
+
+method = contract.get_method_by_name("claim_and_submit")
+
+
+# =========================
+# BUILD ATC
+# =========================
+
+sp = client.suggested_params()
+
+atc = AtomicTransactionComposer()
+
+atc.add_method_call(
+    app_id=APP_ID,
+    method=method,
+    sender=worker_address,
+    sp=sp,
+    signer=signer,
+    method_args=[],
+)
+
+print("Calling claim_and_submit()...")
+
+result = atc.execute(client, 4)
+
+print("✅ Claimed and submitted in one transaction!")
+print("Tx ID:", result.tx_ids)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Create a MilestoneBounty app and escrow its milestones in a single funding group.
+
+Usage: python create_milestone_bounty.py <milestone amount> [<milestone amount> ...]
+Amounts are in microAlgos, at most 16 milestones.
+"""
+
+import json
+import os
+import sys
+
+from algosdk import account, transaction
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.logic import get_application_address
+from algosdk.mnemonic import to_private_key
+from algosdk.v2client import algod
+from dotenv import load_dotenv
+
+# ==============================
+# CONFIG
+# ==============================
+
+MIN_BALANCE = 100_000  # 0.1 ALGO in microAlgos
+
+ARTIFACTS_PATH = "smart_contracts/artifacts/milestone_bounty"
+APP_SPEC_PATH = f"{ARTIFACTS_PATH}/MilestoneBounty.arc56.json"
+
+MILESTONES = [int(amount) for amount in sys.argv[1:]]
+if not MILESTONES:
+    raise ValueError(
+        "Pass the milestone amounts in microAlgos, e.g. 500000 250000 250000"
+    )
+
+# Minimum balance of the milestones box: 2500 + 400 * (key "m" + length prefix + 8 bytes per milestone)
+BOX_COST = 2_500 + 400 * (1 + 2 + 8 * len(MILESTONES))
+
+
+# ==============================
+# LOAD ENV
+# ==============================
+
+load_dotenv()
+
+CREATOR_MNEMONIC = os.getenv("CREATOR_MNEMONIC")
+if not CREATOR_MNEMONIC:
+    raise ValueError("Set CREATOR_MNEMONIC in your .env file.")
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
+
+
+# ==============================
+# CLIENT SETUP
+# ==============================
+
+client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_SERVER)
+print("Connected to:", ALGOD_SERVER)
+
+creator_private_key = to_private_key(CREATOR_MNEMONIC)
+creator_address = account.address_from_private_key(creator_private_key)
+print("Creator:", creator_address)
+
+signer = AccountTransactionSigner(creator_private_key)
+
+
+# ==============================
+# CREATE APP
+# ==============================
+
+with open(APP_SPEC_PATH, encoding="utf-8") as spec_file:
+    app_spec = json.load(spec_file)
+global_schema = app_spec["state"]["schema"]["global"]
+
+with open(f"{ARTIFACTS_PATH}/MilestoneBounty.approval.bin", "rb") as approval_file:
+    approval_program = approval_file.read()
+with open(f"{ARTIFACTS_PATH}/MilestoneBounty.clear.bin", "rb") as clear_file:
+    clear_program = clear_file.read()
+
+create_txn = transaction.ApplicationCreateTxn(
+    sender=creator_address,
+    sp=client.suggested_params(),
+    on_complete=transaction.OnComplete.NoOpOC,
+    approval_program=approval_program,
+    clear_program=clear_program,
+    global_schema=transaction.StateSchema(
+        num_uints=global_schema["ints"], num_byte_slices=global_schema["bytes"]
+    ),
+    local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
+)
+create_txid = client.send_transaction(create_txn.sign(creator_private_key))
+app_id = transaction.wait_for_confirmation(client, create_txid, 4)["application-index"]
+app_address = get_application_address(app_id)
+print("New APP_ID:", app_id)
+
+
+# ==============================
+# FUND AND ESCROW IN ONE GROUP
+# ==============================
+
+sp = client.suggested_params()
+contract = Contract.from_json(json.dumps(app_spec))
+
+atc = AtomicTransactionComposer()
+min_balance_txn = transaction.PaymentTxn(
+    sender=creator_address, sp=sp, receiver=app_address, amt=MIN_BALANCE
+)
+atc.add_transaction(TransactionWithSigner(min_balance_txn, signer))
+escrow_txn = transaction.PaymentTxn(
+    sender=creator_address,
+    sp=sp,
+    receiver=app_address,
+    amt=sum(MILESTONES) + BOX_COST,
+)
+atc.add_method_call(
+    app_id=app_id,
+    method=contract.get_method_by_name("create_bounty"),
+    sender=creator_address,
+    sp=sp,
+    signer=signer,
+    method_args=[TransactionWithSigner(escrow_txn, signer), MILESTONES],
+    boxes=[(app_id, b"m")],
+)
+
+result = atc.execute(client, 4)
+print("Milestones escrowed:", MILESTONES, "Transaction IDs:", result.tx_ids)
+print("Done. Use this APP_ID:", app_id)
@@ -1,33 +1,29 @@
 #!/usr/bin/env python3
 
-import base64
-import json
 import os
+import time
 
 from dotenv import load_dotenv
 
-from algosdk import account, transaction
-from algosdk.abi import Contract
-from algosdk.atomic_transaction_composer import (
-    AtomicTransactionComposer,
-    AccountTransactionSigner,
-    TransactionWithSigner,
-)
+from algosdk import account
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
 from algosdk.logic import get_application_address
 from algosdk.mnemonic import to_private_key
 from algosdk.v2client import algod
 
+from smart_contracts._helpers.bounty_apps import find_recyclable_bounty
+from smart_contracts._helpers.bounty_launch import (
+    MIN_BALANCE,
+    escrow_bounty,
+    launch_bounty,
+)
+from smart_contracts._helpers.templates import built_template, render_program
 
 # ==============================
 # CONFIG
 # ==============================
 
 BOUNTY_AMOUNT = 1_000_000  # 1 ALGO in microAlgos
-MIN_BALANCE = 100_000  # 0.1 ALGO in microAlgos
-
-APPROVAL_TEAL_PATH = "smart_contracts/artifacts/bounty/Bounty.approval.teal"
-CLEAR_TEAL_PATH = "smart_contracts/artifacts/bounty/Bounty.clear.teal"
-APP_SPEC_PATH = "smart_contracts/artifacts/bounty/Bounty.arc56.json"
 
 
 # ==============================
@@ -43,6 +39,9 @@ if not CREATOR_MNEMONIC:
 ALGOD_SERVER = os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
 ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
 
+# Bounty variant: the smallest bounty amount the app accepts.
+MIN_BOUNTY_AMOUNT = int(os.getenv("MIN_BOUNTY_AMOUNT", "0"))
+
 
 # ==============================
 # CLIENT SETUP
@@ -55,113 +54,49 @@ creator_private_key = to_private_key(CREATOR_MNEMONIC)
 creator_address = account.address_from_private_key(creator_private_key)
 print("Creator:", creator_address)
 
+signer = AccountTransactionSigner(creator_private_key)
+
 
 # ==============================
 # HELPERS
 # ==============================
 
 
-def _compile_teal(teal_path: str) -> bytes:
-    with open(teal_path, "r", encoding="utf-8") as teal_file:
-        teal_source = teal_file.read()
-    compile_result = client.compile(teal_source)
-    return base64.b64decode(compile_result["result"])
-
-
-def _load_schema(app_spec_path: str) -> tuple[transaction.StateSchema, transaction.StateSchema]:
-    with open(app_spec_path, "r", encoding="utf-8") as spec_file:
-        app_spec = json.load(spec_file)
-    global_schema = app_spec["state"]["schema"]["global"]
-    local_schema = app_spec["state"]["schema"]["local"]
+def _render_programs() -> tuple[bytes, bytes]:
+    # Splices the variant's values into the bytecode recorded at build time, no compile needed.
+    template = built_template("bounty", "Bounty")
+    values: dict[str, int | bytes] = {
+        # Zero address: the app creator is the bounty creator.
+        "FIXED_CREATOR": bytes(32),
+        "MIN_BOUNTY_AMOUNT": MIN_BOUNTY_AMOUNT,
+    }
     return (
-        transaction.StateSchema(
-            num_uints=global_schema["ints"],
-            num_byte_slices=global_schema["bytes"],
-        ),
-        transaction.StateSchema(
-            num_uints=local_schema["ints"],
-            num_byte_slices=local_schema["bytes"],
-        ),
+        render_program(template, "approval", values),
+        render_program(template, "clear", values),
     )
 
 
 # ==============================
-# CREATE NEW APP
-# ==============================
-
-approval_program = _compile_teal(APPROVAL_TEAL_PATH)
-clear_program = _compile_teal(CLEAR_TEAL_PATH)
-
-global_schema, local_schema = _load_schema(APP_SPEC_PATH)
-
-sp = client.suggested_params()
-create_txn = transaction.ApplicationCreateTxn(
-    sender=creator_address,
-    sp=sp,
-    on_complete=transaction.OnComplete.NoOpOC,
-    approval_program=approval_program,
-    clear_program=clear_program,
-    global_schema=global_schema,
-    local_schema=local_schema,
-)
-
-signed_create_txn = create_txn.sign(creator_private_key)
-create_txid = client.send_transaction(signed_create_txn)
-create_result = transaction.wait_for_confirmation(client, create_txid, 4)
-
-app_id = create_result["application-index"]
-app_address = get_application_address(app_id)
-
-print("New APP_ID:", app_id)
-print("App Address:", app_address)
-
-
-# ==============================
-# FUND MIN BALANCE
-# ==============================
-
-min_balance_txn = transaction.PaymentTxn(
-    sender=creator_address,
-    sp=client.suggested_params(),
-    receiver=app_address,
-    amt=MIN_BALANCE,
-)
-
-min_balance_txid = client.send_transaction(min_balance_txn.sign(creator_private_key))
-transaction.wait_for_confirmation(client, min_balance_txid, 4)
-
-print("Min balance funded:", MIN_BALANCE)
-
-
-# ==============================
-# CALL create_bounty
+# REUSE A FINISHED APP, OR CREATE ONE
 # ==============================
 
-with open(APP_SPEC_PATH, "r", encoding="utf-8") as spec_file:
-    contract = Contract.from_json(spec_file.read())
+started = time.perf_counter()
+approval_program, clear_program = _render_programs()
 
-method = contract.get_method_by_name("create_bounty")
-
-signer = AccountTransactionSigner(creator_private_key)
-
-payment_txn = transaction.PaymentTxn(
-    sender=creator_address,
-    sp=client.suggested_params(),
-    receiver=app_address,
-    amt=BOUNTY_AMOUNT,
-)
-
-atc = AtomicTransactionComposer()
-atc.add_method_call(
-    app_id=app_id,
-    method=method,
-    sender=creator_address,
-    sp=client.suggested_params(),
-    signer=signer,
-    method_args=[TransactionWithSigner(payment_txn, signer), BOUNTY_AMOUNT],
-)
-
-result = atc.execute(client, 4)
-print("Bounty funded. Transaction IDs:", result.tx_ids)
+app_id = find_recyclable_bounty(client, creator_address, approval_program)
+if app_id is not None:
+    print("Reusing finished bounty APP_ID:", app_id)
+    tx_ids = escrow_bounty(
+        client, app_id, creator_address, signer, "reopen", BOUNTY_AMOUNT
+    )
+    print("Bounty reopened. Transaction IDs:", tx_ids)
+else:
+    # Two rounds: the app creation, then the min balance and escrow in one group.
+    app_id = launch_bounty(
+        client, creator_address, signer, approval_program, clear_program, BOUNTY_AMOUNT
+    )
+    print("New APP_ID:", app_id)
+    print("App Address:", get_application_address(app_id))
+    print("Min balance and bounty funded:", MIN_BALANCE, BOUNTY_AMOUNT)
 
-print("Done. Use this APP_ID:", app_id)
+print(f"Done in {time.perf_counter() - started:.1f}s. Use this APP_ID:", app_id)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Create a bounty on an existing BountyRegistry app in a single grouped call."""
+
+import os
+import secrets
+import sys
+
+from algosdk import account, transaction
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.logic import get_application_address
+from algosdk.mnemonic import to_private_key
+from algosdk.v2client import algod
+from dotenv import load_dotenv
+
+# ==============================
+# CONFIG
+# ==============================
+
+BOUNTY_AMOUNT = 1_000_000  # 1 ALGO in microAlgos
+# Minimum balance of a bounty box: 2500 + 400 * (key "b" + uint64 id + 80 byte record)
+BOX_COST = 2_500 + 400 * (1 + 8 + 80)
+
+APP_SPEC_PATH = "smart_contracts/artifacts/bounty_registry/BountyRegistry.arc56.json"
+
+
+def _get_app_id() -> int:
+    app_id_value = sys.argv[1] if len(sys.argv) > 1 else os.getenv("REGISTRY_APP_ID")
+    if not app_id_value:
+        raise ValueError(
+            "Set REGISTRY_APP_ID in .env or pass it as the first argument."
+        )
+    return int(app_id_value)
+
+
+# ==============================
+# LOAD ENV
+# ==============================
+
+load_dotenv()
+
+APP_ID = _get_app_id()
+
+CREATOR_MNEMONIC = os.getenv("CREATOR_MNEMONIC")
+if not CREATOR_MNEMONIC:
+    raise ValueError("Set CREATOR_MNEMONIC in your .env file.")
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
+
+
+# ==============================
+# CLIENT SETUP
+# ==============================
+
+client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_SERVER)
+print("Connected to:", ALGOD_SERVER)
+
+creator_private_key = to_private_key(CREATOR_MNEMONIC)
+creator_address = account.address_from_private_key(creator_private_key)
+print("Creator:", creator_address)
+
+signer = AccountTransactionSigner(creator_private_key)
+
+
+# ==============================
+# CREATE BOUNTY
+# ==============================
+
+with open(APP_SPEC_PATH, encoding="utf-8") as spec_file:
+    contract = Contract.from_json(spec_file.read())
+
+method = contract.get_method_by_name("create_bounty")
+app_address = get_application_address(APP_ID)
+
+# Ids are picked at random so that concurrent creates do not collide; a taken id fails
+# the call, which can then be retried with a new one.
+bounty_id = secrets.randbits(64)
+box_key = b"b" + bounty_id.to_bytes(8, "big")
+
+sp = client.suggested_params()
+payment_txn = transaction.PaymentTxn(
+    sender=creator_address,
+    sp=sp,
+    receiver=app_address,
+    amt=BOUNTY_AMOUNT + BOX_COST,
+)
+
+atc = AtomicTransactionComposer()
+atc.add_method_call(
+    app_id=APP_ID,
+    method=method,
+    sender=creator_address,
+    sp=sp,
+    signer=signer,
+    method_args=[TransactionWithSigner(payment_txn, signer), bounty_id, BOUNTY_AMOUNT],
+    boxes=[(APP_ID, box_key)],
+)
+
+result = atc.execute(client, 4)
+print("Bounty created. Transaction IDs:", result.tx_ids)
+print("Bounty id:", bounty_id)
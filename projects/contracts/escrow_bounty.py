@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Run a bounty through a BountyEscrow logic signature instead of a Bounty app.
+
+Usage: python escrow_bounty.py fund|payout|refund <worker address> <refund round>
+
+fund     pays BOUNTY_AMOUNT into the escrow account
+payout   closes the escrow out to the worker, co-signed by the creator
+refund   closes the escrow back to the creator, from the refund round on
+"""
+
+import os
+import sys
+
+from algosdk import account, transaction
+from algosdk.mnemonic import to_private_key
+from algosdk.v2client import algod
+from dotenv import load_dotenv
+
+from smart_contracts._helpers.bounty_escrow import escrow_address, escrow_program
+
+# ==============================
+# CONFIG
+# ==============================
+
+BOUNTY_AMOUNT = 1_000_000  # 1 ALGO in microAlgos, at least the 0.1 ALGO account minimum
+
+if len(sys.argv) != 4 or sys.argv[1] not in ("fund", "payout", "refund"):
+    raise ValueError(
+        "Usage: python escrow_bounty.py fund|payout|refund <worker address> <refund round>"
+    )
+
+ACTION = sys.argv[1]
+WORKER_ADDRESS = sys.argv[2]
+REFUND_ROUND = int(sys.argv[3])
+
+
+# ==============================
+# LOAD ENV
+# ==============================
+
+load_dotenv()
+
+CREATOR_MNEMONIC = os.getenv("CREATOR_MNEMONIC")
+if not CREATOR_MNEMONIC:
+    raise ValueError("Set CREATOR_MNEMONIC in your .env file.")
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
+
+
+# ==============================
+# CLIENT SETUP
+# ==============================
+
+client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_SERVER)
+print("Connected to:", ALGOD_SERVER)
+
+creator_private_key = to_private_key(CREATOR_MNEMONIC)
+creator_address = account.address_from_private_key(creator_private_key)
+print("Creator:", creator_address)
+
+
+# ==============================
+# DERIVE THE ESCROW OFFLINE
+# ==============================
+
+program = escrow_program(creator_address, WORKER_ADDRESS, REFUND_ROUND)
+escrow = transaction.LogicSigAccount(program)
+print("Escrow address:", escrow_address(program))
+
+
+# ==============================
+# RUN THE ACTION
+# ==============================
+
+sp = client.suggested_params()
+
+if ACTION == "fund":
+    fund_txn = transaction.PaymentTxn(
+        sender=creator_address,
+        sp=sp,
+        receiver=escrow_address(program),
+        amt=BOUNTY_AMOUNT,
+    )
+    txid = client.send_transaction(fund_txn.sign(creator_private_key))
+elif ACTION == "payout":
+    # The creator's co-signature is a zero payment to itself, grouped before the payout.
+    cosign_txn = transaction.PaymentTxn(
+        sender=creator_address, sp=sp, receiver=creator_address, amt=0
+    )
+    payout_txn = transaction.PaymentTxn(
+        sender=escrow_address(program),
+        sp=sp,
+        receiver=WORKER_ADDRESS,
+        amt=0,
+        close_remainder_to=WORKER_ADDRESS,
+    )
+    transaction.assign_group_id([cosign_txn, payout_txn])
+    txid = client.send_transactions(
+        [
+            cosign_txn.sign(creator_private_key),
+            transaction.LogicSigTransaction(payout_txn, escrow),
+        ]
+    )
+else:
+    if sp.first < REFUND_ROUND:
+        raise ValueError(
+            f"The escrow can only be refunded from round {REFUND_ROUND}, now at {sp.first}."
+        )
+    refund_txn = transaction.PaymentTxn(
+        sender=escrow_address(program),
+        sp=sp,
+        receiver=creator_address,
+        amt=0,
+        close_remainder_to=creator_address,
+    )
+    txid = client.send_transaction(transaction.LogicSigTransaction(refund_txn, escrow))
+
+transaction.wait_for_confirmation(client, txid, 4)
+print(f"✅ {ACTION} confirmed. Tx ID:", txid)
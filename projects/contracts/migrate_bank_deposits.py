@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Move a Bank app's per-account deposit boxes into its deposit buckets."""
+
+import argparse
+import base64
+import os
+
+from algosdk import account, encoding
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+)
+from algosdk.mnemonic import to_private_key
+from algosdk.v2client import algod
+from dotenv import load_dotenv
+
+from smart_contracts._helpers.bank_buckets import bucket_key, is_bucket_key
+from smart_contracts.bank.deploy_config import template_values
+
+# Each account needs two box references (its own box and its bucket) out of 8 per call,
+# and scanning a bucket uses about a third of a call's opcode budget.
+ACCOUNTS_PER_CALL = 2
+CALLS_PER_GROUP = 16
+
+APP_SPEC_PATH = "smart_contracts/artifacts/bank/Bank.arc56.json"
+
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument("app_id", type=int)
+parser.add_argument(
+    "--buckets",
+    type=int,
+    default=template_values["DEPOSIT_BUCKETS"],
+    help="DEPOSIT_BUCKETS the app was deployed with",
+)
+args = parser.parse_args()
+if args.buckets <= 0:
+    raise ValueError("The app keeps one box per depositor; pass the app's --buckets.")
+
+load_dotenv()
+
+DEPLOYER_MNEMONIC = os.getenv("DEPLOYER_MNEMONIC")
+if not DEPLOYER_MNEMONIC:
+    raise ValueError("Set DEPLOYER_MNEMONIC in your .env file.")
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
+
+client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_SERVER)
+private_key = to_private_key(DEPLOYER_MNEMONIC)
+sender = account.address_from_private_key(private_key)
+signer = AccountTransactionSigner(private_key)
+
+with open(APP_SPEC_PATH, encoding="utf-8") as spec_file:
+    method = Contract.from_json(spec_file.read()).get_method_by_name("migrate_deposits")
+
+box_names = [
+    base64.b64decode(box["name"])
+    for box in client.application_boxes(args.app_id)["boxes"]
+]
+public_keys = [name for name in box_names if not is_bucket_key(name)]
+print(f"{len(public_keys)} per-account deposit boxes to migrate")
+
+moved = 0
+accounts_per_group = ACCOUNTS_PER_CALL * CALLS_PER_GROUP
+for group_start in range(0, len(public_keys), accounts_per_group):
+    group_keys = public_keys[group_start : group_start + accounts_per_group]
+    sp = client.suggested_params()
+    atc = AtomicTransactionComposer()
+    for start in range(0, len(group_keys), ACCOUNTS_PER_CALL):
+        chunk = group_keys[start : start + ACCOUNTS_PER_CALL]
+        atc.add_method_call(
+            app_id=args.app_id,
+            method=method,
+            sender=sender,
+            sp=sp,
+            signer=signer,
+            method_args=[[encoding.encode_address(public_key) for public_key in chunk]],
+            boxes=[
+                (args.app_id, name)
+                for key in chunk
+                for name in (key, bucket_key(key, args.buckets))
+            ],
+        )
+    result = atc.execute(client, 4)
+    moved += sum(abi_result.return_value for abi_result in result.abi_results)
+    print(f"Moved {moved} of {len(public_keys)} boxes")
+
+print(
+    f"Done. {len(public_keys) - moved} accounts stay in per-account boxes because their bucket is full."
+)
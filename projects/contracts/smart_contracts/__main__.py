@@ -1,27 +1,58 @@
+import argparse
+import atexit
 import dataclasses
+import functools
 import importlib
 import logging
+import os
+import queue
+import re
 import subprocess
 import sys
+import time
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from shutil import rmtree
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from algokit_utils.config import config
-from dotenv import load_dotenv
+from smart_contracts._helpers.build_cache import (
+    compute_build_hash,
+    contract_sources,
+    is_up_to_date,
+    read_manifest,
+    toolchain_versions,
+    write_manifest,
+)
+from smart_contracts._helpers.build_report import (
+    REPORT_FILE_NAME,
+    Report,
+    find_regressions,
+    read_report,
+    size_warnings,
+    update_report,
+    write_build_stats,
+    write_report,
+)
+from smart_contracts._helpers.compiler_worker import CompilerWorker
+from smart_contracts._helpers.scheduler import Task, run_dag
+from smart_contracts._helpers.templates import (
+    clear_sentinel_values,
+    sentinel_flags,
+    template_variables,
+    write_templates,
+)
 
-# Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
-# Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
-# Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
+if TYPE_CHECKING:
+    from smart_contracts._helpers.deploy_context import DeployContext
 
-# Set up logging and load environment variables.
+# Set up logging. algokit_utils and the environment variables are only loaded for
+# deployments (see configure_deploy_environment) so that builds start quickly.
 logging.basicConfig(
     level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
 )
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
@@ -33,7 +64,20 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    @functools.cached_property
+    def deploy(self) -> Callable[["DeployContext"], None] | None:
+        """The deploy function of the contract folder, imported on first use."""
+        return import_deploy_if_exists(self.path.parent)
+
+    @functools.cached_property
+    def depends_on(self) -> tuple[str, ...]:
+        """Contracts that must be deployed first, from `depends_on` in the deploy config."""
+        deploy_module = import_deploy_module_if_exists(self.path.parent)
+        depends_on: tuple[str, ...] | list[str] = getattr(
+            deploy_module, "depends_on", ()
+        )
+        return tuple(depends_on)
 
 
 def import_contract(folder: Path) -> Path:
@@ -45,28 +89,35 @@ def import_contract(folder: Path) -> Path:
         raise Exception(f"Contract not found in {folder}")
 
 
-def import_deploy_if_exists(folder: Path) -> Callable[[], None] | None:
-    """Imports the deploy function from a folder if it exists."""
+def import_deploy_module_if_exists(folder: Path) -> ModuleType | None:
+    """Imports the deploy_config module from a folder if it exists."""
     try:
         module_name = f"{folder.parent.name}.{folder.name}.deploy_config"
-        deploy_module = importlib.import_module(module_name)
-        return deploy_module.deploy  # type: ignore[no-any-return, misc]
+        return importlib.import_module(module_name)
     except ImportError:
         return None
 
 
+def import_deploy_if_exists(folder: Path) -> Callable[["DeployContext"], None] | None:
+    """Imports the deploy function from a folder if it exists."""
+    deploy_module = import_deploy_module_if_exists(folder)
+    if deploy_module is None:
+        return None
+    return deploy_module.deploy  # type: ignore[no-any-return, misc]
+
+
 def has_contract_file(directory: Path) -> bool:
     """Checks whether the directory contains a contract.py file."""
     return (directory / "contract.py").exists()
 
 
 # Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
+# folders that start with '_' (internal helpers). Deploy modules, and with them
+# algokit_utils, are only imported when a contract is actually deployed.
 contracts: list[SmartContract] = [
     SmartContract(
         path=import_contract(folder),
         name=folder.name,
-        deploy=import_deploy_if_exists(folder),
     )
     for folder in root_path.iterdir()
     if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
@@ -76,6 +127,15 @@ contracts: list[SmartContract] = [
 
 deployment_extension = "py"
 
+# Flags passed to `algokit compile python`; part of the build cache key.
+# Bytecode is assembled so the build report can measure logic signatures, which have no app spec.
+compile_flags = [
+    "--no-output-arc32",
+    "--output-arc56",
+    "--output-source-map",
+    "--output-bytecode",
+]
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -86,81 +146,576 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def _build_result_path(output_dir: Path) -> Path:
+    """Returns the app spec produced by a build, or the output directory if there is none."""
+    app_spec_files = sorted(output_dir.glob("*.arc56.json"))
+    if app_spec_files:
+        return app_spec_files[-1]
+    return output_dir
+
+
+def _client_output_path(output_dir: Path, app_spec_path: Path) -> Path:
+    """Expands the client output path for a single app spec, as `algokit generate client` does."""
+    contract_name = app_spec_path.name.removesuffix(".arc56.json")
+    if deployment_extension == "py":
+        contract_name = re.sub(r"(?<!^)(?=[A-Z])", "_", contract_name).lower()
+    return Path(
+        str(_get_output_path(output_dir, deployment_extension)).format(
+            contract_name=contract_name
+        )
+    )
+
+
+def _run_measured(command: list[str]) -> tuple[int, str, int | None]:
+    """
+    Runs a command and returns its exit code, combined output and peak resident set
+    size in KiB (None on platforms without os.wait4).
+    """
+    if not hasattr(os, "wait4"):
+        result = subprocess.run(
+            command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        return result.returncode, result.stdout, None
+    process = subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    assert process.stdout is not None
+    output = process.stdout.read()
+    process.stdout.close()
+    # Reap the process ourselves, subprocess does not expose its resource usage.
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    peak_rss_kb = (
+        usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    )
+    return process.returncode, output, peak_rss_kb
+
+
+def _compile(
+    contract_path: Path,
+    output_dir: Path,
+    flags: list[str],
+    worker: CompilerWorker | None,
+) -> int | None:
+    """
+    Compiles the contract into output_dir, in the worker when one is available.
+    Returns the peak memory of the compiling process in KiB, if known.
+    """
+    if worker is not None:
+        returncode, output = worker.compile(contract_path.resolve(), output_dir, flags)
+        peak_rss_kb = worker.peak_rss_kb
+    else:
+        returncode, output, peak_rss_kb = _run_measured(
+            [
+                "algokit",
+                "--no-color",
+                "compile",
+                "python",
+                str(contract_path.resolve()),
+                f"--out-dir={output_dir}",
+                *flags,
+            ]
+        )
+    if returncode:
+        raise Exception(f"Could not build contract:\n{output}")
+    return peak_rss_kb
+
+
+def _previous_clients(output_dir: Path) -> dict[str, tuple[bytes, bytes]]:
+    """
+    Returns the app spec and typed client contents of the previous build, keyed by
+    app spec file name, if they were generated by the current toolchain.
+    """
+    manifest = read_manifest(output_dir)
+    if manifest is None or manifest.get("toolchain") != toolchain_versions():
+        return {}
+    previous: dict[str, tuple[bytes, bytes]] = {}
+    for app_spec_path in output_dir.glob("*.arc56.json"):
+        client_path = _client_output_path(output_dir, app_spec_path)
+        if client_path.exists():
+            previous[app_spec_path.name] = (
+                app_spec_path.read_bytes(),
+                client_path.read_bytes(),
+            )
+    return previous
+
+
+def _generate_clients(
+    output_dir: Path, app_spec_paths: list[Path], worker: CompilerWorker | None
+) -> int | None:
+    """
+    Generates a typed client for every app spec in output_dir.
+    Returns the peak memory of the generating process in KiB, if known.
+    """
+    if worker is not None:
+        for app_spec_path in app_spec_paths:
+            returncode, output = worker.generate_client(
+                app_spec_path, _client_output_path(output_dir, app_spec_path)
+            )
+            if returncode:
+                raise Exception(f"Could not generate typed client:\n{output}")
+        return worker.peak_rss_kb
+
+    # `algokit generate client` processes every app spec in the directory at once.
+    returncode, output, peak_rss_kb = _run_measured(
+        [
+            "algokit",
+            "generate",
+            "client",
+            str(output_dir),
+            "--output",
+            str(_get_output_path(output_dir, deployment_extension)),
+        ]
+    )
+    if returncode:
+        if "No such command" in output:
+            raise Exception(
+                "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
+            )
+        else:
+            raise Exception(f"Could not generate typed client:\n{output}")
+    return peak_rss_kb
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    *,
+    force: bool = False,
+    worker: CompilerWorker | None = None,
+) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+    The build is skipped when the manifest in the output directory shows the artifacts
+    were produced from the same sources, toolchain and flags, unless force is set.
+    Otherwise, if the output directory already exists, it is cleared.
+    Contracts using template variables are also assembled, and the template variable
+    offsets are recorded so variants can be produced without recompiling.
+    Compilation and client generation run in the given compiler worker if there is one,
+    and through the algokit CLI otherwise.
     """
     output_dir = output_dir.resolve()
+    variables = template_variables(contract_path)
+    flags = [*compile_flags, *sentinel_flags(variables)]
+    build_hash = compute_build_hash(contract_path, [*flags, deployment_extension])
+    if not force and is_up_to_date(output_dir, build_hash):
+        logger.info(
+            f"Skipping {contract_path}, artifacts in {output_dir} are up to date"
+        )
+        return _build_result_path(output_dir)
+    previous_clients = {} if force else _previous_clients(output_dir)
     if output_dir.exists():
         rmtree(output_dir)
     output_dir.mkdir(exist_ok=True, parents=True)
     logger.info(f"Exporting {contract_path} to {output_dir}")
 
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--no-output-arc32",
-            "--output-arc56",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-    if build_result.returncode:
-        raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    compile_started = time.perf_counter()
+    peak_rss_kb = _compile(contract_path, output_dir, flags, worker)
+    if variables:
+        write_templates(output_dir, variables)
+        clear_sentinel_values(output_dir)
+    compile_seconds = time.perf_counter() - compile_started
 
+    generate_started = time.perf_counter()
     # Look for arc56.json files and generate the client based on them.
-    app_spec_file_names: list[str] = [
-        file.name for file in output_dir.glob("*.arc56.json")
-    ]
-
-    client_file: str | None = None
-    if not app_spec_file_names:
+    app_spec_paths = sorted(output_dir.glob("*.arc56.json"))
+    if not app_spec_paths:
         logger.warning(
             "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
         )
     else:
-        for file_name in app_spec_file_names:
-            client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
+        changed_app_spec_paths: list[Path] = []
+        for app_spec_path in app_spec_paths:
+            print(app_spec_path.name)
+            previous = previous_clients.get(app_spec_path.name)
+            if previous is not None and previous[0] == app_spec_path.read_bytes():
+                # An identical app spec yields an identical client, keep the previous one.
+                _client_output_path(output_dir, app_spec_path).write_bytes(previous[1])
+            else:
+                changed_app_spec_paths.append(app_spec_path)
+        generate_rss_kb: int | None = None
+        if not changed_app_spec_paths:
+            logger.info(f"App specs in {output_dir} unchanged, keeping typed clients")
+        elif worker is not None:
+            generate_rss_kb = _generate_clients(
+                output_dir, changed_app_spec_paths, worker
             )
-            if generate_result.returncode:
-                if "No such command" in generate_result.stdout:
-                    raise Exception(
-                        "Could not generate typed client, requires AlgoKit 2.0.0 or later. Please update AlgoKit"
-                    )
-                else:
-                    raise Exception(
-                        f"Could not generate typed client:\n{generate_result.stdout}"
-                    )
-    if client_file:
-        return output_dir / client_file
-    return output_dir
+        else:
+            generate_rss_kb = _generate_clients(output_dir, app_spec_paths, worker)
+        if generate_rss_kb is not None:
+            peak_rss_kb = max(peak_rss_kb or 0, generate_rss_kb)
+    generate_seconds = time.perf_counter() - generate_started
+
+    write_manifest(
+        output_dir, contract_path, build_hash, [*flags, deployment_extension]
+    )
+    # Written after the manifest so the timings are not part of the recorded outputs.
+    write_build_stats(
+        output_dir,
+        compile_seconds=compile_seconds,
+        generate_seconds=generate_seconds,
+        peak_rss_kb=peak_rss_kb,
+    )
+    return _build_result_path(output_dir)
+
+
+# Compiler worker owned by the current build process, see _pooled_build.
+_process_worker: CompilerWorker | None = None
+
+
+def _pooled_build(
+    output_dir: Path, contract_path: Path, force: bool, use_worker: bool  # noqa: FBT001
+) -> Path:
+    """Runs build() inside a process pool worker, reusing one compiler worker per process."""
+    global _process_worker
+    if use_worker and _process_worker is None:
+        _process_worker = CompilerWorker.start()
+        if _process_worker is not None:
+            atexit.register(_process_worker.close)
+    return build(output_dir, contract_path, force=force, worker=_process_worker)
+
+
+def report_build(
+    artifact_path: Path,
+    names: list[str],
+    built_since: float,
+    compare_threshold: float | None = None,
+    baseline: Path | None = None,
+) -> None:
+    """
+    Updates artifacts/build_report.json for the given contracts and warns about programs
+    close to the AVM size limit. With a compare_threshold (in percent), size and time
+    increases above it fail the build and leave build_report.json unchanged, so the
+    next build compares against the same report. Builds are compared with the baseline
+    report when given, otherwise with the previous build_report.json.
+    """
+    report_path = artifact_path / REPORT_FILE_NAME
+    previous = read_report(report_path)
+    current = update_report(previous, artifact_path, names, built_since)
+    built = {name: current[name] for name in names}
+    for warning in size_warnings(built):
+        logger.warning(warning)
+    if compare_threshold is not None:
+        _compare_build(built, previous, compare_threshold, baseline)
+    write_report(report_path, current)
+
+
+def _compare_build(
+    built: Report,
+    previous: Report | None,
+    compare_threshold: float,
+    baseline: Path | None,
+) -> None:
+    if baseline is not None:
+        previous = read_report(baseline)
+        if previous is None:
+            raise Exception(f"Could not read baseline build report {baseline}")
+    if previous is None:
+        logger.info("No previous build report to compare against")
+        return
+    regressions = find_regressions(previous, built, compare_threshold)
+    if regressions:
+        for regression in regressions:
+            logger.error(regression)
+        raise Exception(
+            f"{len(regressions)} build regression(s) above {compare_threshold}%"
+        )
+    logger.info(f"No build regressions above {compare_threshold}%")
+
+
+def build_contracts(
+    contracts_to_build: list[SmartContract],
+    artifact_path: Path,
+    jobs: int = 1,
+    *,
+    force: bool = False,
+    use_worker: bool = True,
+    compare_threshold: float | None = None,
+    baseline: Path | None = None,
+) -> None:
+    """
+    Builds each contract into its own folder under artifact_path and records the
+    results in artifacts/build_report.json, see report_build.
+    With jobs > 1 the builds run in a process pool; failures are collected and
+    reported together once every build has finished.
+    Unless use_worker is False, each build process starts one compiler worker and
+    reuses it for all the contracts it builds.
+    """
+    built_since = time.time()
+    _build_all(
+        contracts_to_build, artifact_path, jobs, force=force, use_worker=use_worker
+    )
+    report_build(
+        artifact_path,
+        [contract.name for contract in contracts_to_build],
+        built_since,
+        compare_threshold,
+        baseline,
+    )
+
+
+def _build_all(
+    contracts_to_build: list[SmartContract],
+    artifact_path: Path,
+    jobs: int,
+    *,
+    force: bool,
+    use_worker: bool,
+) -> None:
+    if jobs <= 1 or len(contracts_to_build) <= 1:
+        worker = CompilerWorker.start() if use_worker and contracts_to_build else None
+        if use_worker and contracts_to_build and worker is None:
+            logger.info("Compiler worker unavailable, building with the algokit CLI")
+        try:
+            for contract in contracts_to_build:
+                logger.info(f"Building app at {contract.path}")
+                build(
+                    artifact_path / contract.name,
+                    contract.path,
+                    force=force,
+                    worker=worker,
+                )
+        finally:
+            if worker is not None:
+                worker.close()
+        return
+
+    failures: dict[str, str] = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                _pooled_build,
+                artifact_path / contract.name,
+                contract.path,
+                force,
+                use_worker,
+            ): contract
+            for contract in contracts_to_build
+        }
+        logger.info(f"Building {len(futures)} apps with {jobs} jobs")
+        for future in as_completed(futures):
+            contract = futures[future]
+            try:
+                future.result()
+            except Exception as ex:
+                failures[contract.name] = str(ex)
+            else:
+                logger.info(f"Built app {contract.name}")
+
+    if failures:
+        for name, error in failures.items():
+            logger.error(f"Build of {name} failed:\n{error}")
+        raise Exception(f"Could not build contracts: {', '.join(sorted(failures))}")
+
+
+def _source_snapshot(contract: SmartContract) -> dict[Path, int]:
+    """Modification times of the contract folder's modules and everything the contract imports."""
+    sources = set(contract.path.parent.glob("*.py"))
+    try:
+        sources.update(contract_sources(contract.path))
+    except SyntaxError:
+        pass  # mid-edit, the folder's own files are enough to notice the next save
+    return {source: source.stat().st_mtime_ns for source in sources if source.exists()}
+
+
+def watch(
+    contracts_to_watch: list[SmartContract],
+    artifact_path: Path,
+    *,
+    interval: float = 0.5,
+    debounce: float = 0.3,
+    use_worker: bool = True,
+) -> None:
+    """
+    Watches the contract folders and rebuilds a contract whenever its sources change.
+    Changes are debounced until the sources have been stable for `debounce` seconds,
+    and only the affected contracts are rebuilt.
+    """
+    worker = CompilerWorker.start() if use_worker else None
+    snapshots = {
+        contract.name: _source_snapshot(contract) for contract in contracts_to_watch
+    }
+    logger.info(
+        f"Watching {', '.join(sorted(snapshots))} for changes, press Ctrl+C to stop"
+    )
+    try:
+        while True:
+            time.sleep(interval)
+            changed = [
+                contract
+                for contract in contracts_to_watch
+                if _source_snapshot(contract) != snapshots[contract.name]
+            ]
+            if not changed:
+                continue
+            pending = {
+                contract.name: _source_snapshot(contract) for contract in changed
+            }
+            while True:
+                time.sleep(debounce)
+                current = {
+                    contract.name: _source_snapshot(contract) for contract in changed
+                }
+                if current == pending:
+                    break
+                pending = current
+            for contract in changed:
+                snapshots[contract.name] = pending[contract.name]
+                logger.info(f"Rebuilding {contract.name}")
+                try:
+                    built_since = time.time()
+                    build(artifact_path / contract.name, contract.path, worker=worker)
+                    report_build(artifact_path, [contract.name], built_since)
+                except Exception as ex:
+                    logger.error(f"Build of {contract.name} failed:\n{ex}")
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
+    finally:
+        if worker is not None:
+            worker.close()
+
+
+# -------------------------- Deploy Logic -------------------------- #
+
+
+def _deploy_tasks(
+    contracts_to_deploy: list[SmartContract], *, after_build: bool
+) -> list[Task]:
+    """
+    Creates a deploy task per contract that waits for the contracts it depends on, and
+    for its own build when after_build is set. Dependencies outside the given contracts
+    are assumed to be deployed already.
+    All deploy functions share one DeployContext, created by a task of its own so that
+    connecting and resolving the deployer overlap with the builds.
+    """
+    from smart_contracts._helpers.deploy_context import DeployContext
+
+    deployable = {contract.name for contract in contracts_to_deploy if contract.deploy}
+    if not deployable:
+        return []
+    get_context = functools.cache(DeployContext.from_environment)
+    tasks = [Task("deploy context", "deploy", get_context)]
+    for contract in contracts_to_deploy:
+        deploy = contract.deploy
+        if deploy is None:
+            continue
+        dependencies = ["deploy context"]
+        if after_build:
+            dependencies.append(f"build {contract.name}")
+        for dependency in contract.depends_on:
+            if dependency in deployable:
+                dependencies.append(f"deploy {dependency}")
+            else:
+                logger.debug(
+                    f"{contract.name} depends on {dependency}, which is not being deployed"
+                )
+        tasks.append(
+            Task(
+                f"deploy {contract.name}",
+                "deploy",
+                functools.partial(_deploy, contract.name, deploy, get_context),
+                tuple(dependencies),
+            )
+        )
+    return tasks
+
+
+def _deploy(
+    name: str,
+    deploy: Callable[["DeployContext"], None],
+    get_context: Callable[[], "DeployContext"],
+) -> None:
+    logger.info(f"Deploying {name}")
+    deploy(get_context())
+
+
+def build_and_deploy(
+    contracts_to_run: list[SmartContract],
+    artifact_path: Path,
+    jobs: int = 1,
+    *,
+    force: bool = False,
+    use_worker: bool = True,
+    compare_threshold: float | None = None,
+    baseline: Path | None = None,
+) -> None:
+    """
+    Builds and deploys contracts as a pipeline: the next contracts are compiled while a
+    deployment waits for confirmations. Each contract is deployed once it is built and
+    the contracts it depends on have been deployed; independent contracts are deployed
+    concurrently.
+    """
+    workers: queue.SimpleQueue[CompilerWorker | None] = queue.SimpleQueue()
+    started_workers: list[CompilerWorker] = []
+    for _ in range(max(1, jobs)):
+        worker = CompilerWorker.start() if use_worker else None
+        if worker is not None:
+            started_workers.append(worker)
+        workers.put(worker)
+
+    def build_with_worker(contract: SmartContract) -> None:
+        worker = workers.get()
+        try:
+            logger.info(f"Building app at {contract.path}")
+            build(
+                artifact_path / contract.name, contract.path, force=force, worker=worker
+            )
+        finally:
+            workers.put(worker)
+
+    tasks = [
+        Task(
+            f"build {contract.name}",
+            "build",
+            functools.partial(build_with_worker, contract),
+        )
+        for contract in contracts_to_run
+    ]
+    deploy_tasks = _deploy_tasks(contracts_to_run, after_build=True)
+    tasks += deploy_tasks
+
+    built_since = time.time()
+    try:
+        run_dag(tasks, {"build": jobs, "deploy": len(deploy_tasks)})
+    finally:
+        for worker in started_workers:
+            worker.close()
+    report_build(
+        artifact_path,
+        [contract.name for contract in contracts_to_run],
+        built_since,
+        compare_threshold,
+        baseline,
+    )
 
 
 # --------------------------- Main Logic --------------------------- #
 
 
-def main(action: str, contract_name: str | None = None) -> None:
+def configure_deploy_environment() -> None:
+    """Configures algokit_utils and loads environment variables for deployments."""
+    from algokit_utils.config import config
+    from dotenv import load_dotenv
+
+    # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
+    # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
+    # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
+    config.configure(debug=True, trace_all=False)
+
+    logger.info("Loading .env")
+    load_dotenv()
+
+
+def main(
+    action: str,
+    contract_name: str | None = None,
+    jobs: int = 1,
+    *,
+    force: bool = False,
+    use_worker: bool = True,
+    compare_threshold: float | None = None,
+    baseline: Path | None = None,
+) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
     # Filter contracts based on an optional specific contract name.
@@ -172,11 +727,21 @@ def main(action: str, contract_name: str | None = None) -> None:
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_contracts(
+                filtered_contracts,
+                artifact_path,
+                jobs,
+                force=force,
+                use_worker=use_worker,
+                compare_threshold=compare_threshold,
+                baseline=baseline,
+            )
         case "deploy":
+            configure_deploy_environment()
             for contract in filtered_contracts:
+                # Logic signatures and other folders without a deploy function have no app spec.
+                if contract.deploy is None:
+                    continue
                 output_dir = artifact_path / contract.name
                 app_spec_file_name = next(
                     (
@@ -188,24 +753,86 @@ def main(action: str, contract_name: str | None = None) -> None:
                 )
                 if app_spec_file_name is None:
                     raise Exception("Could not deploy app, .arc56.json file not found")
-                if contract.deploy:
-                    logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+            deploy_tasks = _deploy_tasks(filtered_contracts, after_build=False)
+            run_dag(deploy_tasks, {"deploy": len(deploy_tasks)})
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
-                if contract.deploy:
-                    logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+            configure_deploy_environment()
+            build_and_deploy(
+                filtered_contracts,
+                artifact_path,
+                jobs,
+                force=force,
+                use_worker=use_worker,
+                compare_threshold=compare_threshold,
+                baseline=baseline,
+            )
+        case "watch":
+            watch(filtered_contracts, artifact_path, use_worker=use_worker)
         case _:
             logger.error(f"Unknown action: {action}")
 
 
+class Arguments(argparse.Namespace):
+    """Typed view of the command line arguments."""
+
+    action: str
+    contract_name: str | None
+    jobs: int
+    force: bool
+    no_worker: bool
+    compare: bool
+    baseline: Path | None
+    threshold: float
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    parser = argparse.ArgumentParser(description="Build and/or deploy smart contracts")
+    parser.add_argument(
+        "action", nargs="?", default="all", help="build, deploy, all or watch"
+    )
+    parser.add_argument(
+        "contract_name", nargs="?", help="only act on this contract folder"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of contracts to build in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild even if the build manifest shows the artifacts are up to date",
+    )
+    parser.add_argument(
+        "--no-worker",
+        action="store_true",
+        help="compile through the algokit CLI instead of a warm compiler worker",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="fail when sizes or build times regress against the previous build report",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="build report to compare against with --compare (default: the previous build report)",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="regression threshold for --compare, in percent (default: 10)",
+    )
+    args = parser.parse_args(namespace=Arguments())
+    main(
+        args.action,
+        args.contract_name,
+        jobs=args.jobs,
+        force=args.force,
+        use_worker=not args.no_worker,
+        compare_threshold=args.threshold if args.compare else None,
+        baseline=args.baseline,
+    )
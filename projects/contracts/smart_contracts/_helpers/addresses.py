@@ -0,0 +1,23 @@
+"""Offline conversion between Algorand addresses and 32 byte public keys, without algosdk."""
+
+import base64
+import hashlib
+
+CHECKSUM_SIZE = 4
+
+
+def _checksum(public_key: bytes) -> bytes:
+    return hashlib.new("sha512_256", public_key).digest()[-CHECKSUM_SIZE:]
+
+
+def encode_address(public_key: bytes) -> str:
+    return base64.b32encode(public_key + _checksum(public_key)).decode().rstrip("=")
+
+
+def decode_address(address: str) -> bytes:
+    """Returns the public key of an address, raising if its checksum does not match."""
+    decoded = base64.b32decode(address + "=" * (-len(address) % 8))
+    public_key, checksum = decoded[:-CHECKSUM_SIZE], decoded[-CHECKSUM_SIZE:]
+    if len(public_key) != 32 or checksum != _checksum(public_key):
+        raise Exception(f"Invalid address: {address}")
+    return public_key
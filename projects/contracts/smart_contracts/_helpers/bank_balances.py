@@ -0,0 +1,72 @@
+"""
+Bulk Bank balance reads.
+
+fetch_balances asks `Bank.balances` for the balances of many accounts by simulating
+read-only calls, so no transaction is sent and the box references are filled in by
+simulate. Each simulate request carries one `balances` call with up to
+MAX_BALANCE_QUERIES (63) accounts, the most its arguments can hold, padded to a full group
+with empty `balances` calls: every account can need two box references, its per-account
+box and its bucket box, and simulate still holds the group to 8 references per app call,
+so a group of 16 calls has room for 64 accounts. That makes 63 balances per algod request,
+and larger account lists are paged over several requests.
+"""
+
+from collections.abc import Sequence
+from pathlib import Path
+
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer, EmptySigner
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.models import SimulateRequest
+
+# Bank.MAX_BALANCE_QUERIES, the most accounts one balances call takes.
+MAX_BALANCE_QUERIES = 63
+CALLS_PER_GROUP = 16
+MAX_EXTRA_OPCODE_BUDGET = 320_000
+
+app_spec_path = Path(__file__).parent.parent / "artifacts" / "bank" / "Bank.arc56.json"
+
+
+def fetch_balances(
+    algod: AlgodClient, app_id: int, sender: str, accounts: Sequence[str]
+) -> dict[str, int]:
+    """
+    Returns the recorded balance of every account, zero for accounts without deposits.
+    sender only needs to exist on the network; nothing is signed.
+    """
+    method = Contract.from_json(
+        app_spec_path.read_text(encoding="utf-8")
+    ).get_method_by_name("balances")
+    sp = algod.suggested_params()
+    balances: dict[str, int] = {}
+    for page_start in range(0, len(accounts), MAX_BALANCE_QUERIES):
+        page = list(accounts[page_start : page_start + MAX_BALANCE_QUERIES])
+        atc = AtomicTransactionComposer()
+        # The empty calls only lend their reference slots to the first call.
+        for call_accounts in [page] + [[]] * (CALLS_PER_GROUP - 1):
+            method_args: list[object] = [call_accounts]
+            atc.add_method_call(
+                app_id=app_id,
+                method=method,
+                sender=sender,
+                sp=sp,
+                signer=EmptySigner(),
+                method_args=method_args,
+                # Keeps the empty calls from being identical transactions.
+                note=len(atc.txn_list).to_bytes(1, "big"),
+            )
+        response = atc.simulate(
+            algod,
+            SimulateRequest(
+                txn_groups=[],
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                # Scanning deposit buckets can exceed the pooled budget of the group.
+                extra_opcode_budget=MAX_EXTRA_OPCODE_BUDGET,
+            ),
+        )
+        if response.failure_message:
+            raise Exception(f"Could not read balances: {response.failure_message}")
+        amounts: list[int] = response.abi_results[0].return_value
+        balances.update(zip(page, amounts, strict=True))
+    return balances
@@ -0,0 +1,59 @@
+"""
+Client-side view of the Bank contract's bucketed deposit storage.
+
+Balances are stored in `DEPOSIT_BUCKETS` boxes named "k" + uint64 bucket index, chosen
+from the first 8 bytes of the SHA-256 of the depositor's public key. Each bucket box is
+24 slots of (32 byte public key, uint64 balance); free slots are all zeros.
+"""
+
+import hashlib
+
+SLOT_SIZE = 40
+SLOTS_PER_BUCKET = 24
+BUCKET_SIZE = SLOT_SIZE * SLOTS_PER_BUCKET
+BUCKET_KEY_PREFIX = b"k"
+ACCOUNT_MIN_BALANCE = 100_000
+
+
+def box_min_balance(key: bytes, size: int) -> int:
+    """Minimum balance a box adds to its app account, 2500 + 400 * (key + value) microAlgos."""
+    return 2_500 + 400 * (len(key) + size)
+
+
+# 390_100 microAlgos, against 18_500 for a per-account box.
+BUCKET_MIN_BALANCE = box_min_balance(BUCKET_KEY_PREFIX + bytes(8), BUCKET_SIZE)
+
+
+def bucket_count(expected_depositors: int) -> int:
+    """Buckets that fit the expected depositors, 24 to a bucket on average."""
+    return -(-expected_depositors // SLOTS_PER_BUCKET)
+
+
+def app_min_balance(buckets: int) -> int:
+    """Minimum balance of a Bank app account once all of its bucket boxes exist."""
+    return ACCOUNT_MIN_BALANCE + buckets * BUCKET_MIN_BALANCE
+
+
+def bucket_key(public_key: bytes, buckets: int) -> bytes:
+    """Name of the box holding the account's balance, for box references."""
+    bucket = int.from_bytes(hashlib.sha256(public_key).digest()[:8], "big") % buckets
+    return BUCKET_KEY_PREFIX + bucket.to_bytes(8, "big")
+
+
+def is_bucket_key(box_name: bytes) -> bool:
+    """Bucket box names are 9 bytes, per-account deposit boxes are 32 byte public keys."""
+    return len(box_name) == len(BUCKET_KEY_PREFIX) + 8 and box_name.startswith(
+        BUCKET_KEY_PREFIX
+    )
+
+
+def decode_bucket(value: bytes) -> dict[bytes, int]:
+    """Maps the public key of every depositor in a bucket box to its balance."""
+    balances: dict[bytes, int] = {}
+    for offset in range(0, len(value), SLOT_SIZE):
+        public_key = value[offset : offset + 32]
+        if any(public_key):
+            balances[public_key] = int.from_bytes(
+                value[offset + 32 : offset + SLOT_SIZE], "big"
+            )
+    return balances
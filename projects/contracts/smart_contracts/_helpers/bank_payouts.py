@@ -0,0 +1,62 @@
+"""
+Client helper for `Bank.withdraw_batch`.
+
+The contract pays every payout with a zero-fee inner payment, so the app call pays
+1 + len(payouts) minimum fees through fee pooling. Each receiver must also be available to
+the app when the inner group is submitted, which group resource sharing allows for any
+account referenced by an app call in the same group. An app call references at most 4
+accounts, so send_payouts puts the first 4 receivers on the withdraw_batch call, leaving
+room for the sender's deposit box references, and every further 4 on an empty `balances`
+call that only carries references: 16 receivers take the withdraw_batch call and 3 more.
+"""
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.bank.bank_client import BankClient
+
+ACCOUNTS_PER_CALL = 4
+MAX_PAYOUTS = 16
+MIN_TXN_FEE = 1_000
+
+
+def receiver_references(payouts: Sequence[tuple[str, int]]) -> list[list[str]]:
+    """Splits the distinct receivers into the account references of each call of the group."""
+    receivers: list[str] = []
+    for receiver, _amount in payouts:
+        if receiver not in receivers:
+            receivers.append(receiver)
+    return [
+        receivers[start : start + ACCOUNTS_PER_CALL]
+        for start in range(0, len(receivers), ACCOUNTS_PER_CALL)
+    ]
+
+
+def send_payouts(app_client: "BankClient", payouts: Sequence[tuple[str, int]]) -> int:
+    """
+    Pays the client's default sender's balance out to the (receiver address, microAlgos)
+    payouts and returns the sender's remaining balance.
+    """
+    import algokit_utils
+
+    if not 0 < len(payouts) <= MAX_PAYOUTS:
+        raise Exception(f"withdraw_batch takes between 1 and {MAX_PAYOUTS} payouts")
+    references = receiver_references(payouts)
+    group = app_client.new_group().withdraw_batch(
+        args=(list(payouts),),
+        params=algokit_utils.CommonAppCallParams(
+            account_references=references[0],
+            # The call's own fee and one for each zero-fee inner payment.
+            static_fee=algokit_utils.AlgoAmount(
+                micro_algo=MIN_TXN_FEE * (1 + len(payouts))
+            ),
+        ),
+    )
+    for accounts in references[1:]:
+        group = group.balances(
+            args=([],),
+            params=algokit_utils.CommonAppCallParams(account_references=accounts),
+        )
+    result = group.send()
+    return cast(int, result.returns[0].value)
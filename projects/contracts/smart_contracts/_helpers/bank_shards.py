@@ -0,0 +1,104 @@
+"""
+Client-side routing for a Bank sharded over several apps.
+
+Each depositor belongs to exactly one shard, chosen by rendezvous hashing of its public
+key over the shard indices: every client computes the same shard without a lookup.
+
+The shard set is fixed once a deposit has been made. Adding a shard routes the depositors
+that now rank it highest (about 1 in K+1) to an app that has no balance for them, and only
+the depositor can withdraw from the old shard to move it. Deploy refuses to change the
+number of shards of a Bank that has taken deposits, see check_shard_count.
+"""
+
+import hashlib
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from smart_contracts._helpers.deployments import recorded_app_id
+
+if TYPE_CHECKING:
+    import algokit_utils
+
+BANK_APP_NAME = "Bank"
+
+
+def shard_app_name(index: int) -> str:
+    """Shard 0 keeps the unsharded app name, so an existing Bank app becomes the first shard."""
+    return BANK_APP_NAME if index == 0 else f"{BANK_APP_NAME}-{index}"
+
+
+def shard_index(public_key: bytes, shards: int) -> int:
+    """Returns the shard of the depositor with this 32 byte public key."""
+    if shards < 1:
+        raise Exception("A sharded Bank needs at least one shard")
+
+    def rank(index: int) -> bytes:
+        return hashlib.sha256(public_key + index.to_bytes(8, "big")).digest()
+
+    return max(range(shards), key=rank)
+
+
+def recorded_shard_ids(algorand: "algokit_utils.AlgorandClient") -> list[int]:
+    """App ids of the shards recorded in the deployment lockfile, in shard order."""
+    app_ids: list[int] = []
+    while (
+        app_id := recorded_app_id(algorand, shard_app_name(len(app_ids)))
+    ) is not None:
+        app_ids.append(app_id)
+    return app_ids
+
+
+def check_shard_count(algorand: "algokit_utils.AlgorandClient", shards: int) -> None:
+    """Raises if deploying `shards` shards would re-route depositors of the recorded shards."""
+    app_ids = recorded_shard_ids(algorand)
+    if (
+        app_ids
+        and shards != len(app_ids)
+        and ShardRouter(app_ids).total_deposit(algorand) > 0
+    ):
+        raise Exception(
+            f"The Bank has taken deposits on {len(app_ids)} shards; deploying {shards} "
+            "would route depositors to shards without their balances"
+        )
+
+
+class ShardRouter:
+    """Maps depositors to the app ids of the Bank shards, given in shard order."""
+
+    def __init__(self, app_ids: Sequence[int]) -> None:
+        self.app_ids = list(app_ids)
+
+    @classmethod
+    def from_deployments(
+        cls, algorand: "algokit_utils.AlgorandClient"
+    ) -> "ShardRouter":
+        """
+        Routes to the shards recorded in the deployment lockfile for the connected network,
+        after checking that each recorded app still exists.
+        """
+        app_ids = recorded_shard_ids(algorand)
+        if not app_ids:
+            raise Exception(
+                "No Bank shards recorded for this network, deploy the bank contract first"
+            )
+        for index, app_id in enumerate(app_ids):
+            try:
+                algorand.app.get_by_id(app_id)
+            except Exception:
+                raise Exception(
+                    f"{shard_app_name(index)} app {app_id} from the deployment lockfile "
+                    "does not exist on this network, deploy the bank contract again"
+                ) from None
+        return cls(app_ids)
+
+    def app_id_for(self, public_key: bytes) -> int:
+        return self.app_ids[shard_index(public_key, len(self.app_ids))]
+
+    def total_deposit(self, algorand: "algokit_utils.AlgorandClient") -> int:
+        """Sums `total_deposit` over all shards, one application lookup per shard."""
+        total = 0
+        for app_id in self.app_ids:
+            state = algorand.app.get_by_id(app_id).global_state.get("total_deposit")
+            if state is not None and isinstance(state.value, int):
+                total += state.value
+        return total
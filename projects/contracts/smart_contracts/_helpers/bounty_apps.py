@@ -0,0 +1,77 @@
+"""
+Helpers for scripts that launch each bounty as its own Bounty app.
+"""
+
+import base64
+from collections.abc import Iterator, Mapping, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+# Approved and Cancelled: the app holds no escrow and can be reopened.
+TERMINAL_STATUSES = (3, 4)
+
+
+def decode_global_state(
+    global_state: Sequence[Mapping[str, object]],
+) -> dict[str, int | bytes]:
+    """Decodes global state as returned by algod into key name to uint or bytes value."""
+    state: dict[str, int | bytes] = {}
+    for entry in global_state:
+        value: Mapping[str, object] = entry["value"]  # type: ignore[assignment]
+        key = base64.b64decode(str(entry["key"])).decode()
+        # type 1 is bytes, type 2 is uint
+        state[key] = (
+            base64.b64decode(str(value["bytes"]))
+            if value["type"] == 1
+            else int(str(value["uint"]))
+        )
+    return state
+
+
+def _created_bounty_apps(
+    algod: "AlgodClient", creator: str
+) -> Iterator[tuple[int, bytes, dict[str, int | bytes]]]:
+    """Yields the id, approval program and decoded global state of every app created by `creator`."""
+    account_info = algod.account_info(creator)
+    created_apps: list[Mapping[str, object]] = account_info.get("created-apps", [])  # type: ignore[union-attr]
+    for app in created_apps:
+        params: Mapping[str, object] = app["params"]  # type: ignore[assignment]
+        global_state: list[Mapping[str, object]] = params.get("global-state", [])  # type: ignore[assignment]
+        yield (
+            int(str(app["id"])),
+            base64.b64decode(str(params["approval-program"])),
+            decode_global_state(global_state),
+        )
+
+
+def find_recyclable_bounty(
+    algod: "AlgodClient", creator: str, approval_program: bytes
+) -> int | None:
+    """
+    Returns the id of a finished Bounty app created by `creator` and running exactly
+    `approval_program` (so it supports reopen and has the same template values), or
+    None if there is none and a new app is needed.
+    """
+    for app_id, program, state in _created_bounty_apps(algod, creator):
+        if program == approval_program and state.get("status") in TERMINAL_STATUSES:
+            return app_id
+    return None
+
+
+def deletable_bounty_apps(
+    algod: "AlgodClient", creator: str, delete_selector: bytes
+) -> list[int]:
+    """
+    Returns the finished Bounty apps created by `creator` that can be deleted: their
+    program dispatches the delete method, recognised by its 4 byte selector, so apps built
+    before delete existed are left alone.
+    """
+    return [
+        app_id
+        for app_id, program, state in _created_bounty_apps(algod, creator)
+        if state.get("status") in TERMINAL_STATUSES
+        and "creator" in state
+        and delete_selector in program
+    ]
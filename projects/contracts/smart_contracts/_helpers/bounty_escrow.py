@@ -0,0 +1,43 @@
+"""
+Offline derivation of BountyEscrow accounts.
+
+A BountyEscrow bounty is a logic signature contract account instead of an app. Its program
+is the built template with the creator, worker and refund round spliced in, and its
+address is the hash of that program, so both are derived without a node: creating the
+bounty is a single payment of the bounty amount to the address.
+"""
+
+import hashlib
+from collections.abc import Mapping
+
+from smart_contracts._helpers.addresses import decode_address, encode_address
+from smart_contracts._helpers.templates import (
+    LOGICSIG_PROGRAM,
+    built_template,
+    render_program,
+)
+
+ESCROW_CONTRACT_NAME = "bounty_escrow"
+ESCROW_LOGICSIG_NAME = "BountyEscrow"
+
+
+def escrow_program(
+    creator: str,
+    worker: str,
+    refund_round: int,
+    template: Mapping[str, object] | None = None,
+) -> bytes:
+    """The escrow program of one bounty, from the template of the last build by default."""
+    if template is None:
+        template = built_template(ESCROW_CONTRACT_NAME, ESCROW_LOGICSIG_NAME)
+    values: dict[str, int | bytes] = {
+        "CREATOR": decode_address(creator),
+        "WORKER": decode_address(worker),
+        "REFUND_ROUND": refund_round,
+    }
+    return render_program(template, LOGICSIG_PROGRAM, values)
+
+
+def escrow_address(program: bytes) -> str:
+    """The address of the contract account controlled by a logic signature program."""
+    return encode_address(hashlib.new("sha512_256", b"Program" + program).digest())
@@ -0,0 +1,84 @@
+"""
+Decoding of the ARC-28 events emitted by the Bounty contracts.
+
+Every bounty state transition logs a BountyStatusChanged event, so an indexer can follow
+all bounty apps with one pass over blocks instead of reading each app's global state.
+"""
+
+import dataclasses
+import hashlib
+import struct
+from collections.abc import Iterator, Mapping
+
+from smart_contracts._helpers.addresses import encode_address
+
+STATUS_CHANGED_SIGNATURE = "BountyStatusChanged(address,address,uint64,uint64)"
+STATUS_CHANGED_SELECTOR = hashlib.new(
+    "sha512_256", STATUS_CHANGED_SIGNATURE.encode()
+).digest()[:4]
+STATUS_NAMES = ("Open", "Claimed", "Submitted", "Approved", "Cancelled")
+
+_STATUS_CHANGED_LAYOUT = struct.Struct(">32s32sQQ")
+
+
+@dataclasses.dataclass(frozen=True)
+class BountyStatusChanged:
+    app_id: int
+    creator: str
+    worker: str
+    amount: int
+    status: int
+
+    @property
+    def status_name(self) -> str:
+        return (
+            STATUS_NAMES[self.status]
+            if self.status < len(STATUS_NAMES)
+            else str(self.status)
+        )
+
+
+def decode_status_changed(app_id: int, log: bytes) -> BountyStatusChanged | None:
+    """Decodes an application log entry, or returns None if it is not a BountyStatusChanged event."""
+    if (
+        log[:4] != STATUS_CHANGED_SELECTOR
+        or len(log) != 4 + _STATUS_CHANGED_LAYOUT.size
+    ):
+        return None
+    fields: tuple[bytes, bytes, int, int] = _STATUS_CHANGED_LAYOUT.unpack(log[4:])
+    creator, worker, amount, status = fields
+    return BountyStatusChanged(
+        app_id=app_id,
+        creator=encode_address(creator),
+        worker=encode_address(worker),
+        amount=amount,
+        status=status,
+    )
+
+
+def _transaction_events(
+    signed_txn: Mapping[str, object],
+) -> Iterator[BountyStatusChanged]:
+    txn: Mapping[str, object] = signed_txn.get("txn", {})  # type: ignore[assignment]
+    apply_data: Mapping[str, object] = signed_txn.get("dt", {})  # type: ignore[assignment]
+    # App creations carry the new app id in the apply data rather than the transaction.
+    app_id = int(str(txn.get("apid") or signed_txn.get("apid") or 0))
+    logs: list[bytes] = apply_data.get("lg", [])  # type: ignore[assignment]
+    for log in logs:
+        event = decode_status_changed(app_id, log)
+        if event is not None:
+            yield event
+    inner_txns: list[Mapping[str, object]] = apply_data.get("itx", [])  # type: ignore[assignment]
+    for inner_txn in inner_txns:
+        yield from _transaction_events(inner_txn)
+
+
+def block_events(block: Mapping[str, object]) -> Iterator[BountyStatusChanged]:
+    """
+    Yields the bounty events of a block as returned by algod's block endpoint in msgpack
+    format, including events logged by inner transactions, in transaction order.
+    """
+    body: Mapping[str, object] = block.get("block", block)  # type: ignore[assignment]
+    signed_txns: list[Mapping[str, object]] = body.get("txns", [])  # type: ignore[assignment]
+    for signed_txn in signed_txns:
+        yield from _transaction_events(signed_txn)
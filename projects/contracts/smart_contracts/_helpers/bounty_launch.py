@@ -0,0 +1,123 @@
+"""
+Launching a bounty as a new Bounty app in two confirmation rounds.
+
+The app id is only known once the app creation is confirmed, so creating the app takes
+one round. The minimum balance payment, the escrow payment and the create_bounty call
+then go out as one atomic group in the second round, instead of a round for the minimum
+balance and another for the escrow.
+"""
+
+import json
+from collections.abc import Mapping
+from pathlib import Path
+
+from algosdk import transaction
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
+
+MIN_BALANCE = 100_000  # 0.1 ALGO in microAlgos
+WAIT_ROUNDS = 4
+
+app_spec_path = (
+    Path(__file__).parent.parent / "artifacts" / "bounty" / "Bounty.arc56.json"
+)
+
+
+def _load_app_spec() -> Mapping[str, object]:
+    app_spec: Mapping[str, object] = json.loads(
+        app_spec_path.read_text(encoding="utf-8")
+    )
+    return app_spec
+
+
+def create_bounty_app(
+    algod: AlgodClient,
+    creator: str,
+    signer: TransactionSigner,
+    approval_program: bytes,
+    clear_program: bytes,
+) -> int:
+    """Creates an app running the given Bounty programs and returns its id once confirmed."""
+    schema: Mapping[str, Mapping[str, int]] = _load_app_spec()["state"]["schema"]  # type: ignore[index]
+    create_txn = transaction.ApplicationCreateTxn(
+        sender=creator,
+        sp=algod.suggested_params(),
+        on_complete=transaction.OnComplete.NoOpOC,
+        approval_program=approval_program,
+        clear_program=clear_program,
+        global_schema=transaction.StateSchema(
+            num_uints=schema["global"]["ints"],
+            num_byte_slices=schema["global"]["bytes"],
+        ),
+        local_schema=transaction.StateSchema(
+            num_uints=schema["local"]["ints"], num_byte_slices=schema["local"]["bytes"]
+        ),
+    )
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(TransactionWithSigner(create_txn, signer))
+    txid = atc.execute(algod, WAIT_ROUNDS).tx_ids[0]
+    confirmation: dict[str, int] | bytes = algod.pending_transaction_info(txid)
+    if not isinstance(confirmation, dict):
+        raise Exception(f"Unexpected msgpack response for app creation {txid}")
+    return confirmation["application-index"]
+
+
+def escrow_bounty(
+    algod: AlgodClient,
+    app_id: int,
+    creator: str,
+    signer: TransactionSigner,
+    method_name: str,
+    amount: int,
+    *,
+    min_balance: int = 0,
+) -> list[str]:
+    """
+    Calls create_bounty or reopen with the bounty payment grouped in. A non-zero
+    min_balance is paid to the app account in the same group, ahead of the escrow.
+    """
+    contract = Contract.from_json(json.dumps(_load_app_spec()))
+    sp = algod.suggested_params()
+    app_address = get_application_address(app_id)
+    atc = AtomicTransactionComposer()
+    if min_balance:
+        min_balance_txn = transaction.PaymentTxn(
+            sender=creator, sp=sp, receiver=app_address, amt=min_balance
+        )
+        atc.add_transaction(TransactionWithSigner(min_balance_txn, signer))
+    payment_txn = transaction.PaymentTxn(
+        sender=creator, sp=sp, receiver=app_address, amt=amount
+    )
+    method_args: list[object] = [TransactionWithSigner(payment_txn, signer), amount]
+    atc.add_method_call(
+        app_id=app_id,
+        method=contract.get_method_by_name(method_name),
+        sender=creator,
+        sp=sp,
+        signer=signer,
+        method_args=method_args,
+    )
+    tx_ids: list[str] = atc.execute(algod, WAIT_ROUNDS).tx_ids
+    return tx_ids
+
+
+def launch_bounty(
+    algod: AlgodClient,
+    creator: str,
+    signer: TransactionSigner,
+    approval_program: bytes,
+    clear_program: bytes,
+    amount: int,
+) -> int:
+    """Creates a Bounty app and escrows amount in it in two confirmation rounds, returns the app id."""
+    app_id = create_bounty_app(algod, creator, signer, approval_program, clear_program)
+    escrow_bounty(
+        algod, app_id, creator, signer, "create_bounty", amount, min_balance=MIN_BALANCE
+    )
+    return app_id
@@ -0,0 +1,156 @@
+import ast
+import functools
+import hashlib
+import importlib.metadata
+import json
+import logging
+import subprocess
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "build_manifest.json"
+
+# Root of the importable `smart_contracts` package, used to resolve contract imports to files.
+package_root = Path(__file__).parent.parent
+
+
+def _toolchain_versions() -> dict[str, str]:
+    """Returns the versions of the tools that produce the build artifacts."""
+    versions: dict[str, str] = {}
+    for package in ("puyapy", "algokit-client-generator"):
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = "unknown"
+    try:
+        result = subprocess.run(
+            ["algokit", "--version"], capture_output=True, text=True, check=False
+        )
+        versions["algokit"] = result.stdout.strip() or "unknown"
+    except OSError:
+        versions["algokit"] = "unknown"
+    return versions
+
+
+toolchain_versions = functools.cache(_toolchain_versions)
+
+
+def _module_file(module_name: str) -> Path | None:
+    """Maps a module inside the smart_contracts package to its source file."""
+    parts = module_name.split(".")
+    if parts[0] != package_root.name:
+        return None
+    module_path = package_root.parent.joinpath(*parts)
+    for candidate in (module_path.with_suffix(".py"), module_path / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _module_name(source: Path) -> str:
+    relative = source.relative_to(package_root.parent).with_suffix("")
+    parts = list(relative.parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _imported_modules(source: Path) -> set[str]:
+    """Returns the absolute names of every module imported by the source file."""
+    tree = ast.parse(source.read_text(encoding="utf-8"), filename=str(source))
+    current = _module_name(source).split(".")
+    package = current if source.name == "__init__.py" else current[:-1]
+    modules: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package[: len(package) - node.level + 1]
+                prefix = ".".join(base + ([node.module] if node.module else []))
+            else:
+                prefix = node.module or ""
+            modules.add(prefix)
+            # `from package import module` imports a submodule rather than a name
+            modules.update(f"{prefix}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def contract_sources(contract_path: Path) -> list[Path]:
+    """
+    Returns contract.py together with every module of the smart_contracts package
+    it imports, directly or transitively.
+    """
+    contract_path = contract_path.resolve()
+    sources = {contract_path}
+    pending = [contract_path]
+    while pending:
+        for module_name in _imported_modules(pending.pop()):
+            module_file = _module_file(module_name)
+            if module_file is not None and module_file.resolve() not in sources:
+                sources.add(module_file.resolve())
+                pending.append(module_file.resolve())
+    return sorted(sources)
+
+
+def compute_build_hash(contract_path: Path, flags: list[str]) -> str:
+    """Content hash of everything that determines the artifacts built for a contract."""
+    digest = hashlib.sha256()
+    for source in contract_sources(contract_path):
+        digest.update(str(source.relative_to(package_root.parent).as_posix()).encode())
+        digest.update(b"\0")
+        digest.update(source.read_bytes())
+        digest.update(b"\0")
+    digest.update(json.dumps(toolchain_versions(), sort_keys=True).encode())
+    digest.update(json.dumps(flags).encode())
+    return digest.hexdigest()
+
+
+def read_manifest(output_dir: Path) -> dict[str, object] | None:
+    """Returns the build manifest stored in output_dir, if there is a readable one."""
+    manifest_path = output_dir / MANIFEST_FILE_NAME
+    if not manifest_path.exists():
+        return None
+    try:
+        manifest: dict[str, object] = json.loads(
+            manifest_path.read_text(encoding="utf-8")
+        )
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring unreadable build manifest {manifest_path}")
+        return None
+    return manifest
+
+
+def is_up_to_date(output_dir: Path, build_hash: str) -> bool:
+    """Checks whether output_dir holds artifacts built from inputs with the given hash."""
+    manifest = read_manifest(output_dir)
+    if manifest is None or manifest.get("hash") != build_hash:
+        return False
+    outputs = manifest.get("outputs", [])
+    return isinstance(outputs, list) and all(
+        (output_dir / str(name)).exists() for name in outputs
+    )
+
+
+def write_manifest(
+    output_dir: Path, contract_path: Path, build_hash: str, flags: list[str]
+) -> None:
+    """Records the inputs and outputs of a completed build in output_dir."""
+    manifest = {
+        "hash": build_hash,
+        "sources": [
+            source.relative_to(package_root.parent).as_posix()
+            for source in contract_sources(contract_path)
+        ],
+        "toolchain": toolchain_versions(),
+        "flags": flags,
+        "outputs": sorted(
+            file.name
+            for file in output_dir.iterdir()
+            if file.is_file() and file.name != MANIFEST_FILE_NAME
+        ),
+    }
+    (output_dir / MANIFEST_FILE_NAME).write_text(
+        json.dumps(manifest, indent=2) + "\n", encoding="utf-8"
+    )
@@ -0,0 +1,219 @@
+import base64
+import json
+import logging
+from pathlib import Path
+from typing import cast
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE_NAME = "build_stats.json"
+REPORT_FILE_NAME = "build_report.json"
+
+# Largest approval plus clear program the AVM accepts (2048 bytes plus 3 extra pages).
+MAX_PROGRAM_SIZE = 8192
+# Programs above this size need extra program pages at creation.
+PAGE_SIZE = 2048
+# Largest logic signature program the AVM accepts, arguments included.
+MAX_LOGICSIG_SIZE = 1000
+
+# Program fields compared by find_regressions.
+SIZE_FIELDS = ("approval_bytes", "clear_bytes", "program_bytes", "teal_lines")
+TIME_FIELDS = ("compile_seconds", "generate_seconds")
+# Timing differences below this many seconds are treated as noise.
+MIN_TIME_DELTA = 0.1
+
+Report = dict[str, dict[str, object]]
+# Program sizes of one contract folder, by app or logic signature name.
+Programs = dict[str, dict[str, object]]
+
+
+def write_build_stats(
+    output_dir: Path,
+    *,
+    compile_seconds: float,
+    generate_seconds: float,
+    peak_rss_kb: int | None,
+) -> None:
+    """Records how long the last build of a contract took and its peak compiler memory."""
+    stats = {
+        "compile_seconds": round(compile_seconds, 3),
+        "generate_seconds": round(generate_seconds, 3),
+        "peak_rss_kb": peak_rss_kb,
+    }
+    (output_dir / STATS_FILE_NAME).write_text(
+        json.dumps(stats, indent=2) + "\n", encoding="utf-8"
+    )
+
+
+def _read_json(path: Path) -> dict[str, object] | None:
+    if not path.exists():
+        return None
+    try:
+        content: dict[str, object] = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring unreadable {path}")
+        return None
+    return content
+
+
+def _teal_lines(teal_path: Path) -> int:
+    """Counts TEAL lines that are neither blank nor comments."""
+    lines = (
+        line.strip() for line in teal_path.read_text(encoding="utf-8").splitlines()
+    )
+    return sum(1 for line in lines if line and not line.startswith("//"))
+
+
+def program_reports(output_dir: Path) -> Programs:
+    """
+    Sizes of each program built into output_dir, by app or logic signature name: an app's
+    approval_bytes and clear_bytes, a logic signature's program_bytes, and their TEAL lines.
+    """
+    programs: Programs = {}
+    for app_spec_path in sorted(output_dir.glob("*.arc56.json")):
+        app_name = app_spec_path.name.removesuffix(".arc56.json")
+        byte_code = (_read_json(app_spec_path) or {}).get("byteCode")
+        entry: dict[str, object] = {"approval_bytes": None, "clear_bytes": None}
+        if isinstance(byte_code, dict):
+            for program_name in ("approval", "clear"):
+                program = base64.b64decode(str(byte_code[program_name]))
+                entry[f"{program_name}_bytes"] = len(program)
+        entry["teal_lines"] = sum(
+            _teal_lines(teal_path)
+            for teal_path in sorted(output_dir.glob(f"{app_name}.*.teal"))
+        )
+        programs[app_name] = entry
+    for teal_path in sorted(output_dir.glob("*.teal")):
+        name = teal_path.name.removesuffix(".teal")
+        if name.rpartition(".")[0] in programs:
+            continue
+        # Logic signatures have no app spec; their bytecode is assembled next to the TEAL.
+        bytecode_path = output_dir / f"{name}.bin"
+        programs[name] = {
+            "program_bytes": (
+                len(bytecode_path.read_bytes()) if bytecode_path.exists() else None
+            ),
+            "teal_lines": _teal_lines(teal_path),
+        }
+    return programs
+
+
+def contract_report(output_dir: Path) -> dict[str, object]:
+    """Collects build statistics and the sizes of each program in one contract's artifacts."""
+    entry: dict[str, object] = dict(_read_json(output_dir / STATS_FILE_NAME) or {})
+    entry["programs"] = program_reports(output_dir)
+    return entry
+
+
+def _programs(entry: dict[str, object]) -> Programs:
+    programs = entry.get("programs")
+    return cast(Programs, programs) if isinstance(programs, dict) else {}
+
+
+def read_report(report_path: Path) -> Report | None:
+    """Returns the contract entries of a build report, or None if there is no readable report."""
+    content = _read_json(report_path)
+    if content is None or not isinstance(content.get("contracts"), dict):
+        return None
+    return dict(cast(Report, content["contracts"]))
+
+
+def update_report(
+    previous: Report | None, artifact_path: Path, names: list[str], built_since: float
+) -> Report:
+    """
+    Returns the previous report updated with the given contracts, keeping the entries of
+    contracts that were not part of this build. Contracts whose build stats predate
+    `built_since` (a timestamp) were skipped as up to date and are marked as cached.
+    """
+    current: Report = dict(previous or {})
+    for name in names:
+        stats_path = artifact_path / name / STATS_FILE_NAME
+        entry = contract_report(artifact_path / name)
+        entry["cached"] = (
+            not stats_path.exists() or stats_path.stat().st_mtime < built_since
+        )
+        current[name] = entry
+    return current
+
+
+def write_report(report_path: Path, report: Report) -> None:
+    content: dict[str, Report] = {"contracts": report}
+    report_path.write_text(json.dumps(content, indent=2) + "\n", encoding="utf-8")
+
+
+def _number(value: object) -> float | None:
+    return float(value) if isinstance(value, int | float) else None
+
+
+def _increase(old: float | None, new: float | None) -> float | None:
+    """Percentage by which new exceeds old, or None if it does not."""
+    if old is None or new is None or new <= old:
+        return None
+    return (new - old) / old * 100 if old else float("inf")
+
+
+def find_regressions(previous: Report, current: Report, threshold: float) -> list[str]:
+    """
+    Lists program size and build time increases of more than `threshold` percent between
+    two reports. Times of contracts that were skipped because they were up to date are not
+    compared.
+    """
+    regressions: list[str] = []
+    for name, entry in sorted(current.items()):
+        before = previous.get(name)
+        if before is None:
+            continue
+        before_programs = _programs(before)
+        for program_name, sizes in sorted(_programs(entry).items()):
+            before_sizes = before_programs.get(program_name, {})
+            for field in SIZE_FIELDS:
+                old, new = _number(before_sizes.get(field)), _number(sizes.get(field))
+                increase = _increase(old, new)
+                if increase is not None and increase > threshold:
+                    regressions.append(
+                        f"{name}/{program_name}: {field} grew {increase:.1f}% ({old:g} -> {new:g})"
+                    )
+        if entry.get("cached"):
+            continue
+        for field in TIME_FIELDS:
+            old, new = _number(before.get(field)), _number(entry.get(field))
+            if old is None or new is None or new - old < MIN_TIME_DELTA:
+                continue
+            increase = _increase(old, new)
+            if increase is not None and increase > threshold:
+                regressions.append(
+                    f"{name}: {field} grew {increase:.1f}% ({old:g} -> {new:g})"
+                )
+    return regressions
+
+
+def size_warnings(current: Report) -> list[str]:
+    """
+    Lists apps whose programs need extra pages or exceed the AVM program size limit, and
+    logic signatures above the logic signature size limit.
+    """
+    warnings: list[str] = []
+    for name, entry in sorted(current.items()):
+        for program_name, sizes in sorted(_programs(entry).items()):
+            label = f"{name}/{program_name}"
+            logicsig = _number(sizes.get("program_bytes"))
+            if logicsig is not None and logicsig > MAX_LOGICSIG_SIZE:
+                warnings.append(
+                    f"{label}: logic signature is {logicsig:g} bytes, above the {MAX_LOGICSIG_SIZE} byte limit"
+                )
+            approval = _number(sizes.get("approval_bytes"))
+            clear = _number(sizes.get("clear_bytes"))
+            if approval is None or clear is None:
+                continue
+            total = int(approval + clear)
+            if total > MAX_PROGRAM_SIZE:
+                warnings.append(
+                    f"{label}: programs are {total} bytes, above the {MAX_PROGRAM_SIZE} byte limit"
+                )
+            elif total > PAGE_SIZE:
+                pages = (total - 1) // PAGE_SIZE
+                warnings.append(
+                    f"{label}: programs are {total} bytes and need {pages} extra program page(s)"
+                )
+    return warnings
@@ -0,0 +1,251 @@
+"""
+Long-lived compiler worker.
+
+Running `algokit compile python` and `algokit generate client` per contract cold-starts
+the algokit CLI, puya and the client generator every time. The worker imports puya and
+algokit_client_generator once and then runs compile and generate jobs received as JSON
+lines on stdin, answering each with a single prefixed JSON line on stdout.
+"""
+
+import io
+import json
+import logging
+import subprocess
+import sys
+import threading
+import traceback
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from types import TracebackType
+from typing import TextIO, TypedDict
+
+logger = logging.getLogger(__name__)
+
+# Marks protocol lines; anything else the worker prints belongs to the running job.
+RESPONSE_PREFIX = "@@compiler-worker "
+
+# Directory containing the smart_contracts package, used as the worker's working directory.
+project_root = Path(__file__).parent.parent.parent
+
+
+class _Job(TypedDict):
+    job: str
+    args: list[str]
+
+
+class CompilerWorker:
+    """Client side of a compiler worker process."""
+
+    def __init__(self, process: subprocess.Popen[str]) -> None:
+        self._process = process
+        self._lock = threading.Lock()
+        # Peak resident set size of the worker in KiB during the last job, if known. Where
+        # it cannot be reset per job (outside Linux) it is the worker's lifetime peak.
+        self.peak_rss_kb: int | None = None
+
+    @classmethod
+    def start(cls) -> "CompilerWorker | None":
+        """Starts a worker, returning None if puya or the client generator cannot be loaded."""
+        try:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "smart_contracts._helpers.compiler_worker"],
+                cwd=project_root,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as ex:
+            logger.debug(f"Could not start compiler worker: {ex}")
+            return None
+        worker = cls(process)
+        ready, output = worker._read_response()
+        if not ready.get("ready"):
+            logger.debug(f"Compiler worker unavailable: {ready.get('error')}{output}")
+            worker.close()
+            return None
+        return worker
+
+    def compile(
+        self, contract_path: Path, output_dir: Path, flags: list[str]
+    ) -> tuple[int, str]:
+        """Compiles contract_path into output_dir, equivalent to `algokit compile python`."""
+        return self._run(
+            "compile", [str(contract_path), f"--out-dir={output_dir}", *flags]
+        )
+
+    def generate_client(
+        self, app_spec_path: Path, output_path: Path
+    ) -> tuple[int, str]:
+        """Generates a typed client for one app spec, equivalent to `algokit generate client`."""
+        return self._run("generate", ["-a", str(app_spec_path), "-o", str(output_path)])
+
+    def close(self) -> None:
+        if self._process.stdin and not self._process.stdin.closed:
+            self._process.stdin.close()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+
+    def __enter__(self) -> "CompilerWorker":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _run(self, job: str, args: list[str]) -> tuple[int, str]:
+        assert self._process.stdin is not None
+        with self._lock:
+            request: _Job = {"job": job, "args": args}
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+            response, output = self._read_response()
+        returncode = response.get("returncode")
+        if not isinstance(returncode, int):
+            raise Exception(f"Compiler worker exited unexpectedly:\n{output}")
+        peak_rss_kb = response.get("peak_rss_kb")
+        self.peak_rss_kb = peak_rss_kb if isinstance(peak_rss_kb, int) else None
+        return returncode, output + str(response.get("output", ""))
+
+    def _read_response(self) -> tuple[dict[str, object], str]:
+        """Reads up to the next protocol line, collecting any other output on the way."""
+        assert self._process.stdout is not None
+        output: list[str] = []
+        for line in self._process.stdout:
+            if line.startswith(RESPONSE_PREFIX):
+                response: dict[str, object] = json.loads(line[len(RESPONSE_PREFIX) :])
+                return response, "".join(output)
+            output.append(line)
+        return {}, "".join(output)
+
+
+# ----------------------------- Worker ----------------------------- #
+
+
+def _send(protocol: TextIO, message: dict[str, object]) -> None:
+    protocol.write(RESPONSE_PREFIX + json.dumps(message) + "\n")
+    protocol.flush()
+
+
+def _reset_peak_rss() -> bool:
+    """
+    Resets the kernel's record of this process's peak resident set size, so that the next
+    _job_peak_rss_kb covers one job. Only Linux supports this; returns whether it worked.
+    """
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        return False
+    return True
+
+
+def _job_peak_rss_kb() -> int | None:
+    """Peak resident set size in KiB since the last _reset_peak_rss."""
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith("VmHWM:"):
+            return int(line.split()[1])
+    return None
+
+
+def _peak_rss_kb() -> int | None:
+    try:
+        import resource
+    except ImportError:  # not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _run_entrypoint(
+    entrypoint: Callable[[], object], argv: list[str]
+) -> tuple[int, str]:
+    """Runs a CLI entrypoint in-process with the given argv, capturing its output."""
+    output = io.StringIO()
+    original_argv = sys.argv
+    sys.argv = argv
+    returncode = 0
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            entrypoint()
+    except SystemExit as ex:
+        if isinstance(ex.code, int):
+            returncode = ex.code
+        elif ex.code is not None:
+            output.write(str(ex.code))
+            returncode = 1
+    except Exception:
+        output.write(traceback.format_exc())
+        returncode = 1
+    finally:
+        sys.argv = original_argv
+    return returncode, output.getvalue()
+
+
+class _CurrentStdout:
+    """Writes to sys.stdout as it is at the time of the write, following redirect_stdout."""
+
+    def write(self, text: str) -> int:
+        stdout: TextIO = sys.stdout
+        return stdout.write(text)
+
+    def flush(self) -> None:
+        sys.stdout.flush()
+
+
+def _configure_puya_logging(*, min_log_level: object) -> None:
+    """
+    Stands in for puya's configure_logging in the worker. puya configures logging once per
+    process, caching loggers bound to the process's stdout and wrapping sys.stdout.buffer,
+    which a second compile or the captured output of a job cannot handle.
+    """
+    import structlog
+    from puya.log import configure_logging
+
+    configure_logging(
+        min_log_level=min_log_level,  # type: ignore[arg-type]
+        cache_logger=False,
+        reconfigure_stdio=False,
+    )
+    structlog.configure(logger_factory=structlog.PrintLoggerFactory(_CurrentStdout()))  # type: ignore[arg-type]
+
+
+def serve() -> None:
+    protocol = sys.stdout
+    try:
+        import puyapy.__main__
+        from algokit_client_generator.cli import main as generate_main
+        from puyapy.__main__ import main as compile_main
+    except ImportError as ex:
+        _send(protocol, {"ready": False, "error": str(ex)})
+        return
+
+    puyapy.__main__.configure_logging = _configure_puya_logging  # type: ignore[assignment]
+    entrypoints: dict[str, tuple[str, Callable[[], object]]] = {
+        "compile": ("puyapy", compile_main),
+        "generate": ("algokitgen-py", generate_main),
+    }
+    _send(protocol, {"ready": True})
+    stdin: TextIO = sys.stdin
+    for line in stdin:
+        request: _Job = json.loads(line)
+        program, entrypoint = entrypoints[request["job"]]
+        per_job = _reset_peak_rss()
+        returncode, output = _run_entrypoint(entrypoint, [program, *request["args"]])
+        # Without a reset the peak covers the worker's whole lifetime and only grows.
+        peak_rss_kb = _job_peak_rss_kb() if per_job else _peak_rss_kb()
+        _send(
+            protocol,
+            {"returncode": returncode, "output": output, "peak_rss_kb": peak_rss_kb},
+        )
+
+
+if __name__ == "__main__":
+    serve()
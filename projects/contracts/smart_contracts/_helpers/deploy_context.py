@@ -0,0 +1,31 @@
+import dataclasses
+
+import algokit_utils
+
+# Transactions are valid for 10 rounds from the first round of their suggested params
+# (1000 on LocalNet), about 30 seconds at ~3 s per round, so the cache is refreshed well
+# before that. algokit-utils 4.0 adds the timeout to time.time(), so it is in seconds even
+# though its docstring says milliseconds; read as milliseconds it just disables the cache.
+SUGGESTED_PARAMS_CACHE_TIMEOUT = 10
+
+
+@dataclasses.dataclass(frozen=True)
+class DeployContext:
+    """
+    State shared by every deploy function in a deployment run: one AlgorandClient, reused
+    so that all contracts share its suggested params cache (each algod call is still its
+    own HTTP request), and the deployer account, resolved (possibly through KMD on
+    LocalNet) only once.
+    """
+
+    algorand: algokit_utils.AlgorandClient
+    deployer: algokit_utils.SigningAccount
+
+    @classmethod
+    def from_environment(cls) -> "DeployContext":
+        algorand = algokit_utils.AlgorandClient.from_environment()
+        algorand.set_suggested_params_cache_timeout(SUGGESTED_PARAMS_CACHE_TIMEOUT)
+        deployer = algorand.account.from_environment("DEPLOYER")
+        # Fill the cache up front, so concurrent deploys do not each fetch suggested params.
+        algorand.get_suggested_params()
+        return cls(algorand=algorand, deployer=deployer)
@@ -0,0 +1,143 @@
+"""
+Deployment lockfile.
+
+`factory.deploy` looks up every app created by the deployer to decide whether to create,
+update or keep an app, which gets slower the more apps the deployer has created.
+artifacts/deployments.json records, per network genesis hash and contract, the deployed
+app id and the hashes of its built and deployed approval programs, so an unchanged
+contract can be recognised with a single application lookup instead.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import algokit_utils
+
+logger = logging.getLogger(__name__)
+
+artifact_path = Path(__file__).parent.parent / "artifacts"
+lockfile_path = artifact_path / "deployments.json"
+
+# Deployments may run concurrently; serialises read-modify-write of the lockfile.
+_lockfile_lock = threading.Lock()
+
+Lockfile = dict[str, dict[str, dict[str, object]]]
+
+
+def _read_lockfile() -> Lockfile:
+    if not lockfile_path.exists():
+        return {}
+    try:
+        lockfile: Lockfile = json.loads(lockfile_path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring unreadable deployment lockfile {lockfile_path}")
+        return {}
+    return lockfile
+
+
+def built_approval_program(contract_name: str, app_name: str) -> bytes | None:
+    """Returns the approval program in the built app spec, if it contains compiled bytecode."""
+    app_spec_path = artifact_path / contract_name / f"{app_name}.arc56.json"
+    app_spec: dict[str, dict[str, str]] = json.loads(
+        app_spec_path.read_text(encoding="utf-8")
+    )
+    byte_code = app_spec.get("byteCode")
+    if not byte_code:
+        return None
+    return base64.b64decode(byte_code["approval"])
+
+
+def program_hash(program: bytes) -> str:
+    return hashlib.sha256(program).hexdigest()
+
+
+def genesis_hash(algorand: "algokit_utils.AlgorandClient") -> str:
+    """Identifies the network; the client caches the params it is read from after one round trip."""
+    return algorand.client.network().genesis_hash
+
+
+def recorded_app_id(
+    algorand: "algokit_utils.AlgorandClient", app_name: str
+) -> int | None:
+    """Returns the app id last recorded for this network, without checking it on chain."""
+    with _lockfile_lock:
+        entry = _read_lockfile().get(genesis_hash(algorand), {}).get(app_name)
+    return int(str(entry["app_id"])) if entry else None
+
+
+def find_current_deployment(
+    algorand: "algokit_utils.AlgorandClient",
+    contract_name: str,
+    app_name: str,
+    creator: str,
+    approval_program: bytes | None = None,
+) -> int | None:
+    """
+    Returns the app id recorded for this network if the built approval program is the one
+    recorded and the app still exists on chain, created by `creator` and running the
+    program recorded as deployed; None when a full deploy is needed.
+    approval_program overrides the program from the built app spec, e.g. after template
+    variables have been substituted.
+    """
+    program = approval_program or built_approval_program(contract_name, app_name)
+    if program is None:
+        return None
+    with _lockfile_lock:
+        entry = _read_lockfile().get(genesis_hash(algorand), {}).get(app_name)
+    if not entry or entry.get("approval_hash") != program_hash(program):
+        return None
+    app_id = int(str(entry["app_id"]))
+    try:
+        app = algorand.app.get_by_id(app_id)
+    except Exception:
+        logger.info(
+            f"{app_name} app {app_id} from the deployment lockfile no longer exists"
+        )
+        return None
+    if app.creator != creator:
+        logger.info(
+            f"{app_name} app {app_id} from the deployment lockfile was created by another account"
+        )
+        return None
+    if program_hash(app.approval_program) != entry.get("deployed_hash"):
+        logger.info(
+            f"{app_name} app {app_id} was updated outside of the deployment lockfile"
+        )
+        return None
+    return app_id
+
+
+def record_deployment(
+    algorand: "algokit_utils.AlgorandClient",
+    contract_name: str,
+    app_name: str,
+    app_id: int,
+    approval_program: bytes | None = None,
+) -> None:
+    """
+    Records the deployed app id for this network with the hashes of the built approval
+    program and of the program on chain. Deploys assemble the TEAL with algod, so the
+    deployed program need not match the built bytecode byte for byte; the built hash
+    detects local changes and the deployed hash updates made outside the lockfile.
+    """
+    program = approval_program or built_approval_program(contract_name, app_name)
+    if program is None:
+        return
+    deployed_program = algorand.app.get_by_id(app_id).approval_program
+    network = genesis_hash(algorand)
+    with _lockfile_lock:
+        lockfile = _read_lockfile()
+        lockfile.setdefault(network, {})[app_name] = {
+            "app_id": app_id,
+            "approval_hash": program_hash(program),
+            "deployed_hash": program_hash(deployed_program),
+        }
+        lockfile_path.write_text(
+            json.dumps(lockfile, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
@@ -0,0 +1,90 @@
+import dataclasses
+import logging
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass
+class Task:
+    """A unit of work in a DAG, run on the executor of its lane once its dependencies succeed."""
+
+    name: str
+    lane: str
+    run: Callable[[], object]
+    depends_on: tuple[str, ...] = ()
+
+
+def _check_acyclic(tasks: dict[str, Task]) -> None:
+    remaining = {name: set(task.depends_on) for name, task in tasks.items()}
+    while remaining:
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        if not ready:
+            raise Exception(f"Dependency cycle between {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for dependencies in remaining.values():
+            dependencies.difference_update(ready)
+
+
+def run_dag(tasks: list[Task], concurrency: dict[str, int]) -> None:
+    """
+    Runs tasks as soon as their dependencies have completed, with at most
+    concurrency[lane] tasks of each lane running at the same time. Ready tasks start in
+    the order they were given. When a task fails its dependents are skipped, the other
+    tasks still run, and an exception naming every failed task is raised at the end.
+    """
+    by_name = {task.name: task for task in tasks}
+    for task in tasks:
+        unknown = [
+            dependency for dependency in task.depends_on if dependency not in by_name
+        ]
+        if unknown:
+            raise Exception(
+                f"Task {task.name} depends on unknown task(s) {', '.join(unknown)}"
+            )
+    _check_acyclic(by_name)
+
+    executors = {
+        lane: ThreadPoolExecutor(max_workers=max(1, workers))
+        for lane, workers in concurrency.items()
+    }
+    pending = list(tasks)
+    running: dict[Future[object], str] = {}
+    done: set[str] = set()
+    failed: dict[str, BaseException] = {}
+    skipped: set[str] = set()
+    try:
+        while pending or running:
+            for task in list(pending):
+                if any(
+                    dependency in failed or dependency in skipped
+                    for dependency in task.depends_on
+                ):
+                    pending.remove(task)
+                    skipped.add(task.name)
+                    logger.warning(f"Skipping {task.name}, a dependency failed")
+                elif all(dependency in done for dependency in task.depends_on):
+                    pending.remove(task)
+                    running[executors[task.lane].submit(task.run)] = task.name
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                error = future.exception()
+                if error is None:
+                    done.add(name)
+                else:
+                    failed[name] = error
+                    logger.error(f"{name} failed: {error}")
+    finally:
+        for executor in executors.values():
+            executor.shutdown(wait=True)
+
+    if failed:
+        message = f"Failed: {', '.join(sorted(failed))}"
+        if skipped:
+            message += f"; skipped: {', '.join(sorted(skipped))}"
+        raise Exception(message)
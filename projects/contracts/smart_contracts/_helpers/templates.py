@@ -0,0 +1,284 @@
+"""
+Template variable builds.
+
+Contracts and logic signatures that use `TemplateVar[...]("NAME")` are compiled once, with
+a unique sentinel value per variable, and `<App>.template.json` records where each sentinel
+sits in the program's constant blocks. Variant programs are then produced by splicing the
+real values over the sentinels, without compiling again.
+
+Constant blocks precede all other opcodes and branch offsets are relative, so values
+whose encoding differs in length from the sentinel can be spliced in safely.
+
+The sentinels are not written to the app specs' templateVariables, so generated clients
+have no default values to deploy with; rendered_app_spec deploys a variant as bytecode.
+"""
+
+import ast
+import base64
+import dataclasses
+import hashlib
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from smart_contracts._helpers.build_cache import contract_sources
+
+if TYPE_CHECKING:
+    import algokit_utils
+
+artifact_path = Path(__file__).parent.parent / "artifacts"
+
+TEMPLATE_FILE_SUFFIX = ".template.json"
+UINT64 = "AVMUint64"
+BYTES = "AVMBytes"
+
+_INTCBLOCK = 0x20
+_BYTECBLOCK = 0x26
+_PROGRAMS = ("approval", "clear")
+# Template key of a logic signature's program, next to the approval and clear programs of apps.
+LOGICSIG_PROGRAM = "program"
+_UINT64_TYPES = {"UInt64", "bool"}
+
+
+def template_variables(contract_path: Path) -> dict[str, str]:
+    """Returns the name and AVM type of every `TemplateVar` used by the contract's sources."""
+    variables: dict[str, str] = {}
+    for source in contract_sources(contract_path):
+        tree = ast.parse(source.read_text(encoding="utf-8"), filename=str(source))
+        for node in ast.walk(tree):
+            # TemplateVar[UInt64]("NAME"), possibly qualified as algopy.TemplateVar
+            match node:
+                case ast.Call(
+                    func=ast.Subscript(value=generic, slice=value_type),
+                    args=[ast.Constant(value=str(name)), *_],
+                ) if (
+                    ast.unparse(generic).split(".")[-1] == "TemplateVar"
+                ):
+                    type_name = ast.unparse(value_type).split(".")[-1]
+                    variables[name] = UINT64 if type_name in _UINT64_TYPES else BYTES
+    return dict(sorted(variables.items()))
+
+
+def sentinel_value(name: str, avm_type: str) -> int | bytes:
+    """A value derived from the variable name that will not collide with real constants."""
+    digest = hashlib.sha256(f"template:{name}".encode()).digest()
+    if avm_type == UINT64:
+        return int.from_bytes(digest[:8], "big") | (1 << 63)
+    return digest
+
+
+def sentinel_flags(variables: Mapping[str, str]) -> list[str]:
+    """
+    puyapy flags setting every template variable to its sentinel; the build always assembles
+    bytecode, which write_templates reads.
+    """
+    flags: list[str] = []
+    for name, avm_type in variables.items():
+        value = sentinel_value(name, avm_type)
+        rendered = str(value) if isinstance(value, int) else f"0x{value.hex()}"
+        flags.append(f"--template-var={name}={rendered}")
+    return flags
+
+
+def _encode_uvarint(value: int) -> bytes:
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _read_uvarint(program: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = program[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _encode(value: int | bytes) -> bytes:
+    if isinstance(value, int):
+        return _encode_uvarint(value)
+    return _encode_uvarint(len(value)) + value
+
+
+def _constant_offsets(program: bytes) -> dict[int | bytes, tuple[int, int]]:
+    """Maps each constant in the leading intcblock/bytecblock to its (offset, length)."""
+    _version, offset = _read_uvarint(program, 0)
+    constants: dict[int | bytes, tuple[int, int]] = {}
+    while offset < len(program) and program[offset] in (_INTCBLOCK, _BYTECBLOCK):
+        opcode = program[offset]
+        count, offset = _read_uvarint(program, offset + 1)
+        for _ in range(count):
+            start = offset
+            constant: int | bytes
+            if opcode == _INTCBLOCK:
+                constant, offset = _read_uvarint(program, offset)
+            else:
+                size, offset = _read_uvarint(program, offset)
+                constant = program[offset : offset + size]
+                offset += size
+            constants.setdefault(constant, (start, offset - start))
+    return constants
+
+
+def _program_template(
+    app_name: str, program: bytes, variables: Mapping[str, str]
+) -> tuple[dict[str, object], set[str]]:
+    """Returns the template of one program and the variables found in it."""
+    constants = _constant_offsets(program)
+    offsets: dict[str, list[int]] = {}
+    for name, avm_type in variables.items():
+        sentinel = sentinel_value(name, avm_type)
+        if sentinel in constants:
+            offsets[name] = list(constants[sentinel])
+        elif _encode(sentinel) in program:
+            raise Exception(
+                f"Template variable {name} in {app_name} is not in a constant block"
+            )
+    return {"byteCode": base64.b64encode(program).decode(), "offsets": offsets}, set(
+        offsets
+    )
+
+
+def _built_programs(output_dir: Path) -> dict[str, dict[str, bytes]]:
+    """
+    The programs assembled in output_dir by name: an app's approval and clear programs,
+    or a logic signature's single LOGICSIG_PROGRAM.
+    """
+    programs: dict[str, dict[str, bytes]] = {}
+    for app_spec_path in sorted(output_dir.glob("*.arc56.json")):
+        app_name = app_spec_path.name.removesuffix(".arc56.json")
+        programs[app_name] = {
+            program_name: (output_dir / f"{app_name}.{program_name}.bin").read_bytes()
+            for program_name in _PROGRAMS
+        }
+    app_program_files = {
+        f"{app_name}.{program_name}.bin"
+        for app_name in programs
+        for program_name in _PROGRAMS
+    }
+    for bytecode_path in sorted(output_dir.glob("*.bin")):
+        if bytecode_path.name not in app_program_files:
+            programs[bytecode_path.stem] = {
+                LOGICSIG_PROGRAM: bytecode_path.read_bytes()
+            }
+    return programs
+
+
+def write_templates(output_dir: Path, variables: Mapping[str, str]) -> None:
+    """
+    Records the sentinel offsets of the programs assembled in output_dir, for each app spec
+    and each logic signature that uses any of the variables. variables come from all of a
+    contract's sources, so an app may use only some of them, for instance when it imports a
+    struct from another contract's module; each template lists the variables its programs
+    use. Raises if a variable was not placed in a constant block, as it could then not be
+    substituted.
+    """
+    for app_name, programs in _built_programs(output_dir).items():
+        template_path = output_dir / f"{app_name}{TEMPLATE_FILE_SUFFIX}"
+        template: dict[str, object] = {}
+        found: set[str] = set()
+        for program_name, program in programs.items():
+            template[program_name], program_variables = _program_template(
+                app_name, program, variables
+            )
+            found |= program_variables
+        if not found:
+            template_path.unlink(missing_ok=True)
+            continue
+        template = {
+            "variables": {name: variables[name] for name in variables if name in found},
+            **template,
+        }
+        template_path.write_text(
+            json.dumps(template, indent=2) + "\n", encoding="utf-8"
+        )
+
+
+def clear_sentinel_values(output_dir: Path) -> None:
+    """
+    Removes the values puyapy records for the template variables in the app specs of
+    output_dir, which are the sentinels the programs were assembled with.
+    """
+    for app_spec_path in sorted(output_dir.glob("*.arc56.json")):
+        app_spec: dict[str, object] = json.loads(
+            app_spec_path.read_text(encoding="utf-8")
+        )
+        variables = app_spec.get("templateVariables")
+        if not isinstance(variables, dict) or not variables:
+            continue
+        app_spec["templateVariables"] = {
+            name: {"type": variable["type"]}
+            for name, variable in cast(dict[str, dict[str, str]], variables).items()
+        }
+        app_spec_path.write_text(json.dumps(app_spec, indent=4), encoding="utf-8")
+
+
+def built_template(contract_name: str, app_name: str) -> dict[str, object]:
+    """Loads the template recorded by the last build of the contract."""
+    path = artifact_path / contract_name / f"{app_name}{TEMPLATE_FILE_SUFFIX}"
+    template: dict[str, object] = json.loads(path.read_text(encoding="utf-8"))
+    return template
+
+
+def render_program(
+    template: Mapping[str, object], program_name: str, values: Mapping[str, int | bytes]
+) -> bytes:
+    """
+    Returns the approval, clear or logic signature program with the given template variable
+    values spliced in.
+    """
+    variables: dict[str, str] = template["variables"]  # type: ignore[assignment]
+    unknown = set(values) - set(variables)
+    if unknown:
+        raise Exception(f"Unknown template variables: {', '.join(sorted(unknown))}")
+    missing = set(variables) - set(values)
+    if missing:
+        raise Exception(f"Missing template variables: {', '.join(sorted(missing))}")
+    program_template: dict[str, object] = template[program_name]  # type: ignore[assignment]
+    program = bytearray(base64.b64decode(str(program_template["byteCode"])))
+    offsets: dict[str, list[int]] = program_template["offsets"]  # type: ignore[assignment]
+
+    def start(item: tuple[str, list[int]]) -> int:
+        return item[1][0]
+
+    # Splice from the end so earlier offsets stay valid when lengths change.
+    for name, (offset, length) in sorted(offsets.items(), key=start, reverse=True):
+        value = values[name]
+        if isinstance(value, int) != (variables[name] == UINT64):
+            raise Exception(
+                f"Template variable {name} must be {'an int' if variables[name] == UINT64 else 'bytes'}"
+            )
+        if isinstance(value, int) and not 0 <= value < 2**64:
+            raise Exception(f"Template variable {name} is out of the uint64 range")
+        program[offset : offset + length] = _encode(value)
+    return bytes(program)
+
+
+def rendered_app_spec(
+    contract_name: str, app_name: str, values: Mapping[str, int | bytes]
+) -> "algokit_utils.Arc56Contract":
+    """
+    Returns the built app spec with the programs rendered from its template as bytecode and
+    without TEAL source, so an AppFactory deploys the variant without compiling on algod.
+    """
+    import algokit_utils
+
+    app_spec_path = artifact_path / contract_name / f"{app_name}.arc56.json"
+    app_spec = algokit_utils.Arc56Contract.from_json(
+        app_spec_path.read_text(encoding="utf-8")
+    )
+    template = built_template(contract_name, app_name)
+    byte_code = algokit_utils.ByteCode(
+        approval=base64.b64encode(
+            render_program(template, "approval", values)
+        ).decode(),
+        clear=base64.b64encode(render_program(template, "clear", values)).decode(),
+    )
+    return dataclasses.replace(app_spec, byte_code=byte_code, source=None)
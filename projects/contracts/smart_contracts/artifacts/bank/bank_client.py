@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "memo"}, {"type": "pay", "name": "pay_txn"}], "name": "deposit", "returns": {"type": "uint64"}, "desc": "Accepts a payment into the app escrow and records sender's deposited balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Sends ALGO back to the caller from their recorded balance", "events": [], "readonly": false, "recommendations": {}}], "name": "Bank", "state": {"keys": {"box": {}, "global": {"total_deposit": {"key": "dG90YWxfZGVwb3NpdA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"deposits": {"keyType": "address", "valueType": "uint64", "prefix": ""}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiACAQAmAg10b3RhbF9kZXBvc2l0BBUffHUxGEAAAygjZzEbQQBNggIEn1l8MgQxIUF2NhoAjgIAFwACI0MxGRREMRhENhoBF4gAeBYpTFCwIkMxGRREMRhENhoBVwIAMRYiCUk4ECISRIgAEhYpTFCwIkMxGUD/wzEYFEQiQ4oCAYv/OAcyChJEi/84CElEi/84AEm+TBdMQQAeiwKLAAgWiwFMvyMoZUSLAAgoTGeLAb5MF0xEjACJiwAWiwFMv0L/4ooBATEAvkwXTESL/0SL/0sBDkSxMQCL/7IIsgcishAjsgGzi/8JSUAACDEAvEiLAEyJMQCLABa/Qv/z", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDEgMAogICAgYnl0ZWNibG9jayAidG90YWxfZGVwb3NpdCIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTEKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAidG90YWxfZGVwb3NpdCIKICAgIGludGNfMSAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdANwogICAgcHVzaGJ5dGVzcyAweDlmNTk3YzMyIDB4MzEyMTQxNzYgLy8gbWV0aG9kICJkZXBvc2l0KHN0cmluZyxwYXkpdWludDY0IiwgbWV0aG9kICJ3aXRoZHJhdyh1aW50NjQpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9kZXBvc2l0X3JvdXRlQDUgbWFpbl93aXRoZHJhd19yb3V0ZUA2CgptYWluX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIGludGNfMSAvLyAwCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZXBvc2l0X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMCAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZGVwb3NpdAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAOQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmRlcG9zaXQobWVtbzogYnl0ZXMsIHBheV90eG46IHVpbnQ2NCkgLT4gdWludDY0OgpkZXBvc2l0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMtMTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGRlcG9zaXQoc2VsZiwgbWVtbzogU3RyaW5nLCBwYXlfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbikgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNgogICAgLy8gYXNzZXJ0IHBheV90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIlJlY2VpdmVyIG11c3QgYmUgdGhlIGNvbnRyYWN0IGFkZHJlc3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNwogICAgLy8gYXNzZXJ0IHBheV90eG4uYW1vdW50ID4gMCwgIkRlcG9zaXQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gRGVwb3NpdCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTkKICAgIC8vIGFtb3VudCwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShwYXlfdHhuLnNlbmRlcikKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBkZXBvc2l0X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMQogICAgLy8gc2VsZi5kZXBvc2l0c1twYXlfdHhuLnNlbmRlcl0gPSBhbW91bnQgKyBwYXlfdHhuLmFtb3VudAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAwCiAgICArCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgYm94X3B1dAoKZGVwb3NpdF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyNQogICAgLy8gc2VsZi50b3RhbF9kZXBvc2l0ICs9IHBheV90eG4uYW1vdW50CiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWNfMCAvLyAidG90YWxfZGVwb3NpdCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9kZXBvc2l0IGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgICsKICAgIGJ5dGVjXzAgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjYKICAgIC8vIHJldHVybiBzZWxmLmRlcG9zaXRzW3BheV90eG4uc2VuZGVyXQogICAgZnJhbWVfZGlnIDEKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIHN3YXAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmRlcG9zaXRzIGVudHJ5IGV4aXN0cwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmRlcG9zaXRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMwogICAgLy8gc2VsZi5kZXBvc2l0c1twYXlfdHhuLnNlbmRlcl0gPSBwYXlfdHhuLmFtb3VudAogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBiIGRlcG9zaXRfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay53aXRoZHJhdyhhbW91bnQ6IHVpbnQ2NCkgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjI4LTI5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB3aXRoZHJhdyhzZWxmLCBhbW91bnQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozMQogICAgLy8gY3VycmVudCwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzIKICAgIC8vIGFzc2VydCBleGlzdHMsICJObyBkZXBvc2l0cyBmb3VuZCBmb3IgdGhpcyBhY2NvdW50IgogICAgc3dhcAogICAgYXNzZXJ0IC8vIE5vIGRlcG9zaXRzIGZvdW5kIGZvciB0aGlzIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIldpdGhkcmF3YWwgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozNAogICAgLy8gYXNzZXJ0IGFtb3VudCA8PSBjdXJyZW50LCAiV2l0aGRyYXdhbCBhbW91bnQgZXhjZWVkcyBiYWxhbmNlIgogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgPD0KICAgIGFzc2VydCAvLyBXaXRoZHJhd2FsIGFtb3VudCBleGNlZWRzIGJhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PWFtb3VudCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzAgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozOAogICAgLy8gcmVtYWluaW5nID0gY3VycmVudCAtIGFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBpZiByZW1haW5pbmcgPT0gVUludDY0KDApOgogICAgYm56IHdpdGhkcmF3X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0MAogICAgLy8gZGVsIHNlbGYuZGVwb3NpdHNbVHhuLnNlbmRlcl0KICAgIHR4biBTZW5kZXIKICAgIGJveF9kZWwKICAgIHBvcAoKd2l0aGRyYXdfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDQKICAgIC8vIHJldHVybiByZW1haW5pbmcKICAgIGZyYW1lX2RpZyAwCiAgICBzd2FwCiAgICByZXRzdWIKCndpdGhkcmF3X2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDIKICAgIC8vIHNlbGYuZGVwb3NpdHNbVHhuLnNlbmRlcl0gPSByZW1haW5pbmcKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAwCiAgICBpdG9iCiAgICBib3hfcHV0CiAgICBiIHdpdGhkcmF3X2FmdGVyX2lmX2Vsc2VANAo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [143], "errorMessage": "Deposit amount must be greater than zero"}, {"pc": [205], "errorMessage": "No deposits found for this account"}, {"pc": [65, 86], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [137], "errorMessage": "Receiver must be the contract address"}, {"pc": [214], "errorMessage": "Withdrawal amount exceeds balance"}, {"pc": [208], "errorMessage": "Withdrawal amount must be greater than zero"}, {"pc": [124], "errorMessage": "can only call when creating"}, {"pc": [68, 89], "errorMessage": "can only call when not creating"}, {"pc": [182], "errorMessage": "check self.deposits entry exists"}, {"pc": [169], "errorMessage": "check self.total_deposit exists"}, {"pc": [105], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "memo"}, {"type": "pay", "name": "pay_txn"}], "name": "deposit", "returns": {"type": "uint64"}, "desc": "Accepts a payment into the app escrow and records sender's deposited balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "amount"}], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Sends ALGO back to the caller from their recorded balance", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "(address,uint64)[]", "name": "payouts"}], "name": "withdraw_batch", "returns": {"type": "uint64"}, "desc": "Pays the caller's recorded balance out to several receivers in one inner transaction\ngroup; the caller covers the inner fees through fee pooling", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "account"}], "name": "balance_of", "returns": {"type": "uint64"}, "desc": "Returns the account's recorded balance, zero if it has none", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "accounts"}], "name": "balances", "returns": {"type": "uint64[]"}, "desc": "Returns the recorded balances of the accounts, in order, zero for accounts without one", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address[]", "name": "accounts"}], "name": "migrate_deposits", "returns": {"type": "uint64"}, "desc": "Moves the accounts' per-account deposit boxes into their buckets where there is room,\nreleasing the boxes' minimum balance; returns the number of boxes moved", "events": [], "readonly": false, "recommendations": {}}], "name": "Bank", "state": {"keys": {"box": {}, "global": {"total_deposit": {"key": "dG90YWxfZGVwb3NpdA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"deposits": {"keyType": "address", "valueType": "uint64", "prefix": ""}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 1}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAGAAEgwAeLnare/MD21MEB4Yzgnd3Svd+OASYDBBUffHUADXRvdGFsX2RlcG9zaXQxGEAAAyoiZzEbQQC7ggYEn1l8MgQxIUF2BAEtl18EpOEP9QSRPuI+BLkn7zc2GgCOBgBpAFQAQAApABYAAiJDMRkURDEYRDYaAYgCDRYoTFCwI0MxGRREMRhENhoBiAGpKExQsCNDMRkURDEYRDYaARfAHIgBgxYoTFCwI0MxGRREMRhENhoBiADLFihMULAjQzEZFEQxGEQ2GgEXiAB3FihMULAjQzEZFEQxGEQ2GgFXAgAxFiMJSTgQIxJEiAASFihMULAjQzEZQP9xMRgURCNDigIBi/84BzIKEkSL/zgISURJIQQPRIv/OABJiAJdSwNLA0sDSwOIAb9LBQhPBEsBTwVPBU8FiAHUIiplRE8CCCpMZ4mKAQExAIgCLzEASwNLA0sDiAGRSUSL/0SL/0sBDkSxMQCL/7IIsgcjshAisgGzi/8JMQBLAU8FTwVPBYgBi4mKAQEiKTEAiAHuSU4DTgNJTgJOA0lOAzEATE8CTwOIAURJRIv/IllHAkSBEA5EIkmLCIsGDEEAT4v/VwIAiwhJTgKBKAuBKFhJVwAgjABJVyAIgAgAAAAAAAAAAKVEJFtJjAGLBwiMB0AAGLEjshCLALIHiwGyCCKyAYsIIwiMCEL/rbZC/+WLB0mLBUlOAg5Es0wJMQBLAYsEiwOLAogA6YwAiYoBAYv/iAFMi/9OA4gAsomKAQGL/yJZSYE/DkSAAgAAIosCiwAMQQAyi/9XAgCLAklOAiQLJFhJiAEZiwFXAgBOBIgAfBZQSRWBCAoWVwYCTFCMASMIjAJC/8aLAYwAiYoBASIpSSKL/yJZIosFiwQMQQBIi/9XAgCLBSQLJFhJjAC+TBeMAYsDjAJBACGLAEmIAMBLA4sBTgROBIgAR71FAYsDjAJAAAaLAyMIjAKLAowDiwUjCIwFQv+wiwOMAImKBAGL/L5MF0xBAASLAEyJi/9BAA2L/iQIi/1MgQi6F0yJIkyJigUAi/xAACqL/0EAGIEor4v9i/5PAruL/b5IJa8SQQAEi/28SIv7vUUBQQAEi/u8SImL/0AAB4v+JQxBACiL/b1FAUAABYv9JblIi/wWi/tMUIv9i/5PAruL+71FAUH/0Iv7vEiJi/wWi/tMv4mKAQMiSSlHAiEFSUAACiklIowCjAGMAImL/wEiW4sFGBaAAWtMUEmMAL1FAUAAC4sAIkmMAowBjACJJYwCIowEiwQlDEEARIsAiwQkukmMAYv/EkEADIsAiwQjjAKMAYwAiYsCSSUSTIwDQQAQiwEyAxKLAowDQQAEiwSMA4sDjAKLBIEoCIwEQv+1iwCLAiKMAowBjACJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSAzMiA5NjAgVE1QTF9NSU5fREVQT1NJVCBUTVBMX0RFUE9TSVRfQlVDS0VUUwogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4ICJ0b3RhbF9kZXBvc2l0IgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzAKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAidG90YWxfZGVwb3NpdCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDExCiAgICBwdXNoYnl0ZXNzIDB4OWY1OTdjMzIgMHgzMTIxNDE3NiAweDAxMmQ5NzVmIDB4YTRlMTBmZjUgMHg5MTNlZTIzZSAweGI5MjdlZjM3IC8vIG1ldGhvZCAiZGVwb3NpdChzdHJpbmcscGF5KXVpbnQ2NCIsIG1ldGhvZCAid2l0aGRyYXcodWludDY0KXVpbnQ2NCIsIG1ldGhvZCAid2l0aGRyYXdfYmF0Y2goKGFkZHJlc3MsdWludDY0KVtdKXVpbnQ2NCIsIG1ldGhvZCAiYmFsYW5jZV9vZihhY2NvdW50KXVpbnQ2NCIsIG1ldGhvZCAiYmFsYW5jZXMoYWRkcmVzc1tdKXVpbnQ2NFtdIiwgbWV0aG9kICJtaWdyYXRlX2RlcG9zaXRzKGFkZHJlc3NbXSl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2RlcG9zaXRfcm91dGVANSBtYWluX3dpdGhkcmF3X3JvdXRlQDYgbWFpbl93aXRoZHJhd19iYXRjaF9yb3V0ZUA3IG1haW5fYmFsYW5jZV9vZl9yb3V0ZUA4IG1haW5fYmFsYW5jZXNfcm91dGVAOSBtYWluX21pZ3JhdGVfZGVwb3NpdHNfcm91dGVAMTAKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX21pZ3JhdGVfZGVwb3NpdHNfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTIxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgbWlncmF0ZV9kZXBvc2l0cwogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYWxhbmNlc19yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTA3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMDcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgYmFsYW5jZXMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFsYW5jZV9vZl9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTAxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTAxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGJhbGFuY2Vfb2YKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfYmF0Y2hfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjY3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjY3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgd2l0aGRyYXdfYmF0Y2gKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjAKICAgIC8vIGNsYXNzIEJhbmsoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgd2l0aGRyYXcKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZGVwb3NpdF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToyMAogICAgLy8gY2xhc3MgQmFuayhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBkZXBvc2l0CiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwCiAgICAvLyBjbGFzcyBCYW5rKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDEzCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYW5rLmNvbnRyYWN0LkJhbmsuZGVwb3NpdChtZW1vOiBieXRlcywgcGF5X3R4bjogdWludDY0KSAtPiB1aW50NjQ6CmRlcG9zaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozMi0zMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZGVwb3NpdChzZWxmLCBtZW1vOiBTdHJpbmcsIHBheV90eG46IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBwYXlfdHhuLnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzUtMzcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5X3R4bi5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICAvLyApLCAiUmVjZWl2ZXIgbXVzdCBiZSB0aGUgY29udHJhY3QgYWRkcmVzcyIKICAgIGFzc2VydCAvLyBSZWNlaXZlciBtdXN0IGJlIHRoZSBjb250cmFjdCBhZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTozOAogICAgLy8gYXNzZXJ0IHBheV90eG4uYW1vdW50ID4gMCwgIkRlcG9zaXQgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQgLy8gRGVwb3NpdCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MzktNDEKICAgIC8vIGFzc2VydCBwYXlfdHhuLmFtb3VudCA+PSBUZW1wbGF0ZVZhcltVSW50NjRdKAogICAgLy8gICAgICJNSU5fREVQT1NJVCIKICAgIC8vICksICJEZXBvc2l0IGFtb3VudCBpcyBiZWxvdyB0aGUgbWluaW11bSIKICAgIGR1cAogICAgaW50YyA0IC8vIFRNUExfTUlOX0RFUE9TSVQKICAgID49CiAgICBhc3NlcnQgLy8gRGVwb3NpdCBhbW91bnQgaXMgYmVsb3cgdGhlIG1pbmltdW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBrZXksIHNsb3QsIGZvdW5kID0gc2VsZi5fYnVja2V0X3Nsb3QocGF5X3R4bi5zZW5kZXIpCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZHVwCiAgICBjYWxsc3ViIF9idWNrZXRfc2xvdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDUKICAgIC8vIHNlbGYuX3JlY29yZGVkX2JhbGFuY2UocGF5X3R4bi5zZW5kZXIsIGtleSwgc2xvdCwgZm91bmQpICsgcGF5X3R4bi5hbW91bnQKICAgIGRpZyAzCiAgICBkaWcgMwogICAgZGlnIDMKICAgIGRpZyAzCiAgICBjYWxsc3ViIF9yZWNvcmRlZF9iYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo0NC00NgogICAgLy8gYmFsYW5jZSA9ICgKICAgIC8vICAgICBzZWxmLl9yZWNvcmRlZF9iYWxhbmNlKHBheV90eG4uc2VuZGVyLCBrZXksIHNsb3QsIGZvdW5kKSArIHBheV90eG4uYW1vdW50CiAgICAvLyApCiAgICBkaWcgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDUKICAgIC8vIHNlbGYuX3JlY29yZGVkX2JhbGFuY2UocGF5X3R4bi5zZW5kZXIsIGtleSwgc2xvdCwgZm91bmQpICsgcGF5X3R4bi5hbW91bnQKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBzZWxmLl9zdG9yZV9iYWxhbmNlKHBheV90eG4uc2VuZGVyLCBiYWxhbmNlLCBrZXksIHNsb3QsIGZvdW5kKQogICAgdW5jb3ZlciA0CiAgICBkaWcgMQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDUKICAgIHVuY292ZXIgNQogICAgY2FsbHN1YiBfc3RvcmVfYmFsYW5jZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NDkKICAgIC8vIHNlbGYudG90YWxfZGVwb3NpdCArPSBwYXlfdHhuLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInRvdGFsX2RlcG9zaXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfZGVwb3NpdCBleGlzdHMKICAgIHVuY292ZXIgMgogICAgKwogICAgYnl0ZWNfMiAvLyAidG90YWxfZGVwb3NpdCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1MAogICAgLy8gcmV0dXJuIGJhbGFuY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5iYW5rLmNvbnRyYWN0LkJhbmsud2l0aGRyYXcoYW1vdW50OiB1aW50NjQpIC0+IHVpbnQ2NDoKd2l0aGRyYXc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1Mi01MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgd2l0aGRyYXcoc2VsZiwgYW1vdW50OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NTUKICAgIC8vIGtleSwgc2xvdCwgZm91bmQgPSBzZWxmLl9idWNrZXRfc2xvdChUeG4uc2VuZGVyKQogICAgdHhuIFNlbmRlcgogICAgY2FsbHN1YiBfYnVja2V0X3Nsb3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBjdXJyZW50ID0gc2VsZi5fcmVjb3JkZWRfYmFsYW5jZShUeG4uc2VuZGVyLCBrZXksIHNsb3QsIGZvdW5kKQogICAgdHhuIFNlbmRlcgogICAgZGlnIDMKICAgIGRpZyAzCiAgICBkaWcgMwogICAgY2FsbHN1YiBfcmVjb3JkZWRfYmFsYW5jZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NTcKICAgIC8vIGFzc2VydCBjdXJyZW50ID4gMCwgIk5vIGRlcG9zaXRzIGZvdW5kIGZvciB0aGlzIGFjY291bnQiCiAgICBkdXAKICAgIGFzc2VydCAvLyBObyBkZXBvc2l0cyBmb3VuZCBmb3IgdGhpcyBhY2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo1OAogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJXaXRoZHJhd2FsIGFtb3VudCBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NlcnQgLy8gV2l0aGRyYXdhbCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NTkKICAgIC8vIGFzc2VydCBhbW91bnQgPD0gY3VycmVudCwgIldpdGhkcmF3YWwgYW1vdW50IGV4Y2VlZHMgYmFsYW5jZSIKICAgIGZyYW1lX2RpZyAtMQogICAgZGlnIDEKICAgIDw9CiAgICBhc3NlcnQgLy8gV2l0aGRyYXdhbCBhbW91bnQgZXhjZWVkcyBiYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo2MQogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1hbW91bnQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjMKICAgIC8vIHJlbWFpbmluZyA9IGN1cnJlbnQgLSBhbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjQKICAgIC8vIHNlbGYuX3N0b3JlX2JhbGFuY2UoVHhuLnNlbmRlciwgcmVtYWluaW5nLCBrZXksIHNsb3QsIGZvdW5kKQogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIHVuY292ZXIgNQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDUKICAgIGNhbGxzdWIgX3N0b3JlX2JhbGFuY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjY1CiAgICAvLyByZXR1cm4gcmVtYWluaW5nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLndpdGhkcmF3X2JhdGNoKHBheW91dHM6IGJ5dGVzKSAtPiB1aW50NjQ6CndpdGhkcmF3X2JhdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6NjctNjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHdpdGhkcmF3X2JhdGNoKHNlbGYsIHBheW91dHM6IGFyYzQuRHluYW1pY0FycmF5W1BheW91dF0pIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjczCiAgICAvLyBrZXksIHNsb3QsIGZvdW5kID0gc2VsZi5fYnVja2V0X3Nsb3QoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIGNhbGxzdWIgX2J1Y2tldF9zbG90CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGNvdmVyIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgMwogICAgZHVwCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3NAogICAgLy8gY3VycmVudCA9IHNlbGYuX3JlY29yZGVkX2JhbGFuY2UoVHhuLnNlbmRlciwga2V5LCBzbG90LCBmb3VuZCkKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIF9yZWNvcmRlZF9iYWxhbmNlCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBhc3NlcnQgY3VycmVudCA+IDAsICJObyBkZXBvc2l0cyBmb3VuZCBmb3IgdGhpcyBhY2NvdW50IgogICAgYXNzZXJ0IC8vIE5vIGRlcG9zaXRzIGZvdW5kIGZvciB0aGlzIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBhc3NlcnQgcGF5b3V0cy5sZW5ndGggPiAwLCAiTm8gcGF5b3V0cyBnaXZlbiIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXBuIDIKICAgIGFzc2VydCAvLyBObyBwYXlvdXRzIGdpdmVuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3OAogICAgLy8gcGF5b3V0cy5sZW5ndGggPD0gTUFYX1BBWU9VVFMKICAgIHB1c2hpbnQgMTYgLy8gMTYKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo3Ny03OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXlvdXRzLmxlbmd0aCA8PSBNQVhfUEFZT1VUUwogICAgLy8gKSwgIlRvbyBtYW55IHBheW91dHMgZm9yIG9uZSB0cmFuc2FjdGlvbiBncm91cCIKICAgIGFzc2VydCAvLyBUb28gbWFueSBwYXlvdXRzIGZvciBvbmUgdHJhbnNhY3Rpb24gZ3JvdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjgxCiAgICAvLyB0b3RhbCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKHBheW91dHMubGVuZ3RoKToKICAgIGR1cAoKd2l0aGRyYXdfYmF0Y2hfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODIKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UocGF5b3V0cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDgKICAgIGZyYW1lX2RpZyA2CiAgICA8CiAgICBieiB3aXRoZHJhd19iYXRjaF9hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODMKICAgIC8vIHJlY2VpdmVyLCBhbW91bnQgPSBwYXlvdXRzW2luZGV4XS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA4CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgICoKICAgIHB1c2hpbnQgNDAgLy8gNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9idXJ5IDAKICAgIGR1cAogICAgZXh0cmFjdCAzMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODQKICAgIC8vIGFzc2VydCBhbW91bnQgPiAwLCAiV2l0aGRyYXdhbCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI+CiAgICBhc3NlcnQgLy8gV2l0aGRyYXdhbCBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODMKICAgIC8vIHJlY2VpdmVyLCBhbW91bnQgPSBwYXlvdXRzW2luZGV4XS5uYXRpdmUKICAgIGludGNfMiAvLyAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODUKICAgIC8vIHRvdGFsICs9IGFtb3VudC5uYXRpdmUKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfZGlnIDcKICAgICsKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODYKICAgIC8vIGlmIGluZGV4ID09IDA6CiAgICBibnogd2l0aGRyYXdfYmF0Y2hfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBvcC5JVHhuQ3JlYXRlLmJlZ2luKCkKICAgIGl0eG5fYmVnaW4KCndpdGhkcmF3X2JhdGNoX2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF90eXBlX2VudW0oVHJhbnNhY3Rpb25UeXBlLlBheW1lbnQpCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5MQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfcmVjZWl2ZXIocmVjZWl2ZXIubmF0aXZlKQogICAgZnJhbWVfZGlnIDAKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hbW91bnQoYW1vdW50Lm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAxCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6OTMKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo4MgogICAgLy8gZm9yIGluZGV4IGluIHVyYW5nZShwYXlvdXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgOAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgOAogICAgYiB3aXRoZHJhd19iYXRjaF9mb3JfaGVhZGVyQDEKCndpdGhkcmF3X2JhdGNoX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6ODkKICAgIC8vIG9wLklUeG5DcmVhdGUubmV4dCgpCiAgICBpdHhuX25leHQKICAgIGIgd2l0aGRyYXdfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA1Cgp3aXRoZHJhd19iYXRjaF9hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBhc3NlcnQgdG90YWwgPD0gY3VycmVudCwgIldpdGhkcmF3YWwgYW1vdW50IGV4Y2VlZHMgYmFsYW5jZSIKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIDw9CiAgICBhc3NlcnQgLy8gV2l0aGRyYXdhbCBhbW91bnQgZXhjZWVkcyBiYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5NQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyByZW1haW5pbmcgPSBjdXJyZW50IC0gdG90YWwKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBzZWxmLl9zdG9yZV9iYWxhbmNlKFR4bi5zZW5kZXIsIHJlbWFpbmluZywga2V5LCBzbG90LCBmb3VuZCkKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAyCiAgICBjYWxsc3ViIF9zdG9yZV9iYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weTo5OQogICAgLy8gcmV0dXJuIHJlbWFpbmluZwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLmJhbGFuY2Vfb2YoYWNjb3VudDogYnl0ZXMpIC0+IHVpbnQ2NDoKYmFsYW5jZV9vZjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEwMS0xMDIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBiYWxhbmNlX29mKHNlbGYsIGFjY291bnQ6IEFjY291bnQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTA0CiAgICAvLyBrZXksIHNsb3QsIGZvdW5kID0gc2VsZi5fYnVja2V0X3Nsb3QoYWNjb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfYnVja2V0X3Nsb3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gcmV0dXJuIHNlbGYuX3JlY29yZGVkX2JhbGFuY2UoYWNjb3VudCwga2V5LCBzbG90LCBmb3VuZCkKICAgIGZyYW1lX2RpZyAtMQogICAgY292ZXIgMwogICAgY2FsbHN1YiBfcmVjb3JkZWRfYmFsYW5jZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5iYWxhbmNlcyhhY2NvdW50czogYnl0ZXMpIC0+IGJ5dGVzOgpiYWxhbmNlczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEwNy0xMTAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBiYWxhbmNlcygKICAgIC8vICAgICBzZWxmLCBhY2NvdW50czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXQogICAgLy8gKSAtPiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF06CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjExMgogICAgLy8gYXNzZXJ0IGFjY291bnRzLmxlbmd0aCA8PSBNQVhfQkFMQU5DRV9RVUVSSUVTLCAiVG9vIG1hbnkgYWNjb3VudHMgZm9yIG9uZSBjYWxsIgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgcHVzaGludCA2MyAvLyA2MwogICAgPD0KICAgIGFzc2VydCAvLyBUb28gbWFueSBhY2NvdW50cyBmb3Igb25lIGNhbGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjExMwogICAgLy8gcmVzdWx0ID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKCkKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIGludGNfMCAvLyAwCgpiYWxhbmNlc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTQKICAgIC8vIGZvciBhY2NvdW50IGluIGFjY291bnRzOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBiYWxhbmNlc19hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTE1CiAgICAvLyBrZXksIHNsb3QsIGZvdW5kID0gc2VsZi5fYnVja2V0X3Nsb3QoYWNjb3VudC5uYXRpdmUpCiAgICBkdXAKICAgIGNhbGxzdWIgX2J1Y2tldF9zbG90CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTYtMTE4CiAgICAvLyByZXN1bHQuYXBwZW5kKAogICAgLy8gICAgIGFyYzQuVUludDY0KHNlbGYuX3JlY29yZGVkX2JhbGFuY2UoYWNjb3VudC5uYXRpdmUsIGtleSwgc2xvdCwgZm91bmQpKQogICAgLy8gKQogICAgZnJhbWVfZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMTcKICAgIC8vIGFyYzQuVUludDY0KHNlbGYuX3JlY29yZGVkX2JhbGFuY2UoYWNjb3VudC5uYXRpdmUsIGtleSwgc2xvdCwgZm91bmQpKQogICAgY292ZXIgNAogICAgY2FsbHN1YiBfcmVjb3JkZWRfYmFsYW5jZQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTE2LTExOAogICAgLy8gcmVzdWx0LmFwcGVuZCgKICAgIC8vICAgICBhcmM0LlVJbnQ2NChzZWxmLl9yZWNvcmRlZF9iYWxhbmNlKGFjY291bnQubmF0aXZlLCBrZXksIHNsb3QsIGZvdW5kKSkKICAgIC8vICkKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOCAvLyA4CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgYmFsYW5jZXNfZm9yX2hlYWRlckAxCgpiYWxhbmNlc19hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjExOQogICAgLy8gcmV0dXJuIHJlc3VsdAogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5taWdyYXRlX2RlcG9zaXRzKGFjY291bnRzOiBieXRlcykgLT4gdWludDY0OgptaWdyYXRlX2RlcG9zaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTIxLTEyMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgbWlncmF0ZV9kZXBvc2l0cyhzZWxmLCBhY2NvdW50czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5BZGRyZXNzXSkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjcKICAgIC8vIG1vdmVkID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTI4CiAgICAvLyBmb3IgYWNjb3VudCBpbiBhY2NvdW50czoKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMAoKbWlncmF0ZV9kZXBvc2l0c19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMjgKICAgIC8vIGZvciBhY2NvdW50IGluIGFjY291bnRzOgogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2RpZyA0CiAgICA8CiAgICBieiBtaWdyYXRlX2RlcG9zaXRzX2FmdGVyX2ZvckA4CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNQogICAgaW50Y18yIC8vIDMyCiAgICAqCiAgICBpbnRjXzIgLy8gMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gYmFsYW5jZSwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShhY2NvdW50Lm5hdGl2ZSkKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMQogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMwCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBtaWdyYXRlX2RlcG9zaXRzX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMxCiAgICAvLyBrZXksIHNsb3QsIGZvdW5kID0gc2VsZi5fYnVja2V0X3Nsb3QoYWNjb3VudC5uYXRpdmUpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjYWxsc3ViIF9idWNrZXRfc2xvdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTMyCiAgICAvLyBzZWxmLl9zdG9yZV9iYWxhbmNlKGFjY291bnQubmF0aXZlLCBiYWxhbmNlLCBrZXksIHNsb3QsIGZvdW5kKQogICAgZGlnIDMKICAgIGZyYW1lX2RpZyAxCiAgICBjb3ZlciA0CiAgICBjb3ZlciA0CiAgICBjYWxsc3ViIF9zdG9yZV9iYWxhbmNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzMKICAgIC8vIGlmIGFjY291bnQubmF0aXZlIG5vdCBpbiBzZWxmLmRlcG9zaXRzOgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAyCiAgICBibnogbWlncmF0ZV9kZXBvc2l0c19hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjEzNAogICAgLy8gbW92ZWQgKz0gMQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKCm1pZ3JhdGVfZGVwb3NpdHNfYWZ0ZXJfaWZfZWxzZUA2OgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMwogICAgZnJhbWVfZGlnIDUKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDUKICAgIGIgbWlncmF0ZV9kZXBvc2l0c19mb3JfaGVhZGVyQDEKCm1pZ3JhdGVfZGVwb3NpdHNfYWZ0ZXJfZm9yQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxMzUKICAgIC8vIHJldHVybiBtb3ZlZAogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5fcmVjb3JkZWRfYmFsYW5jZShhY2NvdW50OiBieXRlcywga2V5OiBieXRlcywgc2xvdDogdWludDY0LCBmb3VuZDogdWludDY0KSAtPiB1aW50NjQ6Cl9yZWNvcmRlZF9iYWxhbmNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTM3LTE0MAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfcmVjb3JkZWRfYmFsYW5jZSgKICAgIC8vICAgICBzZWxmLCBhY2NvdW50OiBBY2NvdW50LCBrZXk6IEJ5dGVzLCBzbG90OiBVSW50NjQsIGZvdW5kOiBib29sICAjIG5vcWE6IEZCVDAwMQogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gYmFsYW5jZSwgZXhpc3RzID0gc2VsZi5kZXBvc2l0cy5tYXliZShhY2NvdW50KQogICAgZnJhbWVfZGlnIC00CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNDMKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IF9yZWNvcmRlZF9iYWxhbmNlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTQ0CiAgICAvLyByZXR1cm4gYmFsYW5jZQogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJldHN1YgoKX3JlY29yZGVkX2JhbGFuY2VfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTQ1CiAgICAvLyBpZiBmb3VuZDoKICAgIGZyYW1lX2RpZyAtMQogICAgYnogX3JlY29yZGVkX2JhbGFuY2VfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNDYKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGtleSwgc2xvdCArIDMyLCA4KSkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18yIC8vIDMyCiAgICArCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIHB1c2hpbnQgOCAvLyA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgc3dhcAogICAgcmV0c3ViCgpfcmVjb3JkZWRfYmFsYW5jZV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNDcKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYmFuay5jb250cmFjdC5CYW5rLl9zdG9yZV9iYWxhbmNlKGFjY291bnQ6IGJ5dGVzLCBiYWxhbmNlOiB1aW50NjQsIGtleTogYnl0ZXMsIHNsb3Q6IHVpbnQ2NCwgZm91bmQ6IHVpbnQ2NCkgLT4gdm9pZDoKX3N0b3JlX2JhbGFuY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNDktMTU3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zdG9yZV9iYWxhbmNlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgYWNjb3VudDogQWNjb3VudCwKICAgIC8vICAgICBiYWxhbmNlOiBVSW50NjQsCiAgICAvLyAgICAga2V5OiBCeXRlcywKICAgIC8vICAgICBzbG90OiBVSW50NjQsCiAgICAvLyAgICAgZm91bmQ6IGJvb2wsICAjIG5vcWE6IEZCVDAwMQogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gNSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNjMKICAgIC8vIGlmIGJhbGFuY2UgPT0gVUludDY0KDApOgogICAgZnJhbWVfZGlnIC00CiAgICBibnogX3N0b3JlX2JhbGFuY2VfZWxzZV9ib2R5QDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gaWYgZm91bmQ6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ6IF9zdG9yZV9iYWxhbmNlX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTY1CiAgICAvLyBvcC5Cb3gucmVwbGFjZShrZXksIHNsb3QsIG9wLmJ6ZXJvKFNMT1RfU0laRSkpCiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICBiemVybwogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gYnVja2V0LCBfZXhpc3RzID0gb3AuQm94LmdldChrZXkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9nZXQKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTY3CiAgICAvLyBpZiBidWNrZXQgPT0gb3AuYnplcm8oQlVDS0VUX1NJWkUpOgogICAgaW50Y18zIC8vIDk2MAogICAgYnplcm8KICAgID09CiAgICBieiBfc3RvcmVfYmFsYW5jZV9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gX2RlbGV0ZWQgPSBvcC5Cb3guZGVsZXRlKGtleSkKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X2RlbAogICAgcG9wCgpfc3RvcmVfYmFsYW5jZV9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNjkKICAgIC8vIGlmIGFjY291bnQgaW4gc2VsZi5kZXBvc2l0czoKICAgIGZyYW1lX2RpZyAtNQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBfc3RvcmVfYmFsYW5jZV9hZnRlcl9pZl9lbHNlQDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzAKICAgIC8vIGRlbCBzZWxmLmRlcG9zaXRzW2FjY291bnRdCiAgICBmcmFtZV9kaWcgLTUKICAgIGJveF9kZWwKICAgIHBvcAoKX3N0b3JlX2JhbGFuY2VfYWZ0ZXJfaWZfZWxzZUAxNzoKICAgIHJldHN1YgoKX3N0b3JlX2JhbGFuY2VfZWxzZV9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzEKICAgIC8vIGVsaWYgZm91bmQgb3Igc2xvdCA8IEJVQ0tFVF9TSVpFOgogICAgZnJhbWVfZGlnIC0xCiAgICBibnogX3N0b3JlX2JhbGFuY2VfaWZfYm9keUAxMAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzMgLy8gOTYwCiAgICA8CiAgICBieiBfc3RvcmVfYmFsYW5jZV9lbHNlX2JvZHlAMTUKCl9zdG9yZV9iYWxhbmNlX2lmX2JvZHlAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzIKICAgIC8vIF9sZW5ndGgsIGJ1Y2tldF9leGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGtleSkKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzMKICAgIC8vIGlmIG5vdCBidWNrZXRfZXhpc3RzOgogICAgYm56IF9zdG9yZV9iYWxhbmNlX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE3NAogICAgLy8gX2NyZWF0ZWQgPSBvcC5Cb3guY3JlYXRlKGtleSwgQlVDS0VUX1NJWkUpCiAgICBmcmFtZV9kaWcgLTMKICAgIGludGNfMyAvLyA5NjAKICAgIGJveF9jcmVhdGUKICAgIHBvcAoKX3N0b3JlX2JhbGFuY2VfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gb3AuQm94LnJlcGxhY2Uoa2V5LCBzbG90LCBhY2NvdW50LmJ5dGVzICsgb3AuaXRvYihiYWxhbmNlKSkKICAgIGZyYW1lX2RpZyAtNAogICAgaXRvYgogICAgZnJhbWVfZGlnIC01CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzYKICAgIC8vIGlmIGFjY291bnQgaW4gc2VsZi5kZXBvc2l0czoKICAgIGZyYW1lX2RpZyAtNQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBfc3RvcmVfYmFsYW5jZV9hZnRlcl9pZl9lbHNlQDE3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzcKICAgIC8vIGRlbCBzZWxmLmRlcG9zaXRzW2FjY291bnRdCiAgICBmcmFtZV9kaWcgLTUKICAgIGJveF9kZWwKICAgIHBvcAogICAgcmV0c3ViCgpfc3RvcmVfYmFsYW5jZV9lbHNlX2JvZHlAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxNzkKICAgIC8vIHNlbGYuZGVwb3NpdHNbYWNjb3VudF0gPSBiYWxhbmNlCiAgICBmcmFtZV9kaWcgLTQKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtNQogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJhbmsuY29udHJhY3QuQmFuay5fYnVja2V0X3Nsb3QoYWNjb3VudDogYnl0ZXMpIC0+IGJ5dGVzLCB1aW50NjQsIHVpbnQ2NDoKX2J1Y2tldF9zbG90OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTgxLTE4MgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfYnVja2V0X3Nsb3Qoc2VsZiwgYWNjb3VudDogQWNjb3VudCkgLT4gdHVwbGVbQnl0ZXMsIFVJbnQ2NCwgYm9vbF06CiAgICBwcm90byAxIDMKICAgIGludGNfMCAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTg4CiAgICAvLyBidWNrZXRzID0gVGVtcGxhdGVWYXJbVUludDY0XSgiREVQT1NJVF9CVUNLRVRTIikKICAgIGludGMgNSAvLyBUTVBMX0RFUE9TSVRfQlVDS0VUUwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxODkKICAgIC8vIGlmIGJ1Y2tldHMgPT0gMDoKICAgIGJueiBfYnVja2V0X3Nsb3RfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTAKICAgIC8vIHJldHVybiBCeXRlcygpLCBVSW50NjQoQlVDS0VUX1NJWkUpLCBGYWxzZQogICAgYnl0ZWNfMSAvLyAweAogICAgaW50Y18zIC8vIDk2MAogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMgogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX2J1Y2tldF9zbG90X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE5MQogICAgLy8gYnVja2V0ID0gb3AuYnRvaShvcC5leHRyYWN0KG9wLnNoYTI1NihhY2NvdW50LmJ5dGVzKSwgMCwgOCkpICUgYnVja2V0cwogICAgZnJhbWVfZGlnIC0xCiAgICBzaGEyNTYKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIDUKICAgICUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjE5MgogICAgLy8ga2V5ID0gQnl0ZXMoYiJrIikgKyBvcC5pdG9iKGJ1Y2tldCkKICAgIGl0b2IKICAgIHB1c2hieXRlcyAweDZiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTMKICAgIC8vIF9sZW5ndGgsIGJ1Y2tldF9leGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGtleSkKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTk0CiAgICAvLyBpZiBub3QgYnVja2V0X2V4aXN0czoKICAgIGJueiBfYnVja2V0X3Nsb3RfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTUtMTk2CiAgICAvLyAjIEEgbmV3IGJ1Y2tldDogdGhlIGFjY291bnQgdGFrZXMgdGhlIGZpcnN0IHNsb3Qgb25jZSB0aGUgYm94IGlzIGNyZWF0ZWQuCiAgICAvLyByZXR1cm4ga2V5LCBVSW50NjQoMCksIEZhbHNlCiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18wIC8vIDAKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfYnVja2V0X3Nsb3RfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MTk3CiAgICAvLyBmcmVlID0gVUludDY0KEJVQ0tFVF9TSVpFKQogICAgaW50Y18zIC8vIDk2MAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTgKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZSgwLCBCVUNLRVRfU0laRSwgU0xPVF9TSVpFKToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDQKCl9idWNrZXRfc2xvdF9mb3JfaGVhZGVyQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTgKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZSgwLCBCVUNLRVRfU0laRSwgU0xPVF9TSVpFKToKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzMgLy8gOTYwCiAgICA8CiAgICBieiBfYnVja2V0X3Nsb3RfYWZ0ZXJfZm9yQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTkKICAgIC8vIG93bmVyID0gb3AuQm94LmV4dHJhY3Qoa2V5LCBzbG90LCAzMikKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18yIC8vIDMyCiAgICBib3hfZXh0cmFjdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gaWYgb3duZXIgPT0gYWNjb3VudC5ieXRlczoKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IF9idWNrZXRfc2xvdF9hZnRlcl9pZl9lbHNlQDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gcmV0dXJuIGtleSwgc2xvdCwgVHJ1ZQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfYnVja2V0X3Nsb3RfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JhbmsvY29udHJhY3QucHk6MjAyCiAgICAvLyBpZiBmcmVlID09IEJVQ0tFVF9TSVpFIGFuZCBvd25lciA9PSBHbG9iYWwuemVyb19hZGRyZXNzLmJ5dGVzOgogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgaW50Y18zIC8vIDk2MAogICAgPT0KICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMwogICAgYnogX2J1Y2tldF9zbG90X2FmdGVyX2lmX2Vsc2VAMTEKICAgIGZyYW1lX2RpZyAxCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgID09CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfYnVyeSAzCiAgICBieiBfYnVja2V0X3Nsb3RfYWZ0ZXJfaWZfZWxzZUAxMQogICAgZnJhbWVfZGlnIDQKICAgIGZyYW1lX2J1cnkgMwoKX2J1Y2tldF9zbG90X2FmdGVyX2lmX2Vsc2VAMTE6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYmFuay9jb250cmFjdC5weToxOTgKICAgIC8vIGZvciBzbG90IGluIHVyYW5nZSgwLCBCVUNLRVRfU0laRSwgU0xPVF9TSVpFKToKICAgIGZyYW1lX2RpZyA0CiAgICBwdXNoaW50IDQwIC8vIDQwCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgX2J1Y2tldF9zbG90X2Zvcl9oZWFkZXJANQoKX2J1Y2tldF9zbG90X2FmdGVyX2ZvckAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9iYW5rL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gcmV0dXJuIGtleSwgZnJlZSwgRmFsc2UKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMgogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [282], "errorMessage": "Deposit amount is below the minimum"}, {"pc": [277], "errorMessage": "Deposit amount must be greater than zero"}, {"pc": [463, 465, 471, 610, 682], "errorMessage": "Index access is out of bounds"}, {"pc": [349, 426], "errorMessage": "No deposits found for this account"}, {"pc": [433], "errorMessage": "No payouts given"}, {"pc": [117, 137, 156, 179, 199, 220], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [271], "errorMessage": "Receiver must be the contract address"}, {"pc": [583], "errorMessage": "Too many accounts for one call"}, {"pc": [437], "errorMessage": "Too many payouts for one transaction group"}, {"pc": [358, 536], "errorMessage": "Withdrawal amount exceeds balance"}, {"pc": [352, 485], "errorMessage": "Withdrawal amount must be greater than zero"}, {"pc": [258], "errorMessage": "can only call when creating"}, {"pc": [120, 140, 159, 182, 202, 223], "errorMessage": "can only call when not creating"}, {"pc": [321], "errorMessage": "check self.total_deposit exists"}, {"pc": [239], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"MIN_DEPOSIT": {"type": "AVMUint64"}, "DEPOSIT_BUCKETS": {"type": "AVMUint64"}}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -83,6 +83,42 @@ class WithdrawArgs:
     def abi_method_signature(self) -> str:
         return "withdraw(uint64)uint64"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class WithdrawBatchArgs:
+    """Dataclass for withdraw_batch arguments"""
+    payouts: list[tuple[str, int]]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "withdraw_batch((address,uint64)[])uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BalanceOfArgs:
+    """Dataclass for balance_of arguments"""
+    account: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "balance_of(account)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class BalancesArgs:
+    """Dataclass for balances arguments"""
+    accounts: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "balances(address[])uint64[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class MigrateDepositsArgs:
+    """Dataclass for migrate_deposits arguments"""
+    accounts: list[str]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "migrate_deposits(address[])uint64"
+
 
 class BankParams:
     def __init__(self, app_client: algokit_utils.AppClient):
@@ -114,6 +150,58 @@ class BankParams:
             "args": method_args,
         }))
 
+    def withdraw_batch(
+        self,
+        args: tuple[list[tuple[str, int]]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_batch((address,uint64)[])uint64",
+            "args": method_args,
+        }))
+
+    def balance_of(
+        self,
+        args: tuple[str | bytes] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "balance_of(account)uint64",
+            "args": method_args,
+        }))
+
+    def balances(
+        self,
+        args: tuple[list[str]] | BalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "balances(address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def migrate_deposits(
+        self,
+        args: tuple[list[str]] | MigrateDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate_deposits(address[])uint64",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -155,6 +243,58 @@ class BankCreateTransactionParams:
             "args": method_args,
         }))
 
+    def withdraw_batch(
+        self,
+        args: tuple[list[tuple[str, int]]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_batch((address,uint64)[])uint64",
+            "args": method_args,
+        }))
+
+    def balance_of(
+        self,
+        args: tuple[str | bytes] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "balance_of(account)uint64",
+            "args": method_args,
+        }))
+
+    def balances(
+        self,
+        args: tuple[list[str]] | BalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "balances(address[])uint64[]",
+            "args": method_args,
+        }))
+
+    def migrate_deposits(
+        self,
+        args: tuple[list[str]] | MigrateDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate_deposits(address[])uint64",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -202,6 +342,70 @@ class BankSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def withdraw_batch(
+        self,
+        args: tuple[list[tuple[str, int]]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_batch((address,uint64)[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def balance_of(
+        self,
+        args: tuple[str | bytes] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "balance_of(account)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def balances(
+        self,
+        args: tuple[list[str]] | BalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "balances(address[])uint64[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def migrate_deposits(
+        self,
+        args: tuple[list[str]] | MigrateDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "migrate_deposits(address[])uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -491,6 +695,30 @@ class BankClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw_batch((address,uint64)[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["balance_of(account)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["balances(address[])uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["migrate_deposits(address[])uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -501,7 +729,7 @@ class BankClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | list[int]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -712,6 +940,86 @@ class BankFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def withdraw_batch(
+        self,
+        args: tuple[list[tuple[str, int]]] | WithdrawBatchArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw_batch((address,uint64)[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "withdraw_batch((address,uint64)[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def balance_of(
+        self,
+        args: tuple[str | bytes] | BalanceOfArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the balance_of(account)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "balance_of(account)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def balances(
+        self,
+        args: tuple[list[str]] | BalancesArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the balances(address[])uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "balances(address[])uint64[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def migrate_deposits(
+        self,
+        args: tuple[list[str]] | MigrateDepositsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the migrate_deposits(address[])uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "migrate_deposits(address[])uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class BankFactoryUpdateParams:
     """Parameters for 'update' operations of Bank contract"""
 
@@ -849,6 +1157,78 @@ class BankComposer:
         )
         return self
 
+    def withdraw_batch(
+        self,
+        args: tuple[list[tuple[str, int]]] | WithdrawBatchArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw_batch(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw_batch((address,uint64)[])uint64", v
+            )
+        )
+        return self
+
+    def balance_of(
+        self,
+        args: tuple[str | bytes] | BalanceOfArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.balance_of(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "balance_of(account)uint64", v
+            )
+        )
+        return self
+
+    def balances(
+        self,
+        args: tuple[list[str]] | BalancesArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.balances(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "balances(address[])uint64[]", v
+            )
+        )
+        return self
+
+    def migrate_deposits(
+        self,
+        args: tuple[list[str]] | MigrateDepositsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BankComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.migrate_deposits(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "migrate_deposits(address[])uint64", v
+            )
+        )
+        return self
+
     def clear_state(
         self,
         *,
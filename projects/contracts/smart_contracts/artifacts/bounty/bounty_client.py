@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}, {"type": "uint64", "name": "amount"}], "name": "create_bounty", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "claim", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "submit_work", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "approve", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "cancel", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_bounty_info", "returns": {"type": "(address,address,uint64,uint64)"}, "events": [], "readonly": true, "recommendations": {}}], "name": "Bounty", "state": {"keys": {"box": {}, "global": {"creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "worker": {"key": "d29ya2Vy", "keyType": "AVMString", "valueType": "address"}, "amount": {"key": "YW1vdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiADAAECJgQGc3RhdHVzB2NyZWF0b3IGYW1vdW50BndvcmtlcjEYQAAOKTEAZysyA2cqImcoImcxG0EAoIIGBIemS6wE8Vd3JgTrJGf2BNYR29gEMfJqmwTtFe22NhoAjgYAVQBJAD0AMQAlAAIiQzEZFEQxGESIASJMFkwWTwNPA1BPAlBMUIAEFR98dUxQsCNDMRkURDEYRIgA1SNDMRkURDEYRIgAniNDMRkURDEYRIgAfyNDMRkURDEYRIgAXSNDMRkURDEYRDEWIwlJOBAjEkQ2GgEXiAANI0MxGUD/jDEYFEQjQ4oCADEAIillRBJEIiplRBREIihlRBREi/44ACIpZUQSRIv+OAcyChJEi/44CIv/EkQqi/9niSIoZUQURDEAIillRBNEKzEAZygjZ4kxACIrZUQSRCIoZUQjEkQoJGeJMQAiKWVEEkQiKGVEJBJEsSIrZUQiKmVEsgiyByOyECKyAbMqImcogQNniTEAIillRBJEIihlRBREsSIpZUQiKmVEsgiyByOyECKyAbMqImcogQRniSIpZUQiK2VEIiplRCIoZUSJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMgogICAgYnl0ZWNibG9jayAic3RhdHVzIiAiY3JlYXRvciIgImFtb3VudCIgIndvcmtlciIKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQKICAgIC8vIHNlbGYuY3JlYXRvciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNQogICAgLy8gc2VsZi53b3JrZXIgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2CiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE3CiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTEKICAgIHB1c2hieXRlc3MgMHg4N2E2NGJhYyAweGYxNTc3NzI2IDB4ZWIyNDY3ZjYgMHhkNjExZGJkOCAweDMxZjI2YTliIDB4ZWQxNWVkYjYgLy8gbWV0aG9kICJjcmVhdGVfYm91bnR5KHBheSx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2xhaW0oKXZvaWQiLCBtZXRob2QgInN1Ym1pdF93b3JrKCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlKCl2b2lkIiwgbWV0aG9kICJjYW5jZWwoKXZvaWQiLCBtZXRob2QgImdldF9ib3VudHlfaW5mbygpKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUA1IG1haW5fY2xhaW1fcm91dGVANiBtYWluX3N1Ym1pdF93b3JrX3JvdXRlQDcgbWFpbl9hcHByb3ZlX3JvdXRlQDggbWFpbl9jYW5jZWxfcm91dGVAOSBtYWluX2dldF9ib3VudHlfaW5mb19yb3V0ZUAxMAoKbWFpbl9hZnRlcl9pZl9lbHNlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9ib3VudHlfaW5mbwogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NhbmNlbF9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2FuY2VsCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGFwcHJvdmUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc3VibWl0X3dvcmtfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHN1Ym1pdF93b3JrCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBjbGFpbQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfYm91bnR5X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9ib3VudHkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTMKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY3JlYXRlX2JvdW50eShwYXltZW50OiB1aW50NjQsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpjcmVhdGVfYm91bnR5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxOS0yMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2JvdW50eShzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjIKICAgIC8vIGFzc2VydCBzZWxmLmFtb3VudCA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjIzCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyNQogICAgLy8gYXNzZXJ0IHBheW1lbnQuc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI2CiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyNwogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IGFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyOQogICAgLy8gc2VsZi5hbW91bnQgPSBhbW91bnQKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmNsYWltKCkgLT4gdm9pZDoKY2xhaW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMzCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgIT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgIT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNgogICAgLy8gc2VsZi53b3JrZXIgPSBUeG4uc2VuZGVyCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNwogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuc3VibWl0X3dvcmsoKSAtPiB2b2lkOgpzdWJtaXRfd29yazoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYud29ya2VyCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAid29ya2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndvcmtlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDIKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KDIpCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBpbnRjXzIgLy8gMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmFwcHJvdmUoKSAtPiB2b2lkOgphcHByb3ZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo0OAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo0OQogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1MS01NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYud29ya2VyLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NTIKICAgIC8vIHJlY2VpdmVyPXNlbGYud29ya2VyLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53b3JrZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUzCiAgICAvLyBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NTEtNTQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1NgogICAgLy8gc2VsZi5hbW91bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1NwogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMykKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY2FuY2VsKCkgLT4gdm9pZDoKY2FuY2VsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NjQtNjcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmNyZWF0b3IsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2NQogICAgLy8gcmVjZWl2ZXI9c2VsZi5jcmVhdG9yLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NjYKICAgIC8vIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NjQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2NC02NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYuY3JlYXRvciwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2OQogICAgLy8gc2VsZi5hbW91bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoNCkKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuZ2V0X2JvdW50eV9pbmZvKCkgLT4gYnl0ZXMsIGJ5dGVzLCB1aW50NjQsIHVpbnQ2NDoKZ2V0X2JvdW50eV9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3NAogICAgLy8gcmV0dXJuIHNlbGYuY3JlYXRvciwgc2VsZi53b3JrZXIsIHNlbGYuYW1vdW50LCBzZWxmLnN0YXR1cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [115, 150, 162, 174, 186, 198], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [229], "errorMessage": "can only call when creating"}, {"pc": [118, 153, 165, 177, 189, 201], "errorMessage": "can only call when not creating"}, {"pc": [246, 350, 392, 423], "errorMessage": "check self.amount exists"}, {"pc": [240, 262, 297, 332, 375, 388, 415], "errorMessage": "check self.creator exists"}, {"pc": [252, 289, 319, 338, 381, 427], "errorMessage": "check self.status exists"}, {"pc": [313, 346, 419], "errorMessage": "check self.worker exists"}, {"pc": [211], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}, {"type": "uint64", "name": "amount"}], "name": "create_bounty", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "claim", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "submit_work", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "claim_and_submit", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "approve", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "cancel", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}, {"type": "uint64", "name": "amount"}], "name": "reopen", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "delete", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["DeleteApplication"], "create": []}, "args": [], "name": "approve_and_close", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_bounty_info", "returns": {"type": "(address,address,uint64,uint64)"}, "events": [], "readonly": true, "recommendations": {}}], "name": "Bounty", "state": {"keys": {"box": {}, "global": {"creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "worker": {"key": "d29ya2Vy", "keyType": "AVMString", "valueType": "address"}, "amount": {"key": "YW1vdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 2}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAFAAECA4niruWn/+X41wEmBQZzdGF0dXMGYW1vdW50B2NyZWF0b3IGd29ya2VyIDAuUi9wABlmicbv3sPCy9jv2oQ/y330bQgawoFVmJL3IjEYQAAaJwRJRQIyAxJBAR0xACpMZysyA2cpImcoImcxG0EA/oIKBIemS6wE8Vd3JgTrJGf2BEBMaLAE1hHb2AQx8mqbBDy7iowEJDeNPATpmMIgBO0V7bY2GgCOCgCXAIsAfwBzAGcAWwBBADMAJQACIkMxGRREMRhEiAJ/TBZMFk8DTwNQTwJQTFCABBUffHVMULAjQzEZgQUSRDEYRIgCHCNDMRmBBRJEMRhEiAHNI0MxGRREMRhEMRYjCUk4ECMSRDYaAReIAV4jQzEZFEQxGESIASEjQzEZFEQxGESIAOQjQzEZFEQxGESIALsjQzEZFEQxGESIAJUjQzEZFEQxGESIAGwjQzEZFEQxGEQxFiMJSTgQIxJENhoBF4gAESNDMRlA/0oxGBREI0NJQv7higIAMQAiKmVEEkQiKWVEFEQiKGVEFESL/jgAIiplRBJEi/44BzIKEkSL/jgIi/8SRIv/IQQPRCmL/2eL/4gBnIkiKGVEFEQxACIqZUQTRCsxAGcoI2ciKWVEiAF/iTEAIitlRBJEIihlRCMSRCgkZyIpZUSIAWWJIihlRBREMQAiKmVEE0QrMQBnKCRnIillRIgBSIkxACIqZUQSRCIoZUQkEkQiKWVEsSIrZUQiKWVEsgiyByOyECKyAbMpImcoJWeIAReJMQAiKmVEEkQiKGVEFEQiKWVEsSIqZUQiKWVEsgiyByOyECKyAbMpImcogQRniADmiYoCADEAIiplRBJEIihlRCUSQAAKIihlRIEEEkEAMyNEi/44ACIqZUQSRIv+OAcyChJEi/44CIv/EkSL/yEED0QrMgNnKYv/ZygiZ4v/iACViSJC/8oxACIqZUQSQAAIMQAyCRJBACsjRCIoZUQlEkAACiIoZUSBBBJBABIjRLEyCUmyCbIHI7IQIrIBs4kiQv/rIkL/0jEAIiplRBJEIihlRCQSRCIpZUSxIitlREsBsgiyByOyECKyAbOxMglJsgmyByOyECKyAbMpImcoJWeIABKJIiplRCIrZUQiKWVEIihlRImKAQAiKmVEIitlRIv/FiIoZUQWTwNPA1BPAlBMUIAElvPNdkxQsIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiAzIFRNUExfTUlOX0JPVU5UWV9BTU9VTlQKICAgIGJ5dGVjYmxvY2sgInN0YXR1cyIgImFtb3VudCIgImNyZWF0b3IiICJ3b3JrZXIiIFRNUExfRklYRURfQ1JFQVRPUgogICAgaW50Y18wIC8vIDAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjMtMjQKICAgIC8vICMgRGVwbG95LXRpbWUgdmFyaWFudHM6IGEgemVybyBGSVhFRF9DUkVBVE9SIG1ha2VzIHRoZSBhcHAgY3JlYXRvciB0aGUgYm91bnR5IGNyZWF0b3IuCiAgICAvLyBmaXhlZF9jcmVhdG9yID0gVGVtcGxhdGVWYXJbQWNjb3VudF0oIkZJWEVEX0NSRUFUT1IiKQogICAgYnl0ZWMgNCAvLyBUTVBMX0ZJWEVEX0NSRUFUT1IKICAgIGR1cAogICAgYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI2CiAgICAvLyBUeG4uc2VuZGVyIGlmIGZpeGVkX2NyZWF0b3IgPT0gR2xvYmFsLnplcm9fYWRkcmVzcyBlbHNlIGZpeGVkX2NyZWF0b3IKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGJ6IG1haW5fdGVybmFyeV9mYWxzZUA3CiAgICB0eG4gU2VuZGVyCgptYWluX3Rlcm5hcnlfbWVyZ2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjUKICAgIC8vIHNlbGYuY3JlYXRvciA9ICgKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI1LTI3CiAgICAvLyBzZWxmLmNyZWF0b3IgPSAoCiAgICAvLyAgICAgVHhuLnNlbmRlciBpZiBmaXhlZF9jcmVhdG9yID09IEdsb2JhbC56ZXJvX2FkZHJlc3MgZWxzZSBmaXhlZF9jcmVhdG9yCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyOAogICAgLy8gc2VsZi53b3JrZXIgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI5CiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMwCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQKICAgIC8vIGNsYXNzIEJvdW50eShBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDIxCiAgICBwdXNoYnl0ZXNzIDB4ODdhNjRiYWMgMHhmMTU3NzcyNiAweGViMjQ2N2Y2IDB4NDA0YzY4YjAgMHhkNjExZGJkOCAweDMxZjI2YTliIDB4M2NiYjhhOGMgMHgyNDM3OGQzYyAweGU5OThjMjIwIDB4ZWQxNWVkYjYgLy8gbWV0aG9kICJjcmVhdGVfYm91bnR5KHBheSx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2xhaW0oKXZvaWQiLCBtZXRob2QgInN1Ym1pdF93b3JrKCl2b2lkIiwgbWV0aG9kICJjbGFpbV9hbmRfc3VibWl0KCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlKCl2b2lkIiwgbWV0aG9kICJjYW5jZWwoKXZvaWQiLCBtZXRob2QgInJlb3BlbihwYXksdWludDY0KXZvaWQiLCBtZXRob2QgImRlbGV0ZSgpdm9pZCIsIG1ldGhvZCAiYXBwcm92ZV9hbmRfY2xvc2UoKXZvaWQiLCBtZXRob2QgImdldF9ib3VudHlfaW5mbygpKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUAxMSBtYWluX2NsYWltX3JvdXRlQDEyIG1haW5fc3VibWl0X3dvcmtfcm91dGVAMTMgbWFpbl9jbGFpbV9hbmRfc3VibWl0X3JvdXRlQDE0IG1haW5fYXBwcm92ZV9yb3V0ZUAxNSBtYWluX2NhbmNlbF9yb3V0ZUAxNiBtYWluX3Jlb3Blbl9yb3V0ZUAxNyBtYWluX2RlbGV0ZV9yb3V0ZUAxOCBtYWluX2FwcHJvdmVfYW5kX2Nsb3NlX3JvdXRlQDE5IG1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDIwCgptYWluX2FmdGVyX2lmX2Vsc2VAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNTQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfYm91bnR5X2luZm8KICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX2FuZF9jbG9zZV9yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTMyCiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgRGVsZXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBhcHByb3ZlX2FuZF9jbG9zZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfcm91dGVAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjExOQogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZGVsZXRlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3Jlb3Blbl9yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTAzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNAogICAgLy8gY2xhc3MgQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTAzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVvcGVuCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NhbmNlbF9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6ODgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNhbmNlbAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgYXBwcm92ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbGFpbV9hbmRfc3VibWl0X3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xhaW1fYW5kX3N1Ym1pdAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zdWJtaXRfd29ya19yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NTUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHN1Ym1pdF93b3JrCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo0NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xhaW0KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9ib3VudHkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNAogICAgLy8gY2xhc3MgQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIzCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl90ZXJuYXJ5X2ZhbHNlQDc6CiAgICBkdXAKICAgIGIgbWFpbl90ZXJuYXJ5X21lcmdlQDgKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5jcmVhdGVfYm91bnR5KHBheW1lbnQ6IHVpbnQ2NCwgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CmNyZWF0ZV9ib3VudHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMyLTMzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfYm91bnR5KHNlbGYsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNQogICAgLy8gYXNzZXJ0IHNlbGYuYW1vdW50ID09IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzYKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjM4CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzkKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPT0gYW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQxCiAgICAvLyBhc3NlcnQgYW1vdW50ID49IFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1JTl9CT1VOVFlfQU1PVU5UIikKICAgIGZyYW1lX2RpZyAtMQogICAgaW50YyA0IC8vIFRNUExfTUlOX0JPVU5UWV9BTU9VTlQKICAgID49CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDMKICAgIC8vIHNlbGYuYW1vdW50ID0gYW1vdW50CiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKGFtb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY2xhaW0oKSAtPiB2b2lkOgpjbGFpbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDgKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciAhPSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAhPQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLndvcmtlciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUyCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgxKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUzCiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHNlbGYuYW1vdW50KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICBjYWxsc3ViIF9lbWl0X3N0YXR1c19jaGFuZ2VkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5zdWJtaXRfd29yaygpIC0+IHZvaWQ6CnN1Ym1pdF93b3JrOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi53b3JrZXIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1OAogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MAogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMikKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGludGNfMiAvLyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MQogICAgLy8gc2VsZi5fZW1pdF9zdGF0dXNfY2hhbmdlZChzZWxmLmFtb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY2xhaW1fYW5kX3N1Ym1pdCgpIC0+IHZvaWQ6CmNsYWltX2FuZF9zdWJtaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjY1LTY2CiAgICAvLyAjIEZhc3QgcGF0aCBmb3IgYSB3b3JrZXIgd2hvIGFscmVhZHkgaGFzIHRoZSBkZWxpdmVyYWJsZTogY2xhaW0gYW5kIHN1Ym1pdCBpbiBvbmUgY2FsbC4KICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciAhPSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAhPQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjY5CiAgICAvLyBzZWxmLndvcmtlciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgyKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18yIC8vIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjcxCiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHNlbGYuYW1vdW50KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICBjYWxsc3ViIF9lbWl0X3N0YXR1c19jaGFuZ2VkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5hcHByb3ZlKCkgLT4gdm9pZDoKYXBwcm92ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzYKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMikKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzcKICAgIC8vIHBhaWQgPSBzZWxmLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojc5LTgyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi53b3JrZXIsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo4MAogICAgLy8gcmVjZWl2ZXI9c2VsZi53b3JrZXIsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAid29ya2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndvcmtlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6ODEKICAgIC8vIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3OS04MgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYud29ya2VyLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgzKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18zIC8vIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHBhaWQpCiAgICBjYWxsc3ViIF9lbWl0X3N0YXR1c19jaGFuZ2VkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5jYW5jZWwoKSAtPiB2b2lkOgpjYW5jZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjkwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo5MgogICAgLy8gcmVmdW5kZWQgPSBzZWxmLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojk0LTk3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5jcmVhdG9yLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6OTUKICAgIC8vIHJlY2VpdmVyPXNlbGYuY3JlYXRvciwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6OTQtOTcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmNyZWF0b3IsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6OTkKICAgIC8vIHNlbGYuYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTAwCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCg0KQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgcHVzaGludCA0IC8vIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gc2VsZi5fZW1pdF9zdGF0dXNfY2hhbmdlZChyZWZ1bmRlZCkKICAgIGNhbGxzdWIgX2VtaXRfc3RhdHVzX2NoYW5nZWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LnJlb3BlbihwYXltZW50OiB1aW50NjQsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpyZW9wZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEwMy0xMDQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlb3BlbihzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTA1LTEwNgogICAgLy8gIyBTdGFydHMgYSBuZXcgYm91bnR5IGluIGEgZmluaXNoZWQgYXBwLCBzYXZpbmcgYW4gYXBwIGNyZWF0aW9uIGFuZCBmdW5kaW5nIHJvdW5kLgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMDcKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGludGNfMyAvLyAzCiAgICA9PQogICAgYm56IHJlb3Blbl9ib29sX3RydWVAMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGJ6IHJlb3Blbl9ib29sX2ZhbHNlQDMKCnJlb3Blbl9ib29sX3RydWVAMjoKICAgIGludGNfMSAvLyAxCgpyZW9wZW5fYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMDcKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTA5CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTEwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMTEKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBhbW91bnQKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQW1vdW50CiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTEyCiAgICAvLyBhc3NlcnQgYW1vdW50ID49IFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1JTl9CT1VOVFlfQU1PVU5UIikKICAgIGZyYW1lX2RpZyAtMQogICAgaW50YyA0IC8vIFRNUExfTUlOX0JPVU5UWV9BTU9VTlQKICAgID49CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTE0CiAgICAvLyBzZWxmLndvcmtlciA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTE1CiAgICAvLyBzZWxmLmFtb3VudCA9IGFtb3VudAogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMTYKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTE3CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKGFtb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgpyZW9wZW5fYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgcmVvcGVuX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmRlbGV0ZSgpIC0+IHZvaWQ6CmRlbGV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTIxLTEyMwogICAgLy8gIyBSZW1vdmVzIGEgZmluaXNoZWQgYm91bnR5IGZyb20gaXRzIGNyZWF0b3IncyBhY2NvdW50OyB0aGUgYXBwIGFjY291bnQncyByZW1haW5pbmcKICAgIC8vICMgYmFsYW5jZSBnb2VzIGJhY2sgdG8gdGhlIGFwcCBjcmVhdG9yLCB3aG8gZnVuZGVkIGl0cyBtaW5pbXVtIGJhbGFuY2UuCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3Igb3IgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGJueiBkZWxldGVfYm9vbF90cnVlQDIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGJ6IGRlbGV0ZV9ib29sX2ZhbHNlQDMKCmRlbGV0ZV9ib29sX3RydWVAMjoKICAgIGludGNfMSAvLyAxCgpkZWxldGVfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjEtMTIzCiAgICAvLyAjIFJlbW92ZXMgYSBmaW5pc2hlZCBib3VudHkgZnJvbSBpdHMgY3JlYXRvcidzIGFjY291bnQ7IHRoZSBhcHAgYWNjb3VudCdzIHJlbWFpbmluZwogICAgLy8gIyBiYWxhbmNlIGdvZXMgYmFjayB0byB0aGUgYXBwIGNyZWF0b3IsIHdobyBmdW5kZWQgaXRzIG1pbmltdW0gYmFsYW5jZS4KICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciBvciBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjQKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGludGNfMyAvLyAzCiAgICA9PQogICAgYm56IGRlbGV0ZV9ib29sX3RydWVANgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGJ6IGRlbGV0ZV9ib29sX2ZhbHNlQDcKCmRlbGV0ZV9ib29sX3RydWVANjoKICAgIGludGNfMSAvLyAxCgpkZWxldGVfYm9vbF9tZXJnZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjQKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTI2LTEzMAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEyNwogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjgKICAgIC8vIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTI2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEyOQogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTI2LTEzMAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgpkZWxldGVfYm9vbF9mYWxzZUA3OgogICAgaW50Y18wIC8vIDAKICAgIGIgZGVsZXRlX2Jvb2xfbWVyZ2VAOAoKZGVsZXRlX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGRlbGV0ZV9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5hcHByb3ZlX2FuZF9jbG9zZSgpIC0+IHZvaWQ6CmFwcHJvdmVfYW5kX2Nsb3NlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMzQtMTM1CiAgICAvLyAjIGFwcHJvdmUgZm9sbG93ZWQgYnkgZGVsZXRlIGluIG9uZSBjYWxsOyB0aGUgY2FsbCBwYXlzIHRoZSBmZWVzIG9mIGJvdGggaW5uZXIgcGF5bWVudHMuCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMzcKICAgIC8vIHBhaWQgPSBzZWxmLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzOS0xNDMKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIC8vICAgICBhbW91bnQ9cGFpZCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQwCiAgICAvLyByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzOQogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNDIKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzOS0xNDMKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIC8vICAgICBhbW91bnQ9cGFpZCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0NC0xNDgKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNDUKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGR1cAogICAgaXR4bl9maWVsZCBDbG9zZVJlbWFpbmRlclRvCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNDcKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0NC0xNDgKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMykKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGludGNfMyAvLyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNTIKICAgIC8vIHNlbGYuX2VtaXRfc3RhdHVzX2NoYW5nZWQocGFpZCkKICAgIGNhbGxzdWIgX2VtaXRfc3RhdHVzX2NoYW5nZWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmdldF9ib3VudHlfaW5mbygpIC0+IGJ5dGVzLCBieXRlcywgdWludDY0LCB1aW50NjQ6CmdldF9ib3VudHlfaW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTU3CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE1OAogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYud29ya2VyKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNTkKICAgIC8vIHNlbGYuYW1vdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2MAogICAgLy8gc2VsZi5zdGF0dXMsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTU2LTE2MQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi53b3JrZXIpLAogICAgLy8gICAgIHNlbGYuYW1vdW50LAogICAgLy8gICAgIHNlbGYuc3RhdHVzLAogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuX2VtaXRfc3RhdHVzX2NoYW5nZWQoYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6Cl9lbWl0X3N0YXR1c19jaGFuZ2VkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNjMtMTY0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9lbWl0X3N0YXR1c19jaGFuZ2VkKHNlbGYsIGFtb3VudDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2OAogICAgLy8gY3JlYXRvcj1hcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2OQogICAgLy8gd29ya2VyPWFyYzQuQWRkcmVzcyhzZWxmLndvcmtlciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAid29ya2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndvcmtlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTcwCiAgICAvLyBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNzEKICAgIC8vIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTY3LTE3MgogICAgLy8gQm91bnR5U3RhdHVzQ2hhbmdlZCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgLy8gICAgIHdvcmtlcj1hcmM0LkFkZHJlc3Moc2VsZi53b3JrZXIpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2Ni0xNzMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBCb3VudHlTdGF0dXNDaGFuZ2VkKAogICAgLy8gICAgICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgLy8gICAgICAgICB3b3JrZXI9YXJjNC5BZGRyZXNzKHNlbGYud29ya2VyKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4OTZmM2NkNzYgLy8gbWV0aG9kICJCb3VudHlTdGF0dXNDaGFuZ2VkKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [237, 251], "errorMessage": "OnCompletion is not DeleteApplication"}, {"pc": [200, 263, 289, 301, 313, 325, 337, 349], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [380], "errorMessage": "can only call when creating"}, {"pc": [203, 240, 254, 266, 292, 304, 316, 328, 340, 352], "errorMessage": "can only call when not creating"}, {"pc": [401, 476, 502, 531, 554, 563, 602, 611, 802, 857], "errorMessage": "check self.amount exists"}, {"pc": [395, 417, 463, 518, 541, 590, 607, 642, 673, 724, 789, 849, 869], "errorMessage": "check self.creator exists"}, {"pc": [407, 455, 492, 510, 547, 596, 648, 657, 742, 751, 795, 861, 880], "errorMessage": "check self.status exists"}, {"pc": [486, 559, 807, 853, 873], "errorMessage": "check self.worker exists"}, {"pc": [276, 362], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {"MIN_BOUNTY_AMOUNT": {"type": "AVMUint64"}, "FIXED_CREATOR": {"type": "address"}}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -74,11 +74,52 @@ class CreateBountyArgs:
     def abi_method_signature(self) -> str:
         return "create_bounty(pay,uint64)void"
 
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ReopenArgs:
+    """Dataclass for reopen arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "reopen(pay,uint64)void"
+
+
+class _BountyDelete:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def delete(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppDeleteMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "delete()void",
+        }))
+
+    def approve_and_close(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppDeleteMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.delete(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_and_close()void",
+        }))
+
 
 class BountyParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def delete(self) -> "_BountyDelete":
+        return _BountyDelete(self.app_client)
+
     def create_bounty(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
@@ -114,6 +155,17 @@ class BountyParams:
             "method": "submit_work()void",
         }))
 
+    def claim_and_submit(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_and_submit()void",
+        }))
+
     def approve(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -136,6 +188,19 @@ class BountyParams:
             "method": "cancel()void",
         }))
 
+    def reopen(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | ReopenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reopen(pay,uint64)void",
+            "args": method_args,
+        }))
+
     def get_bounty_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -158,10 +223,41 @@ class BountyParams:
         )
 
 
+class _BountyDeleteTransaction:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def delete(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "delete()void",
+        }))
+
+    def approve_and_close(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.delete(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_and_close()void",
+        }))
+
+
 class BountyCreateTransactionParams:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def delete(self) -> "_BountyDeleteTransaction":
+        return _BountyDeleteTransaction(self.app_client)
+
     def create_bounty(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
@@ -197,6 +293,17 @@ class BountyCreateTransactionParams:
             "method": "submit_work()void",
         }))
 
+    def claim_and_submit(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_and_submit()void",
+        }))
+
     def approve(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -219,6 +326,19 @@ class BountyCreateTransactionParams:
             "method": "cancel()void",
         }))
 
+    def reopen(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | ReopenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reopen(pay,uint64)void",
+            "args": method_args,
+        }))
+
     def get_bounty_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -241,10 +361,47 @@ class BountyCreateTransactionParams:
         )
 
 
+class _BountyDeleteSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def delete(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "delete()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def approve_and_close(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.delete(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_and_close()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+
 class BountySend:
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def delete(self) -> "_BountyDeleteSend":
+        return _BountyDeleteSend(self.app_client)
+
     def create_bounty(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
@@ -289,6 +446,20 @@ class BountySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def claim_and_submit(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim_and_submit()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def approve(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -317,6 +488,22 @@ class BountySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
+    def reopen(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | ReopenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reopen(pay,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def get_bounty_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None,
@@ -579,6 +766,12 @@ class BountyClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim_and_submit()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["approve()void"],
@@ -591,12 +784,30 @@ class BountyClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["reopen(pay,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_bounty_info()(address,address,uint64,uint64)"],
         return_value: algokit_utils.ABIReturn | None
     ) -> tuple[str, str, int, int] | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["delete()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["approve_and_close()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -634,7 +845,28 @@ class BountyBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
     def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
         return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
 
-class BountyFactory(algokit_utils.TypedAppFactoryProtocol[BountyBareCallCreateParams, None, None]):
+@dataclasses.dataclass(frozen=True)
+class BountyMethodCallDeleteParams(
+    algokit_utils.BaseAppClientMethodCallParams[
+        typing.Any,
+        str | None,
+    ]
+):
+    """Parameters for calling Bounty contract using ABI"""
+    on_complete: typing.Literal[OnComplete.DeleteApplicationOC] | None = None
+    method: str | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientMethodCallParams:
+        method_args = _parse_abi_args(self.args)
+        return algokit_utils.AppClientMethodCallParams(
+            **{
+                **self.__dict__,
+                "method": self.method or getattr(self.args, "abi_method_signature", None),
+                "args": method_args,
+            }
+        )
+
+class BountyFactory(algokit_utils.TypedAppFactoryProtocol[BountyBareCallCreateParams, None, BountyMethodCallDeleteParams]):
     """Factory for deploying and managing BountyClient smart contracts"""
 
     def __init__(
@@ -681,7 +913,7 @@ class BountyFactory(algokit_utils.TypedAppFactoryProtocol[BountyBareCallCreatePa
         on_schema_break: algokit_utils.OnSchemaBreak | None = None,
         create_params: BountyBareCallCreateParams | None = None,
         update_params: None = None,
-        delete_params: None = None,
+        delete_params: BountyMethodCallDeleteParams | None = None,
         existing_deployments: algokit_utils.ApplicationLookup | None = None,
         ignore_cache: bool = False,
         app_name: str | None = None,
@@ -694,7 +926,7 @@ class BountyFactory(algokit_utils.TypedAppFactoryProtocol[BountyBareCallCreatePa
             on_schema_break=on_schema_break,
             create_params=create_params.to_algokit_utils_params() if create_params else None,
             update_params=update_params,
-            delete_params=delete_params,
+            delete_params=delete_params.to_algokit_utils_params() if delete_params else None,
             existing_deployments=existing_deployments,
             ignore_cache=ignore_cache,
             app_name=app_name,
@@ -836,6 +1068,25 @@ class BountyFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def claim_and_submit(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim_and_submit()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim_and_submit()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def approve(
         self,
         *,
@@ -874,6 +1125,26 @@ class BountyFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def reopen(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | ReopenArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the reopen(pay,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "reopen(pay,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
     def get_bounty_info(
         self,
         *,
@@ -893,6 +1164,44 @@ class BountyFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def delete(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the delete()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "delete()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def approve_and_close(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the approve_and_close()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "approve_and_close()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class BountyFactoryUpdateParams:
     """Parameters for 'update' operations of Bounty contract"""
 
@@ -986,6 +1295,45 @@ class BountyFactorySendCreate:
         return BountyClient(result[0]), result[1]
 
 
+class _BountyDeleteComposer:
+    def __init__(self, composer: "BountyComposer"):
+        self.composer = composer
+    def delete(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyComposer":
+        self.composer._composer.add_app_delete_method_call(
+            self.composer.client.params.delete.delete(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "delete()void", v
+            )
+        )
+        return self.composer
+    def approve_and_close(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyComposer":
+        self.composer._composer.add_app_delete_method_call(
+            self.composer.client.params.delete.approve_and_close(
+                
+                params=params,
+                
+            )
+        )
+        self.composer._result_mappers.append(
+            lambda v: self.composer.client.decode_return_value(
+                "approve_and_close()void", v
+            )
+        )
+        return self.composer
+
+
 class BountyComposer:
     """Composer for creating transaction groups for Bounty contract calls"""
 
@@ -994,6 +1342,10 @@ class BountyComposer:
         self._composer = client.algorand.new_group()
         self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
 
+    @property
+    def delete(self) -> "_BountyDeleteComposer":
+        return _BountyDeleteComposer(self)
+
     def create_bounty(
         self,
         args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
@@ -1046,6 +1398,23 @@ class BountyComposer:
         )
         return self
 
+    def claim_and_submit(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim_and_submit(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim_and_submit()void", v
+            )
+        )
+        return self
+
     def approve(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -1080,6 +1449,24 @@ class BountyComposer:
         )
         return self
 
+    def reopen(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | ReopenArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.reopen(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "reopen(pay,uint64)void", v
+            )
+        )
+        return self
+
     def get_bounty_info(
         self,
         params: algokit_utils.CommonAppCallParams | None = None
@@ -0,0 +1,1254 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}, {"type": "uint64", "name": "bounty_id"}, {"type": "uint64", "name": "amount"}], "name": "create_bounty", "returns": {"type": "void"}, "desc": "Escrows a new bounty under bounty_id, which must not be in use; creators should\npick it at random. The payment covers the bounty amount plus the minimum balance of the bounty's box.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bounty_id"}], "name": "claim", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bounty_id"}], "name": "submit_work", "returns": {"type": "void"}, "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bounty_id"}], "name": "approve", "returns": {"type": "void"}, "desc": "Pays the worker and closes the bounty; the caller covers both inner fees", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bounty_id"}], "name": "cancel", "returns": {"type": "void"}, "desc": "Refunds an unclaimed bounty to its creator and closes it", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "bounty_id"}], "name": "get_bounty_info", "returns": {"type": "(address,address,uint64,uint64)"}, "events": [], "readonly": true, "recommendations": {}}], "name": "BountyRegistry", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {"bounties": {"keyType": "uint64", "valueType": "BountyRecord", "prefix": "Yg=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"BountyRecord": [{"name": "creator", "type": "address"}, {"name": "worker", "type": "address"}, {"name": "amount", "type": "uint64"}, {"name": "status", "type": "uint64"}]}, "byteCode": {"approval": "CiADAQBAJgQBYggAAAAAAAAAAAgAAAAAAAAAAQgAAAAAAAAAAjEbQQC4ggYEIKjEQQQ9HS8PBAS9ub4ErdYwbgR3Kzm6BIKlVdU2GgCOBgBpAFkASQA5ACkAAiNDMRkURDEYRDYaAReIAXpMFkwWTwNPA1BPAlBMUIAEFR98dUxQsCJDMRkURDEYRDYaAReIASkiQzEZFEQxGEQ2GgEXiADdIkMxGRREMRhENhoBF4gArCJDMRkURDEYRDYaAReIAHciQzEZFEQxGEQxFiIJSTgQIhJENhoBFzYaAheIAA0iQzEZQP90MRgURCJDigMAi/9Ei/4WKExQSb1FARREi/04ADEAEkSL/TgHMgoSRDIKcwFEMQAyA4v/Fk4CUExQKVBPAky/MgpzAURMCYv9OAiL/08CCBJEiYoBAIv/FihMUEm+RElXSAgpqEQxAEsBVwAgE0QxAFwgKlxIv4mKAQCL/xYoTFBJvkQxAEsBVyAgEkRJV0gIKqhEK1xIv4mKAQCL/xYoTFC+RDEASwFXACBMSwESREsBV0gIK6hEsUsBVyAgTwIkW7IIsgcishAjsgGzi/9MI4gASYmKAQCL/xYoTFC+RDEASwFXACBMSwESREsBV0gIKahETCRbi/9OAogAH4mKAQSL/xYoTFC+RElXACBLAVcgIEsCJFtPA4FIW4mKAwAyCnMBRIv9FihMULxIMgpzAUQJsYv/CLIIi/6yByKyECOyAbOJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "desc": "\n    Keeps every bounty in one app, in a box per bounty id. Creators pick the ids, so\n    concurrent creates never contend for a shared counter; a bounty's box is deleted\n    and its minimum balance refunded to the creator once the bounty is paid out or\n    cancelled.\n    ", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5X3JlZ2lzdHJ5LmNvbnRyYWN0LkJvdW50eVJlZ2lzdHJ5Ll9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDEgMCA2NAogICAgYnl0ZWNibG9jayAiYiIgMHgwMDAwMDAwMDAwMDAwMDAwIDB4MDAwMDAwMDAwMDAwMDAwMSAweDAwMDAwMDAwMDAwMDAwMDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6MTkKICAgIC8vIGNsYXNzIEJvdW50eVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTEKICAgIHB1c2hieXRlc3MgMHgyMGE4YzQ0MSAweDNkMWQyZjBmIDB4MDRiZGI5YmUgMHhhZGQ2MzA2ZSAweDc3MmIzOWJhIDB4ODJhNTU1ZDUgLy8gbWV0aG9kICJjcmVhdGVfYm91bnR5KHBheSx1aW50NjQsdWludDY0KXZvaWQiLCBtZXRob2QgImNsYWltKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJzdWJtaXRfd29yayh1aW50NjQpdm9pZCIsIG1ldGhvZCAiYXBwcm92ZSh1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2FuY2VsKHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfYm91bnR5X2luZm8odWludDY0KShhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9ib3VudHlfcm91dGVANSBtYWluX2NsYWltX3JvdXRlQDYgbWFpbl9zdWJtaXRfd29ya19yb3V0ZUA3IG1haW5fYXBwcm92ZV9yb3V0ZUA4IG1haW5fY2FuY2VsX3JvdXRlQDkgbWFpbl9nZXRfYm91bnR5X2luZm9fcm91dGVAMTAKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6MTkKICAgIC8vIGNsYXNzIEJvdW50eVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzEgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9ib3VudHlfaW5mb19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6OTgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weToxOQogICAgLy8gY2xhc3MgQm91bnR5UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6OTgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2JvdW50eV9pbmZvCiAgICBzd2FwCiAgICBpdG9iCiAgICBzd2FwCiAgICBpdG9iCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2FuY2VsX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weToxOQogICAgLy8gY2xhc3MgQm91bnR5UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODkKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjYW5jZWwKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo3NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6MTkKICAgIC8vIGNsYXNzIEJvdW50eVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgYXBwcm92ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9zdWJtaXRfd29ya19yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo2OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6MTkKICAgIC8vIGNsYXNzIEJvdW50eVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc3VibWl0X3dvcmsKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2xhaW1fcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5CiAgICAvLyBjbGFzcyBCb3VudHlSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo1OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNsYWltCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9ib3VudHlfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6MzAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5CiAgICAvLyBjbGFzcyBCb3VudHlSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2JvdW50eQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5CiAgICAvLyBjbGFzcyBCb3VudHlSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAxMwogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5X3JlZ2lzdHJ5LmNvbnRyYWN0LkJvdW50eVJlZ2lzdHJ5LmNyZWF0ZV9ib3VudHkocGF5bWVudDogdWludDY0LCBib3VudHlfaWQ6IHVpbnQ2NCwgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CmNyZWF0ZV9ib3VudHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwLTMzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfYm91bnR5KAogICAgLy8gICAgIHNlbGYsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCBib3VudHlfaWQ6IFVJbnQ2NCwgYW1vdW50OiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTozOQogICAgLy8gYXNzZXJ0IGFtb3VudCA+IDAsICJCb3VudHkgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8iCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2VydCAvLyBCb3VudHkgYW1vdW50IG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NDAKICAgIC8vIGFzc2VydCBib3VudHlfaWQgbm90IGluIHNlbGYuYm91bnRpZXMsICJCb3VudHkgaWQgaXMgYWxyZWFkeSBpbiB1c2UiCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gImIiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gQm91bnR5IGlkIGlzIGFscmVhZHkgaW4gdXNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxCiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gVHhuLnNlbmRlciwgIlBheW1lbnQgbXVzdCBjb21lIGZyb20gdGhlIGNyZWF0b3IiCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgY29tZSBmcm9tIHRoZSBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzCiAgICAvLyBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo0Mi00NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJSZWNlaXZlciBtdXN0IGJlIHRoZSByZWdpc3RyeSIKICAgIGFzc2VydCAvLyBSZWNlaXZlciBtdXN0IGJlIHRoZSByZWdpc3RyeQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo0NgogICAgLy8gbWluX2JhbGFuY2VfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NDkKICAgIC8vIHdvcmtlcj1hcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NTAKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3LTUyCiAgICAvLyBzZWxmLmJvdW50aWVzW2JvdW50eV9pZF0gPSBCb3VudHlSZWNvcmQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgd29ya2VyPWFyYzQuQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoT1BFTiksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo1MQogICAgLy8gc3RhdHVzPWFyYzQuVUludDY0KE9QRU4pLAogICAgYnl0ZWNfMSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NDctNTIKICAgIC8vIHNlbGYuYm91bnRpZXNbYm91bnR5X2lkXSA9IEJvdW50eVJlY29yZCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICB3b3JrZXI9YXJjNC5BZGRyZXNzKEdsb2JhbC56ZXJvX2FkZHJlc3MpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChPUEVOKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzCiAgICAvLyBib3hfY29zdCA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgLSBtaW5fYmFsYW5jZV9iZWZvcmUKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo1NQogICAgLy8gcGF5bWVudC5hbW91bnQgPT0gYW1vdW50ICsgYm94X2Nvc3QKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQW1vdW50CiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgKwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NTQtNTYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcGF5bWVudC5hbW91bnQgPT0gYW1vdW50ICsgYm94X2Nvc3QKICAgIC8vICksICJQYXltZW50IG11c3QgYmUgdGhlIGFtb3VudCBwbHVzIHRoZSBib3ggY29zdCIKICAgIGFzc2VydCAvLyBQYXltZW50IG11c3QgYmUgdGhlIGFtb3VudCBwbHVzIHRoZSBib3ggY29zdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eV9yZWdpc3RyeS5jb250cmFjdC5Cb3VudHlSZWdpc3RyeS5jbGFpbShib3VudHlfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKY2xhaW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4LTU5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjbGFpbShzZWxmLCBib3VudHlfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo2MAogICAgLy8gYm91bnR5ID0gc2VsZi5ib3VudGllc1tib3VudHlfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJiIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJvdW50aWVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo2MQogICAgLy8gYXNzZXJ0IGJvdW50eS5zdGF0dXMgPT0gT1BFTgogICAgZHVwCiAgICBleHRyYWN0IDcyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlY18xIC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgYj09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyICE9IGJvdW50eS5jcmVhdG9yLm5hdGl2ZQogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgICE9CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NjQKICAgIC8vIGJvdW50eS53b3JrZXIgPSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlcikKICAgIHR4biBTZW5kZXIKICAgIHJlcGxhY2UyIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1CiAgICAvLyBib3VudHkuc3RhdHVzID0gYXJjNC5VSW50NjQoQ0xBSU1FRCkKICAgIGJ5dGVjXzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAxCiAgICByZXBsYWNlMiA3MgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo2NgogICAgLy8gc2VsZi5ib3VudGllc1tib3VudHlfaWRdID0gYm91bnR5LmNvcHkoKQogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eV9yZWdpc3RyeS5jb250cmFjdC5Cb3VudHlSZWdpc3RyeS5zdWJtaXRfd29yayhib3VudHlfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKc3VibWl0X3dvcms6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4LTY5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzdWJtaXRfd29yayhzZWxmLCBib3VudHlfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo3MAogICAgLy8gYm91bnR5ID0gc2VsZi5ib3VudGllc1tib3VudHlfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJiIgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJvdW50aWVzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo3MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gYm91bnR5Lndvcmtlci5uYXRpdmUKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBleHRyYWN0IDMyIDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo3MgogICAgLy8gYXNzZXJ0IGJvdW50eS5zdGF0dXMgPT0gQ0xBSU1FRAogICAgZHVwCiAgICBleHRyYWN0IDcyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlY18yIC8vIDB4MDAwMDAwMDAwMDAwMDAwMQogICAgYj09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NzQKICAgIC8vIGJvdW50eS5zdGF0dXMgPSBhcmM0LlVJbnQ2NChTVUJNSVRURUQpCiAgICBieXRlY18zIC8vIDB4MDAwMDAwMDAwMDAwMDAwMgogICAgcmVwbGFjZTIgNzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NzUKICAgIC8vIHNlbGYuYm91bnRpZXNbYm91bnR5X2lkXSA9IGJvdW50eS5jb3B5KCkKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHlfcmVnaXN0cnkuY29udHJhY3QuQm91bnR5UmVnaXN0cnkuYXBwcm92ZShib3VudHlfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKYXBwcm92ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6NzctNzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFwcHJvdmUoc2VsZiwgYm91bnR5X2lkOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODAKICAgIC8vIGJvdW50eSA9IHNlbGYuYm91bnRpZXNbYm91bnR5X2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAiYiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm91bnRpZXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBib3VudHkuY3JlYXRvci5uYXRpdmUKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo4MgogICAgLy8gYXNzZXJ0IGJvdW50eS5zdGF0dXMgPT0gU1VCTUlUVEVECiAgICBkaWcgMQogICAgZXh0cmFjdCA3MiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWNfMyAvLyAweDAwMDAwMDAwMDAwMDAwMDIKICAgIGI9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0LTg2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9Ym91bnR5Lndvcmtlci5uYXRpdmUsIGFtb3VudD1ib3VudHkuYW1vdW50Lm5hdGl2ZSwgZmVlPTAKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODUKICAgIC8vIHJlY2VpdmVyPWJvdW50eS53b3JrZXIubmF0aXZlLCBhbW91bnQ9Ym91bnR5LmFtb3VudC5uYXRpdmUsIGZlZT0wCiAgICBkaWcgMQogICAgZXh0cmFjdCAzMiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHVuY292ZXIgMgogICAgaW50Y18yIC8vIDY0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMCAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODUKICAgIC8vIHJlY2VpdmVyPWJvdW50eS53b3JrZXIubmF0aXZlLCBhbW91bnQ9Ym91bnR5LmFtb3VudC5uYXRpdmUsIGZlZT0wCiAgICBpbnRjXzEgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODQtODYKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1ib3VudHkud29ya2VyLm5hdGl2ZSwgYW1vdW50PWJvdW50eS5hbW91bnQubmF0aXZlLCBmZWU9MAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODcKICAgIC8vIHNlbGYuX2Nsb3NlKGJvdW50eV9pZCwgYm91bnR5LmNyZWF0b3IubmF0aXZlLCBVSW50NjQoMCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGludGNfMSAvLyAwCiAgICBjYWxsc3ViIF9jbG9zZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eV9yZWdpc3RyeS5jb250cmFjdC5Cb3VudHlSZWdpc3RyeS5jYW5jZWwoYm91bnR5X2lkOiB1aW50NjQpIC0+IHZvaWQ6CmNhbmNlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6ODktOTAKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNhbmNlbChzZWxmLCBib3VudHlfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo5MgogICAgLy8gYm91bnR5ID0gc2VsZi5ib3VudGllc1tib3VudHlfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlY18wIC8vICJiIgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ib3VudGllcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6OTMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IGJvdW50eS5jcmVhdG9yLm5hdGl2ZQogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBhc3NlcnQgYm91bnR5LnN0YXR1cyA9PSBPUEVOCiAgICBkaWcgMQogICAgZXh0cmFjdCA3MiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWNfMSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBzZWxmLl9jbG9zZShib3VudHlfaWQsIGJvdW50eS5jcmVhdG9yLm5hdGl2ZSwgYm91bnR5LmFtb3VudC5uYXRpdmUpCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgX2Nsb3NlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5X3JlZ2lzdHJ5LmNvbnRyYWN0LkJvdW50eVJlZ2lzdHJ5LmdldF9ib3VudHlfaW5mbyhib3VudHlfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXMsIGJ5dGVzLCB1aW50NjQsIHVpbnQ2NDoKZ2V0X2JvdW50eV9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weTo5OC0xMDEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYm91bnR5X2luZm8oCiAgICAvLyAgICAgc2VsZiwgYm91bnR5X2lkOiBVSW50NjQKICAgIC8vICkgLT4gdHVwbGVbYXJjNC5BZGRyZXNzLCBhcmM0LkFkZHJlc3MsIFVJbnQ2NCwgVUludDY0XToKICAgIHByb3RvIDEgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weToxMDIKICAgIC8vIGJvdW50eSA9IHNlbGYuYm91bnRpZXNbYm91bnR5X2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAiYiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYm91bnRpZXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNAogICAgLy8gYm91bnR5LmNyZWF0b3IsCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6MTA1CiAgICAvLyBib3VudHkud29ya2VyLAogICAgZGlnIDEKICAgIGV4dHJhY3QgMzIgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNgogICAgLy8gYm91bnR5LmFtb3VudC5uYXRpdmUsCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDY0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weToxMDcKICAgIC8vIGJvdW50eS5zdGF0dXMubmF0aXZlLAogICAgdW5jb3ZlciAzCiAgICBwdXNoaW50IDcyIC8vIDcyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weToxMDMtMTA4CiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIGJvdW50eS5jcmVhdG9yLAogICAgLy8gICAgIGJvdW50eS53b3JrZXIsCiAgICAvLyAgICAgYm91bnR5LmFtb3VudC5uYXRpdmUsCiAgICAvLyAgICAgYm91bnR5LnN0YXR1cy5uYXRpdmUsCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5X3JlZ2lzdHJ5LmNvbnRyYWN0LkJvdW50eVJlZ2lzdHJ5Ll9jbG9zZShib3VudHlfaWQ6IHVpbnQ2NCwgY3JlYXRvcjogYnl0ZXMsIHJlZnVuZDogdWludDY0KSAtPiB2b2lkOgpfY2xvc2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMC0xMTEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2Nsb3NlKHNlbGYsIGJvdW50eV9pZDogVUludDY0LCBjcmVhdG9yOiBBY2NvdW50LCByZWZ1bmQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weToxMTMKICAgIC8vIG1pbl9iYWxhbmNlX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eV9yZWdpc3RyeS9jb250cmFjdC5weToxMTQKICAgIC8vIGRlbCBzZWxmLmJvdW50aWVzW2JvdW50eV9pZF0KICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAiYiIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNQogICAgLy8gYm94X2Nvc3QgPSBtaW5fYmFsYW5jZV9iZWZvcmUgLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHlfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9Y3JlYXRvciwgYW1vdW50PXJlZnVuZCArIGJveF9jb3N0LCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18wIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18xIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [242], "errorMessage": "Bounty amount must be greater than zero"}, {"pc": [254], "errorMessage": "Bounty id is already in use"}, {"pc": [326, 336, 366, 372, 398, 408, 417, 458, 468, 497, 502], "errorMessage": "Index access is out of bounds"}, {"pc": [96, 135, 151, 167, 183, 199], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [311], "errorMessage": "Payment must be the amount plus the box cost"}, {"pc": [262], "errorMessage": "Payment must come from the creator"}, {"pc": [270], "errorMessage": "Receiver must be the registry"}, {"pc": [275, 298, 522, 535], "errorMessage": "account funded"}, {"pc": [234], "errorMessage": "can only call when creating"}, {"pc": [99, 138, 154, 170, 186, 202], "errorMessage": "can only call when not creating"}, {"pc": [324, 361, 393, 453, 495], "errorMessage": "check self.bounties entry exists"}, {"pc": [212], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True)
+class BountyRecord:
+    """Struct for BountyRecord"""
+    creator: str
+    worker: str
+    amount: int
+    status: int
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateBountyArgs:
+    """Dataclass for create_bounty arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+    bounty_id: int
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_bounty(pay,uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ClaimArgs:
+    """Dataclass for claim arguments"""
+    bounty_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "claim(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SubmitWorkArgs:
+    """Dataclass for submit_work arguments"""
+    bounty_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "submit_work(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ApproveArgs:
+    """Dataclass for approve arguments"""
+    bounty_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "approve(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CancelArgs:
+    """Dataclass for cancel arguments"""
+    bounty_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "cancel(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBountyInfoArgs:
+    """Dataclass for get_bounty_info arguments"""
+    bounty_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_bounty_info(uint64)(address,address,uint64,uint64)"
+
+
+class BountyRegistryParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def claim(
+        self,
+        args: tuple[int] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim(uint64)void",
+            "args": method_args,
+        }))
+
+    def submit_work(
+        self,
+        args: tuple[int] | SubmitWorkArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit_work(uint64)void",
+            "args": method_args,
+        }))
+
+    def approve(
+        self,
+        args: tuple[int] | ApproveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve(uint64)void",
+            "args": method_args,
+        }))
+
+    def cancel(
+        self,
+        args: tuple[int] | CancelArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_bounty_info(
+        self,
+        args: tuple[int] | GetBountyInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info(uint64)(address,address,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class BountyRegistryCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def claim(
+        self,
+        args: tuple[int] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim(uint64)void",
+            "args": method_args,
+        }))
+
+    def submit_work(
+        self,
+        args: tuple[int] | SubmitWorkArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit_work(uint64)void",
+            "args": method_args,
+        }))
+
+    def approve(
+        self,
+        args: tuple[int] | ApproveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve(uint64)void",
+            "args": method_args,
+        }))
+
+    def cancel(
+        self,
+        args: tuple[int] | CancelArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel(uint64)void",
+            "args": method_args,
+        }))
+
+    def get_bounty_info(
+        self,
+        args: tuple[int] | GetBountyInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info(uint64)(address,address,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class BountyRegistrySend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def claim(
+        self,
+        args: tuple[int] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def submit_work(
+        self,
+        args: tuple[int] | SubmitWorkArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit_work(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def approve(
+        self,
+        args: tuple[int] | ApproveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def cancel(
+        self,
+        args: tuple[int] | CancelArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_bounty_info(
+        self,
+        args: tuple[int] | GetBountyInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[str, str, int, int]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info(uint64)(address,address,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[str, str, int, int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class BountyRegistryState:
+    """Methods to access state for the current BountyRegistry app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "BountyRecord": BountyRecord
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def bounties(self) -> "_MapState[int, BountyRecord]":
+        """Get values from the bounties map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "bounties",
+            self._struct_classes.get("BountyRecord")
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class BountyRegistryClient:
+    """Client for interacting with BountyRegistry smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = BountyRegistryParams(self.app_client)
+        self.create_transaction = BountyRegistryCreateTransactionParams(self.app_client)
+        self.send = BountyRegistrySend(self.app_client)
+        self.state = BountyRegistryState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "BountyRegistryClient":
+        return BountyRegistryClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "BountyRegistryClient":
+        return BountyRegistryClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "BountyRegistryClient":
+        return BountyRegistryClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "BountyRegistryComposer":
+        return BountyRegistryComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_bounty(pay,uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["submit_work(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["approve(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["cancel(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_bounty_info(uint64)(address,address,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[str, str, int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | tuple[str, str, int, int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class BountyRegistryBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating BountyRegistry contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class BountyRegistryFactory(algokit_utils.TypedAppFactoryProtocol[BountyRegistryBareCallCreateParams, None, None]):
+    """Factory for deploying and managing BountyRegistryClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = BountyRegistryFactoryParams(self.app_factory)
+        self.create_transaction = BountyRegistryFactoryCreateTransaction(self.app_factory)
+        self.send = BountyRegistryFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: BountyRegistryBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[BountyRegistryClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return BountyRegistryClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> BountyRegistryClient:
+        """Get an app client by creator address and name"""
+        return BountyRegistryClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> BountyRegistryClient:
+        """Get an app client by app ID"""
+        return BountyRegistryClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class BountyRegistryFactoryParams:
+    """Parameters for creating transactions for BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = BountyRegistryFactoryCreateParams(app_factory)
+        self.update = BountyRegistryFactoryUpdateParams(app_factory)
+        self.delete = BountyRegistryFactoryDeleteParams(app_factory)
+
+class BountyRegistryFactoryCreateParams:
+    """Parameters for 'create' operations of BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateBountyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_bounty(pay,uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_bounty(pay,uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim(
+        self,
+        args: tuple[int] | ClaimArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def submit_work(
+        self,
+        args: tuple[int] | SubmitWorkArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the submit_work(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "submit_work(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def approve(
+        self,
+        args: tuple[int] | ApproveArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the approve(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "approve(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def cancel(
+        self,
+        args: tuple[int] | CancelArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the cancel(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "cancel(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_bounty_info(
+        self,
+        args: tuple[int] | GetBountyInfoArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_bounty_info(uint64)(address,address,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_bounty_info(uint64)(address,address,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class BountyRegistryFactoryUpdateParams:
+    """Parameters for 'update' operations of BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class BountyRegistryFactoryDeleteParams:
+    """Parameters for 'delete' operations of BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class BountyRegistryFactoryCreateTransaction:
+    """Create transactions for BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = BountyRegistryFactoryCreateTransactionCreate(app_factory)
+
+
+class BountyRegistryFactoryCreateTransactionCreate:
+    """Create new instances of BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class BountyRegistryFactorySend:
+    """Send calls to BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = BountyRegistryFactorySendCreate(app_factory)
+
+
+class BountyRegistryFactorySendCreate:
+    """Send create calls to BountyRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[BountyRegistryClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return BountyRegistryClient(result[0]), result[1]
+
+
+class BountyRegistryComposer:
+    """Composer for creating transaction groups for BountyRegistry contract calls"""
+
+    def __init__(self, client: "BountyRegistryClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_bounty(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_bounty(pay,uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def claim(
+        self,
+        args: tuple[int] | ClaimArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim(uint64)void", v
+            )
+        )
+        return self
+
+    def submit_work(
+        self,
+        args: tuple[int] | SubmitWorkArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.submit_work(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "submit_work(uint64)void", v
+            )
+        )
+        return self
+
+    def approve(
+        self,
+        args: tuple[int] | ApproveArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.approve(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "approve(uint64)void", v
+            )
+        )
+        return self
+
+    def cancel(
+        self,
+        args: tuple[int] | CancelArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.cancel(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "cancel(uint64)void", v
+            )
+        )
+        return self
+
+    def get_bounty_info(
+        self,
+        args: tuple[int] | GetBountyInfoArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "BountyRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_bounty_info(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_bounty_info(uint64)(address,address,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "BountyRegistryComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "BountyRegistryComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -0,0 +1,1365 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}, {"type": "uint64", "name": "amount"}], "name": "create_bounty", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "box_payment"}, {"type": "byte[]", "name": "submission"}], "name": "submit", "returns": {"type": "void"}, "desc": "Records the caller's submission, replacing any earlier one. box_payment covers the\nminimum balance of a new submission box, and is zero when replacing a submission.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "worker"}], "name": "approve_submission", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "cancel", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "reclaim_submission", "returns": {"type": "void"}, "desc": "Deletes the caller's submission box once the bounty is settled and refunds its cost", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "account", "name": "worker"}], "name": "get_submission", "returns": {"type": "byte[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_bounty_info", "returns": {"type": "(address,address,uint64,uint64,uint64)"}, "events": [], "readonly": true, "recommendations": {}}], "name": "CompetitiveBounty", "state": {"keys": {"box": {}, "global": {"creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "winner": {"key": "d2lubmVy", "keyType": "AVMString", "valueType": "address"}, "amount": {"key": "YW1vdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMString", "valueType": "AVMUint64"}, "submission_count": {"key": "c3VibWlzc2lvbl9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"submissions": {"keyType": "address", "valueType": "AVMBytes", "prefix": "cw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiAEAAEDBCYHBnN0YXR1cwdjcmVhdG9yBmFtb3VudAFzEHN1Ym1pc3Npb25fY291bnQGd2lubmVyBBUffHUxGEAAEykxAGcnBTIDZyoiZygiZycEImcxG0EA4IIHBIemS6wEVPy4IgTGNuQqBDHyapsE3MpUcwS+TKR1BFRdwt42GgCOBwCOAHIAYABUAEgAKQACIkMxGRREMRhEiAIDTwIWTwIWTwIWTwRPBFBPA1BPAlBMUCcGTFCwI0MxGRREMRhENhoBF8AciAHISRUWVwYCTFAnBkxQsCNDMRkURDEYRIgBbyNDMRkURDEYRIgBMiNDMRkURDEYRDYaARfAHIgA4iNDMRkURDEYRDEWIwlJOBAjEkQ2GgFXAgCIAGcjQzEZFEQxGEQxFiMJSTgQIxJENhoBF4gADSNDMRlA/1MxGBREI0OKAgAxACIpZUQSRCIqZUQURCIoZUQURIv/RIv+OAAiKWVEEkSL/jgHMgoSRIv+OAiL/xJEKov/ZzIDi/+IATSJigIAIihlRBREIiplREQxACIpZUQTRIv/FYEgEkQrMQBQvUUBQAALIicEZUQjCCcETGcyCnMBRCsxAFBJvEiL/78yCnMBREwJi/44ADEAEkSL/jgHMgoSRIv+OAgSRImKAQAxACIpZUQSRCIoZUQURCuL/1C9RQFEIiplRLFJsgiL/7IHI7IQIrIBsycFi/9nKiJnKCRni/9MiACXiTEAIillRBJEIihlRBREIiplRLEiKWVESwGyCLIHI7IQIrIBsyoiZyglZzIDTIgAZokiKGVEJBJAAAkiKGVEJRJBACojRCsxAFC9RQFEMgpzAUQrMQBQvEgyCnMBRAmxMQCyB7III7IQIrIBs4kiQv/TigEBK4v/UL6AAE4CTYkiKWVEIicFZUQiKmVEIihlRCInBGVEiYoCACIpZUSL/xYiKGVEFk8Ci/5QTwJQTFCABJbzzXZMULCJ", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "desc": "\n    Bounty open to many workers at once: each records a submission in a box of their own\n    without claiming, and the creator approves one submission to pay its worker.\n    ", "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuY29tcGV0aXRpdmVfYm91bnR5LmNvbnRyYWN0LkNvbXBldGl0aXZlQm91bnR5Ll9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSAzIDQKICAgIGJ5dGVjYmxvY2sgInN0YXR1cyIgImNyZWF0b3IiICJhbW91bnQiICJzIiAic3VibWlzc2lvbl9jb3VudCIgIndpbm5lciIgMHgxNTFmN2M3NQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToyOAogICAgLy8gc2VsZi5jcmVhdG9yID0gVHhuLnNlbmRlcgogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjI5CiAgICAvLyBzZWxmLndpbm5lciA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjIDUgLy8gIndpbm5lciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MzAKICAgIC8vIHNlbGYuYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MzEKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KE9QRU4pCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MzIKICAgIC8vIHNlbGYuc3VibWlzc2lvbl9jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNCAvLyAic3VibWlzc2lvbl9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBDb21wZXRpdGl2ZUJvdW50eShBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDEyCiAgICBwdXNoYnl0ZXNzIDB4ODdhNjRiYWMgMHg1NGZjYjgyMiAweGM2MzZlNDJhIDB4MzFmMjZhOWIgMHhkY2NhNTQ3MyAweGJlNGNhNDc1IDB4NTQ1ZGMyZGUgLy8gbWV0aG9kICJjcmVhdGVfYm91bnR5KHBheSx1aW50NjQpdm9pZCIsIG1ldGhvZCAic3VibWl0KHBheSxieXRlW10pdm9pZCIsIG1ldGhvZCAiYXBwcm92ZV9zdWJtaXNzaW9uKGFjY291bnQpdm9pZCIsIG1ldGhvZCAiY2FuY2VsKCl2b2lkIiwgbWV0aG9kICJyZWNsYWltX3N1Ym1pc3Npb24oKXZvaWQiLCBtZXRob2QgImdldF9zdWJtaXNzaW9uKGFjY291bnQpYnl0ZVtdIiwgbWV0aG9kICJnZXRfYm91bnR5X2luZm8oKShhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfYm91bnR5X3JvdXRlQDUgbWFpbl9zdWJtaXRfcm91dGVANiBtYWluX2FwcHJvdmVfc3VibWlzc2lvbl9yb3V0ZUA3IG1haW5fY2FuY2VsX3JvdXRlQDggbWFpbl9yZWNsYWltX3N1Ym1pc3Npb25fcm91dGVAOSBtYWluX2dldF9zdWJtaXNzaW9uX3JvdXRlQDEwIG1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDExCgptYWluX2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBDb21wZXRpdGl2ZUJvdW50eShBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfYm91bnR5X2luZm9fcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjExNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9ib3VudHlfaW5mbwogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3N1Ym1pc3Npb25fcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjExMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBDb21wZXRpdGl2ZUJvdW50eShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MTExCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9zdWJtaXNzaW9uCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYnl0ZWMgNiAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZWNsYWltX3N1Ym1pc3Npb25fcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6OTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHJlY2xhaW1fc3VibWlzc2lvbgogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jYW5jZWxfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6ODcKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNhbmNlbAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX3N1Ym1pc3Npb25fcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NzMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBDb21wZXRpdGl2ZUJvdW50eShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NzMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBhcHByb3ZlX3N1Ym1pc3Npb24KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc3VibWl0X3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjQ4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxNAogICAgLy8gY2xhc3MgQ29tcGV0aXRpdmVCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NDgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzdWJtaXQKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTozNAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MTQKICAgIC8vIGNsYXNzIENvbXBldGl0aXZlQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MzQKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfYm91bnR5CiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MTQKICAgIC8vIGNsYXNzIENvbXBldGl0aXZlQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDE0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb21wZXRpdGl2ZV9ib3VudHkuY29udHJhY3QuQ29tcGV0aXRpdmVCb3VudHkuY3JlYXRlX2JvdW50eShwYXltZW50OiB1aW50NjQsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpjcmVhdGVfYm91bnR5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTozNC0zNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2JvdW50eShzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MzYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MzcKICAgIC8vIGFzc2VydCBzZWxmLmFtb3VudCA9PSAwCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTozOAogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IE9QRU4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjQwCiAgICAvLyBhc3NlcnQgYW1vdW50ID4gMCwgIkJvdW50eSBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybyIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXJ0IC8vIEJvdW50eSBhbW91bnQgbXVzdCBiZSBncmVhdGVyIHRoYW4gemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo0MQogICAgLy8gYXNzZXJ0IHBheW1lbnQuc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjQyCiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo0MwogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IGFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo0NQogICAgLy8gc2VsZi5hbW91bnQgPSBhbW91bnQKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NDYKICAgIC8vIHNlbGYuX2VtaXRfc3RhdHVzX2NoYW5nZWQoR2xvYmFsLnplcm9fYWRkcmVzcywgYW1vdW50KQogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2VtaXRfc3RhdHVzX2NoYW5nZWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb21wZXRpdGl2ZV9ib3VudHkuY29udHJhY3QuQ29tcGV0aXRpdmVCb3VudHkuc3VibWl0KGJveF9wYXltZW50OiB1aW50NjQsIHN1Ym1pc3Npb246IGJ5dGVzKSAtPiB2b2lkOgpzdWJtaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjQ4LTQ5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzdWJtaXQoc2VsZiwgYm94X3BheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCBzdWJtaXNzaW9uOiBCeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo1NAogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IE9QRU4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjU1CiAgICAvLyBhc3NlcnQgc2VsZi5hbW91bnQgPiAwLCAiQm91bnR5IGlzIG5vdCBmdW5kZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgIGFzc2VydCAvLyBCb3VudHkgaXMgbm90IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo1NgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgIT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgIT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo1OAogICAgLy8gc3VibWlzc2lvbi5sZW5ndGggPT0gU1VCTUlTU0lPTl9TSVpFCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgcHVzaGludCAzMiAvLyAzMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NTctNTkKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgc3VibWlzc2lvbi5sZW5ndGggPT0gU1VCTUlTU0lPTl9TSVpFCiAgICAvLyApLCAiU3VibWlzc2lvbiBtdXN0IGJlIGEgMzIgYnl0ZSBkaWdlc3QiCiAgICBhc3NlcnQgLy8gU3VibWlzc2lvbiBtdXN0IGJlIGEgMzIgYnl0ZSBkaWdlc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NjEKICAgIC8vIGlmIFR4bi5zZW5kZXIgbm90IGluIHNlbGYuc3VibWlzc2lvbnM6CiAgICBieXRlY18zIC8vICJzIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBzdWJtaXRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLnN1Ym1pc3Npb25fY291bnQgKz0gMQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInN1Ym1pc3Npb25fY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3VibWlzc2lvbl9jb3VudCBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBieXRlYyA0IC8vICJzdWJtaXNzaW9uX2NvdW50IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCnN1Ym1pdF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjYzCiAgICAvLyBtaW5fYmFsYW5jZV9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NjQKICAgIC8vIHNlbGYuc3VibWlzc2lvbnNbVHhuLnNlbmRlcl0gPSBzdWJtaXNzaW9uCiAgICBieXRlY18zIC8vICJzIgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjY1CiAgICAvLyBib3hfY29zdCA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgLSBtaW5fYmFsYW5jZV9iZWZvcmUKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgc3dhcAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo2NwogICAgLy8gYXNzZXJ0IGJveF9wYXltZW50LnNlbmRlciA9PSBUeG4uc2VuZGVyLCAiUGF5bWVudCBtdXN0IGNvbWUgZnJvbSB0aGUgd29ya2VyIgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGNvbWUgZnJvbSB0aGUgd29ya2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjY5CiAgICAvLyBib3hfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NjgtNzAKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYm94X3BheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgLy8gKSwgIlJlY2VpdmVyIG11c3QgYmUgdGhlIGFwcCIKICAgIGFzc2VydCAvLyBSZWNlaXZlciBtdXN0IGJlIHRoZSBhcHAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6NzEKICAgIC8vIGFzc2VydCBib3hfcGF5bWVudC5hbW91bnQgPT0gYm94X2Nvc3QsICJQYXltZW50IG11c3QgYmUgdGhlIGJveCBjb3N0IgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgID09CiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIHRoZSBib3ggY29zdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbXBldGl0aXZlX2JvdW50eS5jb250cmFjdC5Db21wZXRpdGl2ZUJvdW50eS5hcHByb3ZlX3N1Ym1pc3Npb24od29ya2VyOiBieXRlcykgLT4gdm9pZDoKYXBwcm92ZV9zdWJtaXNzaW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo3My03NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgYXBwcm92ZV9zdWJtaXNzaW9uKHNlbGYsIHdvcmtlcjogQWNjb3VudCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo3NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo3NgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IE9QRU4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBhc3NlcnQgd29ya2VyIGluIHNlbGYuc3VibWlzc2lvbnMsICJXb3JrZXIgaGFzIG5vIHN1Ym1pc3Npb24iCiAgICBieXRlY18zIC8vICJzIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIFdvcmtlciBoYXMgbm8gc3VibWlzc2lvbgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo3OQogICAgLy8gcGFpZCA9IHNlbGYuYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6ODAKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj13b3JrZXIsIGFtb3VudD1wYWlkLCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGR1cAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo4MgogICAgLy8gc2VsZi53aW5uZXIgPSB3b3JrZXIKICAgIGJ5dGVjIDUgLy8gIndpbm5lciIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6ODMKICAgIC8vIHNlbGYuYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6ODQKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KEFQUFJPVkVEKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18yIC8vIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHdvcmtlciwgcGFpZCkKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbXBldGl0aXZlX2JvdW50eS5jb250cmFjdC5Db21wZXRpdGl2ZUJvdW50eS5jYW5jZWwoKSAtPiB2b2lkOgpjYW5jZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjkwCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gT1BFTgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6OTIKICAgIC8vIHJlZnVuZGVkID0gc2VsZi5hbW91bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo5MwogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPXNlbGYuY3JlYXRvciwgYW1vdW50PXJlZnVuZGVkLCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6OTUKICAgIC8vIHNlbGYuYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6OTYKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KENBTkNFTExFRCkKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGludGNfMyAvLyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weTo5NwogICAgLy8gc2VsZi5fZW1pdF9zdGF0dXNfY2hhbmdlZChHbG9iYWwuemVyb19hZGRyZXNzLCByZWZ1bmRlZCkKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgc3dhcAogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbXBldGl0aXZlX2JvdW50eS5jb250cmFjdC5Db21wZXRpdGl2ZUJvdW50eS5yZWNsYWltX3N1Ym1pc3Npb24oKSAtPiB2b2lkOgpyZWNsYWltX3N1Ym1pc3Npb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IEFQUFJPVkVEIG9yIHNlbGYuc3RhdHVzID09IENBTkNFTExFRAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzIgLy8gMwogICAgPT0KICAgIGJueiByZWNsYWltX3N1Ym1pc3Npb25fYm9vbF90cnVlQDIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18zIC8vIDQKICAgID09CiAgICBieiByZWNsYWltX3N1Ym1pc3Npb25fYm9vbF9mYWxzZUAzCgpyZWNsYWltX3N1Ym1pc3Npb25fYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQoKcmVjbGFpbV9zdWJtaXNzaW9uX2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MTAyCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gQVBQUk9WRUQgb3Igc2VsZi5zdGF0dXMgPT0gQ0FOQ0VMTEVECiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MTAzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBpbiBzZWxmLnN1Ym1pc3Npb25zLCAiTm8gc3VibWlzc2lvbiB0byByZWNsYWltIgogICAgYnl0ZWNfMyAvLyAicyIKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm8gc3VibWlzc2lvbiB0byByZWNsYWltCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEwNQogICAgLy8gbWluX2JhbGFuY2VfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEwNgogICAgLy8gZGVsIHNlbGYuc3VibWlzc2lvbnNbVHhuLnNlbmRlcl0KICAgIGJ5dGVjXzMgLy8gInMiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxMDcKICAgIC8vIHJlZnVuZCA9IG1pbl9iYWxhbmNlX2JlZm9yZSAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxMDkKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cmVmdW5kLCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIHR4biBTZW5kZXIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCnJlY2xhaW1fc3VibWlzc2lvbl9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzAgLy8gMAogICAgYiByZWNsYWltX3N1Ym1pc3Npb25fYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmNvbXBldGl0aXZlX2JvdW50eS5jb250cmFjdC5Db21wZXRpdGl2ZUJvdW50eS5nZXRfc3VibWlzc2lvbih3b3JrZXI6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X3N1Ym1pc3Npb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjExMS0xMTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfc3VibWlzc2lvbihzZWxmLCB3b3JrZXI6IEFjY291bnQpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjExMwogICAgLy8gcmV0dXJuIHNlbGYuc3VibWlzc2lvbnMuZ2V0KHdvcmtlciwgZGVmYXVsdD1CeXRlcygpKQogICAgYnl0ZWNfMyAvLyAicyIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBwdXNoYnl0ZXMgMHgKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbXBldGl0aXZlX2JvdW50eS5jb250cmFjdC5Db21wZXRpdGl2ZUJvdW50eS5nZXRfYm91bnR5X2luZm8oKSAtPiBieXRlcywgYnl0ZXMsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CmdldF9ib3VudHlfaW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MTIwCiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEyMQogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYud2lubmVyKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJ3aW5uZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud2lubmVyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxMjIKICAgIC8vIHNlbGYuYW1vdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEyMwogICAgLy8gc2VsZi5zdGF0dXMsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb21wZXRpdGl2ZV9ib3VudHkvY29udHJhY3QucHk6MTI0CiAgICAvLyBzZWxmLnN1Ym1pc3Npb25fY291bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAic3VibWlzc2lvbl9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdWJtaXNzaW9uX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxMTktMTI1CiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLndpbm5lciksCiAgICAvLyAgICAgc2VsZi5hbW91bnQsCiAgICAvLyAgICAgc2VsZi5zdGF0dXMsCiAgICAvLyAgICAgc2VsZi5zdWJtaXNzaW9uX2NvdW50LAogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbXBldGl0aXZlX2JvdW50eS5jb250cmFjdC5Db21wZXRpdGl2ZUJvdW50eS5fZW1pdF9zdGF0dXNfY2hhbmdlZCh3b3JrZXI6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKX2VtaXRfc3RhdHVzX2NoYW5nZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEyNy0xMjgKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2VtaXRfc3RhdHVzX2NoYW5nZWQoc2VsZiwgd29ya2VyOiBBY2NvdW50LCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxMzEKICAgIC8vIGNyZWF0b3I9YXJjNC5BZGRyZXNzKHNlbGYuY3JlYXRvciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxMzMKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEzNAogICAgLy8gc3RhdHVzPWFyYzQuVUludDY0KHNlbGYuc3RhdHVzKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbXBldGl0aXZlX2JvdW50eS9jb250cmFjdC5weToxMzAtMTM1CiAgICAvLyBCb3VudHlTdGF0dXNDaGFuZ2VkKAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKHNlbGYuY3JlYXRvciksCiAgICAvLyAgICAgd29ya2VyPWFyYzQuQWRkcmVzcyh3b3JrZXIpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29tcGV0aXRpdmVfYm91bnR5L2NvbnRyYWN0LnB5OjEyOS0xMzYKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBCb3VudHlTdGF0dXNDaGFuZ2VkKAogICAgLy8gICAgICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgLy8gICAgICAgICB3b3JrZXI9YXJjNC5BZGRyZXNzKHdvcmtlciksCiAgICAvLyAgICAgICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgICAgICBzdGF0dXM9YXJjNC5VSW50NjQoc2VsZi5zdGF0dXMpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDk2ZjNjZDc2IC8vIG1ldGhvZCAiQm91bnR5U3RhdHVzQ2hhbmdlZChhZGRyZXNzLGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [351], "errorMessage": "Bounty amount must be greater than zero"}, {"pc": [403], "errorMessage": "Bounty is not funded"}, {"pc": [623], "errorMessage": "No submission to reclaim"}, {"pc": [152, 191, 222, 234, 246, 264, 292], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [483], "errorMessage": "Payment must be the box cost"}, {"pc": [469], "errorMessage": "Payment must come from the worker"}, {"pc": [477], "errorMessage": "Receiver must be the app"}, {"pc": [418], "errorMessage": "Submission must be a 32 byte digest"}, {"pc": [509], "errorMessage": "Worker has no submission"}, {"pc": [444, 459, 628, 639], "errorMessage": "account funded"}, {"pc": [323], "errorMessage": "can only call when creating"}, {"pc": [155, 194, 225, 237, 249, 267, 295], "errorMessage": "can only call when not creating"}, {"pc": [340, 402, 513, 564, 686], "errorMessage": "check self.amount exists"}, {"pc": [334, 359, 409, 493, 552, 569, 677, 703], "errorMessage": "check self.creator exists"}, {"pc": [346, 396, 499, 558, 599, 608, 690, 710], "errorMessage": "check self.status exists"}, {"pc": [433, 695], "errorMessage": "check self.submission_count exists"}, {"pc": [682], "errorMessage": "check self.winner exists"}, {"pc": [277, 305], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateBountyArgs:
+    """Dataclass for create_bounty arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+    amount: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_bounty(pay,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SubmitArgs:
+    """Dataclass for submit arguments"""
+    box_payment: algokit_utils.AppMethodCallTransactionArgument
+    submission: bytes | str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "submit(pay,byte[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ApproveSubmissionArgs:
+    """Dataclass for approve_submission arguments"""
+    worker: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "approve_submission(account)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetSubmissionArgs:
+    """Dataclass for get_submission arguments"""
+    worker: str | bytes
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_submission(account)byte[]"
+
+
+class CompetitiveBountyParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64)void",
+            "args": method_args,
+        }))
+
+    def submit(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str] | SubmitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit(pay,byte[])void",
+            "args": method_args,
+        }))
+
+    def approve_submission(
+        self,
+        args: tuple[str | bytes] | ApproveSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_submission(account)void",
+            "args": method_args,
+        }))
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel()void",
+        }))
+
+    def reclaim_submission(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reclaim_submission()void",
+        }))
+
+    def get_submission(
+        self,
+        args: tuple[str | bytes] | GetSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_submission(account)byte[]",
+            "args": method_args,
+        }))
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class CompetitiveBountyCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64)void",
+            "args": method_args,
+        }))
+
+    def submit(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str] | SubmitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit(pay,byte[])void",
+            "args": method_args,
+        }))
+
+    def approve_submission(
+        self,
+        args: tuple[str | bytes] | ApproveSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_submission(account)void",
+            "args": method_args,
+        }))
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel()void",
+        }))
+
+    def reclaim_submission(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reclaim_submission()void",
+        }))
+
+    def get_submission(
+        self,
+        args: tuple[str | bytes] | GetSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_submission(account)byte[]",
+            "args": method_args,
+        }))
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class CompetitiveBountySend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def submit(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str] | SubmitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "submit(pay,byte[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def approve_submission(
+        self,
+        args: tuple[str | bytes] | ApproveSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_submission(account)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def reclaim_submission(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "reclaim_submission()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_submission(
+        self,
+        args: tuple[str | bytes] | GetSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[bytes]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_submission(account)byte[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[bytes], parsed_response)
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[str, str, int, int, int]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[str, str, int, int, int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    creator: str
+    winner: str
+    amount: int
+    status: int
+    submission_count: int
+
+class CompetitiveBountyState:
+    """Methods to access state for the current CompetitiveBounty app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def creator(self) -> str:
+        """Get the current value of the creator key in global_state state"""
+        value = self.app_client.state.global_state.get_value("creator")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def winner(self) -> str:
+        """Get the current value of the winner key in global_state state"""
+        value = self.app_client.state.global_state.get_value("winner")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def amount(self) -> int:
+        """Get the current value of the amount key in global_state state"""
+        value = self.app_client.state.global_state.get_value("amount")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def status(self) -> int:
+        """Get the current value of the status key in global_state state"""
+        value = self.app_client.state.global_state.get_value("status")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def submission_count(self) -> int:
+        """Get the current value of the submission_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("submission_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def submissions(self) -> "_MapState[str, bytes]":
+        """Get values from the submissions map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "submissions",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
+class CompetitiveBountyClient:
+    """Client for interacting with CompetitiveBounty smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = CompetitiveBountyParams(self.app_client)
+        self.create_transaction = CompetitiveBountyCreateTransactionParams(self.app_client)
+        self.send = CompetitiveBountySend(self.app_client)
+        self.state = CompetitiveBountyState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "CompetitiveBountyClient":
+        return CompetitiveBountyClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "CompetitiveBountyClient":
+        return CompetitiveBountyClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "CompetitiveBountyClient":
+        return CompetitiveBountyClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "CompetitiveBountyComposer":
+        return CompetitiveBountyComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_bounty(pay,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["submit(pay,byte[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["approve_submission(account)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["cancel()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["reclaim_submission()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_submission(account)byte[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> bytes | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_bounty_info()(address,address,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[str, str, int, int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | bytes | tuple[str, str, int, int, int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class CompetitiveBountyBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating CompetitiveBounty contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class CompetitiveBountyFactory(algokit_utils.TypedAppFactoryProtocol[CompetitiveBountyBareCallCreateParams, None, None]):
+    """Factory for deploying and managing CompetitiveBountyClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = CompetitiveBountyFactoryParams(self.app_factory)
+        self.create_transaction = CompetitiveBountyFactoryCreateTransaction(self.app_factory)
+        self.send = CompetitiveBountyFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: CompetitiveBountyBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[CompetitiveBountyClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return CompetitiveBountyClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> CompetitiveBountyClient:
+        """Get an app client by creator address and name"""
+        return CompetitiveBountyClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> CompetitiveBountyClient:
+        """Get an app client by app ID"""
+        return CompetitiveBountyClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class CompetitiveBountyFactoryParams:
+    """Parameters for creating transactions for CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CompetitiveBountyFactoryCreateParams(app_factory)
+        self.update = CompetitiveBountyFactoryUpdateParams(app_factory)
+        self.delete = CompetitiveBountyFactoryDeleteParams(app_factory)
+
+class CompetitiveBountyFactoryCreateParams:
+    """Parameters for 'create' operations of CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_bounty(pay,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_bounty(pay,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def submit(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str] | SubmitArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the submit(pay,byte[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "submit(pay,byte[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def approve_submission(
+        self,
+        args: tuple[str | bytes] | ApproveSubmissionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the approve_submission(account)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "approve_submission(account)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def cancel(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the cancel()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "cancel()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def reclaim_submission(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the reclaim_submission()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "reclaim_submission()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_submission(
+        self,
+        args: tuple[str | bytes] | GetSubmissionArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_submission(account)byte[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_submission(account)byte[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_bounty_info(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_bounty_info()(address,address,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class CompetitiveBountyFactoryUpdateParams:
+    """Parameters for 'update' operations of CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class CompetitiveBountyFactoryDeleteParams:
+    """Parameters for 'delete' operations of CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class CompetitiveBountyFactoryCreateTransaction:
+    """Create transactions for CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CompetitiveBountyFactoryCreateTransactionCreate(app_factory)
+
+
+class CompetitiveBountyFactoryCreateTransactionCreate:
+    """Create new instances of CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class CompetitiveBountyFactorySend:
+    """Send calls to CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = CompetitiveBountyFactorySendCreate(app_factory)
+
+
+class CompetitiveBountyFactorySendCreate:
+    """Send create calls to CompetitiveBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[CompetitiveBountyClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return CompetitiveBountyClient(result[0]), result[1]
+
+
+class CompetitiveBountyComposer:
+    """Composer for creating transaction groups for CompetitiveBounty contract calls"""
+
+    def __init__(self, client: "CompetitiveBountyClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, int] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_bounty(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_bounty(pay,uint64)void", v
+            )
+        )
+        return self
+
+    def submit(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, bytes | str] | SubmitArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.submit(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "submit(pay,byte[])void", v
+            )
+        )
+        return self
+
+    def approve_submission(
+        self,
+        args: tuple[str | bytes] | ApproveSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.approve_submission(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "approve_submission(account)void", v
+            )
+        )
+        return self
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.cancel(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "cancel()void", v
+            )
+        )
+        return self
+
+    def reclaim_submission(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.reclaim_submission(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "reclaim_submission()void", v
+            )
+        )
+        return self
+
+    def get_submission(
+        self,
+        args: tuple[str | bytes] | GetSubmissionArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_submission(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_submission(account)byte[]", v
+            )
+        )
+        return self
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_bounty_info(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_bounty_info()(address,address,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "CompetitiveBountyComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "CompetitiveBountyComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
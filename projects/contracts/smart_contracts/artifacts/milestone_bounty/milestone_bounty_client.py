@@ -0,0 +1,1220 @@
+# flake8: noqa
+# fmt: off
+# mypy: ignore-errors
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^3.0.0
+
+# common
+import dataclasses
+import typing
+# core algosdk
+import algosdk
+from algosdk.transaction import OnComplete
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.source_map import SourceMap
+from algosdk.transaction import Transaction
+from algosdk.v2client.models import SimulateTraceConfig
+# utils
+import algokit_utils
+from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
+
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "pay", "name": "payment"}, {"type": "uint64[]", "name": "milestones"}], "name": "create_bounty", "returns": {"type": "void"}, "desc": "Escrows the milestones' total; the payment covers it plus the minimum balance of the\nmilestones box.", "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "claim", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "index"}], "name": "approve_milestone", "returns": {"type": "void"}, "desc": "Pays milestone `index` to the worker. Paying the last one also returns the box cost.", "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "cancel", "returns": {"type": "void"}, "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_milestones", "returns": {"type": "uint64[]"}, "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_bounty_info", "returns": {"type": "(address,address,uint64,uint64,uint64)"}, "events": [], "readonly": true, "recommendations": {}}], "name": "MilestoneBounty", "state": {"keys": {"box": {"milestones": {"key": "bQ==", "keyType": "AVMString", "valueType": "uint64[]"}}, "global": {"creator": {"key": "Y3JlYXRvcg==", "keyType": "AVMString", "valueType": "address"}, "worker": {"key": "d29ya2Vy", "keyType": "AVMString", "valueType": "address"}, "amount": {"key": "YW1vdW50", "keyType": "AVMString", "valueType": "AVMUint64"}, "status": {"key": "c3RhdHVz", "keyType": "AVMString", "valueType": "AVMUint64"}, "paid_milestones": {"key": "cGFpZF9taWxlc3RvbmVz", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 2, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiADAAEIJgcHY3JlYXRvcgZhbW91bnQGc3RhdHVzAW0Gd29ya2VyD3BhaWRfbWlsZXN0b25lcwQVH3x1MRhAABMoMQBnJwQyA2cpImcqImcnBSJnMRtBAKyCBgQNtU8mBPFXdyYEIDCmVgQx8mqbBOnmUYkEVF3C3jYaAI4GAGIAVgBGADoAKQACIkMxGRREMRhEiAHbTwIWTwIWTwIWTwRPBFBPA1BPAlBMUCcGTFCwI0MxGRREMRhEiAGqJwZMULAjQzEZFEQxGESIAWcjQzEZFEQxGEQ2GgEXiADkI0MxGRREMRhEiAC6I0MxGRREMRhEMRYjCUk4ECMSRDYaAYgADSNDMRlA/4AxGBREI0OKAgCAAEkxACIoZUQSRCIpZUQURCIqZUQURIv/IllJQQBuiwKBEA5BAGYjRCKMASKMAIsAiwIMQQAbi/9XAgCLAElOAiQLW0lEiwEIjAEjCIwAQv/dMgpzAUQrvEgri/+/MgpzAURMCYv+OAAiKGVEEkSL/jgHMgoSRIv+OAiLAUlOAk8DCBJEKUsBZ4gBCIkiQv+XIiplRBREMQAiKGVEE0QnBDEAZyojZyIpZUSIAOaJigEAMQAiKGVEEkQiKmVEIxJEK75EIlmL/w1EI4v/kCInBWVESwEaFEQrvkRXAgCL/yQLW0lOArEiJwRlREsBsgiyByOyECKyAbMiJwVlRE8CGScFTGciKWVETAkpTGciKWVEQAAHKoEDZ4gAWYsAiABziTEAIihlRBJEIiplRBREIillRLEiKGVESwGyCLIHI7IQIrIBsykiZyqBBGeIACWIAEGJK76AAgAATgJNiSIoZUQiJwRlRCIpZUQiKmVEIicFZUSJMgpzAUQrvEgyCnMBRAmxIihlRLIHsggjshAisgGziYoBACIoZUQiJwRlRIv/FiIqZUQWTwNPA1BPAlBMUIAElvPNdkxQsIk=", "clear": "CoEBQw=="}, "compilerInfo": {"compiler": "puya", "compilerVersion": {"major": 4, "minor": 7, "patch": 0}}, "desc": "\n    Bounty paid out in milestones from one escrow: create_bounty escrows the total of up to 16\n    milestone amounts, kept in a box, and each approve_milestone pays one of them to the worker.\n    ", "events": [{"args": [{"type": "address", "name": "creator"}, {"type": "address", "name": "worker"}, {"type": "uint64", "name": "amount"}, {"type": "uint64", "name": "status"}], "name": "BountyStatusChanged", "desc": "ARC-28 event emitted by every bounty state transition, with the new status."}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMubWlsZXN0b25lX2JvdW50eS5jb250cmFjdC5NaWxlc3RvbmVCb3VudHkuX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMCAxIDgKICAgIGJ5dGVjYmxvY2sgImNyZWF0b3IiICJhbW91bnQiICJzdGF0dXMiICJtIiAid29ya2VyIiAicGFpZF9taWxlc3RvbmVzIiAweDE1MWY3Yzc1CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToyOQogICAgLy8gc2VsZi5jcmVhdG9yID0gVHhuLnNlbmRlcgogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTozMAogICAgLy8gc2VsZi53b3JrZXIgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlYyA0IC8vICJ3b3JrZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTozMQogICAgLy8gc2VsZi5hbW91bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6MzIKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KE9QRU4pCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjMzCiAgICAvLyBzZWxmLnBhaWRfbWlsZXN0b25lcyA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNSAvLyAicGFpZF9taWxlc3RvbmVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjE1CiAgICAvLyBjbGFzcyBNaWxlc3RvbmVCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMQogICAgcHVzaGJ5dGVzcyAweDBkYjU0ZjI2IDB4ZjE1Nzc3MjYgMHgyMDMwYTY1NiAweDMxZjI2YTliIDB4ZTllNjUxODkgMHg1NDVkYzJkZSAvLyBtZXRob2QgImNyZWF0ZV9ib3VudHkocGF5LHVpbnQ2NFtdKXZvaWQiLCBtZXRob2QgImNsYWltKCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX21pbGVzdG9uZSh1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2FuY2VsKCl2b2lkIiwgbWV0aG9kICJnZXRfbWlsZXN0b25lcygpdWludDY0W10iLCBtZXRob2QgImdldF9ib3VudHlfaW5mbygpKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9ib3VudHlfcm91dGVANSBtYWluX2NsYWltX3JvdXRlQDYgbWFpbl9hcHByb3ZlX21pbGVzdG9uZV9yb3V0ZUA3IG1haW5fY2FuY2VsX3JvdXRlQDggbWFpbl9nZXRfbWlsZXN0b25lc19yb3V0ZUA5IG1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDEwCgptYWluX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxNQogICAgLy8gY2xhc3MgTWlsZXN0b25lQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9ib3VudHlfaW5mb19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjExNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9ib3VudHlfaW5mbwogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgaXRvYgogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDYgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X21pbGVzdG9uZXNfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjExMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9taWxlc3RvbmVzCiAgICBieXRlYyA2IC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NhbmNlbF9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6OTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNhbmNlbAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX21pbGVzdG9uZV9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6NzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxNQogICAgLy8gY2xhc3MgTWlsZXN0b25lQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo3OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFwcHJvdmVfbWlsZXN0b25lCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo3MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xhaW0KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6MzUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxNQogICAgLy8gY2xhc3MgTWlsZXN0b25lQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjM1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2JvdW50eQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxNQogICAgLy8gY2xhc3MgTWlsZXN0b25lQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDEzCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5taWxlc3RvbmVfYm91bnR5LmNvbnRyYWN0Lk1pbGVzdG9uZUJvdW50eS5jcmVhdGVfYm91bnR5KHBheW1lbnQ6IHVpbnQ2NCwgbWlsZXN0b25lczogYnl0ZXMpIC0+IHZvaWQ6CmNyZWF0ZV9ib3VudHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTozNS00MAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2JvdW50eSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIG1pbGVzdG9uZXM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgcHVzaGJ5dGVzICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo0NgogICAgLy8gYXNzZXJ0IHNlbGYuYW1vdW50ID09IDAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo0NwogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IE9QRU4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo0OQogICAgLy8gbWlsZXN0b25lcy5sZW5ndGggPiAwIGFuZCBtaWxlc3RvbmVzLmxlbmd0aCA8PSBNQVhfTUlMRVNUT05FUwogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgYnogY3JlYXRlX2JvdW50eV9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAyCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICA8PQogICAgYnogY3JlYXRlX2JvdW50eV9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCgpjcmVhdGVfYm91bnR5X2Jvb2xfbWVyZ2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjQ4LTUwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIG1pbGVzdG9uZXMubGVuZ3RoID4gMCBhbmQgbWlsZXN0b25lcy5sZW5ndGggPD0gTUFYX01JTEVTVE9ORVMKICAgIC8vICksICJFeHBlY3RlZCAxIHRvIDE2IG1pbGVzdG9uZXMiCiAgICBhc3NlcnQgLy8gRXhwZWN0ZWQgMSB0byAxNiBtaWxlc3RvbmVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo1MgogICAgLy8gdG90YWwgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDEKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKCmNyZWF0ZV9ib3VudHlfZm9yX2hlYWRlckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6NTMKICAgIC8vIGZvciBtaWxlc3RvbmUgaW4gbWlsZXN0b25lczoKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogY3JlYXRlX2JvdW50eV9hZnRlcl9mb3JAOAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18yIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjU0CiAgICAvLyBhc3NlcnQgbWlsZXN0b25lLm5hdGl2ZSA+IDAsICJNaWxlc3RvbmUgYW1vdW50cyBtdXN0IGJlIGdyZWF0ZXIgdGhhbiB6ZXJvIgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYXNzZXJ0IC8vIE1pbGVzdG9uZSBhbW91bnRzIG11c3QgYmUgZ3JlYXRlciB0aGFuIHplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjU1CiAgICAvLyB0b3RhbCArPSBtaWxlc3RvbmUubmF0aXZlCiAgICBmcmFtZV9kaWcgMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIGNyZWF0ZV9ib3VudHlfZm9yX2hlYWRlckA1CgpjcmVhdGVfYm91bnR5X2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6NTcKICAgIC8vIG1pbl9iYWxhbmNlX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6NTgKICAgIC8vIHNlbGYubWlsZXN0b25lcy52YWx1ZSA9IG1pbGVzdG9uZXMuY29weSgpCiAgICBieXRlY18zIC8vICJtIgogICAgYm94X2RlbAogICAgcG9wCiAgICBieXRlY18zIC8vICJtIgogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo1OQogICAgLy8gYm94X2Nvc3QgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlIC0gbWluX2JhbGFuY2VfYmVmb3JlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIHN3YXAKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjYxCiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6NjQKICAgIC8vIHBheW1lbnQuYW1vdW50ID09IHRvdGFsICsgYm94X2Nvc3QKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQW1vdW50CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgICsKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo2My02NQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50LmFtb3VudCA9PSB0b3RhbCArIGJveF9jb3N0CiAgICAvLyApLCAiUGF5bWVudCBtdXN0IGJlIHRoZSBtaWxlc3RvbmUgdG90YWwgcGx1cyB0aGUgYm94IGNvc3QiCiAgICBhc3NlcnQgLy8gUGF5bWVudCBtdXN0IGJlIHRoZSBtaWxlc3RvbmUgdG90YWwgcGx1cyB0aGUgYm94IGNvc3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBzZWxmLmFtb3VudCA9IHRvdGFsCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjY4CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHRvdGFsKQogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgpjcmVhdGVfYm91bnR5X2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGNyZWF0ZV9ib3VudHlfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLm1pbGVzdG9uZV9ib3VudHkuY29udHJhY3QuTWlsZXN0b25lQm91bnR5LmNsYWltKCkgLT4gdm9pZDoKY2xhaW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo3MgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IE9QRU4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo3MwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgIT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgIT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6NzUKICAgIC8vIHNlbGYud29ya2VyID0gVHhuLnNlbmRlcgogICAgYnl0ZWMgNCAvLyAid29ya2VyIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojc2CiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NChDTEFJTUVEKQogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo3NwogICAgLy8gc2VsZi5fZW1pdF9zdGF0dXNfY2hhbmdlZChzZWxmLmFtb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm1pbGVzdG9uZV9ib3VudHkuY29udHJhY3QuTWlsZXN0b25lQm91bnR5LmFwcHJvdmVfbWlsZXN0b25lKGluZGV4OiB1aW50NjQpIC0+IHZvaWQ6CmFwcHJvdmVfbWlsZXN0b25lOgogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6NzktODAKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFwcHJvdmVfbWlsZXN0b25lKHNlbGYsIGluZGV4OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjgyCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo4MwogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IENMQUlNRUQKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBhc3NlcnQgaW5kZXggPCBzZWxmLm1pbGVzdG9uZXMudmFsdWUubGVuZ3RoLCAiTm8gc3VjaCBtaWxlc3RvbmUiCiAgICBieXRlY18zIC8vICJtIgogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubWlsZXN0b25lcyBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBhc3NlcnQgLy8gTm8gc3VjaCBtaWxlc3RvbmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBtaWxlc3RvbmVfYml0ID0gVUludDY0KDEpIDw8IGluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfZGlnIC0xCiAgICBzaGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBhc3NlcnQgc2VsZi5wYWlkX21pbGVzdG9uZXMgJiBtaWxlc3RvbmVfYml0ID09IDAsICJNaWxlc3RvbmUgYWxyZWFkeSBwYWlkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInBhaWRfbWlsZXN0b25lcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYWlkX21pbGVzdG9uZXMgZXhpc3RzCiAgICBkaWcgMQogICAgJgogICAgIQogICAgYXNzZXJ0IC8vIE1pbGVzdG9uZSBhbHJlYWR5IHBhaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojg3CiAgICAvLyBwYWlkID0gc2VsZi5taWxlc3RvbmVzLnZhbHVlW2luZGV4XS5uYXRpdmUKICAgIGJ5dGVjXzMgLy8gIm0iCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5taWxlc3RvbmVzIGV4aXN0cwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9c2VsZi53b3JrZXIsIGFtb3VudD1wYWlkLCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo5MQogICAgLy8gc2VsZi5wYWlkX21pbGVzdG9uZXMgfD0gbWlsZXN0b25lX2JpdAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInBhaWRfbWlsZXN0b25lcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYWlkX21pbGVzdG9uZXMgZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIHwKICAgIGJ5dGVjIDUgLy8gInBhaWRfbWlsZXN0b25lcyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weTo5MgogICAgLy8gc2VsZi5hbW91bnQgLT0gcGFpZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICBzd2FwCiAgICAtCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6OTMKICAgIC8vIGlmIHNlbGYuYW1vdW50ID09IDA6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgIGJueiBhcHByb3ZlX21pbGVzdG9uZV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NChBUFBST1ZFRCkKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6OTUKICAgIC8vIHNlbGYuX3JlbGVhc2VfbWlsZXN0b25lcygpCiAgICBjYWxsc3ViIF9yZWxlYXNlX21pbGVzdG9uZXMKCmFwcHJvdmVfbWlsZXN0b25lX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHBhaWQpCiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm1pbGVzdG9uZV9ib3VudHkuY29udHJhY3QuTWlsZXN0b25lQm91bnR5LmNhbmNlbCgpIC0+IHZvaWQ6CmNhbmNlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjEwMAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6MTAxCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gT1BFTgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gcmVmdW5kZWQgPSBzZWxmLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMDQKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1zZWxmLmNyZWF0b3IsIGFtb3VudD1yZWZ1bmRlZCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMDYKICAgIC8vIHNlbGYuYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjEwNwogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoQ0FOQ0VMTEVEKQogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgcHVzaGludCA0IC8vIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMDgKICAgIC8vIHNlbGYuX3JlbGVhc2VfbWlsZXN0b25lcygpCiAgICBjYWxsc3ViIF9yZWxlYXNlX21pbGVzdG9uZXMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjEwOQogICAgLy8gc2VsZi5fZW1pdF9zdGF0dXNfY2hhbmdlZChyZWZ1bmRlZCkKICAgIGNhbGxzdWIgX2VtaXRfc3RhdHVzX2NoYW5nZWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5taWxlc3RvbmVfYm91bnR5LmNvbnRyYWN0Lk1pbGVzdG9uZUJvdW50eS5nZXRfbWlsZXN0b25lcygpIC0+IGJ5dGVzOgpnZXRfbWlsZXN0b25lczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjExMwogICAgLy8gcmV0dXJuIHNlbGYubWlsZXN0b25lcy5nZXQoZGVmYXVsdD1hcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKSkKICAgIGJ5dGVjXzMgLy8gIm0iCiAgICBib3hfZ2V0CiAgICBwdXNoYnl0ZXMgMHgwMDAwCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5taWxlc3RvbmVfYm91bnR5LmNvbnRyYWN0Lk1pbGVzdG9uZUJvdW50eS5nZXRfYm91bnR5X2luZm8oKSAtPiBieXRlcywgYnl0ZXMsIHVpbnQ2NCwgdWludDY0LCB1aW50NjQ6CmdldF9ib3VudHlfaW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjEyMAogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYuY3JlYXRvciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6MTIxCiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi53b3JrZXIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIndvcmtlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53b3JrZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMjIKICAgIC8vIHNlbGYuYW1vdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMjMKICAgIC8vIHNlbGYuc3RhdHVzLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMjQKICAgIC8vIHNlbGYucGFpZF9taWxlc3RvbmVzLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInBhaWRfbWlsZXN0b25lcyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wYWlkX21pbGVzdG9uZXMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMTktMTI1CiAgICAvLyByZXR1cm4gKAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhzZWxmLndvcmtlciksCiAgICAvLyAgICAgc2VsZi5hbW91bnQsCiAgICAvLyAgICAgc2VsZi5zdGF0dXMsCiAgICAvLyAgICAgc2VsZi5wYWlkX21pbGVzdG9uZXMsCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubWlsZXN0b25lX2JvdW50eS5jb250cmFjdC5NaWxlc3RvbmVCb3VudHkuX3JlbGVhc2VfbWlsZXN0b25lcygpIC0+IHZvaWQ6Cl9yZWxlYXNlX21pbGVzdG9uZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMzAKICAgIC8vIG1pbl9iYWxhbmNlX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6MTMxCiAgICAvLyBkZWwgc2VsZi5taWxlc3RvbmVzLnZhbHVlCiAgICBieXRlY18zIC8vICJtIgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxMzIKICAgIC8vIHJlZnVuZCA9IG1pbl9iYWxhbmNlX2JlZm9yZSAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6MTM0CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9c2VsZi5jcmVhdG9yLCBhbW91bnQ9cmVmdW5kLCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm1pbGVzdG9uZV9ib3VudHkuY29udHJhY3QuTWlsZXN0b25lQm91bnR5Ll9lbWl0X3N0YXR1c19jaGFuZ2VkKGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpfZW1pdF9zdGF0dXNfY2hhbmdlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjEzNi0xMzcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2VtaXRfc3RhdHVzX2NoYW5nZWQoc2VsZiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjE0MQogICAgLy8gY3JlYXRvcj1hcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxNDIKICAgIC8vIHdvcmtlcj1hcmM0LkFkZHJlc3Moc2VsZi53b3JrZXIpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gIndvcmtlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53b3JrZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxNDMKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWlsZXN0b25lX2JvdW50eS9jb250cmFjdC5weToxNDQKICAgIC8vIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9taWxlc3RvbmVfYm91bnR5L2NvbnRyYWN0LnB5OjE0MC0xNDUKICAgIC8vIEJvdW50eVN0YXR1c0NoYW5nZWQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIC8vICAgICB3b3JrZXI9YXJjNC5BZGRyZXNzKHNlbGYud29ya2VyKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICBzdGF0dXM9YXJjNC5VSW50NjQoc2VsZi5zdGF0dXMpLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL21pbGVzdG9uZV9ib3VudHkvY29udHJhY3QucHk6MTM5LTE0NgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEJvdW50eVN0YXR1c0NoYW5nZWQoCiAgICAvLyAgICAgICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKHNlbGYuY3JlYXRvciksCiAgICAvLyAgICAgICAgIHdvcmtlcj1hcmM0LkFkZHJlc3Moc2VsZi53b3JrZXIpLAogICAgLy8gICAgICAgICBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIC8vICAgICAgICAgc3RhdHVzPWFyYzQuVUludDY0KHNlbGYuc3RhdHVzKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg5NmYzY2Q3NiAvLyBtZXRob2QgIkJvdW50eVN0YXR1c0NoYW5nZWQoYWRkcmVzcyxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [315], "errorMessage": "Expected 1 to 16 milestones"}, {"pc": [490], "errorMessage": "Milestone already paid"}, {"pc": [344], "errorMessage": "Milestone amounts must be greater than zero"}, {"pc": [476], "errorMessage": "No such milestone"}, {"pc": [143, 182, 199, 211, 227, 239], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [407], "errorMessage": "Payment must be the milestone total plus the box cost"}, {"pc": [361, 373, 652, 660], "errorMessage": "account funded"}, {"pc": [269], "errorMessage": "can only call when creating"}, {"pc": [146, 185, 202, 214, 230, 242], "errorMessage": "can only call when not creating"}, {"pc": [289, 445, 539, 548, 582, 637], "errorMessage": "check self.amount exists"}, {"pc": [283, 383, 431, 458, 570, 587, 628, 666, 685], "errorMessage": "check self.creator exists"}, {"pc": [470, 493], "errorMessage": "check self.milestones exists"}, {"pc": [485, 528, 646], "errorMessage": "check self.paid_milestones exists"}, {"pc": [295, 423, 464, 576, 641, 697], "errorMessage": "check self.status exists"}, {"pc": [510, 633, 690], "errorMessage": "check self.worker exists"}, {"pc": [252], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
+
+def _parse_abi_args(args: object | None = None) -> list[object] | None:
+    """Helper to parse ABI args into the format expected by underlying client"""
+    if args is None:
+        return None
+
+    def convert_dataclass(value: object) -> object:
+        if dataclasses.is_dataclass(value):
+            return tuple(convert_dataclass(getattr(value, field.name)) for field in dataclasses.fields(value))
+        elif isinstance(value, (list, tuple)):
+            return type(value)(convert_dataclass(item) for item in value)
+        return value
+
+    match args:
+        case tuple():
+            method_args = list(args)
+        case _ if dataclasses.is_dataclass(args):
+            method_args = [getattr(args, field.name) for field in dataclasses.fields(args)]
+        case _:
+            raise ValueError("Invalid 'args' type. Expected 'tuple' or 'TypedDict' for respective typed arguments.")
+
+    return [
+        convert_dataclass(arg) if not isinstance(arg, algokit_utils.AppMethodCallTransactionArgument) else arg
+        for arg in method_args
+    ] if method_args else None
+
+def _init_dataclass(cls: type, data: dict) -> object:
+    """
+    Recursively instantiate a dataclass of type `cls` from `data`.
+
+    For each field on the dataclass, if the field type is also a dataclass
+    and the corresponding data is a dict, instantiate that field recursively.
+    """
+    field_values = {}
+    for field in dataclasses.fields(cls):
+        field_value = data.get(field.name)
+        # Check if the field expects another dataclass and the value is a dict.
+        if dataclasses.is_dataclass(field.type) and isinstance(field_value, dict):
+            field_values[field.name] = _init_dataclass(typing.cast(type, field.type), field_value)
+        else:
+            field_values[field.name] = field_value
+    return cls(**field_values)
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CreateBountyArgs:
+    """Dataclass for create_bounty arguments"""
+    payment: algokit_utils.AppMethodCallTransactionArgument
+    milestones: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "create_bounty(pay,uint64[])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ApproveMilestoneArgs:
+    """Dataclass for approve_milestone arguments"""
+    index: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "approve_milestone(uint64)void"
+
+
+class MilestoneBountyParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, list[int]] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64[])void",
+            "args": method_args,
+        }))
+
+    def claim(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim()void",
+        }))
+
+    def approve_milestone(
+        self,
+        args: tuple[int] | ApproveMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_milestone(uint64)void",
+            "args": method_args,
+        }))
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel()void",
+        }))
+
+    def get_milestones(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestones()uint64[]",
+        }))
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> algokit_utils.AppCallParams:
+        return self.app_client.params.bare.clear_state(
+            params,
+            
+        )
+
+
+class MilestoneBountyCreateTransactionParams:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, list[int]] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64[])void",
+            "args": method_args,
+        }))
+
+    def claim(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim()void",
+        }))
+
+    def approve_milestone(
+        self,
+        args: tuple[int] | ApproveMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_milestone(uint64)void",
+            "args": method_args,
+        }))
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel()void",
+        }))
+
+    def get_milestones(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestones()uint64[]",
+        }))
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class MilestoneBountySend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, list[int]] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_bounty(pay,uint64[])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def claim(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "claim()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def approve_milestone(
+        self,
+        args: tuple[int] | ApproveMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "approve_milestone(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "cancel()void",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_milestones(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[int]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_milestones()uint64[]",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[int]], parsed_response)
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[tuple[str, str, int, int, int]]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[tuple[str, str, int, int, int]], parsed_response)
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[algokit_utils.ABIReturn]:
+        return self.app_client.send.bare.clear_state(
+            params,
+            send_params=send_params,
+        )
+
+
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    creator: str
+    worker: str
+    amount: int
+    status: int
+    paid_milestones: int
+
+class BoxStateValue(typing.TypedDict):
+    """Shape of box state key values"""
+    milestones: list[int]
+
+class MilestoneBountyState:
+    """Methods to access state for the current MilestoneBounty app"""
+
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def creator(self) -> str:
+        """Get the current value of the creator key in global_state state"""
+        value = self.app_client.state.global_state.get_value("creator")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def worker(self) -> str:
+        """Get the current value of the worker key in global_state state"""
+        value = self.app_client.state.global_state.get_value("worker")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def amount(self) -> int:
+        """Get the current value of the amount key in global_state state"""
+        value = self.app_client.state.global_state.get_value("amount")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def status(self) -> int:
+        """Get the current value of the status key in global_state state"""
+        value = self.app_client.state.global_state.get_value("status")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def paid_milestones(self) -> int:
+        """Get the current value of the paid_milestones key in global_state state"""
+        value = self.app_client.state.global_state.get_value("paid_milestones")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> BoxStateValue:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return typing.cast(BoxStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(BoxStateValue, converted)
+
+    @property
+    def milestones(self) -> list[int]:
+        """Get the current value of the milestones key in box state"""
+        value = self.app_client.state.box.get_value("milestones")
+        if isinstance(value, dict) and "uint64[]" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["uint64[]"], value)  # type: ignore
+        return typing.cast(list[int], value)
+
+class MilestoneBountyClient:
+    """Client for interacting with MilestoneBounty smart contract"""
+
+    @typing.overload
+    def __init__(self, app_client: algokit_utils.AppClient) -> None: ...
+    
+    @typing.overload
+    def __init__(
+        self,
+        *,
+        algorand: _AlgoKitAlgorandClient,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        app_client: algokit_utils.AppClient | None = None,
+        *,
+        algorand: _AlgoKitAlgorandClient | None = None,
+        app_id: int | None = None,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> None:
+        if app_client:
+            self.app_client = app_client
+        elif algorand and app_id:
+            self.app_client = algokit_utils.AppClient(
+                algokit_utils.AppClientParams(
+                    algorand=algorand,
+                    app_spec=APP_SPEC,
+                    app_id=app_id,
+                    app_name=app_name,
+                    default_sender=default_sender,
+                    default_signer=default_signer,
+                    approval_source_map=approval_source_map,
+                    clear_source_map=clear_source_map,
+                )
+            )
+        else:
+            raise ValueError("Either app_client or algorand and app_id must be provided")
+    
+        self.params = MilestoneBountyParams(self.app_client)
+        self.create_transaction = MilestoneBountyCreateTransactionParams(self.app_client)
+        self.send = MilestoneBountySend(self.app_client)
+        self.state = MilestoneBountyState(self.app_client)
+
+    @staticmethod
+    def from_creator_and_name(
+        creator_address: str,
+        app_name: str,
+        algorand: _AlgoKitAlgorandClient,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+    ) -> "MilestoneBountyClient":
+        return MilestoneBountyClient(
+            algokit_utils.AppClient.from_creator_and_name(
+                creator_address=creator_address,
+                app_name=app_name,
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+                ignore_cache=ignore_cache,
+                app_lookup_cache=app_lookup_cache,
+            )
+        )
+    
+    @staticmethod
+    def from_network(
+        algorand: _AlgoKitAlgorandClient,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "MilestoneBountyClient":
+        return MilestoneBountyClient(
+            algokit_utils.AppClient.from_network(
+                app_spec=APP_SPEC,
+                algorand=algorand,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+    
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+    
+    @property
+    def app_name(self) -> str:
+        return self.app_client.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_client.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_client.algorand
+
+    def clone(
+        self,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> "MilestoneBountyClient":
+        return MilestoneBountyClient(
+            self.app_client.clone(
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                approval_source_map=approval_source_map,
+                clear_source_map=clear_source_map,
+            )
+        )
+
+    def new_group(self) -> "MilestoneBountyComposer":
+        return MilestoneBountyComposer(self)
+
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["create_bounty(pay,uint64[])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["claim()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["approve_milestone(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["cancel()void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_milestones()uint64[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_bounty_info()(address,address,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> tuple[str, str, int, int, int] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None: ...
+
+    def decode_return_value(
+        self,
+        method: str,
+        return_value: algokit_utils.ABIReturn | None
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | list[int] | tuple[str, str, int, int, int]:
+        """Decode ABI return value for the given method."""
+        if return_value is None:
+            return None
+    
+        arc56_method = self.app_spec.get_arc56_method(method)
+        decoded = return_value.get_arc56_value(arc56_method, self.app_spec.structs)
+    
+        # If method returns a struct, convert the dict to appropriate dataclass
+        if (arc56_method and
+            arc56_method.returns and
+            arc56_method.returns.struct and
+            isinstance(decoded, dict)):
+            struct_class = globals().get(arc56_method.returns.struct)
+            if struct_class:
+                return struct_class(**typing.cast(dict, decoded))
+        return decoded
+
+
+@dataclasses.dataclass(frozen=True)
+class MilestoneBountyBareCallCreateParams(algokit_utils.AppClientBareCallCreateParams):
+    """Parameters for creating MilestoneBounty contract with bare calls"""
+    on_complete: typing.Literal[OnComplete.NoOpOC] | None = None
+
+    def to_algokit_utils_params(self) -> algokit_utils.AppClientBareCallCreateParams:
+        return algokit_utils.AppClientBareCallCreateParams(**self.__dict__)
+
+class MilestoneBountyFactory(algokit_utils.TypedAppFactoryProtocol[MilestoneBountyBareCallCreateParams, None, None]):
+    """Factory for deploying and managing MilestoneBountyClient smart contracts"""
+
+    def __init__(
+        self,
+        algorand: _AlgoKitAlgorandClient,
+        *,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        version: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ):
+        self.app_factory = algokit_utils.AppFactory(
+            params=algokit_utils.AppFactoryParams(
+                algorand=algorand,
+                app_spec=APP_SPEC,
+                app_name=app_name,
+                default_sender=default_sender,
+                default_signer=default_signer,
+                version=version,
+                compilation_params=compilation_params,
+            )
+        )
+        self.params = MilestoneBountyFactoryParams(self.app_factory)
+        self.create_transaction = MilestoneBountyFactoryCreateTransaction(self.app_factory)
+        self.send = MilestoneBountyFactorySend(self.app_factory)
+
+    @property
+    def app_name(self) -> str:
+        return self.app_factory.app_name
+    
+    @property
+    def app_spec(self) -> algokit_utils.Arc56Contract:
+        return self.app_factory.app_spec
+    
+    @property
+    def algorand(self) -> _AlgoKitAlgorandClient:
+        return self.app_factory.algorand
+
+    def deploy(
+        self,
+        *,
+        on_update: algokit_utils.OnUpdate | None = None,
+        on_schema_break: algokit_utils.OnSchemaBreak | None = None,
+        create_params: MilestoneBountyBareCallCreateParams | None = None,
+        update_params: None = None,
+        delete_params: None = None,
+        existing_deployments: algokit_utils.ApplicationLookup | None = None,
+        ignore_cache: bool = False,
+        app_name: str | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> tuple[MilestoneBountyClient, algokit_utils.AppFactoryDeployResult]:
+        """Deploy the application"""
+        deploy_response = self.app_factory.deploy(
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            create_params=create_params.to_algokit_utils_params() if create_params else None,
+            update_params=update_params,
+            delete_params=delete_params,
+            existing_deployments=existing_deployments,
+            ignore_cache=ignore_cache,
+            app_name=app_name,
+            compilation_params=compilation_params,
+            send_params=send_params,
+        )
+
+        return MilestoneBountyClient(deploy_response[0]), deploy_response[1]
+
+    def get_app_client_by_creator_and_name(
+        self,
+        creator_address: str,
+        app_name: str,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        ignore_cache: bool | None = None,
+        app_lookup_cache: algokit_utils.ApplicationLookup | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> MilestoneBountyClient:
+        """Get an app client by creator address and name"""
+        return MilestoneBountyClient(
+            self.app_factory.get_app_client_by_creator_and_name(
+                creator_address,
+                app_name,
+                default_sender,
+                default_signer,
+                ignore_cache,
+                app_lookup_cache,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> MilestoneBountyClient:
+        """Get an app client by app ID"""
+        return MilestoneBountyClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class MilestoneBountyFactoryParams:
+    """Parameters for creating transactions for MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = MilestoneBountyFactoryCreateParams(app_factory)
+        self.update = MilestoneBountyFactoryUpdateParams(app_factory)
+        self.delete = MilestoneBountyFactoryDeleteParams(app_factory)
+
+class MilestoneBountyFactoryCreateParams:
+    """Parameters for 'create' operations of MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, list[int]] | CreateBountyArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_bounty(pay,uint64[])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_bounty(pay,uint64[])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def claim(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the claim()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "claim()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def approve_milestone(
+        self,
+        args: tuple[int] | ApproveMilestoneArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the approve_milestone(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "approve_milestone(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def cancel(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the cancel()void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "cancel()void",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_milestones(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_milestones()uint64[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_milestones()uint64[]",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_bounty_info(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_bounty_info()(address,address,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_bounty_info()(address,address,uint64,uint64,uint64)",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+class MilestoneBountyFactoryUpdateParams:
+    """Parameters for 'update' operations of MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppUpdateParams:
+        """Updates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_update(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+class MilestoneBountyFactoryDeleteParams:
+    """Parameters for 'delete' operations of MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        
+    ) -> algokit_utils.AppDeleteParams:
+        """Deletes an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.deploy_delete(
+            algokit_utils.AppClientBareCallParams(**dataclasses.asdict(params)),
+            )
+
+
+class MilestoneBountyFactoryCreateTransaction:
+    """Create transactions for MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = MilestoneBountyFactoryCreateTransactionCreate(app_factory)
+
+
+class MilestoneBountyFactoryCreateTransactionCreate:
+    """Create new instances of MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+    ) -> Transaction:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.create_transaction.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+        )
+
+
+class MilestoneBountyFactorySend:
+    """Send calls to MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = MilestoneBountyFactorySendCreate(app_factory)
+
+
+class MilestoneBountyFactorySendCreate:
+    """Send create calls to MilestoneBounty contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        send_params: algokit_utils.SendParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None,
+    ) -> tuple[MilestoneBountyClient, algokit_utils.SendAppCreateTransactionResult]:
+        """Creates a new instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        result = self.app_factory.send.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            send_params=send_params,
+            compilation_params=compilation_params
+        )
+        return MilestoneBountyClient(result[0]), result[1]
+
+
+class MilestoneBountyComposer:
+    """Composer for creating transaction groups for MilestoneBounty contract calls"""
+
+    def __init__(self, client: "MilestoneBountyClient"):
+        self.client = client
+        self._composer = client.algorand.new_group()
+        self._result_mappers: list[typing.Callable[[algokit_utils.ABIReturn | None], object] | None] = []
+
+    def create_bounty(
+        self,
+        args: tuple[algokit_utils.AppMethodCallTransactionArgument, list[int]] | CreateBountyArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "MilestoneBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.create_bounty(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "create_bounty(pay,uint64[])void", v
+            )
+        )
+        return self
+
+    def claim(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "MilestoneBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.claim(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "claim()void", v
+            )
+        )
+        return self
+
+    def approve_milestone(
+        self,
+        args: tuple[int] | ApproveMilestoneArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "MilestoneBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.approve_milestone(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "approve_milestone(uint64)void", v
+            )
+        )
+        return self
+
+    def cancel(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "MilestoneBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.cancel(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "cancel()void", v
+            )
+        )
+        return self
+
+    def get_milestones(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "MilestoneBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_milestones(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_milestones()uint64[]", v
+            )
+        )
+        return self
+
+    def get_bounty_info(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "MilestoneBountyComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_bounty_info(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_bounty_info()(address,address,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def clear_state(
+        self,
+        *,
+        args: list[bytes] | None = None,
+        params: algokit_utils.CommonAppCallParams | None = None,
+    ) -> "MilestoneBountyComposer":
+        params=params or algokit_utils.CommonAppCallParams()
+        self._composer.add_app_call(
+            self.client.params.clear_state(
+                algokit_utils.AppClientBareCallParams(
+                    **{
+                        **dataclasses.asdict(params),
+                        "args": args
+                    }
+                )
+            )
+        )
+        return self
+    
+    def add_transaction(
+        self, txn: Transaction, signer: TransactionSigner | None = None
+    ) -> "MilestoneBountyComposer":
+        self._composer.add_transaction(txn, signer)
+        return self
+    
+    def composer(self) -> algokit_utils.TransactionComposer:
+        return self._composer
+    
+    def simulate(
+        self,
+        allow_more_logs: bool | None = None,
+        allow_empty_signatures: bool | None = None,
+        allow_unnamed_resources: bool | None = None,
+        extra_opcode_budget: int | None = None,
+        exec_trace_config: SimulateTraceConfig | None = None,
+        simulation_round: int | None = None,
+        skip_signatures: bool | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.simulate(
+            allow_more_logs=allow_more_logs,
+            allow_empty_signatures=allow_empty_signatures,
+            allow_unnamed_resources=allow_unnamed_resources,
+            extra_opcode_budget=extra_opcode_budget,
+            exec_trace_config=exec_trace_config,
+            simulation_round=simulation_round,
+            skip_signatures=skip_signatures,
+        )
+    
+    def send(
+        self,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._composer.send(send_params)
@@ -1,46 +1,208 @@
 from algopy import *
 from algopy.arc4 import abimethod
 
+# Largest inner transaction group, and so the most payouts settled by one withdraw_batch call.
+MAX_PAYOUTS = 16
+# Most accounts one balances call can take: application args are limited to 2048 bytes in
+# total, which the method selector, the array length and 32 bytes per address fill at 63.
+MAX_BALANCE_QUERIES = 63
+# Bucket boxes hold fixed slots of (address, balance); an all-zero address marks a free slot.
+SLOT_SIZE = 40
+SLOTS_PER_BUCKET = 24
+# 960 bytes, within the 1 KiB read budget of a single box reference.
+BUCKET_SIZE = SLOT_SIZE * SLOTS_PER_BUCKET
+
+
+# A (receiver, amount) payout of withdraw_batch.
+Payout = arc4.Tuple[arc4.Address, arc4.UInt64]
+
 
 class Bank(ARC4Contract):
     total_deposit: UInt64
 
     def __init__(self) -> None:
         """Initializes contract storages on deployment"""
+        # Balances live in DEPOSIT_BUCKETS bucket boxes selected by hashing the address.
+        # Per-account boxes hold balances of accounts whose bucket is full, every balance
+        # when DEPOSIT_BUCKETS is 0, and balances recorded before buckets were introduced,
+        # which move into their bucket on the account's next write or via migrate_deposits.
         self.deposits = BoxMap(Account, UInt64, key_prefix="")
         self.total_deposit = UInt64(0)
 
     @abimethod()
     def deposit(self, memo: String, pay_txn: gtxn.PaymentTransaction) -> UInt64:
         """Accepts a payment into the app escrow and records sender's deposited balance"""
-        assert pay_txn.receiver == Global.current_application_address, "Receiver must be the contract address"
+        assert (
+            pay_txn.receiver == Global.current_application_address
+        ), "Receiver must be the contract address"
         assert pay_txn.amount > 0, "Deposit amount must be greater than zero"
+        assert pay_txn.amount >= TemplateVar[UInt64](
+            "MIN_DEPOSIT"
+        ), "Deposit amount is below the minimum"
 
-        amount, exists = self.deposits.maybe(pay_txn.sender)
-        if exists:
-            self.deposits[pay_txn.sender] = amount + pay_txn.amount
-        else:
-            self.deposits[pay_txn.sender] = pay_txn.amount
+        key, slot, found = self._bucket_slot(pay_txn.sender)
+        balance = (
+            self._recorded_balance(pay_txn.sender, key, slot, found) + pay_txn.amount
+        )
+        self._store_balance(pay_txn.sender, balance, key, slot, found)
 
         self.total_deposit += pay_txn.amount
-        return self.deposits[pay_txn.sender]
+        return balance
 
     @abimethod()
     def withdraw(self, amount: UInt64) -> UInt64:
         """Sends ALGO back to the caller from their recorded balance"""
-        current, exists = self.deposits.maybe(Txn.sender)
-        assert exists, "No deposits found for this account"
+        key, slot, found = self._bucket_slot(Txn.sender)
+        current = self._recorded_balance(Txn.sender, key, slot, found)
+        assert current > 0, "No deposits found for this account"
         assert amount > 0, "Withdrawal amount must be greater than zero"
         assert amount <= current, "Withdrawal amount exceeds balance"
 
         itxn.Payment(receiver=Txn.sender, amount=amount, fee=0).submit()
 
         remaining = current - amount
-        if remaining == UInt64(0):
-            del self.deposits[Txn.sender]
-        else:
-            self.deposits[Txn.sender] = remaining
+        self._store_balance(Txn.sender, remaining, key, slot, found)
+        return remaining
+
+    @abimethod()
+    def withdraw_batch(self, payouts: arc4.DynamicArray[Payout]) -> UInt64:
+        """
+        Pays the caller's recorded balance out to up to MAX_PAYOUTS receivers in one inner
+        transaction group. The inner payments have zero fee, so the call pays
+        1 + len(payouts) minimum fees through fee pooling. Every receiver must be available
+        to the app: with 4 account references per app call, 16 receivers are spread over
+        this call and other app calls in its group through group resource sharing, see
+        _helpers/bank_payouts.py.
+        """
+        key, slot, found = self._bucket_slot(Txn.sender)
+        current = self._recorded_balance(Txn.sender, key, slot, found)
+        assert current > 0, "No deposits found for this account"
+        assert payouts.length > 0, "No payouts given"
+        assert (
+            payouts.length <= MAX_PAYOUTS
+        ), "Too many payouts for one transaction group"
 
+        total = UInt64(0)
+        for index in urange(payouts.length):
+            receiver, amount = payouts[index].native
+            assert amount > 0, "Withdrawal amount must be greater than zero"
+            total += amount.native
+            if index == 0:
+                op.ITxnCreate.begin()
+            else:
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.Payment)
+            op.ITxnCreate.set_receiver(receiver.native)
+            op.ITxnCreate.set_amount(amount.native)
+            op.ITxnCreate.set_fee(0)
+        assert total <= current, "Withdrawal amount exceeds balance"
+        op.ITxnCreate.submit()
+
+        remaining = current - total
+        self._store_balance(Txn.sender, remaining, key, slot, found)
         return remaining
 
+    @abimethod(readonly=True)
+    def balance_of(self, account: Account) -> UInt64:
+        """Returns the account's recorded balance, zero if it has none"""
+        key, slot, found = self._bucket_slot(account)
+        return self._recorded_balance(account, key, slot, found)
+
+    @abimethod(readonly=True)
+    def balances(
+        self, accounts: arc4.DynamicArray[arc4.Address]
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Returns the recorded balances of the accounts, in order, zero for accounts without one"""
+        assert accounts.length <= MAX_BALANCE_QUERIES, "Too many accounts for one call"
+        result = arc4.DynamicArray[arc4.UInt64]()
+        for account in accounts:
+            key, slot, found = self._bucket_slot(account.native)
+            result.append(
+                arc4.UInt64(self._recorded_balance(account.native, key, slot, found))
+            )
+        return result
+
+    @abimethod()
+    def migrate_deposits(self, accounts: arc4.DynamicArray[arc4.Address]) -> UInt64:
+        """
+        Moves the accounts' per-account deposit boxes into their buckets where there is room,
+        releasing the boxes' minimum balance; returns the number of boxes moved
+        """
+        moved = UInt64(0)
+        for account in accounts:
+            balance, exists = self.deposits.maybe(account.native)
+            if exists:
+                key, slot, found = self._bucket_slot(account.native)
+                self._store_balance(account.native, balance, key, slot, found)
+                if account.native not in self.deposits:
+                    moved += 1
+        return moved
+
+    @subroutine
+    def _recorded_balance(
+        self, account: Account, key: Bytes, slot: UInt64, found: bool  # noqa: FBT001
+    ) -> UInt64:
+        """Returns the account's recorded balance given its bucket slot, zero if it has none"""
+        balance, exists = self.deposits.maybe(account)
+        if exists:
+            return balance
+        if found:
+            return op.btoi(op.Box.extract(key, slot + 32, 8))
+        return UInt64(0)
+
+    @subroutine
+    def _store_balance(
+        self,
+        account: Account,
+        balance: UInt64,
+        key: Bytes,
+        slot: UInt64,
+        found: bool,  # noqa: FBT001
+    ) -> None:
+        """
+        Records the account's balance in the bucket slot found by _bucket_slot, falling back
+        to a per-account box when the bucket is full. A zero balance frees the account's slot
+        or box, and the bucket box itself once its last slot is free.
+        """
+        if balance == UInt64(0):
+            if found:
+                op.Box.replace(key, slot, op.bzero(SLOT_SIZE))
+                bucket, _exists = op.Box.get(key)
+                if bucket == op.bzero(BUCKET_SIZE):
+                    _deleted = op.Box.delete(key)
+            if account in self.deposits:
+                del self.deposits[account]
+        elif found or slot < BUCKET_SIZE:
+            _length, bucket_exists = op.Box.length(key)
+            if not bucket_exists:
+                _created = op.Box.create(key, BUCKET_SIZE)
+            op.Box.replace(key, slot, account.bytes + op.itob(balance))
+            if account in self.deposits:
+                del self.deposits[account]
+        else:
+            self.deposits[account] = balance
 
+    @subroutine
+    def _bucket_slot(self, account: Account) -> tuple[Bytes, UInt64, bool]:
+        """
+        Returns the key of the account's bucket, the offset of its slot and True if the
+        account has a slot; otherwise the offset of the first free slot, or BUCKET_SIZE
+        when there is none
+        """
+        buckets = TemplateVar[UInt64]("DEPOSIT_BUCKETS")
+        if buckets == 0:
+            return Bytes(), UInt64(BUCKET_SIZE), False
+        bucket = op.btoi(op.extract(op.sha256(account.bytes), 0, 8)) % buckets
+        key = Bytes(b"k") + op.itob(bucket)
+        _length, bucket_exists = op.Box.length(key)
+        if not bucket_exists:
+            # A new bucket: the account takes the first slot once the box is created.
+            return key, UInt64(0), False
+        free = UInt64(BUCKET_SIZE)
+        for slot in urange(0, BUCKET_SIZE, SLOT_SIZE):
+            owner = op.Box.extract(key, slot, 32)
+            if owner == account.bytes:
+                return key, slot, True
+            if free == BUCKET_SIZE and owner == Global.zero_address.bytes:
+                free = slot
+        return key, free, False
@@ -1,31 +1,89 @@
 import logging
+import os
 
 import algokit_utils
 
+from smart_contracts._helpers.bank_buckets import app_min_balance, bucket_count
+from smart_contracts._helpers.bank_shards import check_shard_count, shard_app_name
+from smart_contracts._helpers.deploy_context import DeployContext
+from smart_contracts._helpers.deployments import (
+    find_current_deployment,
+    record_deployment,
+)
+from smart_contracts._helpers.templates import (
+    built_template,
+    render_program,
+    rendered_app_spec,
+)
+
 logger = logging.getLogger(__name__)
 
+# Template variable values of the deployed app, spliced into the built template.
+template_values: dict[str, int | bytes] = {
+    # A bucket box holds 24 depositors for a 0.3901 ALGO minimum balance, the cost of 21
+    # per-account boxes, so it pays for itself once 22 depositors share it. The bucket
+    # count is sized from BANK_EXPECTED_DEPOSITORS, or set directly with
+    # BANK_DEPOSIT_BUCKETS; the default of 0 keeps one box per depositor. Deploy funds the
+    # minimum balance of every bucket up front so it is never drawn from deposits.
+    "DEPOSIT_BUCKETS": int(
+        os.environ.get(
+            "BANK_DEPOSIT_BUCKETS",
+            bucket_count(int(os.environ.get("BANK_EXPECTED_DEPOSITORS", "0"))),
+        )
+    ),
+    "MIN_DEPOSIT": 0,
+}
 
-def deploy() -> None:
-    from smart_contracts.artifacts.bank.bank_client import BankFactory
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
+def deploy(context: DeployContext) -> None:
+    """Deploys BANK_SHARDS (default 1) Bank apps, see _helpers/bank_shards.py for routing."""
+    algorand = context.algorand
+    deployer_ = context.deployer
+    shards = int(os.environ.get("BANK_SHARDS", "1"))
+    check_shard_count(algorand, shards)
 
-    factory = algorand.client.get_typed_app_factory(
-        BankFactory, default_sender=deployer_.address
+    approval_program = render_program(
+        built_template("bank", "Bank"), "approval", template_values
     )
-
-    app_client, result = factory.deploy(
-        on_update=algokit_utils.OnUpdate.AppendApp,
-        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    # Deploys the bytecode rendered from the build, without compiling on algod.
+    factory = algorand.client.get_app_factory(
+        rendered_app_spec("bank", "Bank", template_values),
+        default_sender=deployer_.address,
     )
 
-    if result.operation_performed in [
-        algokit_utils.OperationPerformed.Create,
-        algokit_utils.OperationPerformed.Replace,
-    ]:
-        logger.info(
-            f"Deployed Bank app {app_client.app_id} to address {app_client.app_address}"
+    for index in range(shards):
+        app_name = shard_app_name(index)
+        app_id = find_current_deployment(
+            algorand, "bank", app_name, deployer_.address, approval_program
         )
+        if app_id is not None:
+            logger.info(f"{app_name} app {app_id} is up to date, skipping deploy")
+            continue
 
+        app_client, result = factory.deploy(
+            on_update=algokit_utils.OnUpdate.AppendApp,
+            on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+            app_name=app_name,
+        )
+        record_deployment(
+            algorand, "bank", app_name, app_client.app_id, approval_program
+        )
 
+        if result.operation_performed in [
+            algokit_utils.OperationPerformed.Create,
+            algokit_utils.OperationPerformed.Replace,
+        ]:
+            algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    amount=algokit_utils.AlgoAmount(
+                        micro_algo=app_min_balance(
+                            int(template_values["DEPOSIT_BUCKETS"])
+                        )
+                    ),
+                    sender=deployer_.address,
+                    receiver=app_client.app_address,
+                )
+            )
+            logger.info(
+                f"Deployed {app_name} app {app_client.app_id} to address {app_client.app_address}"
+            )
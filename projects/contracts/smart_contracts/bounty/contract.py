@@ -1,5 +1,14 @@
 from algopy import *
-from algopy.arc4 import ARC4Contract, abimethod
+from algopy.arc4 import abimethod
+
+
+class BountyStatusChanged(arc4.Struct):
+    """ARC-28 event emitted by every bounty state transition, with the new status."""
+
+    creator: arc4.Address
+    worker: arc4.Address
+    amount: arc4.UInt64
+    status: arc4.UInt64
 
 
 class Bounty(ARC4Contract):
@@ -11,7 +20,11 @@ class Bounty(ARC4Contract):
     # 0=Open, 1=Claimed, 2=Submitted, 3=Approved, 4=Cancelled
 
     def __init__(self) -> None:
-        self.creator = Txn.sender
+        # Deploy-time variants: a zero FIXED_CREATOR makes the app creator the bounty creator.
+        fixed_creator = TemplateVar[Account]("FIXED_CREATOR")
+        self.creator = (
+            Txn.sender if fixed_creator == Global.zero_address else fixed_creator
+        )
         self.worker = Global.zero_address
         self.amount = UInt64(0)
         self.status = UInt64(0)
@@ -25,8 +38,10 @@ class Bounty(ARC4Contract):
         assert payment.sender == self.creator
         assert payment.receiver == Global.current_application_address
         assert payment.amount == amount
+        assert amount >= TemplateVar[UInt64]("MIN_BOUNTY_AMOUNT")
 
         self.amount = amount
+        self._emit_status_changed(amount)
 
     @abimethod()
     def claim(self) -> None:
@@ -35,6 +50,7 @@ class Bounty(ARC4Contract):
 
         self.worker = Txn.sender
         self.status = UInt64(1)
+        self._emit_status_changed(self.amount)
 
     @abimethod()
     def submit_work(self) -> None:
@@ -42,11 +58,23 @@ class Bounty(ARC4Contract):
         assert self.status == UInt64(1)
 
         self.status = UInt64(2)
+        self._emit_status_changed(self.amount)
+
+    @abimethod()
+    def claim_and_submit(self) -> None:
+        # Fast path for a worker who already has the deliverable: claim and submit in one call.
+        assert self.status == UInt64(0)
+        assert Txn.sender != self.creator
+
+        self.worker = Txn.sender
+        self.status = UInt64(2)
+        self._emit_status_changed(self.amount)
 
     @abimethod()
     def approve(self) -> None:
         assert Txn.sender == self.creator
         assert self.status == UInt64(2)
+        paid = self.amount
 
         itxn.Payment(
             receiver=self.worker,
@@ -55,11 +83,13 @@ class Bounty(ARC4Contract):
 
         self.amount = UInt64(0)
         self.status = UInt64(3)
+        self._emit_status_changed(paid)
 
     @abimethod()
     def cancel(self) -> None:
         assert Txn.sender == self.creator
         assert self.status == UInt64(0)
+        refunded = self.amount
 
         itxn.Payment(
             receiver=self.creator,
@@ -68,7 +98,76 @@ class Bounty(ARC4Contract):
 
         self.amount = UInt64(0)
         self.status = UInt64(4)
+        self._emit_status_changed(refunded)
+
+    @abimethod()
+    def reopen(self, payment: gtxn.PaymentTransaction, amount: UInt64) -> None:
+        # Starts a new bounty in a finished app, saving an app creation and funding round.
+        assert Txn.sender == self.creator
+        assert self.status == UInt64(3) or self.status == UInt64(4)
+
+        assert payment.sender == self.creator
+        assert payment.receiver == Global.current_application_address
+        assert payment.amount == amount
+        assert amount >= TemplateVar[UInt64]("MIN_BOUNTY_AMOUNT")
+
+        self.worker = Global.zero_address
+        self.amount = amount
+        self.status = UInt64(0)
+        self._emit_status_changed(amount)
+
+    @abimethod(allow_actions=["DeleteApplication"])
+    def delete(self) -> None:
+        # Removes a finished bounty from its creator's account; the app account's remaining
+        # balance goes back to the app creator, who funded its minimum balance.
+        assert Txn.sender == self.creator or Txn.sender == Global.creator_address
+        assert self.status == UInt64(3) or self.status == UInt64(4)
+
+        itxn.Payment(
+            receiver=Global.creator_address,
+            close_remainder_to=Global.creator_address,
+            fee=0,
+        ).submit()
+
+    @abimethod(allow_actions=["DeleteApplication"])
+    def approve_and_close(self) -> None:
+        # approve followed by delete in one call; the call pays the fees of both inner payments.
+        assert Txn.sender == self.creator
+        assert self.status == UInt64(2)
+        paid = self.amount
+
+        itxn.Payment(
+            receiver=self.worker,
+            amount=paid,
+            fee=0,
+        ).submit()
+        itxn.Payment(
+            receiver=Global.creator_address,
+            close_remainder_to=Global.creator_address,
+            fee=0,
+        ).submit()
+
+        self.amount = UInt64(0)
+        self.status = UInt64(3)
+        self._emit_status_changed(paid)
 
     @abimethod(readonly=True)
-    def get_bounty_info(self) -> tuple[Account, Account, UInt64, UInt64]:
-        return self.creator, self.worker, self.amount, self.status
+    def get_bounty_info(self) -> tuple[arc4.Address, arc4.Address, UInt64, UInt64]:
+        return (
+            arc4.Address(self.creator),
+            arc4.Address(self.worker),
+            self.amount,
+            self.status,
+        )
+
+    @subroutine
+    def _emit_status_changed(self, amount: UInt64) -> None:
+        """Emits the new status; amount is the escrowed amount, or the amount paid out."""
+        arc4.emit(
+            BountyStatusChanged(
+                creator=arc4.Address(self.creator),
+                worker=arc4.Address(self.worker),
+                amount=arc4.UInt64(amount),
+                status=arc4.UInt64(self.status),
+            )
+        )
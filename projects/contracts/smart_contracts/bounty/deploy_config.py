@@ -2,23 +2,52 @@ import logging
 
 import algokit_utils
 
+from smart_contracts._helpers.deploy_context import DeployContext
+from smart_contracts._helpers.deployments import (
+    find_current_deployment,
+    record_deployment,
+)
+from smart_contracts._helpers.templates import (
+    built_template,
+    render_program,
+    rendered_app_spec,
+)
+
 logger = logging.getLogger(__name__)
 
+# Template variable values of the app deployed here; other variants are rendered from
+# the same build, see create_new_bounty_app.py.
+template_values: dict[str, int | bytes] = {
+    "FIXED_CREATOR": bytes(32),
+    "MIN_BOUNTY_AMOUNT": 0,
+}
 
-def deploy() -> None:
-    from smart_contracts.artifacts.bounty.bounty_client import BountyFactory
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
+def deploy(context: DeployContext) -> None:
+    algorand = context.algorand
+    deployer_ = context.deployer
 
-    factory = algorand.client.get_typed_app_factory(
-        BountyFactory, default_sender=deployer_.address
+    approval_program = render_program(
+        built_template("bounty", "Bounty"), "approval", template_values
+    )
+    app_id = find_current_deployment(
+        algorand, "bounty", "Bounty", deployer_.address, approval_program
+    )
+    if app_id is not None:
+        logger.info(f"Bounty app {app_id} is up to date, skipping deploy")
+        return
+
+    # Deploys the variant's bytecode rendered from the build, without compiling on algod.
+    factory = algorand.client.get_app_factory(
+        rendered_app_spec("bounty", "Bounty", template_values),
+        default_sender=deployer_.address,
     )
 
     app_client, result = factory.deploy(
         on_update=algokit_utils.OnUpdate.AppendApp,
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
     )
+    record_deployment(algorand, "bounty", "Bounty", app_client.app_id, approval_program)
 
     if result.operation_performed in [
         algokit_utils.OperationPerformed.Create,
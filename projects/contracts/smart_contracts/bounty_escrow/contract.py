@@ -0,0 +1,28 @@
+from algopy import *
+
+# Highest fee the escrow pays, so that no one can drain it through the fee of a refund.
+MAX_FEE = 10_000
+
+
+@logicsig(name="BountyEscrow")
+def bounty_escrow() -> bool:
+    """
+    Stateless bounty escrow: a contract account that closes its balance out to WORKER in a
+    group whose first transaction is sent by CREATOR, which is how the creator co-signs the
+    payout, or back to CREATOR from round REFUND_ROUND on.
+    """
+    creator = TemplateVar[Account]("CREATOR")
+    worker = TemplateVar[Account]("WORKER")
+
+    assert Txn.type_enum == TransactionType.Payment
+    assert Txn.rekey_to == Global.zero_address
+    assert Txn.fee <= MAX_FEE
+
+    if Txn.close_remainder_to == worker:
+        assert Txn.receiver == worker
+        assert Global.group_size == 2 and Txn.group_index == 1
+        return gtxn.Transaction(0).sender == creator
+
+    assert Txn.close_remainder_to == creator
+    assert Txn.receiver == creator
+    return Txn.first_valid >= TemplateVar[UInt64]("REFUND_ROUND")
@@ -0,0 +1,3 @@
+from smart_contracts.bounty_registry.contract import BountyRecord, BountyRegistry
+
+__all__ = ["BountyRecord", "BountyRegistry"]
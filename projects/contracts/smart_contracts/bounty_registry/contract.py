@@ -0,0 +1,116 @@
+from algopy import *
+from algopy.arc4 import abimethod
+
+# Bounty status codes, as in the single-bounty Bounty contract.
+OPEN = 0
+CLAIMED = 1
+SUBMITTED = 2
+APPROVED = 3
+CANCELLED = 4
+
+
+class BountyRecord(arc4.Struct):
+    creator: arc4.Address
+    worker: arc4.Address
+    amount: arc4.UInt64
+    status: arc4.UInt64
+
+
+class BountyRegistry(ARC4Contract):
+    """
+    Keeps every bounty in one app, in a box per bounty id. Creators pick the ids, so
+    concurrent creates never contend for a shared counter; a bounty's box is deleted
+    and its minimum balance refunded to the creator once the bounty is paid out or
+    cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.bounties = BoxMap(UInt64, BountyRecord, key_prefix="b")
+
+    @abimethod()
+    def create_bounty(
+        self, payment: gtxn.PaymentTransaction, bounty_id: UInt64, amount: UInt64
+    ) -> None:
+        """
+        Escrows a new bounty under bounty_id, which must not be in use; creators should
+        pick it at random. The payment covers the bounty amount plus the minimum balance
+        of the bounty's box.
+        """
+        assert amount > 0, "Bounty amount must be greater than zero"
+        assert bounty_id not in self.bounties, "Bounty id is already in use"
+        assert payment.sender == Txn.sender, "Payment must come from the creator"
+        assert (
+            payment.receiver == Global.current_application_address
+        ), "Receiver must be the registry"
+
+        min_balance_before = Global.current_application_address.min_balance
+        self.bounties[bounty_id] = BountyRecord(
+            creator=arc4.Address(Txn.sender),
+            worker=arc4.Address(Global.zero_address),
+            amount=arc4.UInt64(amount),
+            status=arc4.UInt64(OPEN),
+        )
+        box_cost = Global.current_application_address.min_balance - min_balance_before
+        assert (
+            payment.amount == amount + box_cost
+        ), "Payment must be the amount plus the box cost"
+
+    @abimethod()
+    def claim(self, bounty_id: UInt64) -> None:
+        bounty = self.bounties[bounty_id].copy()
+        assert bounty.status == OPEN
+        assert Txn.sender != bounty.creator.native
+
+        bounty.worker = arc4.Address(Txn.sender)
+        bounty.status = arc4.UInt64(CLAIMED)
+        self.bounties[bounty_id] = bounty.copy()
+
+    @abimethod()
+    def submit_work(self, bounty_id: UInt64) -> None:
+        bounty = self.bounties[bounty_id].copy()
+        assert Txn.sender == bounty.worker.native
+        assert bounty.status == CLAIMED
+
+        bounty.status = arc4.UInt64(SUBMITTED)
+        self.bounties[bounty_id] = bounty.copy()
+
+    @abimethod()
+    def approve(self, bounty_id: UInt64) -> None:
+        """Pays the worker and closes the bounty; the caller covers both inner fees"""
+        bounty = self.bounties[bounty_id].copy()
+        assert Txn.sender == bounty.creator.native
+        assert bounty.status == SUBMITTED
+
+        itxn.Payment(
+            receiver=bounty.worker.native, amount=bounty.amount.native, fee=0
+        ).submit()
+        self._close(bounty_id, bounty.creator.native, UInt64(0))
+
+    @abimethod()
+    def cancel(self, bounty_id: UInt64) -> None:
+        """Refunds an unclaimed bounty to its creator and closes it"""
+        bounty = self.bounties[bounty_id].copy()
+        assert Txn.sender == bounty.creator.native
+        assert bounty.status == OPEN
+
+        self._close(bounty_id, bounty.creator.native, bounty.amount.native)
+
+    @abimethod(readonly=True)
+    def get_bounty_info(
+        self, bounty_id: UInt64
+    ) -> tuple[arc4.Address, arc4.Address, UInt64, UInt64]:
+        bounty = self.bounties[bounty_id].copy()
+        return (
+            bounty.creator,
+            bounty.worker,
+            bounty.amount.native,
+            bounty.status.native,
+        )
+
+    @subroutine
+    def _close(self, bounty_id: UInt64, creator: Account, refund: UInt64) -> None:
+        """Deletes the bounty's box and pays refund plus the box's minimum balance to creator"""
+        min_balance_before = Global.current_application_address.min_balance
+        del self.bounties[bounty_id]
+        box_cost = min_balance_before - Global.current_application_address.min_balance
+        itxn.Payment(receiver=creator, amount=refund + box_cost, fee=0).submit()
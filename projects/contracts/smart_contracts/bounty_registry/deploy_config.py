@@ -0,0 +1,53 @@
+import logging
+
+import algokit_utils
+
+from smart_contracts._helpers.deploy_context import DeployContext
+from smart_contracts._helpers.deployments import (
+    find_current_deployment,
+    record_deployment,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def deploy(context: DeployContext) -> None:
+    from smart_contracts.artifacts.bounty_registry.bounty_registry_client import (
+        BountyRegistryFactory,
+    )
+
+    algorand = context.algorand
+    deployer_ = context.deployer
+
+    app_id = find_current_deployment(
+        algorand, "bounty_registry", "BountyRegistry", deployer_.address
+    )
+    if app_id is not None:
+        logger.info(f"BountyRegistry app {app_id} is up to date, skipping deploy")
+        return
+
+    factory = algorand.client.get_typed_app_factory(
+        BountyRegistryFactory, default_sender=deployer_.address
+    )
+
+    app_client, result = factory.deploy(
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+    record_deployment(algorand, "bounty_registry", "BountyRegistry", app_client.app_id)
+
+    if result.operation_performed in [
+        algokit_utils.OperationPerformed.Create,
+        algokit_utils.OperationPerformed.Replace,
+    ]:
+        # The registry's own minimum balance; each bounty pays for its box on creation.
+        algorand.send.payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(micro_algo=100_000),
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+        logger.info(
+            f"Deployed BountyRegistry app {app_client.app_id} to address {app_client.app_address}"
+        )
@@ -0,0 +1,3 @@
+from smart_contracts.competitive_bounty.contract import CompetitiveBounty
+
+__all__ = ["CompetitiveBounty"]
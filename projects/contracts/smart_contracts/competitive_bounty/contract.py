@@ -0,0 +1,136 @@
+from algopy import *
+from algopy.arc4 import abimethod
+
+from smart_contracts.bounty.contract import BountyStatusChanged
+
+# Bounty status codes; competitive bounties are never Claimed or Submitted.
+OPEN = 0
+APPROVED = 3
+CANCELLED = 4
+# A submission is a digest of the deliverable, such as its SHA-256.
+SUBMISSION_SIZE = 32
+
+
+class CompetitiveBounty(ARC4Contract):
+    """
+    Bounty open to many workers at once: each records a submission in a box of their own
+    without claiming, and the creator approves one submission to pay its worker.
+    """
+
+    creator: Account
+    winner: Account
+    amount: UInt64
+    status: UInt64
+    submission_count: UInt64
+
+    def __init__(self) -> None:
+        self.submissions = BoxMap(Account, Bytes, key_prefix="s")
+        self.creator = Txn.sender
+        self.winner = Global.zero_address
+        self.amount = UInt64(0)
+        self.status = UInt64(OPEN)
+        self.submission_count = UInt64(0)
+
+    @abimethod()
+    def create_bounty(self, payment: gtxn.PaymentTransaction, amount: UInt64) -> None:
+        assert Txn.sender == self.creator
+        assert self.amount == 0
+        assert self.status == OPEN
+
+        assert amount > 0, "Bounty amount must be greater than zero"
+        assert payment.sender == self.creator
+        assert payment.receiver == Global.current_application_address
+        assert payment.amount == amount
+
+        self.amount = amount
+        self._emit_status_changed(Global.zero_address, amount)
+
+    @abimethod()
+    def submit(self, box_payment: gtxn.PaymentTransaction, submission: Bytes) -> None:
+        """
+        Records the caller's submission, replacing any earlier one. box_payment covers the
+        minimum balance of a new submission box, and is zero when replacing a submission.
+        """
+        assert self.status == OPEN
+        assert self.amount > 0, "Bounty is not funded"
+        assert Txn.sender != self.creator
+        assert (
+            submission.length == SUBMISSION_SIZE
+        ), "Submission must be a 32 byte digest"
+
+        if Txn.sender not in self.submissions:
+            self.submission_count += 1
+        min_balance_before = Global.current_application_address.min_balance
+        self.submissions[Txn.sender] = submission
+        box_cost = Global.current_application_address.min_balance - min_balance_before
+
+        assert box_payment.sender == Txn.sender, "Payment must come from the worker"
+        assert (
+            box_payment.receiver == Global.current_application_address
+        ), "Receiver must be the app"
+        assert box_payment.amount == box_cost, "Payment must be the box cost"
+
+    @abimethod()
+    def approve_submission(self, worker: Account) -> None:
+        assert Txn.sender == self.creator
+        assert self.status == OPEN
+        assert worker in self.submissions, "Worker has no submission"
+
+        paid = self.amount
+        itxn.Payment(receiver=worker, amount=paid, fee=0).submit()
+
+        self.winner = worker
+        self.amount = UInt64(0)
+        self.status = UInt64(APPROVED)
+        self._emit_status_changed(worker, paid)
+
+    @abimethod()
+    def cancel(self) -> None:
+        assert Txn.sender == self.creator
+        assert self.status == OPEN
+
+        refunded = self.amount
+        itxn.Payment(receiver=self.creator, amount=refunded, fee=0).submit()
+
+        self.amount = UInt64(0)
+        self.status = UInt64(CANCELLED)
+        self._emit_status_changed(Global.zero_address, refunded)
+
+    @abimethod()
+    def reclaim_submission(self) -> None:
+        """Deletes the caller's submission box once the bounty is settled and refunds its cost"""
+        assert self.status == APPROVED or self.status == CANCELLED
+        assert Txn.sender in self.submissions, "No submission to reclaim"
+
+        min_balance_before = Global.current_application_address.min_balance
+        del self.submissions[Txn.sender]
+        refund = min_balance_before - Global.current_application_address.min_balance
+
+        itxn.Payment(receiver=Txn.sender, amount=refund, fee=0).submit()
+
+    @abimethod(readonly=True)
+    def get_submission(self, worker: Account) -> Bytes:
+        return self.submissions.get(worker, default=Bytes())
+
+    @abimethod(readonly=True)
+    def get_bounty_info(
+        self,
+    ) -> tuple[arc4.Address, arc4.Address, UInt64, UInt64, UInt64]:
+        return (
+            arc4.Address(self.creator),
+            arc4.Address(self.winner),
+            self.amount,
+            self.status,
+            self.submission_count,
+        )
+
+    @subroutine
+    def _emit_status_changed(self, worker: Account, amount: UInt64) -> None:
+        arc4.emit(
+            BountyStatusChanged(
+                creator=arc4.Address(self.creator),
+                worker=arc4.Address(worker),
+                amount=arc4.UInt64(amount),
+                status=arc4.UInt64(self.status),
+            )
+        )
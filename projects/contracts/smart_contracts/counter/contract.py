@@ -3,17 +3,31 @@ from algopy.arc4 import abimethod
 
 
 class Counter(ARC4Contract):
+    """
+    Throughput probe: a contract with no business logic, used to baseline node and harness
+    throughput. Each sender increments a counter in its own box, so concurrent senders never
+    write the same box, and the global count totals all increments.
+    """
 
     count: UInt64
 
     def __init__(self) -> None:
         self.count = UInt64(0)
-
-    # @abimethod(create = "require")
-    # def create(self) -> None:
-    #     self.count = UInt64(0)
+        self.counters = BoxMap(Account, UInt64, key_prefix="c")
 
     @abimethod()
     def incr_counter(self) -> UInt64:
         self.count += UInt64(1)
         return self.count
+
+    @abimethod()
+    def incr_by(self, n: UInt64) -> UInt64:
+        """Adds n to the sender's counter and to the global count, returns the sender's counter"""
+        counter = self.counters.get(Txn.sender, default=UInt64(0)) + n
+        self.counters[Txn.sender] = counter
+        self.count += n
+        return counter
+
+    @abimethod(readonly=True)
+    def get_counter(self, account: Account) -> UInt64:
+        return self.counters.get(account, default=UInt64(0))
@@ -2,17 +2,28 @@ import logging
 
 import algokit_utils
 
+from smart_contracts._helpers.deploy_context import DeployContext
+from smart_contracts._helpers.deployments import (
+    find_current_deployment,
+    record_deployment,
+)
+
 logger = logging.getLogger(__name__)
 
 
 # define deployment behaviour based on supplied app spec
-def deploy() -> None:
+def deploy(context: DeployContext) -> None:
     from smart_contracts.artifacts.counter.counter_client import (
         CounterFactory,
     )
 
-    algorand = algokit_utils.AlgorandClient.from_environment()
-    deployer_ = algorand.account.from_environment("DEPLOYER")
+    algorand = context.algorand
+    deployer_ = context.deployer
+
+    app_id = find_current_deployment(algorand, "counter", "Counter", deployer_.address)
+    if app_id is not None:
+        logger.info(f"Counter app {app_id} is up to date, skipping deploy")
+        return
 
     factory = algorand.client.get_typed_app_factory(
         CounterFactory, default_sender=deployer_.address
@@ -22,6 +33,7 @@ def deploy() -> None:
         on_update=algokit_utils.OnUpdate.AppendApp,
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
     )
+    record_deployment(algorand, "counter", "Counter", app_client.app_id)
 
     if result.operation_performed in [
         algokit_utils.OperationPerformed.Create,
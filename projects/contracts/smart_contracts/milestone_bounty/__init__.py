@@ -0,0 +1,3 @@
+from smart_contracts.milestone_bounty.contract import MilestoneBounty
+
+__all__ = ["MilestoneBounty"]
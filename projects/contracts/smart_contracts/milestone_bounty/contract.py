@@ -0,0 +1,146 @@
+from algopy import *
+from algopy.arc4 import abimethod
+
+from smart_contracts.bounty.contract import BountyStatusChanged
+
+# Bounty status codes; milestone bounties are approved milestone by milestone, without Submitted.
+OPEN = 0
+CLAIMED = 1
+APPROVED = 3
+CANCELLED = 4
+# paid_milestones keeps one bit per milestone.
+MAX_MILESTONES = 16
+
+
+class MilestoneBounty(ARC4Contract):
+    """
+    Bounty paid out in milestones from one escrow: create_bounty escrows the total of up to 16
+    milestone amounts, kept in a box, and each approve_milestone pays one of them to the worker.
+    """
+
+    creator: Account
+    worker: Account
+    amount: UInt64
+    status: UInt64
+    paid_milestones: UInt64
+
+    def __init__(self) -> None:
+        self.milestones = Box(arc4.DynamicArray[arc4.UInt64], key="m")
+        self.creator = Txn.sender
+        self.worker = Global.zero_address
+        self.amount = UInt64(0)
+        self.status = UInt64(OPEN)
+        self.paid_milestones = UInt64(0)
+
+    @abimethod()
+    def create_bounty(
+        self,
+        payment: gtxn.PaymentTransaction,
+        milestones: arc4.DynamicArray[arc4.UInt64],
+    ) -> None:
+        """
+        Escrows the milestones' total; the payment covers it plus the minimum balance of the
+        milestones box.
+        """
+        assert Txn.sender == self.creator
+        assert self.amount == 0
+        assert self.status == OPEN
+        assert (
+            milestones.length > 0 and milestones.length <= MAX_MILESTONES
+        ), "Expected 1 to 16 milestones"
+
+        total = UInt64(0)
+        for milestone in milestones:
+            assert milestone.native > 0, "Milestone amounts must be greater than zero"
+            total += milestone.native
+
+        min_balance_before = Global.current_application_address.min_balance
+        self.milestones.value = milestones.copy()
+        box_cost = Global.current_application_address.min_balance - min_balance_before
+
+        assert payment.sender == self.creator
+        assert payment.receiver == Global.current_application_address
+        assert (
+            payment.amount == total + box_cost
+        ), "Payment must be the milestone total plus the box cost"
+
+        self.amount = total
+        self._emit_status_changed(total)
+
+    @abimethod()
+    def claim(self) -> None:
+        assert self.status == OPEN
+        assert Txn.sender != self.creator
+
+        self.worker = Txn.sender
+        self.status = UInt64(CLAIMED)
+        self._emit_status_changed(self.amount)
+
+    @abimethod()
+    def approve_milestone(self, index: UInt64) -> None:
+        """Pays milestone `index` to the worker. Paying the last one also returns the box cost."""
+        assert Txn.sender == self.creator
+        assert self.status == CLAIMED
+        assert index < self.milestones.value.length, "No such milestone"
+        milestone_bit = UInt64(1) << index
+        assert self.paid_milestones & milestone_bit == 0, "Milestone already paid"
+        paid = self.milestones.value[index].native
+
+        itxn.Payment(receiver=self.worker, amount=paid, fee=0).submit()
+
+        self.paid_milestones |= milestone_bit
+        self.amount -= paid
+        if self.amount == 0:
+            self.status = UInt64(APPROVED)
+            self._release_milestones()
+        self._emit_status_changed(paid)
+
+    @abimethod()
+    def cancel(self) -> None:
+        assert Txn.sender == self.creator
+        assert self.status == OPEN
+        refunded = self.amount
+
+        itxn.Payment(receiver=self.creator, amount=refunded, fee=0).submit()
+
+        self.amount = UInt64(0)
+        self.status = UInt64(CANCELLED)
+        self._release_milestones()
+        self._emit_status_changed(refunded)
+
+    @abimethod(readonly=True)
+    def get_milestones(self) -> arc4.DynamicArray[arc4.UInt64]:
+        return self.milestones.get(default=arc4.DynamicArray[arc4.UInt64]())
+
+    @abimethod(readonly=True)
+    def get_bounty_info(
+        self,
+    ) -> tuple[arc4.Address, arc4.Address, UInt64, UInt64, UInt64]:
+        return (
+            arc4.Address(self.creator),
+            arc4.Address(self.worker),
+            self.amount,
+            self.status,
+            self.paid_milestones,
+        )
+
+    @subroutine
+    def _release_milestones(self) -> None:
+        """Deletes the milestones box of a finished bounty and returns its cost to the creator."""
+        min_balance_before = Global.current_application_address.min_balance
+        del self.milestones.value
+        refund = min_balance_before - Global.current_application_address.min_balance
+
+        itxn.Payment(receiver=self.creator, amount=refund, fee=0).submit()
+
+    @subroutine
+    def _emit_status_changed(self, amount: UInt64) -> None:
+        """Emits the new status; amount is the escrowed amount, or the amount paid out."""
+        arc4.emit(
+            BountyStatusChanged(
+                creator=arc4.Address(self.creator),
+                worker=arc4.Address(self.worker),
+                amount=arc4.UInt64(amount),
+                status=arc4.UInt64(self.status),
+            )
+        )
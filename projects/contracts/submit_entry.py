@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Submit work to a CompetitiveBounty app, identified by the SHA-256 digest of a deliverable file."""
+
+import hashlib
+import os
+import sys
+
+from algosdk import account, encoding, transaction
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+from algosdk.mnemonic import to_private_key
+from algosdk.v2client import algod
+from dotenv import load_dotenv
+
+# ==============================
+# CONFIG
+# ==============================
+
+# Minimum balance of a submission box: 2500 + 400 * (key "s" + 32 byte address + 32 byte digest)
+BOX_COST = 2_500 + 400 * (1 + 32 + 32)
+
+APP_SPEC_PATH = (
+    "smart_contracts/artifacts/competitive_bounty/CompetitiveBounty.arc56.json"
+)
+
+if len(sys.argv) != 3:
+    raise ValueError("Usage: python submit_entry.py <app id> <deliverable file>")
+
+APP_ID = int(sys.argv[1])
+DELIVERABLE_PATH = sys.argv[2]
+
+
+# ==============================
+# LOAD ENV
+# ==============================
+
+load_dotenv()
+
+WORKER_MNEMONIC = os.getenv("WORKER_MNEMONIC")
+if not WORKER_MNEMONIC:
+    raise ValueError("Set WORKER_MNEMONIC in your .env file.")
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
+
+
+# ==============================
+# CLIENT SETUP
+# ==============================
+
+client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_SERVER)
+print("Connected to:", ALGOD_SERVER)
+
+worker_private_key = to_private_key(WORKER_MNEMONIC)
+worker_address = account.address_from_private_key(worker_private_key)
+print("Worker:", worker_address)
+
+signer = AccountTransactionSigner(worker_private_key)
+
+
+# ==============================
+# SUBMIT
+# ==============================
+
+with open(DELIVERABLE_PATH, "rb") as deliverable_file:
+    submission = hashlib.sha256(deliverable_file.read()).digest()
+print("Submission digest:", submission.hex())
+
+with open(APP_SPEC_PATH, encoding="utf-8") as spec_file:
+    contract = Contract.from_json(spec_file.read())
+
+box_key = b"s" + encoding.decode_address(worker_address)
+try:
+    client.application_box_by_name(APP_ID, box_key)
+    box_payment = 0  # Replacing an earlier submission reuses its box.
+except AlgodHTTPError:
+    box_payment = BOX_COST
+
+sp = client.suggested_params()
+payment_txn = transaction.PaymentTxn(
+    sender=worker_address,
+    sp=sp,
+    receiver=get_application_address(APP_ID),
+    amt=box_payment,
+)
+
+atc = AtomicTransactionComposer()
+atc.add_method_call(
+    app_id=APP_ID,
+    method=contract.get_method_by_name("submit"),
+    sender=worker_address,
+    sp=sp,
+    signer=signer,
+    method_args=[TransactionWithSigner(payment_txn, signer), submission],
+    boxes=[(APP_ID, box_key)],
+)
+
+result = atc.execute(client, 4)
+print("Submission recorded. Transaction IDs:", result.tx_ids)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Delete the creator's finished bounty apps, reclaiming their minimum balance."""
+
+import os
+
+from algosdk import account, transaction
+from algosdk.abi import Contract
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+)
+from algosdk.mnemonic import to_private_key
+from algosdk.v2client import algod
+from dotenv import load_dotenv
+
+from smart_contracts._helpers.bounty_apps import deletable_bounty_apps
+
+# ==============================
+# CONFIG
+# ==============================
+
+DELETES_PER_GROUP = 16  # atomic group size limit
+
+APP_SPEC_PATH = "smart_contracts/artifacts/bounty/Bounty.arc56.json"
+
+
+# ==============================
+# LOAD ENV
+# ==============================
+
+load_dotenv()
+
+CREATOR_MNEMONIC = os.getenv("CREATOR_MNEMONIC")
+if not CREATOR_MNEMONIC:
+    raise ValueError("Set CREATOR_MNEMONIC in your .env file.")
+
+ALGOD_SERVER = os.getenv("ALGOD_SERVER", "https://testnet-api.algonode.cloud")
+ALGOD_TOKEN = os.getenv("ALGOD_TOKEN", "")
+
+
+# ==============================
+# CLIENT SETUP
+# ==============================
+
+client = algod.AlgodClient(ALGOD_TOKEN, ALGOD_SERVER)
+print("Connected to:", ALGOD_SERVER)
+
+creator_private_key = to_private_key(CREATOR_MNEMONIC)
+creator_address = account.address_from_private_key(creator_private_key)
+print("Creator:", creator_address)
+
+signer = AccountTransactionSigner(creator_private_key)
+
+
+# ==============================
+# SWEEP
+# ==============================
+
+with open(APP_SPEC_PATH, encoding="utf-8") as spec_file:
+    method = Contract.from_json(spec_file.read()).get_method_by_name("delete")
+
+app_ids = deletable_bounty_apps(client, creator_address, method.get_selector())
+print(f"{len(app_ids)} finished bounty apps to delete")
+
+for start in range(0, len(app_ids), DELETES_PER_GROUP):
+    group_app_ids = app_ids[start : start + DELETES_PER_GROUP]
+    sp = client.suggested_params()
+    # Each call also pays for the inner payment closing the app account.
+    sp.flat_fee = True
+    sp.fee = 2 * sp.min_fee
+
+    atc = AtomicTransactionComposer()
+    for app_id in group_app_ids:
+        atc.add_method_call(
+            app_id=app_id,
+            method=method,
+            sender=creator_address,
+            sp=sp,
+            signer=signer,
+            on_complete=transaction.OnComplete.DeleteApplicationOC,
+        )
+    result = atc.execute(client, 4)
+    print(f"Deleted apps {group_app_ids} in round {result.confirmed_round}")
+
+print("Done.")
@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from types import SimpleNamespace
+
+import pytest
+from algosdk import abi, account
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.transaction import ApplicationCallTxn, SuggestedParams
+
+from smart_contracts._helpers.bank_balances import (
+    CALLS_PER_GROUP,
+    MAX_BALANCE_QUERIES,
+    fetch_balances,
+)
+
+accounts = [account.generate_account()[1] for _ in range(130)]
+
+
+def test_fetch_balances_pages_full_calls_over_simulate_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    requests: list[list[list[str]]] = []
+    address_array = abi.ABIType.from_string("address[]")
+
+    def simulate(
+        atc: AtomicTransactionComposer, *args: object, **kwargs: object
+    ) -> SimpleNamespace:
+        calls: list[list[str]] = []
+        for txn_with_signer in atc.txn_list:
+            txn = txn_with_signer.txn
+            assert isinstance(txn, ApplicationCallTxn)
+            decoded: Sequence[str] = address_array.decode(txn.app_args[1])
+            calls.append(list(decoded))
+        requests.append(calls)
+        amounts = [accounts.index(address) for address in calls[0]]
+        return SimpleNamespace(
+            failure_message=None,
+            abi_results=[SimpleNamespace(return_value=amounts)],
+        )
+
+    monkeypatch.setattr(AtomicTransactionComposer, "simulate", simulate)
+    algod = SimpleNamespace(
+        suggested_params=lambda: SuggestedParams(
+            fee=1000, first=1, last=11, gh="AAAA", gen="testnet", flat_fee=True
+        )
+    )
+
+    balances = fetch_balances(algod, 1001, accounts[0], accounts)
+
+    assert [len(calls[0]) for calls in requests] == [
+        MAX_BALANCE_QUERIES,
+        MAX_BALANCE_QUERIES,
+        130 - 2 * MAX_BALANCE_QUERIES,
+    ]
+    for calls in requests:
+        assert len(calls) == CALLS_PER_GROUP
+        assert all(not call for call in calls[1:])
+    assert balances == {address: index for index, address in enumerate(accounts)}
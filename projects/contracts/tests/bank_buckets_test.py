@@ -0,0 +1,28 @@
+import hashlib
+
+from smart_contracts._helpers.bank_buckets import (
+    BUCKET_SIZE,
+    bucket_key,
+    decode_bucket,
+    is_bucket_key,
+)
+
+
+def test_bucket_key_hashes_public_key_into_range() -> None:
+    public_key = bytes(range(32))
+    expected = int.from_bytes(hashlib.sha256(public_key).digest()[:8], "big") % 64
+
+    key = bucket_key(public_key, 64)
+
+    assert key == b"k" + expected.to_bytes(8, "big")
+    assert is_bucket_key(key)
+    assert not is_bucket_key(public_key)
+
+
+def test_decode_bucket_skips_free_slots() -> None:
+    first, second = b"\x01" * 32, b"\x02" * 32
+    value = bytearray(BUCKET_SIZE)
+    value[0:40] = first + (5).to_bytes(8, "big")
+    value[80:120] = second + (7).to_bytes(8, "big")
+
+    assert decode_bucket(bytes(value)) == {first: 5, second: 7}
@@ -0,0 +1,29 @@
+import pytest
+
+from smart_contracts._helpers.bank_payouts import (
+    MAX_PAYOUTS,
+    receiver_references,
+    send_payouts,
+)
+
+
+def test_receiver_references_spread_a_full_batch_over_four_calls() -> None:
+    payouts = [(f"receiver-{index}", 10) for index in range(MAX_PAYOUTS)]
+
+    references = receiver_references(payouts)
+
+    assert [len(accounts) for accounts in references] == [4, 4, 4, 4]
+    assert [receiver for accounts in references for receiver in accounts] == [
+        receiver for receiver, _amount in payouts
+    ]
+
+
+def test_receiver_references_reference_each_receiver_once() -> None:
+    assert receiver_references([("a", 1), ("b", 2), ("a", 3)]) == [["a", "b"]]
+
+
+def test_send_payouts_rejects_more_than_max_payouts() -> None:
+    payouts = [(f"receiver-{index}", 1) for index in range(MAX_PAYOUTS + 1)]
+
+    with pytest.raises(Exception, match="between 1 and 16 payouts"):
+        send_payouts(None, payouts)  # type: ignore[arg-type]
@@ -0,0 +1,86 @@
+import hashlib
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from smart_contracts._helpers import deployments
+from smart_contracts._helpers.bank_shards import (
+    ShardRouter,
+    check_shard_count,
+    shard_app_name,
+    shard_index,
+)
+
+public_keys = [hashlib.sha256(str(number).encode()).digest() for number in range(1000)]
+
+
+def test_adding_a_shard_only_moves_depositors_to_the_new_shard() -> None:
+    before = [shard_index(public_key, 4) for public_key in public_keys]
+    after = [shard_index(public_key, 5) for public_key in public_keys]
+
+    assert set(before) == {0, 1, 2, 3}
+    moved = [new for old, new in zip(before, after, strict=True) if old != new]
+    assert set(moved) == {4}
+    assert len(moved) < len(public_keys) / 3
+
+
+def fake_algorand(total_deposits: dict[int, int]) -> SimpleNamespace:
+    apps = {
+        app_id: SimpleNamespace(
+            approval_program=b"program",
+            global_state={"total_deposit": SimpleNamespace(value=total_deposit)},
+        )
+        for app_id, total_deposit in total_deposits.items()
+    }
+    return SimpleNamespace(
+        client=SimpleNamespace(
+            network=lambda: SimpleNamespace(genesis_hash="testnet-genesis")
+        ),
+        app=SimpleNamespace(get_by_id=apps.__getitem__),
+    )
+
+
+def record_shards(algorand: SimpleNamespace, app_ids: list[int]) -> None:
+    for index, app_id in enumerate(app_ids):
+        deployments.record_deployment(
+            algorand, "bank", shard_app_name(index), app_id, b"program"
+        )
+
+
+@pytest.fixture(autouse=True)
+def lockfile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(deployments, "lockfile_path", tmp_path / "deployments.json")
+
+
+def test_router_uses_recorded_shards_and_sums_total_deposit() -> None:
+    algorand = fake_algorand({1001: 10010, 1002: 10020})
+    record_shards(algorand, [1001, 1002])
+
+    router = ShardRouter.from_deployments(algorand)
+
+    assert router.app_ids == [1001, 1002]
+    assert (
+        router.app_id_for(public_keys[0])
+        == router.app_ids[shard_index(public_keys[0], 2)]
+    )
+    assert router.total_deposit(algorand) == 20030
+
+
+def test_router_rejects_recorded_shards_missing_on_chain() -> None:
+    recorded = fake_algorand({1001: 0, 1002: 0})
+    record_shards(recorded, [1001, 1002])
+
+    with pytest.raises(Exception, match="Bank-1 app 1002 .* does not exist"):
+        ShardRouter.from_deployments(fake_algorand({1001: 0}))
+
+
+def test_shard_count_is_fixed_once_deposits_exist() -> None:
+    empty = fake_algorand({1001: 0, 1002: 0})
+    record_shards(empty, [1001, 1002])
+    check_shard_count(empty, 3)
+
+    funded = fake_algorand({1001: 0, 1002: 500})
+    check_shard_count(funded, 2)
+    with pytest.raises(Exception, match="taken deposits on 2 shards; deploying 3"):
+        check_shard_count(funded, 3)
@@ -0,0 +1,270 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, String, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts._helpers.bank_buckets import (
+    ACCOUNT_MIN_BALANCE,
+    SLOTS_PER_BUCKET,
+    app_min_balance,
+    box_min_balance,
+    bucket_key,
+    decode_bucket,
+)
+from smart_contracts.bank.contract import MAX_PAYOUTS, Bank, Payout
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.set_template_var("MIN_DEPOSIT", 0)
+        yield ctx
+
+
+def deposit(
+    context: AlgopyTestContext, contract: Bank, sender: Account, amount: int
+) -> UInt64:
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(
+        sender=sender, receiver=app.address, amount=UInt64(amount)
+    )
+    return contract.deposit(String(""), payment)
+
+
+def test_deposit_records_balance_in_bucket(context: AlgopyTestContext) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 64)
+    contract = Bank()
+    depositor = context.any.account()
+
+    # Act
+    deposit(context, contract, depositor, 100)
+    output = deposit(context, contract, depositor, 50)
+
+    # Assert
+    key = bucket_key(depositor.bytes.value, 64)
+    assert output == 150
+    assert decode_bucket(context.ledger.get_box(contract, key)) == {
+        depositor.bytes.value: 150
+    }
+    assert not context.ledger.box_exists(contract, depositor.bytes)
+    assert contract.balance_of(depositor) == 150
+
+
+def test_deposit_takes_free_slot_in_shared_bucket(context: AlgopyTestContext) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 1)
+    contract = Bank()
+    first, second = context.any.account(), context.any.account()
+    deposit(context, contract, first, 100)
+
+    # Act
+    deposit(context, contract, second, 30)
+
+    # Assert
+    bucket = decode_bucket(
+        context.ledger.get_box(contract, bucket_key(second.bytes.value, 1))
+    )
+    assert bucket == {first.bytes.value: 100, second.bytes.value: 30}
+    addresses = arc4.DynamicArray(
+        arc4.Address(first), arc4.Address(second), arc4.Address(context.any.account())
+    )
+    assert [balance.native for balance in contract.balances(addresses)] == [100, 30, 0]
+
+
+def test_deposits_stay_within_bucket_min_balance_funded_at_deploy(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 1)
+    contract = Bank()
+    first, second = context.any.account(), context.any.account()
+    key = bucket_key(first.bytes.value, 1)
+    funded = app_min_balance(1) - ACCOUNT_MIN_BALANCE
+
+    def boxes_min_balance() -> int:
+        return sum(
+            box_min_balance(box_key, len(context.ledger.get_box(contract, box_key)))
+            for box_key in (key, first.bytes.value, second.bytes.value)
+            if context.ledger.box_exists(contract, box_key)
+        )
+
+    # Act
+    deposit(context, contract, first, 100)
+    new_bucket = boxes_min_balance()
+    deposit(context, contract, second, 30)
+    existing_bucket = boxes_min_balance()
+
+    # Assert
+    assert new_bucket == funded
+    assert existing_bucket == funded
+
+
+def test_deposit_overflows_full_bucket_into_account_box(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 1)
+    contract = Bank()
+    for _ in range(SLOTS_PER_BUCKET):
+        deposit(context, contract, context.any.account(), 10)
+    late = context.any.account()
+
+    # Act
+    deposit(context, contract, late, 20)
+
+    # Assert
+    assert context.ledger.box_exists(contract, late.bytes)
+    assert late.bytes.value not in decode_bucket(
+        context.ledger.get_box(contract, bucket_key(late.bytes.value, 1))
+    )
+    assert contract.balance_of(late) == 20
+
+
+def test_withdraw_of_last_balance_deletes_bucket(context: AlgopyTestContext) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 64)
+    contract = Bank()
+    depositor = context.any.account()
+    deposit(context, contract, depositor, 100)
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": depositor}):
+        partial = contract.withdraw(UInt64(40))
+    with context.txn.create_group(active_txn_overrides={"sender": depositor}):
+        output = contract.withdraw(UInt64(60))
+
+    # Assert
+    assert partial == 60
+    assert output == 0
+    assert not context.ledger.box_exists(
+        contract, bucket_key(depositor.bytes.value, 64)
+    )
+    assert contract.balance_of(depositor) == 0
+
+
+def test_withdraw_rejects_more_than_balance(context: AlgopyTestContext) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 64)
+    contract = Bank()
+    depositor = context.any.account()
+    deposit(context, contract, depositor, 100)
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": depositor}),
+        pytest.raises(AssertionError, match="Withdrawal amount exceeds balance"),
+    ):
+        contract.withdraw(UInt64(101))
+
+
+def test_migrate_deposits_moves_account_boxes_into_buckets(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 64)
+    contract = Bank()
+    legacy, bucketed = context.any.account(), context.any.account()
+    contract.deposits[legacy] = UInt64(70)
+    deposit(context, contract, bucketed, 10)
+
+    # Act
+    output = contract.migrate_deposits(
+        arc4.DynamicArray(arc4.Address(legacy), arc4.Address(bucketed))
+    )
+
+    # Assert
+    assert output == 1
+    assert not context.ledger.box_exists(contract, legacy.bytes)
+    assert (
+        decode_bucket(
+            context.ledger.get_box(contract, bucket_key(legacy.bytes.value, 64))
+        )[legacy.bytes.value]
+        == 70
+    )
+    assert contract.balance_of(legacy) == 70
+    assert contract.balance_of(bucketed) == 10
+
+
+def test_zero_buckets_keeps_one_box_per_depositor(context: AlgopyTestContext) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 0)
+    contract = Bank()
+    depositor = context.any.account()
+
+    # Act
+    output = deposit(context, contract, depositor, 25)
+
+    # Assert
+    assert output == 25
+    assert context.ledger.box_exists(contract, depositor.bytes)
+    assert contract.balance_of(depositor) == 25
+
+
+def payouts(receivers: list[Account], amount: int) -> arc4.DynamicArray[Payout]:
+    return arc4.DynamicArray[Payout](
+        *(
+            Payout((arc4.Address(receiver), arc4.UInt64(amount)))
+            for receiver in receivers
+        )
+    )
+
+
+def test_withdraw_batch_pays_a_full_batch_in_one_inner_group(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 64)
+    contract = Bank()
+    depositor = context.any.account()
+    deposit(context, contract, depositor, 1_000)
+    receivers = [context.any.account() for _ in range(MAX_PAYOUTS)]
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": depositor}):
+        output = contract.withdraw_batch(payouts(receivers, 10))
+
+    # Assert
+    assert output == 1_000 - 10 * MAX_PAYOUTS
+    inner = context.txn.last_group.get_itxn_group(0)
+    for index, receiver in enumerate(receivers):
+        assert inner.payment(index).receiver == receiver
+        assert inner.payment(index).amount == 10
+        assert inner.payment(index).fee == 0
+    assert contract.balance_of(depositor) == output
+
+
+def test_withdraw_batch_rejects_more_than_balance(context: AlgopyTestContext) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 64)
+    contract = Bank()
+    depositor = context.any.account()
+    deposit(context, contract, depositor, 100)
+    receivers = [context.any.account() for _ in range(3)]
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": depositor}),
+        pytest.raises(AssertionError, match="Withdrawal amount exceeds balance"),
+    ):
+        contract.withdraw_batch(payouts(receivers, 34))
+    assert contract.balance_of(depositor) == 100
+
+
+def test_withdraw_batch_rejects_more_than_max_payouts(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    context.set_template_var("DEPOSIT_BUCKETS", 64)
+    contract = Bank()
+    depositor = context.any.account()
+    deposit(context, contract, depositor, 1_000)
+    receivers = [context.any.account() for _ in range(MAX_PAYOUTS + 1)]
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": depositor}),
+        pytest.raises(AssertionError, match="Too many payouts"),
+    ):
+        contract.withdraw_batch(payouts(receivers, 1))
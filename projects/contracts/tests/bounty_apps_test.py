@@ -0,0 +1,70 @@
+import base64
+from typing import Any
+
+from smart_contracts._helpers.bounty_apps import (
+    decode_global_state,
+    deletable_bounty_apps,
+    find_recyclable_bounty,
+)
+
+PROGRAM = b"\x0a\x20\x01\x01"
+
+
+def _state(status: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "key": base64.b64encode(b"creator").decode(),
+            "value": {
+                "type": 1,
+                "bytes": base64.b64encode(bytes(32)).decode(),
+                "uint": 0,
+            },
+        },
+        {
+            "key": base64.b64encode(b"status").decode(),
+            "value": {"type": 2, "bytes": "", "uint": status},
+        },
+    ]
+
+
+def _app(app_id: int, status: int, program: bytes = PROGRAM) -> dict[str, Any]:
+    return {
+        "id": app_id,
+        "params": {
+            "approval-program": base64.b64encode(program).decode(),
+            "global-state": _state(status),
+        },
+    }
+
+
+class FakeAlgod:
+    def __init__(self, apps: list[dict[str, Any]]) -> None:
+        self.apps = apps
+
+    def account_info(self, address: str) -> dict[str, Any]:
+        return {"address": address, "created-apps": self.apps}
+
+
+def test_decode_global_state() -> None:
+    assert decode_global_state(_state(2)) == {"creator": bytes(32), "status": 2}
+
+
+def test_find_recyclable_bounty_needs_a_finished_app_with_the_same_program() -> None:
+    algod: Any = FakeAlgod([_app(1, 3, program=b"\x0a"), _app(2, 1), _app(3, 4)])
+    assert find_recyclable_bounty(algod, "CREATOR", PROGRAM) == 3
+
+    algod = FakeAlgod([_app(2, 0)])
+    assert find_recyclable_bounty(algod, "CREATOR", PROGRAM) is None
+
+
+def test_deletable_bounty_apps_need_the_delete_method() -> None:
+    selector = b"\x24\x37\x8d\x3c"
+    algod: Any = FakeAlgod(
+        [
+            _app(1, 3),
+            _app(2, 4, program=PROGRAM + selector),
+            _app(3, 0, program=PROGRAM + selector),
+        ]
+    )
+
+    assert deletable_bounty_apps(algod, "CREATOR", selector) == [2]
@@ -0,0 +1,144 @@
+from collections.abc import Iterator
+
+import algopy
+import pytest
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts._helpers.addresses import decode_address, encode_address
+from smart_contracts._helpers.bounty_escrow import escrow_address, escrow_program
+from smart_contracts._helpers.templates import BYTES, LOGICSIG_PROGRAM, UINT64
+from smart_contracts.bounty_escrow.contract import MAX_FEE, bounty_escrow
+
+REFUND_ROUND = 5_000
+ZERO_ADDRESS = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ"
+
+# Template of a program that is only its constant blocks: intcblock REFUND_ROUND; bytecblock CREATOR WORKER.
+template = {
+    "variables": {"CREATOR": BYTES, "REFUND_ROUND": UINT64, "WORKER": BYTES},
+    LOGICSIG_PROGRAM: {
+        "byteCode": "CiABASYCAQIBAw==",
+        "offsets": {"REFUND_ROUND": [3, 1], "CREATOR": [6, 2], "WORKER": [8, 2]},
+    },
+}
+
+
+def test_addresses_round_trip_and_are_checked() -> None:
+    assert encode_address(bytes(32)) == ZERO_ADDRESS
+    public_key = bytes(range(32))
+    assert decode_address(encode_address(public_key)) == public_key
+
+    with pytest.raises(Exception, match="Invalid address"):
+        decode_address(ZERO_ADDRESS[:-1] + "A")
+
+
+def test_escrow_program_and_address_depend_on_every_term() -> None:
+    creator, worker = encode_address(bytes(range(32))), encode_address(
+        bytes(range(1, 33))
+    )
+    program = escrow_program(creator, worker, 1000, template)
+
+    assert program == b"\x0a\x20\x01\xe8\x07\x26\x02\x20" + bytes(
+        range(32)
+    ) + b"\x20" + bytes(range(1, 33))
+    addresses = {
+        escrow_address(program),
+        escrow_address(escrow_program(worker, creator, 1000, template)),
+        escrow_address(escrow_program(creator, worker, 1001, template)),
+    }
+    assert len(addresses) == 3
+    assert decode_address(escrow_address(program))
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.set_template_var("REFUND_ROUND", REFUND_ROUND)
+        yield ctx
+
+
+def run_escrow(
+    context: AlgopyTestContext, *gtxns: algopy.gtxn.TransactionBase
+) -> bool | algopy.UInt64:
+    with context.txn.create_group(gtxns=list(gtxns), active_txn_index=len(gtxns) - 1):
+        return context.execute_logicsig(bounty_escrow)
+
+
+def test_escrow_pays_worker_in_group_opened_by_creator(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    creator, worker = context.any.account(), context.any.account()
+    context.set_template_var("CREATOR", creator)
+    context.set_template_var("WORKER", worker)
+    escrow = context.any.account()
+
+    def payout() -> algopy.gtxn.PaymentTransaction:
+        return context.any.txn.payment(
+            sender=escrow,
+            receiver=worker,
+            close_remainder_to=worker,
+            fee=algopy.UInt64(1000),
+        )
+
+    # Act / Assert
+    assert run_escrow(context, context.any.txn.payment(sender=creator), payout())
+    assert not run_escrow(context, context.any.txn.payment(sender=worker), payout())
+    with pytest.raises(AssertionError):
+        run_escrow(context, payout())
+
+
+def test_escrow_refunds_creator_only_from_refund_round(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    creator, worker = context.any.account(), context.any.account()
+    context.set_template_var("CREATOR", creator)
+    context.set_template_var("WORKER", worker)
+    escrow = context.any.account()
+
+    def refund(first_valid: int) -> algopy.gtxn.PaymentTransaction:
+        return context.any.txn.payment(
+            sender=escrow,
+            receiver=creator,
+            close_remainder_to=creator,
+            first_valid=algopy.UInt64(first_valid),
+        )
+
+    # Act / Assert
+    assert run_escrow(context, refund(REFUND_ROUND))
+    assert not run_escrow(context, refund(REFUND_ROUND - 1))
+
+
+def test_escrow_rejects_other_receivers_rekeys_and_high_fees(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    creator, worker = context.any.account(), context.any.account()
+    context.set_template_var("CREATOR", creator)
+    context.set_template_var("WORKER", worker)
+    escrow = context.any.account()
+    drains = [
+        context.any.txn.payment(
+            sender=escrow, receiver=worker, close_remainder_to=creator
+        ),
+        context.any.txn.payment(
+            sender=escrow, receiver=creator, close_remainder_to=context.any.account()
+        ),
+        context.any.txn.payment(
+            sender=escrow,
+            receiver=creator,
+            close_remainder_to=creator,
+            rekey_to=context.any.account(),
+        ),
+        context.any.txn.payment(
+            sender=escrow,
+            receiver=creator,
+            close_remainder_to=creator,
+            fee=algopy.UInt64(MAX_FEE + 1),
+        ),
+    ]
+
+    # Act / Assert
+    for drain in drains:
+        with pytest.raises(AssertionError):
+            run_escrow(context, drain)
@@ -0,0 +1,56 @@
+from smart_contracts._helpers.bounty_events import (
+    STATUS_CHANGED_SELECTOR,
+    BountyStatusChanged,
+    block_events,
+    decode_status_changed,
+)
+
+ZERO_ADDRESS = "AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAY5HFKQ"
+
+
+def _event_log(amount: int, status: int) -> bytes:
+    return (
+        STATUS_CHANGED_SELECTOR
+        + bytes(64)
+        + amount.to_bytes(8, "big")
+        + status.to_bytes(8, "big")
+    )
+
+
+def test_decode_status_changed_ignores_other_logs() -> None:
+    event = decode_status_changed(7, _event_log(1_000_000, 3))
+
+    assert event == BountyStatusChanged(
+        app_id=7, creator=ZERO_ADDRESS, worker=ZERO_ADDRESS, amount=1_000_000, status=3
+    )
+    assert event.status_name == "Approved"
+    assert decode_status_changed(7, b"\x15\x1f\x7c\x75" + bytes(8)) is None
+    assert decode_status_changed(7, _event_log(1, 0)[:-1]) is None
+
+
+def test_block_events_include_creations_and_inner_transactions() -> None:
+    block = {
+        "block": {
+            "txns": [
+                {"txn": {"type": "pay"}},
+                {"txn": {"type": "appl"}, "apid": 10, "dt": {"lg": [_event_log(5, 0)]}},
+                {
+                    "txn": {"type": "appl", "apid": 20},
+                    "dt": {
+                        "lg": [b"not an event"],
+                        "itx": [
+                            {
+                                "txn": {"type": "appl", "apid": 11},
+                                "dt": {"lg": [_event_log(5, 1)]},
+                            }
+                        ],
+                    },
+                },
+            ]
+        }
+    }
+
+    assert [(event.app_id, event.status) for event in block_events(block)] == [
+        (10, 0),
+        (11, 1),
+    ]
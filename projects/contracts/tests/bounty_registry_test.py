@@ -0,0 +1,158 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.bounty_registry.contract import OPEN, BountyRegistry
+
+AMOUNT = 1_000_000
+BOUNTY_ID = 2**63 + 5
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def box_key(bounty_id: int) -> bytes:
+    return b"b" + bounty_id.to_bytes(8, "big")
+
+
+def create(
+    context: AlgopyTestContext,
+    contract: BountyRegistry,
+    creator: Account,
+    bounty_id: int = BOUNTY_ID,
+) -> None:
+    app = context.ledger.get_app(contract)
+    # algopy_testing does not track minimum balance, so boxes cost nothing here.
+    payment = context.any.txn.payment(
+        sender=creator, receiver=app.address, amount=UInt64(AMOUNT)
+    )
+    with context.txn.create_group(
+        gtxns=[
+            payment,
+            context.any.txn.application_call(sender=creator, app_id=app),
+        ],
+        active_txn_index=1,
+    ):
+        contract.create_bounty(payment, UInt64(bounty_id), UInt64(AMOUNT))
+
+
+def test_create_bounty_keys_box_by_given_id(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = BountyRegistry()
+    creator = context.any.account()
+
+    # Act
+    create(context, contract, creator)
+
+    # Assert
+    assert context.ledger.box_exists(contract, box_key(BOUNTY_ID))
+    creator_address, worker_address, amount, status = contract.get_bounty_info(
+        UInt64(BOUNTY_ID)
+    )
+    assert creator_address.native == creator
+    assert worker_address == arc4.Address()
+    assert amount == AMOUNT
+    assert status == OPEN
+
+
+def test_create_bounty_rejects_id_in_use(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = BountyRegistry()
+    create(context, contract, context.any.account())
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Bounty id is already in use"):
+        create(context, contract, context.any.account())
+
+
+def test_approve_pays_worker_and_deletes_box(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = BountyRegistry()
+    creator, worker = context.any.account(), context.any.account()
+    create(context, contract, creator)
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim(UInt64(BOUNTY_ID))
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.submit_work(UInt64(BOUNTY_ID))
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        contract.approve(UInt64(BOUNTY_ID))
+
+    # Assert
+    payout = context.txn.last_group.get_itxn_group(0).payment(0)
+    refund = context.txn.last_group.get_itxn_group(1).payment(0)
+    assert payout.receiver == worker
+    assert payout.amount == AMOUNT
+    assert refund.receiver == creator
+    assert not context.ledger.box_exists(contract, box_key(BOUNTY_ID))
+
+
+def test_cancel_refunds_creator_and_deletes_box(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = BountyRegistry()
+    creator = context.any.account()
+    create(context, contract, creator)
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        contract.cancel(UInt64(BOUNTY_ID))
+
+    # Assert
+    refund = context.txn.last_group.last_itxn.payment
+    assert refund.receiver == creator
+    assert refund.amount == AMOUNT
+    assert not context.ledger.box_exists(contract, box_key(BOUNTY_ID))
+
+
+def test_creator_cannot_claim_own_bounty(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = BountyRegistry()
+    creator = context.any.account()
+    create(context, contract, creator)
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": creator}),
+        pytest.raises(AssertionError),
+    ):
+        contract.claim(UInt64(BOUNTY_ID))
+
+
+def test_only_creator_can_approve(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = BountyRegistry()
+    creator, worker = context.any.account(), context.any.account()
+    create(context, contract, creator)
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim(UInt64(BOUNTY_ID))
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.submit_work(UInt64(BOUNTY_ID))
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": worker}),
+        pytest.raises(AssertionError),
+    ):
+        contract.approve(UInt64(BOUNTY_ID))
+
+
+def test_cancel_rejects_claimed_bounty(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = BountyRegistry()
+    creator, worker = context.any.account(), context.any.account()
+    create(context, contract, creator)
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim(UInt64(BOUNTY_ID))
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": creator}),
+        pytest.raises(AssertionError),
+    ):
+        contract.cancel(UInt64(BOUNTY_ID))
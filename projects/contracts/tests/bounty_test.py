@@ -0,0 +1,274 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, OnCompleteAction, UInt64
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.bounty.contract import Bounty
+
+AMOUNT = 1_000_000
+OPEN, CLAIMED, SUBMITTED, APPROVED, CANCELLED = range(5)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        ctx.set_template_var("FIXED_CREATOR", Account())
+        ctx.set_template_var("MIN_BOUNTY_AMOUNT", 0)
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> Bounty:
+    return Bounty()
+
+
+def status(contract: Bounty) -> int:
+    return contract.status.value
+
+
+def fund(context: AlgopyTestContext, contract: Bounty, method: str) -> None:
+    creator = context.default_sender
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(
+        sender=creator, receiver=app.address, amount=UInt64(AMOUNT)
+    )
+    with context.txn.create_group(
+        gtxns=[payment, context.any.txn.application_call(sender=creator, app_id=app)],
+        active_txn_index=1,
+    ):
+        getattr(contract, method)(payment, UInt64(AMOUNT))
+
+
+def finish(context: AlgopyTestContext, contract: Bounty, worker: Account) -> None:
+    """Runs a funded bounty through claim, submit and approve."""
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim()
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.submit_work()
+    contract.approve()
+
+
+def test_reopen_starts_new_bounty_after_approval(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    finish(context, contract, context.any.account())
+
+    # Act
+    fund(context, contract, "reopen")
+
+    # Assert
+    assert status(contract) == OPEN
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ):
+        contract.claim()
+    assert status(contract) == CLAIMED
+
+
+def test_reopen_rejects_open_bounty(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+
+    # Act / Assert
+    with pytest.raises(AssertionError):
+        fund(context, contract, "reopen")
+
+
+def test_reopen_rejects_other_sender(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    contract.cancel()
+    stranger = context.any.account()
+    app = context.ledger.get_app(contract)
+    payment = context.any.txn.payment(
+        sender=stranger, receiver=app.address, amount=UInt64(AMOUNT)
+    )
+
+    # Act / Assert
+    with (
+        context.txn.create_group(
+            gtxns=[
+                payment,
+                context.any.txn.application_call(sender=stranger, app_id=app),
+            ],
+            active_txn_index=1,
+        ),
+        pytest.raises(AssertionError),
+    ):
+        contract.reopen(payment, UInt64(AMOUNT))
+
+
+def test_delete_closes_finished_bounty_to_app_creator(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    contract.cancel()
+
+    # Act
+    with context.txn.create_group(
+        active_txn_overrides={"on_completion": OnCompleteAction.DeleteApplication}
+    ):
+        contract.delete()
+
+    # Assert
+    close = context.txn.last_group.last_itxn.payment
+    assert close.close_remainder_to == context.default_sender
+    assert close.fee == 0
+
+
+def test_delete_rejects_unfinished_bounty(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+
+    # Act / Assert
+    with (
+        context.txn.create_group(
+            active_txn_overrides={"on_completion": OnCompleteAction.DeleteApplication}
+        ),
+        pytest.raises(AssertionError),
+    ):
+        contract.delete()
+
+
+def test_delete_rejects_other_sender(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    contract.cancel()
+
+    # Act / Assert
+    with (
+        context.txn.create_group(
+            active_txn_overrides={
+                "sender": context.any.account(),
+                "on_completion": OnCompleteAction.DeleteApplication,
+            }
+        ),
+        pytest.raises(AssertionError),
+    ):
+        contract.delete()
+
+
+def test_claim_and_submit_moves_open_bounty_to_submitted(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    worker = context.any.account()
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim_and_submit()
+
+    # Assert
+    assert status(contract) == SUBMITTED
+    contract.approve()
+    assert context.txn.last_group.last_itxn.payment.receiver == worker
+
+
+def test_claim_and_submit_rejects_creator(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+
+    # Act / Assert
+    with pytest.raises(AssertionError):
+        contract.claim_and_submit()
+
+
+def test_claim_and_submit_rejects_claimed_bounty(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ):
+        contract.claim()
+
+    # Act / Assert
+    with (
+        context.txn.create_group(
+            active_txn_overrides={"sender": context.any.account()}
+        ),
+        pytest.raises(AssertionError),
+    ):
+        contract.claim_and_submit()
+
+
+def test_approve_and_close_pays_worker_then_closes_app(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    worker = context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim_and_submit()
+
+    # Act
+    with context.txn.create_group(
+        active_txn_overrides={"on_completion": OnCompleteAction.DeleteApplication}
+    ):
+        contract.approve_and_close()
+
+    # Assert
+    payout = context.txn.last_group.get_itxn_group(0).payment(0)
+    close = context.txn.last_group.get_itxn_group(1).payment(0)
+    assert payout.receiver == worker
+    assert payout.amount == AMOUNT
+    assert close.close_remainder_to == context.default_sender
+    assert status(contract) == APPROVED
+
+
+def test_approve_and_close_rejects_unsubmitted_bounty(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    with context.txn.create_group(
+        active_txn_overrides={"sender": context.any.account()}
+    ):
+        contract.claim()
+
+    # Act / Assert
+    with (
+        context.txn.create_group(
+            active_txn_overrides={"on_completion": OnCompleteAction.DeleteApplication}
+        ),
+        pytest.raises(AssertionError),
+    ):
+        contract.approve_and_close()
+
+
+def test_approve_and_close_rejects_worker(
+    context: AlgopyTestContext, contract: Bounty
+) -> None:
+    # Arrange
+    fund(context, contract, "create_bounty")
+    worker = context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim_and_submit()
+
+    # Act / Assert
+    with (
+        context.txn.create_group(
+            active_txn_overrides={
+                "sender": worker,
+                "on_completion": OnCompleteAction.DeleteApplication,
+            }
+        ),
+        pytest.raises(AssertionError),
+    ):
+        contract.approve_and_close()
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers import build_cache
+
+
+@pytest.fixture()
+def package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "smart_contracts"
+    (root / "shared").mkdir(parents=True)
+    (root / "bounty").mkdir()
+    (root / "__init__.py").write_text("")
+    (root / "shared" / "__init__.py").write_text("")
+    (root / "shared" / "structs.py").write_text("from algopy import arc4\n")
+    (root / "bounty" / "__init__.py").write_text("")
+    (root / "bounty" / "helpers.py").write_text(
+        "from smart_contracts.shared import structs\n"
+    )
+    (root / "bounty" / "contract.py").write_text(
+        "from algopy import *\nfrom .helpers import something\n"
+    )
+    monkeypatch.setattr(build_cache, "package_root", root)
+    monkeypatch.setattr(build_cache, "toolchain_versions", lambda: {"puyapy": "4.7.0"})
+    return root
+
+
+def test_contract_sources_follow_local_imports(package: Path) -> None:
+    sources = build_cache.contract_sources(package / "bounty" / "contract.py")
+
+    assert [source.relative_to(package).as_posix() for source in sources] == [
+        "bounty/contract.py",
+        "bounty/helpers.py",
+        "shared/__init__.py",
+        "shared/structs.py",
+    ]
+
+
+def test_build_hash_tracks_imported_modules_and_flags(package: Path) -> None:
+    contract_path = package / "bounty" / "contract.py"
+    original = build_cache.compute_build_hash(contract_path, ["--output-arc56"])
+
+    assert build_cache.compute_build_hash(contract_path, ["--output-arc56"]) == original
+    assert build_cache.compute_build_hash(contract_path, ["--output-arc32"]) != original
+
+    (package / "shared" / "structs.py").write_text("from algopy import arc4, UInt64\n")
+    assert build_cache.compute_build_hash(contract_path, ["--output-arc56"]) != original
+
+
+def test_manifest_marks_output_up_to_date(package: Path, tmp_path: Path) -> None:
+    contract_path = package / "bounty" / "contract.py"
+    output_dir = tmp_path / "artifacts" / "bounty"
+    output_dir.mkdir(parents=True)
+    (output_dir / "Bounty.arc56.json").write_text("{}")
+    build_hash = build_cache.compute_build_hash(contract_path, [])
+
+    assert not build_cache.is_up_to_date(output_dir, build_hash)
+
+    build_cache.write_manifest(output_dir, contract_path, build_hash, [])
+    assert build_cache.is_up_to_date(output_dir, build_hash)
+    assert not build_cache.is_up_to_date(output_dir, "stale")
+
+    (output_dir / "Bounty.arc56.json").unlink()
+    assert not build_cache.is_up_to_date(output_dir, build_hash)
@@ -0,0 +1,120 @@
+import base64
+import json
+import shutil
+from pathlib import Path
+
+from smart_contracts._helpers.build_report import (
+    contract_report,
+    find_regressions,
+    read_report,
+    size_warnings,
+    update_report,
+    write_build_stats,
+)
+
+artifact_path = Path(__file__).parent.parent / "smart_contracts" / "artifacts"
+
+
+def test_contract_report_sizes_each_app_separately(tmp_path: Path) -> None:
+    for contract_name, app_name in (("bounty", "Bounty"), ("bank", "Bank")):
+        for path in (artifact_path / contract_name).glob(f"{app_name}.*"):
+            shutil.copy(path, tmp_path)
+
+    report = contract_report(tmp_path)
+
+    programs = report["programs"]
+    assert isinstance(programs, dict)
+    assert set(programs) == {"Bounty", "Bank"}
+    for app_name, sizes in programs.items():
+        app_spec = json.loads((tmp_path / f"{app_name}.arc56.json").read_text())
+        assert sizes["approval_bytes"] == len(
+            base64.b64decode(app_spec["byteCode"]["approval"])
+        )
+        assert sizes["clear_bytes"] == len(
+            base64.b64decode(app_spec["byteCode"]["clear"])
+        )
+        assert sizes["teal_lines"] > 0
+
+
+def test_contract_report_measures_logic_signature_bytecode(tmp_path: Path) -> None:
+    (tmp_path / "Escrow.teal").write_text("#pragma version 10\n// comment\nint 1\n")
+    (tmp_path / "Escrow.bin").write_bytes(b"\x0a\x81\x01")
+
+    report = contract_report(tmp_path)
+
+    assert report["programs"] == {"Escrow": {"program_bytes": 3, "teal_lines": 2}}
+
+
+def test_update_report_keeps_other_contracts_and_marks_cached(tmp_path: Path) -> None:
+    for name in ("bank", "counter"):
+        (tmp_path / name).mkdir()
+        write_build_stats(
+            tmp_path / name, compile_seconds=1.0, generate_seconds=0.5, peak_rss_kb=1024
+        )
+    (tmp_path / "build_report.json").write_text(
+        json.dumps({"contracts": {"bounty": {"approval_bytes": 10}}})
+    )
+
+    previous = read_report(tmp_path / "build_report.json")
+    current = update_report(previous, tmp_path, ["bank"], built_since=0)
+    assert previous == {"bounty": {"approval_bytes": 10}}
+    assert set(current) == {"bank", "bounty"}
+    assert current["bank"]["cached"] is False
+    assert current["bank"]["compile_seconds"] == 1.0
+
+    current = update_report(current, tmp_path, ["counter"], built_since=float("inf"))
+    assert current["counter"]["cached"] is True
+
+
+def test_find_regressions_applies_threshold() -> None:
+    previous = {
+        "bank": {
+            "compile_seconds": 2.0,
+            "programs": {"Bank": {"approval_bytes": 1000, "teal_lines": 100}},
+        }
+    }
+    current = {
+        "bank": {
+            "compile_seconds": 2.05,
+            "cached": False,
+            "programs": {"Bank": {"approval_bytes": 1200, "teal_lines": 105}},
+        }
+    }
+
+    assert find_regressions(previous, current, threshold=10) == [
+        "bank/Bank: approval_bytes grew 20.0% (1000 -> 1200)"
+    ]
+    assert find_regressions(previous, current, threshold=25) == []
+
+
+def test_find_regressions_ignores_times_of_cached_contracts() -> None:
+    previous = {"bank": {"compile_seconds": 1.0}}
+    current = {"bank": {"compile_seconds": 5.0, "cached": True}}
+
+    assert find_regressions(previous, current, threshold=10) == []
+
+
+def test_size_warnings_check_each_program_against_its_limit() -> None:
+    warnings = size_warnings(
+        {
+            "bounty": {
+                "programs": {
+                    "Small": {"approval_bytes": 1000, "clear_bytes": 4},
+                    "Paged": {"approval_bytes": 3000, "clear_bytes": 4},
+                }
+            },
+            "huge": {"programs": {"Huge": {"approval_bytes": 9000, "clear_bytes": 4}}},
+            "escrow": {
+                "programs": {
+                    "Fits": {"program_bytes": 900},
+                    "TooLong": {"program_bytes": 1200},
+                }
+            },
+        }
+    )
+
+    assert warnings == [
+        "bounty/Paged: programs are 3004 bytes and need 1 extra program page(s)",
+        "escrow/TooLong: logic signature is 1200 bytes, above the 1000 byte limit",
+        "huge/Huge: programs are 9004 bytes, above the 8192 byte limit",
+    ]
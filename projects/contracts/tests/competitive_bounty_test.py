@@ -0,0 +1,163 @@
+import hashlib
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Bytes, UInt64
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.competitive_bounty.contract import (
+    APPROVED,
+    CANCELLED,
+    CompetitiveBounty,
+)
+
+AMOUNT = 1_000_000
+DIGEST = hashlib.sha256(b"deliverable").digest()
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def contract(context: AlgopyTestContext) -> CompetitiveBounty:
+    contract = CompetitiveBounty()
+    app = context.ledger.get_app(contract)
+    creator = context.default_sender
+    payment = context.any.txn.payment(
+        sender=creator, receiver=app.address, amount=UInt64(AMOUNT)
+    )
+    with context.txn.create_group(
+        gtxns=[payment, context.any.txn.application_call(sender=creator, app_id=app)],
+        active_txn_index=1,
+    ):
+        contract.create_bounty(payment, UInt64(AMOUNT))
+    return contract
+
+
+def submit(
+    context: AlgopyTestContext,
+    contract: CompetitiveBounty,
+    worker: Account,
+    submission: bytes = DIGEST,
+) -> None:
+    app = context.ledger.get_app(contract)
+    # algopy_testing does not track minimum balance, so boxes cost nothing here.
+    box_payment = context.any.txn.payment(
+        sender=worker, receiver=app.address, amount=UInt64(0)
+    )
+    with context.txn.create_group(
+        gtxns=[
+            box_payment,
+            context.any.txn.application_call(sender=worker, app_id=app),
+        ],
+        active_txn_index=1,
+    ):
+        contract.submit(box_payment, Bytes(submission))
+
+
+def test_submit_records_one_box_per_worker(
+    context: AlgopyTestContext, contract: CompetitiveBounty
+) -> None:
+    # Arrange
+    first, second = context.any.account(), context.any.account()
+
+    # Act
+    submit(context, contract, first)
+    submit(context, contract, second)
+    submit(context, contract, first, hashlib.sha256(b"revised").digest())
+
+    # Assert
+    assert contract.submission_count == 2
+    assert contract.get_submission(first) == hashlib.sha256(b"revised").digest()
+    assert contract.get_submission(second) == DIGEST
+    assert contract.get_submission(context.any.account()) == b""
+
+
+def test_submit_rejects_creator_and_bad_digest(
+    context: AlgopyTestContext, contract: CompetitiveBounty
+) -> None:
+    # Act / Assert
+    with pytest.raises(AssertionError):
+        submit(context, contract, context.default_sender)
+    with pytest.raises(AssertionError, match="Submission must be a 32 byte digest"):
+        submit(context, contract, context.any.account(), b"short")
+
+
+def test_approve_submission_pays_chosen_worker(
+    context: AlgopyTestContext, contract: CompetitiveBounty
+) -> None:
+    # Arrange
+    loser, winner = context.any.account(), context.any.account()
+    submit(context, contract, loser)
+    submit(context, contract, winner)
+
+    # Act
+    contract.approve_submission(winner)
+
+    # Assert
+    payout = context.txn.last_group.last_itxn.payment
+    assert payout.receiver == winner
+    assert payout.amount == AMOUNT
+    assert contract.winner == winner
+    assert contract.status == APPROVED
+    with pytest.raises(AssertionError):
+        submit(context, contract, context.any.account())
+
+
+def test_approve_submission_rejects_worker_without_submission(
+    context: AlgopyTestContext, contract: CompetitiveBounty
+) -> None:
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Worker has no submission"):
+        contract.approve_submission(context.any.account())
+
+
+def test_approve_submission_rejects_other_sender(
+    context: AlgopyTestContext, contract: CompetitiveBounty
+) -> None:
+    # Arrange
+    worker = context.any.account()
+    submit(context, contract, worker)
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": worker}),
+        pytest.raises(AssertionError),
+    ):
+        contract.approve_submission(worker)
+
+
+def test_reclaim_submission_after_cancel_deletes_box(
+    context: AlgopyTestContext, contract: CompetitiveBounty
+) -> None:
+    # Arrange
+    worker = context.any.account()
+    submit(context, contract, worker)
+    contract.cancel()
+
+    # Act
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.reclaim_submission()
+
+    # Assert
+    assert contract.status == CANCELLED
+    assert context.txn.last_group.last_itxn.payment.receiver == worker
+    assert not context.ledger.box_exists(contract, b"s" + worker.bytes.value)
+
+
+def test_reclaim_submission_rejects_open_bounty(
+    context: AlgopyTestContext, contract: CompetitiveBounty
+) -> None:
+    # Arrange
+    worker = context.any.account()
+    submit(context, contract, worker)
+
+    # Act / Assert
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": worker}),
+        pytest.raises(AssertionError),
+    ):
+        contract.reclaim_submission()
@@ -0,0 +1,99 @@
+import importlib.util
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.compiler_worker import CompilerWorker
+
+
+@pytest.fixture()
+def fake_toolchain(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Stands in for puyapy and the client generator by echoing their arguments."""
+    (tmp_path / "puyapy").mkdir()
+    (tmp_path / "puyapy" / "__init__.py").write_text("")
+    (tmp_path / "puyapy" / "__main__.py").write_text(
+        textwrap.dedent(
+            """
+            import sys
+
+            def main():
+                print("compiling", *sys.argv[1:])
+                if "broken.py" in sys.argv[1]:
+                    sys.exit(1)
+            """
+        )
+    )
+    (tmp_path / "algokit_client_generator").mkdir()
+    (tmp_path / "algokit_client_generator" / "__init__.py").write_text("")
+    (tmp_path / "algokit_client_generator" / "cli.py").write_text(
+        textwrap.dedent(
+            """
+            import sys
+
+            def main():
+                print("generating", *sys.argv[1:])
+            """
+        )
+    )
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    return tmp_path
+
+
+def test_worker_runs_jobs_in_one_process(fake_toolchain: Path, tmp_path: Path) -> None:
+    worker = CompilerWorker.start()
+    assert worker is not None
+    with worker:
+        returncode, output = worker.compile(
+            tmp_path / "contract.py", tmp_path / "out", ["--output-arc56"]
+        )
+        assert returncode == 0
+        assert output.split() == [
+            "compiling",
+            str(tmp_path / "contract.py"),
+            f"--out-dir={tmp_path / 'out'}",
+            "--output-arc56",
+        ]
+
+        returncode, output = worker.compile(
+            tmp_path / "broken.py", tmp_path / "out", []
+        )
+        assert returncode == 1
+
+        returncode, output = worker.generate_client(
+            tmp_path / "Bank.arc56.json", tmp_path / "bank_client.py"
+        )
+        assert returncode == 0
+        assert output.split() == [
+            "generating",
+            "-a",
+            str(tmp_path / "Bank.arc56.json"),
+            "-o",
+            str(tmp_path / "bank_client.py"),
+        ]
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("puyapy") is not None, reason="puyapy is installed"
+)
+def test_worker_unavailable_without_toolchain() -> None:
+    assert CompilerWorker.start() is None
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("puyapy") is None, reason="puyapy is not installed"
+)
+def test_worker_compiles_with_the_installed_puyapy(tmp_path: Path) -> None:
+    contract = (
+        Path(__file__).parent.parent / "smart_contracts" / "counter" / "contract.py"
+    )
+
+    worker = CompilerWorker.start()
+    assert worker is not None
+    with worker:
+        returncode, output = worker.compile(
+            contract, tmp_path, ["--output-arc56", "--no-output-arc32"]
+        )
+
+    assert returncode == 0, output
+    assert (tmp_path / "Counter.arc56.json").exists()
@@ -11,6 +11,9 @@ from smart_contracts.artifacts.counter.counter_client import (
     CounterFactory,
 )
 
+# 2500 + 400 * (key "c" + 32 byte address + uint64 counter)
+COUNTER_BOX_COST = 2_500 + 400 * (1 + 32 + 8)
+
 
 @pytest.fixture()
 def deployer(algorand_client: AlgorandClient) -> SigningAccount:
@@ -33,23 +36,33 @@ def counter_client(
         on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
         on_update=algokit_utils.OnUpdate.AppendApp,
     )
+    # incr_by stores the sender's counter in a box the app's balance pays for.
+    algorand_client.account.ensure_funded(
+        account_to_fund=client.app_address,
+        dispenser_account=deployer.address,
+        min_spending_balance=AlgoAmount.from_micro_algo(COUNTER_BOX_COST),
+    )
     return client
 
 
-def test_says_hello(counter_client: CounterClient) -> None:
-    result = counter_client.send.hello(args=("World",))
-    assert result.abi_return == "Hello, World"
+def test_incr_by_returns_sender_counter(
+    counter_client: CounterClient, deployer: SigningAccount
+) -> None:
+    before = counter_client.send.get_counter(args=(deployer.address,)).abi_return
+    assert before is not None
 
+    result = counter_client.send.incr_by(args=(3,))
 
-def test_simulate_says_hello_with_correct_budget_consumed(
+    assert result.abi_return == before + 3
+    assert (
+        counter_client.send.get_counter(args=(deployer.address,)).abi_return
+        == before + 3
+    )
+
+
+def test_simulate_incr_by_with_correct_budget_consumed(
     counter_client: CounterClient,
 ) -> None:
-    result = (
-        counter_client.new_group()
-        .hello(args=("World",))
-        .hello(args=("Jane",))
-        .simulate()
-    )
-    assert result.returns[0].value == "Hello, World"
-    assert result.returns[1].value == "Hello, Jane"
+    result = counter_client.new_group().incr_by(args=(1,)).incr_by(args=(2,)).simulate()
+    assert result.returns[1].value == result.returns[0].value + 2
     assert result.simulate_response["txn-groups"][0]["app-budget-consumed"] < 100
@@ -1,6 +1,7 @@
 from collections.abc import Iterator
 
 import pytest
+from algopy import UInt64
 from algopy_testing import AlgopyTestContext, algopy_testing_context
 
 from smart_contracts.counter.contract import Counter
@@ -12,13 +13,22 @@ def context() -> Iterator[AlgopyTestContext]:
         yield ctx
 
 
-def test_hello(context: AlgopyTestContext) -> None:
+def test_incr_by_counts_per_sender(context: AlgopyTestContext) -> None:
     # Arrange
-    dummy_input = context.any.string(length=10)
     contract = Counter()
+    first, second = context.any.account(), context.any.account()
 
     # Act
-    output = contract.hello(dummy_input)
+    with context.txn.create_group(active_txn_overrides={"sender": first}):
+        contract.incr_by(UInt64(2))
+    with context.txn.create_group(active_txn_overrides={"sender": second}):
+        contract.incr_by(UInt64(5))
+    with context.txn.create_group(active_txn_overrides={"sender": first}):
+        output = contract.incr_by(UInt64(3))
 
     # Assert
-    assert output == f"Hello, {dummy_input}"
+    assert output == 5
+    assert contract.get_counter(first) == 5
+    assert contract.get_counter(second) == 5
+    assert contract.get_counter(context.any.account()) == 0
+    assert contract.count == 10
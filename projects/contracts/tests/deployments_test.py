@@ -0,0 +1,160 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+from algokit_utils import AppInformation
+
+from smart_contracts._helpers import deployments
+
+CREATOR = "CREATOR"
+APPROVAL = b"\x0a\x20\x01\x01"
+
+
+class FakeApps:
+    def __init__(self, apps: dict[int, AppInformation]) -> None:
+        self.apps = apps
+        self.lookups: list[int] = []
+
+    def get_by_id(self, app_id: int) -> AppInformation:
+        self.lookups.append(app_id)
+        if app_id not in self.apps:
+            raise Exception("application does not exist")
+        return self.apps[app_id]
+
+
+class FakeNetwork:
+    def __init__(self, genesis_hash: str) -> None:
+        self.genesis_hash = genesis_hash
+
+    def network(self) -> "FakeNetwork":
+        return self
+
+
+class FakeAlgorand:
+    def __init__(self, apps: dict[int, AppInformation], genesis_hash: str) -> None:
+        self.app = FakeApps(apps)
+        self.client = FakeNetwork(genesis_hash)
+
+
+def fake_algorand(
+    apps: dict[int, AppInformation], genesis_hash: str = "testnet-genesis"
+) -> FakeAlgorand:
+    return FakeAlgorand(apps, genesis_hash)
+
+
+@pytest.fixture(autouse=True)
+def artifacts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    (tmp_path / "bank").mkdir()
+    (tmp_path / "bank" / "Bank.arc56.json").write_text(
+        json.dumps(
+            {
+                "byteCode": {
+                    "approval": base64.b64encode(APPROVAL).decode(),
+                    "clear": "CoEBQw==",
+                }
+            }
+        )
+    )
+    monkeypatch.setattr(deployments, "artifact_path", tmp_path)
+    monkeypatch.setattr(deployments, "lockfile_path", tmp_path / "deployments.json")
+    return tmp_path
+
+
+def on_chain(program: bytes, creator: str = CREATOR) -> AppInformation:
+    return AppInformation(
+        app_id=1001,
+        app_address="APP",
+        approval_program=program,
+        clear_state_program=b"\x0a\x81\x01\x43",
+        creator=creator,
+        global_state={},
+        local_ints=0,
+        local_byte_slices=0,
+        global_ints=0,
+        global_byte_slices=0,
+        extra_program_pages=0,
+    )
+
+
+def test_recorded_deployment_is_found_with_a_single_lookup() -> None:
+    # Arrange
+    algorand = fake_algorand({1001: on_chain(APPROVAL)})
+    assert (
+        deployments.find_current_deployment(algorand, "bank", "Bank", CREATOR) is None
+    )
+    deployments.record_deployment(algorand, "bank", "Bank", 1001)
+    algorand.app.lookups.clear()
+
+    # Act
+    app_id = deployments.find_current_deployment(algorand, "bank", "Bank", CREATOR)
+
+    # Assert
+    assert app_id == 1001
+    assert algorand.app.lookups == [1001]
+
+
+def test_deployed_program_is_compared_with_the_one_on_chain() -> None:
+    # Arrange: algod assembled the TEAL into different bytes than the built bytecode.
+    algorand = fake_algorand({1001: on_chain(b"assembled by algod")})
+    deployments.record_deployment(algorand, "bank", "Bank", 1001)
+
+    # Act
+    app_id = deployments.find_current_deployment(algorand, "bank", "Bank", CREATOR)
+
+    # Assert
+    assert app_id == 1001
+
+
+def test_changed_bytecode_needs_a_deploy(artifacts: Path) -> None:
+    # Arrange
+    algorand = fake_algorand({1001: on_chain(APPROVAL)})
+    deployments.record_deployment(algorand, "bank", "Bank", 1001)
+    algorand.app.lookups.clear()
+    changed = base64.b64encode(APPROVAL + b"\x81").decode()
+    (artifacts / "bank" / "Bank.arc56.json").write_text(
+        json.dumps({"byteCode": {"approval": changed}})
+    )
+
+    # Act
+    app_id = deployments.find_current_deployment(algorand, "bank", "Bank", CREATOR)
+
+    # Assert
+    assert app_id is None
+    assert algorand.app.lookups == []
+
+
+@pytest.mark.parametrize(
+    "apps",
+    [
+        {},
+        {1001: on_chain(APPROVAL, creator="SOMEONE_ELSE")},
+        {1001: on_chain(b"updated")},
+    ],
+    ids=["deleted", "other creator", "updated"],
+)
+def test_stale_entries_need_a_deploy(apps: dict[int, AppInformation]) -> None:
+    # Arrange
+    deployed = fake_algorand({1001: on_chain(APPROVAL)})
+    deployments.record_deployment(deployed, "bank", "Bank", 1001)
+
+    # Act
+    app_id = deployments.find_current_deployment(
+        fake_algorand(apps), "bank", "Bank", CREATOR
+    )
+
+    # Assert
+    assert app_id is None
+
+
+def test_entries_are_per_network() -> None:
+    # Arrange
+    apps = {1001: on_chain(APPROVAL)}
+    deployments.record_deployment(fake_algorand(apps), "bank", "Bank", 1001)
+    localnet = fake_algorand(apps, genesis_hash="localnet-genesis")
+
+    # Act
+    app_id = deployments.find_current_deployment(localnet, "bank", "Bank", CREATOR)
+
+    # Assert
+    assert app_id is None
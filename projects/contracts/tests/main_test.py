@@ -0,0 +1,78 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.__main__ import report_build
+from smart_contracts._helpers.build_report import write_build_stats
+
+project_root = Path(__file__).parent.parent
+
+
+def test_importing_entrypoint_does_not_load_deploy_modules() -> None:
+    script = (
+        "import json, sys\n"
+        "import smart_contracts.__main__ as entrypoint\n"
+        "print(json.dumps([name for name in sys.modules if name.startswith(('algokit_utils', 'dotenv'))"
+        " or name.endswith('.deploy_config')]))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+def test_deploy_skips_logic_signatures_without_app_spec() -> None:
+    script = "import smart_contracts.__main__ as entrypoint\nentrypoint.main('deploy', 'bounty_escrow')\n"
+
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=project_root, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_report_build_keeps_previous_report_on_regression(tmp_path: Path) -> None:
+    (tmp_path / "bank").mkdir()
+    write_build_stats(
+        tmp_path / "bank", compile_seconds=1.0, generate_seconds=0.5, peak_rss_kb=None
+    )
+    report_path = tmp_path / "build_report.json"
+    report_path.write_text(
+        json.dumps({"contracts": {"bank": {"compile_seconds": 0.5}}})
+    )
+
+    with pytest.raises(Exception, match="1 build regression"):
+        report_build(tmp_path, ["bank"], built_since=0, compare_threshold=10)
+
+    assert json.loads(report_path.read_text()) == {
+        "contracts": {"bank": {"compile_seconds": 0.5}}
+    }
+
+
+def test_report_build_compares_with_baseline(tmp_path: Path) -> None:
+    (tmp_path / "bank").mkdir()
+    write_build_stats(
+        tmp_path / "bank", compile_seconds=1.0, generate_seconds=0.5, peak_rss_kb=None
+    )
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"contracts": {"bank": {"compile_seconds": 0.5}}}))
+
+    with pytest.raises(Exception, match="1 build regression"):
+        report_build(
+            tmp_path, ["bank"], built_since=0, compare_threshold=10, baseline=baseline
+        )
+
+    baseline.write_text(json.dumps({"contracts": {"bank": {"compile_seconds": 1.0}}}))
+    report_build(
+        tmp_path, ["bank"], built_since=0, compare_threshold=10, baseline=baseline
+    )
+    report = json.loads((tmp_path / "build_report.json").read_text())
+    assert report["contracts"]["bank"]["compile_seconds"] == 1.0
@@ -0,0 +1,167 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, UInt64, arc4
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.milestone_bounty.contract import (
+    APPROVED,
+    CANCELLED,
+    CLAIMED,
+    MilestoneBounty,
+)
+
+MILESTONES = (300_000, 700_000)
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+def milestones(*amounts: int) -> arc4.DynamicArray[arc4.UInt64]:
+    return arc4.DynamicArray[arc4.UInt64](*(arc4.UInt64(amount) for amount in amounts))
+
+
+def create(
+    context: AlgopyTestContext, contract: MilestoneBounty, *amounts: int
+) -> None:
+    app = context.ledger.get_app(contract)
+    creator = context.default_sender
+    # algopy_testing does not track minimum balance, so boxes cost nothing here.
+    payment = context.any.txn.payment(
+        sender=creator, receiver=app.address, amount=UInt64(sum(amounts))
+    )
+    with context.txn.create_group(
+        gtxns=[payment, context.any.txn.application_call(sender=creator, app_id=app)],
+        active_txn_index=1,
+    ):
+        contract.create_bounty(payment, milestones(*amounts))
+
+
+@pytest.fixture()
+def claimed(context: AlgopyTestContext) -> tuple[MilestoneBounty, Account]:
+    contract = MilestoneBounty()
+    create(context, contract, *MILESTONES)
+    worker = context.any.account()
+    with context.txn.create_group(active_txn_overrides={"sender": worker}):
+        contract.claim()
+    return contract, worker
+
+
+def test_create_bounty_escrows_milestone_total(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = MilestoneBounty()
+
+    # Act
+    create(context, contract, *MILESTONES)
+
+    # Assert
+    assert contract.amount == sum(MILESTONES)
+    assert [m.native for m in contract.get_milestones()] == list(MILESTONES)
+
+
+def test_create_bounty_rejects_zero_or_too_many_milestones(
+    context: AlgopyTestContext,
+) -> None:
+    # Act / Assert
+    with pytest.raises(AssertionError, match="Milestone amounts"):
+        create(context, MilestoneBounty(), 100, 0)
+    with pytest.raises(AssertionError, match="Expected 1 to 16 milestones"):
+        create(context, MilestoneBounty(), *([1] * 17))
+
+
+def test_approve_milestone_pays_each_milestone_once(
+    context: AlgopyTestContext, claimed: tuple[MilestoneBounty, Account]
+) -> None:
+    # Arrange
+    contract, worker = claimed
+
+    # Act
+    contract.approve_milestone(UInt64(1))
+
+    # Assert
+    payout = context.txn.last_group.last_itxn.payment
+    assert payout.receiver == worker
+    assert payout.amount == MILESTONES[1]
+    assert contract.amount == MILESTONES[0]
+    assert contract.paid_milestones == 0b10
+    assert contract.status == CLAIMED
+    with pytest.raises(AssertionError, match="Milestone already paid"):
+        contract.approve_milestone(UInt64(1))
+
+
+def test_last_milestone_approves_bounty_and_deletes_box(
+    context: AlgopyTestContext, claimed: tuple[MilestoneBounty, Account]
+) -> None:
+    # Arrange
+    contract, worker = claimed
+    contract.approve_milestone(UInt64(0))
+
+    # Act
+    contract.approve_milestone(UInt64(1))
+
+    # Assert
+    payout = context.txn.last_group.get_itxn_group(0).payment(0)
+    refund = context.txn.last_group.get_itxn_group(1).payment(0)
+    assert payout.receiver == worker
+    assert refund.receiver == context.default_sender
+    assert contract.amount == 0
+    assert contract.status == APPROVED
+    assert not context.ledger.box_exists(contract, b"m")
+
+
+def test_approve_milestone_rejects_unknown_index_and_other_sender(
+    context: AlgopyTestContext, claimed: tuple[MilestoneBounty, Account]
+) -> None:
+    # Arrange
+    contract, worker = claimed
+
+    # Act / Assert
+    with pytest.raises(AssertionError, match="No such milestone"):
+        contract.approve_milestone(UInt64(len(MILESTONES)))
+    with (
+        context.txn.create_group(active_txn_overrides={"sender": worker}),
+        pytest.raises(AssertionError),
+    ):
+        contract.approve_milestone(UInt64(0))
+
+
+def test_approve_milestone_rejects_unclaimed_bounty(
+    context: AlgopyTestContext,
+) -> None:
+    # Arrange
+    contract = MilestoneBounty()
+    create(context, contract, *MILESTONES)
+
+    # Act / Assert
+    with pytest.raises(AssertionError):
+        contract.approve_milestone(UInt64(0))
+
+
+def test_cancel_refunds_open_bounty(context: AlgopyTestContext) -> None:
+    # Arrange
+    contract = MilestoneBounty()
+    create(context, contract, *MILESTONES)
+
+    # Act
+    contract.cancel()
+
+    # Assert
+    refund = context.txn.last_group.get_itxn_group(0).payment(0)
+    assert refund.receiver == context.default_sender
+    assert refund.amount == sum(MILESTONES)
+    assert contract.status == CANCELLED
+    assert not context.ledger.box_exists(contract, b"m")
+
+
+def test_cancel_rejects_claimed_bounty(
+    context: AlgopyTestContext, claimed: tuple[MilestoneBounty, Account]
+) -> None:
+    # Arrange
+    contract, _worker = claimed
+
+    # Act / Assert
+    with pytest.raises(AssertionError):
+        contract.cancel()
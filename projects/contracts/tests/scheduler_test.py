@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+from smart_contracts._helpers.scheduler import Task, run_dag
+
+
+def test_dependencies_run_first() -> None:
+    order: list[str] = []
+    tasks = [
+        Task(
+            "deploy bounty",
+            "deploy",
+            lambda: order.append("deploy bounty"),
+            ("build bounty", "deploy bank"),
+        ),
+        Task("build bounty", "build", lambda: order.append("build bounty")),
+        Task(
+            "deploy bank",
+            "deploy",
+            lambda: order.append("deploy bank"),
+            ("build bank",),
+        ),
+        Task("build bank", "build", lambda: order.append("build bank")),
+    ]
+
+    run_dag(tasks, {"build": 1, "deploy": 1})
+
+    assert order.index("deploy bank") > order.index("build bank")
+    assert order.index("deploy bounty") > max(
+        order.index("build bounty"), order.index("deploy bank")
+    )
+
+
+def test_lanes_overlap() -> None:
+    deploying = threading.Event()
+    second_build_ran_during_deploy = threading.Event()
+
+    def deploy_first() -> None:
+        deploying.set()
+        assert second_build_ran_during_deploy.wait(timeout=5)
+
+    def build_second() -> None:
+        assert deploying.wait(timeout=5)
+        second_build_ran_during_deploy.set()
+
+    tasks = [
+        Task("build a", "build", lambda: None),
+        Task("build b", "build", build_second, ("build a",)),
+        Task("deploy a", "deploy", deploy_first, ("build a",)),
+    ]
+
+    run_dag(tasks, {"build": 1, "deploy": 1})
+
+    assert second_build_ran_during_deploy.is_set()
+
+
+def test_failure_skips_dependents_but_runs_independent_tasks() -> None:
+    ran: list[str] = []
+
+    def fail() -> None:
+        raise ValueError("compile error")
+
+    tasks = [
+        Task("build a", "build", fail),
+        Task("deploy a", "deploy", lambda: ran.append("deploy a"), ("build a",)),
+        Task("build b", "build", lambda: ran.append("build b")),
+    ]
+
+    with pytest.raises(Exception, match="Failed: build a; skipped: deploy a"):
+        run_dag(tasks, {"build": 2, "deploy": 1})
+    assert ran == ["build b"]
+
+
+def test_cycles_are_rejected() -> None:
+    tasks = [
+        Task("deploy a", "deploy", lambda: None, ("deploy b",)),
+        Task("deploy b", "deploy", lambda: None, ("deploy a",)),
+    ]
+
+    with pytest.raises(Exception, match="Dependency cycle"):
+        run_dag(tasks, {"deploy": 1})
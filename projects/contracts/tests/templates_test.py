@@ -0,0 +1,162 @@
+import base64
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts._helpers.templates import (
+    BYTES,
+    LOGICSIG_PROGRAM,
+    UINT64,
+    built_template,
+    clear_sentinel_values,
+    render_program,
+    rendered_app_spec,
+    sentinel_value,
+    template_variables,
+    write_templates,
+)
+
+contracts_path = Path(__file__).parent.parent / "smart_contracts"
+
+variables = {"MIN": UINT64, "OWNER": BYTES}
+min_sentinel = sentinel_value("MIN", UINT64)
+owner_sentinel = sentinel_value("OWNER", BYTES)
+
+
+def _uvarint(value: int) -> bytes:
+    encoded = bytearray()
+    while value >= 0x80:
+        encoded.append((value & 0x7F) | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _program(*, pushed: bool = False) -> bytes:
+    """#pragma version 10; intcblock 0 1 MIN; bytecblock "x" OWNER; then a few opcodes."""
+    assert isinstance(min_sentinel, int)
+    assert isinstance(owner_sentinel, bytes)
+    intcblock = b"\x20\x03\x00\x01" + _uvarint(min_sentinel)
+    bytecblock = b"\x26\x02\x01x" + _uvarint(len(owner_sentinel)) + owner_sentinel
+    code = b"\x81" + _uvarint(min_sentinel) if pushed else b"\x22\x23\x28\x29"
+    return b"\x0a" + (
+        b"\x20\x01\x00" + code if pushed else intcblock + bytecblock + code
+    )
+
+
+def _write_build(output_dir: Path, approval: bytes, clear: bytes) -> None:
+    (output_dir / "App.arc56.json").write_text("{}")
+    (output_dir / "App.approval.bin").write_bytes(approval)
+    (output_dir / "App.clear.bin").write_bytes(clear)
+
+
+def test_template_variables_are_found_in_contract_sources() -> None:
+    assert template_variables(contracts_path / "bounty" / "contract.py") == {
+        "FIXED_CREATOR": BYTES,
+        "MIN_BOUNTY_AMOUNT": UINT64,
+    }
+    assert template_variables(contracts_path / "bounty_escrow" / "contract.py") == {
+        "CREATOR": BYTES,
+        "REFUND_ROUND": UINT64,
+        "WORKER": BYTES,
+    }
+    assert template_variables(contracts_path / "counter" / "contract.py") == {}
+
+
+def test_render_program_splices_values_of_any_length(tmp_path: Path) -> None:
+    _write_build(tmp_path, _program(), b"\x0a\x81\x01")
+    write_templates(tmp_path, variables)
+    template = json.loads((tmp_path / "App.template.json").read_text())
+    assert template["clear"]["offsets"] == {}
+
+    owner = bytes(range(32))
+    approval = render_program(template, "approval", {"MIN": 5, "OWNER": owner})
+    assert (
+        approval
+        == b"\x0a\x20\x03\x00\x01\x05\x26\x02\x01x\x20" + owner + b"\x22\x23\x28\x29"
+    )
+    assert (
+        render_program(template, "clear", {"MIN": 5, "OWNER": owner}) == b"\x0a\x81\x01"
+    )
+
+    with pytest.raises(Exception, match="Missing template variables: OWNER"):
+        render_program(template, "approval", {"MIN": 5})
+    with pytest.raises(Exception, match="MIN must be an int"):
+        render_program(template, "approval", {"MIN": b"5", "OWNER": owner})
+
+
+def test_write_templates_rejects_values_outside_constant_blocks(tmp_path: Path) -> None:
+    _write_build(tmp_path, _program(pushed=True), b"\x0a\x81\x01")
+
+    with pytest.raises(Exception, match="MIN in App is not in a constant block"):
+        write_templates(tmp_path, variables)
+
+
+def test_write_templates_records_logic_signature_programs(tmp_path: Path) -> None:
+    _write_build(tmp_path, _program(), b"\x0a\x81\x01")
+    (tmp_path / "Escrow.bin").write_bytes(_program())
+    write_templates(tmp_path, variables)
+
+    template = json.loads((tmp_path / "Escrow.template.json").read_text())
+    assert set(template) == {"variables", LOGICSIG_PROGRAM}
+    owner = bytes(range(32))
+    assert render_program(
+        template, LOGICSIG_PROGRAM, {"MIN": 5, "OWNER": owner}
+    ) == render_program(
+        json.loads((tmp_path / "App.template.json").read_text()),
+        "approval",
+        {"MIN": 5, "OWNER": owner},
+    )
+
+
+def test_write_templates_records_only_variables_each_app_uses(tmp_path: Path) -> None:
+    _write_build(tmp_path, _program(), b"\x0a\x81\x01")
+    (tmp_path / "Plain.arc56.json").write_text("{}")
+    (tmp_path / "Plain.approval.bin").write_bytes(b"\x0a\x81\x01")
+    (tmp_path / "Plain.clear.bin").write_bytes(b"\x0a\x81\x01")
+
+    write_templates(tmp_path, {**variables, "UNUSED": UINT64})
+
+    template = json.loads((tmp_path / "App.template.json").read_text())
+    assert template["variables"] == variables
+    assert not (tmp_path / "Plain.template.json").exists()
+
+
+def test_clear_sentinel_values_leaves_template_values_unset(tmp_path: Path) -> None:
+    app_spec = {
+        "name": "App",
+        "templateVariables": {"MIN": {"type": "AVMUint64", "value": "AAAAAAAAAAU="}},
+    }
+    (tmp_path / "App.arc56.json").write_text(json.dumps(app_spec))
+    (tmp_path / "Plain.arc56.json").write_text("{}")
+
+    clear_sentinel_values(tmp_path)
+
+    assert json.loads((tmp_path / "App.arc56.json").read_text()) == {
+        "name": "App",
+        "templateVariables": {"MIN": {"type": "AVMUint64"}},
+    }
+    assert (tmp_path / "Plain.arc56.json").read_text() == "{}"
+
+
+def test_rendered_app_spec_deploys_bytecode_without_source() -> None:
+    values: dict[str, int | bytes] = {
+        "MIN_BOUNTY_AMOUNT": 5,
+        "FIXED_CREATOR": bytes(range(32)),
+    }
+
+    app_spec = rendered_app_spec("bounty", "Bounty", values)
+
+    template = built_template("bounty", "Bounty")
+    assert app_spec.source is None
+    assert app_spec.byte_code is not None
+    assert base64.b64decode(app_spec.byte_code.approval) == render_program(
+        template, "approval", values
+    )
+    assert base64.b64decode(app_spec.byte_code.clear) == render_program(
+        template, "clear", values
+    )
+    assert all(
+        variable.value is None for variable in app_spec.template_variables.values()
+    )
@@ -1,7 +1,9 @@
 /* eslint-disable */
 /**
- * This file was automatically generated by @algorandfoundation/algokit-client-generator.
- * DO NOT MODIFY IT BY HAND.
+ * Typed client for the Bounty app, written by hand from
+ * projects/contracts/smart_contracts/artifacts/bounty/Bounty.arc56.json in the layout of
+ * @algorandfoundation/algokit-client-generator. `npm run generate:app-clients` replaces it
+ * with the generated client; `npm run typecheck` checks it against algokit-utils.
  * requires: @algorandfoundation/algokit-utils: ^7
  */
 import { type AlgorandClient } from '@algorandfoundation/algokit-utils/types/algorand-client'
@@ -24,7 +26,7 @@ import { SendParams, SendSingleTransactionResult, SendAtomicTransactionComposerR
 import { Address, encodeAddress, modelsv2, OnApplicationComplete, Transaction, TransactionSigner } from 'algosdk'
 import SimulateResponse = modelsv2.SimulateResponse
 
-export const APP_SPEC: Arc56Contract = {"name":"Bounty","structs":{},"methods":[{"name":"create_bounty","args":[{"type":"pay","name":"payment"},{"type":"uint64","name":"amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"claim","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"submit_work","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"approve","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"cancel","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[],"recommendations":{}},{"name":"get_bounty_info","args":[],"returns":{"type":"(address,address,uint64,uint64)"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":2,"bytes":2},"local":{"ints":0,"bytes":0}},"keys":{"global":{"creator":{"keyType":"AVMString","valueType":"address","key":"Y3JlYXRvcg=="},"worker":{"keyType":"AVMString","valueType":"address","key":"d29ya2Vy"},"amount":{"keyType":"AVMString","valueType":"AVMUint64","key":"YW1vdW50"},"status":{"keyType":"AVMString","valueType":"AVMUint64","key":"c3RhdHVz"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"bareActions":{"create":["NoOp"],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[115,150,162,174,186,198],"errorMessage":"OnCompletion is not NoOp"},{"pc":[229],"errorMessage":"can only call when creating"},{"pc":[118,153,165,177,189,201],"errorMessage":"can only call when not creating"},{"pc":[246,350,392,423],"errorMessage":"check self.amount exists"},{"pc":[240,262,297,332,375,388,415],"errorMessage":"check self.creator exists"},{"pc":[252,289,319,338,381,427],"errorMessage":"check self.status exists"},{"pc":[313,346,419],"errorMessage":"check self.worker exists"},{"pc":[211],"errorMessage":"transaction type is pay"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMgogICAgYnl0ZWNibG9jayAic3RhdHVzIiAiY3JlYXRvciIgImFtb3VudCIgIndvcmtlciIKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQKICAgIC8vIHNlbGYuY3JlYXRvciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNQogICAgLy8gc2VsZi53b3JrZXIgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2CiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMiAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE3CiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAMTEKICAgIHB1c2hieXRlc3MgMHg4N2E2NGJhYyAweGYxNTc3NzI2IDB4ZWIyNDY3ZjYgMHhkNjExZGJkOCAweDMxZjI2YTliIDB4ZWQxNWVkYjYgLy8gbWV0aG9kICJjcmVhdGVfYm91bnR5KHBheSx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2xhaW0oKXZvaWQiLCBtZXRob2QgInN1Ym1pdF93b3JrKCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlKCl2b2lkIiwgbWV0aG9kICJjYW5jZWwoKXZvaWQiLCBtZXRob2QgImdldF9ib3VudHlfaW5mbygpKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUA1IG1haW5fY2xhaW1fcm91dGVANiBtYWluX3N1Ym1pdF93b3JrX3JvdXRlQDcgbWFpbl9hcHByb3ZlX3JvdXRlQDggbWFpbl9jYW5jZWxfcm91dGVAOSBtYWluX2dldF9ib3VudHlfaW5mb19yb3V0ZUAxMAoKbWFpbl9hZnRlcl9pZl9lbHNlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGdldF9ib3VudHlfaW5mbwogICAgc3dhcAogICAgaXRvYgogICAgc3dhcAogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NhbmNlbF9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2FuY2VsCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2FwcHJvdmVfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDYKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGFwcHJvdmUKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc3VibWl0X3dvcmtfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHN1Ym1pdF93b3JrCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBjbGFpbQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfYm91bnR5X3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9ib3VudHkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTMKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY3JlYXRlX2JvdW50eShwYXltZW50OiB1aW50NjQsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpjcmVhdGVfYm91bnR5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxOS0yMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2JvdW50eShzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjIKICAgIC8vIGFzc2VydCBzZWxmLmFtb3VudCA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjIzCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyNQogICAgLy8gYXNzZXJ0IHBheW1lbnQuc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI2CiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyNwogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID09IGFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyOQogICAgLy8gc2VsZi5hbW91bnQgPSBhbW91bnQKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmNsYWltKCkgLT4gdm9pZDoKY2xhaW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMzCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgIT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgIT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNgogICAgLy8gc2VsZi53b3JrZXIgPSBUeG4uc2VuZGVyCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNwogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMSkKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuc3VibWl0X3dvcmsoKSAtPiB2b2lkOgpzdWJtaXRfd29yazoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDEKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYud29ya2VyCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAid29ya2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndvcmtlciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDIKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDQKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KDIpCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBpbnRjXzIgLy8gMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmFwcHJvdmUoKSAtPiB2b2lkOgphcHByb3ZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo0OAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo0OQogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1MS01NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYud29ya2VyLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NTIKICAgIC8vIHJlY2VpdmVyPXNlbGYud29ya2VyLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi53b3JrZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUzCiAgICAvLyBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUxCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NTEtNTQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1NgogICAgLy8gc2VsZi5hbW91bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1NwogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMykKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIHB1c2hpbnQgMyAvLyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY2FuY2VsKCkgLT4gdm9pZDoKY2FuY2VsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NjQtNjcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmNyZWF0b3IsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2NQogICAgLy8gcmVjZWl2ZXI9c2VsZi5jcmVhdG9yLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NjYKICAgIC8vIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NjQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2NC02NwogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYuY3JlYXRvciwKICAgIC8vICAgICBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2OQogICAgLy8gc2VsZi5hbW91bnQgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoNCkKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuZ2V0X2JvdW50eV9pbmZvKCkgLT4gYnl0ZXMsIGJ5dGVzLCB1aW50NjQsIHVpbnQ2NDoKZ2V0X2JvdW50eV9pbmZvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3NAogICAgLy8gcmV0dXJuIHNlbGYuY3JlYXRvciwgc2VsZi53b3JrZXIsIHNlbGYuYW1vdW50LCBzZWxmLnN0YXR1cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIHJldHN1Ygo=","clear":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CiADAAECJgQGc3RhdHVzB2NyZWF0b3IGYW1vdW50BndvcmtlcjEYQAAOKTEAZysyA2cqImcoImcxG0EAoIIGBIemS6wE8Vd3JgTrJGf2BNYR29gEMfJqmwTtFe22NhoAjgYAVQBJAD0AMQAlAAIiQzEZFEQxGESIASJMFkwWTwNPA1BPAlBMUIAEFR98dUxQsCNDMRkURDEYRIgA1SNDMRkURDEYRIgAniNDMRkURDEYRIgAfyNDMRkURDEYRIgAXSNDMRkURDEYRDEWIwlJOBAjEkQ2GgEXiAANI0MxGUD/jDEYFEQjQ4oCADEAIillRBJEIiplRBREIihlRBREi/44ACIpZUQSRIv+OAcyChJEi/44CIv/EkQqi/9niSIoZUQURDEAIillRBNEKzEAZygjZ4kxACIrZUQSRCIoZUQjEkQoJGeJMQAiKWVEEkQiKGVEJBJEsSIrZUQiKmVEsgiyByOyECKyAbMqImcogQNniTEAIillRBJEIihlRBREsSIpZUQiKmVEsgiyByOyECKyAbMqImcogQRniSIpZUQiK2VEIiplRCIoZUSJ","clear":"CoEBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":4,"minor":7,"patch":0}},"events":[],"templateVariables":{}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"name":"Bounty","structs":{},"methods":[{"name":"create_bounty","args":[{"type":"pay","name":"payment"},{"type":"uint64","name":"amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"claim","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"submit_work","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"claim_and_submit","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"approve","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"cancel","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"reopen","args":[{"type":"pay","name":"payment"},{"type":"uint64","name":"amount"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"delete","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["DeleteApplication"]},"readonly":false,"events":[],"recommendations":{}},{"name":"approve_and_close","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["DeleteApplication"]},"readonly":false,"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"recommendations":{}},{"name":"get_bounty_info","args":[],"returns":{"type":"(address,address,uint64,uint64)"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"networks":{},"state":{"schema":{"global":{"ints":2,"bytes":2},"local":{"ints":0,"bytes":0}},"keys":{"global":{"creator":{"keyType":"AVMString","valueType":"address","key":"Y3JlYXRvcg=="},"worker":{"keyType":"AVMString","valueType":"address","key":"d29ya2Vy"},"amount":{"keyType":"AVMString","valueType":"AVMUint64","key":"YW1vdW50"},"status":{"keyType":"AVMString","valueType":"AVMUint64","key":"c3RhdHVz"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"bareActions":{"create":["NoOp"],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[237,251],"errorMessage":"OnCompletion is not DeleteApplication"},{"pc":[200,263,289,301,313,325,337,349],"errorMessage":"OnCompletion is not NoOp"},{"pc":[380],"errorMessage":"can only call when creating"},{"pc":[203,240,254,266,292,304,316,328,340,352],"errorMessage":"can only call when not creating"},{"pc":[401,476,502,531,554,563,602,611,802,857],"errorMessage":"check self.amount exists"},{"pc":[395,417,463,518,541,590,607,642,673,724,789,849,869],"errorMessage":"check self.creator exists"},{"pc":[407,455,492,510,547,596,648,657,742,751,795,861,880],"errorMessage":"check self.status exists"},{"pc":[486,559,807,853,873],"errorMessage":"check self.worker exists"},{"pc":[276,362],"errorMessage":"transaction type is pay"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiAzIFRNUExfTUlOX0JPVU5UWV9BTU9VTlQKICAgIGJ5dGVjYmxvY2sgInN0YXR1cyIgImFtb3VudCIgImNyZWF0b3IiICJ3b3JrZXIiIFRNUExfRklYRURfQ1JFQVRPUgogICAgaW50Y18wIC8vIDAKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjMtMjQKICAgIC8vICMgRGVwbG95LXRpbWUgdmFyaWFudHM6IGEgemVybyBGSVhFRF9DUkVBVE9SIG1ha2VzIHRoZSBhcHAgY3JlYXRvciB0aGUgYm91bnR5IGNyZWF0b3IuCiAgICAvLyBmaXhlZF9jcmVhdG9yID0gVGVtcGxhdGVWYXJbQWNjb3VudF0oIkZJWEVEX0NSRUFUT1IiKQogICAgYnl0ZWMgNCAvLyBUTVBMX0ZJWEVEX0NSRUFUT1IKICAgIGR1cAogICAgYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI2CiAgICAvLyBUeG4uc2VuZGVyIGlmIGZpeGVkX2NyZWF0b3IgPT0gR2xvYmFsLnplcm9fYWRkcmVzcyBlbHNlIGZpeGVkX2NyZWF0b3IKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgPT0KICAgIGJ6IG1haW5fdGVybmFyeV9mYWxzZUA3CiAgICB0eG4gU2VuZGVyCgptYWluX3Rlcm5hcnlfbWVyZ2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MjUKICAgIC8vIHNlbGYuY3JlYXRvciA9ICgKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI1LTI3CiAgICAvLyBzZWxmLmNyZWF0b3IgPSAoCiAgICAvLyAgICAgVHhuLnNlbmRlciBpZiBmaXhlZF9jcmVhdG9yID09IEdsb2JhbC56ZXJvX2FkZHJlc3MgZWxzZSBmaXhlZF9jcmVhdG9yCiAgICAvLyApCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToyOAogICAgLy8gc2VsZi53b3JrZXIgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjI5CiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMwCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQKICAgIC8vIGNsYXNzIEJvdW50eShBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDIxCiAgICBwdXNoYnl0ZXNzIDB4ODdhNjRiYWMgMHhmMTU3NzcyNiAweGViMjQ2N2Y2IDB4NDA0YzY4YjAgMHhkNjExZGJkOCAweDMxZjI2YTliIDB4M2NiYjhhOGMgMHgyNDM3OGQzYyAweGU5OThjMjIwIDB4ZWQxNWVkYjYgLy8gbWV0aG9kICJjcmVhdGVfYm91bnR5KHBheSx1aW50NjQpdm9pZCIsIG1ldGhvZCAiY2xhaW0oKXZvaWQiLCBtZXRob2QgInN1Ym1pdF93b3JrKCl2b2lkIiwgbWV0aG9kICJjbGFpbV9hbmRfc3VibWl0KCl2b2lkIiwgbWV0aG9kICJhcHByb3ZlKCl2b2lkIiwgbWV0aG9kICJjYW5jZWwoKXZvaWQiLCBtZXRob2QgInJlb3BlbihwYXksdWludDY0KXZvaWQiLCBtZXRob2QgImRlbGV0ZSgpdm9pZCIsIG1ldGhvZCAiYXBwcm92ZV9hbmRfY2xvc2UoKXZvaWQiLCBtZXRob2QgImdldF9ib3VudHlfaW5mbygpKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUAxMSBtYWluX2NsYWltX3JvdXRlQDEyIG1haW5fc3VibWl0X3dvcmtfcm91dGVAMTMgbWFpbl9jbGFpbV9hbmRfc3VibWl0X3JvdXRlQDE0IG1haW5fYXBwcm92ZV9yb3V0ZUAxNSBtYWluX2NhbmNlbF9yb3V0ZUAxNiBtYWluX3Jlb3Blbl9yb3V0ZUAxNyBtYWluX2RlbGV0ZV9yb3V0ZUAxOCBtYWluX2FwcHJvdmVfYW5kX2Nsb3NlX3JvdXRlQDE5IG1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDIwCgptYWluX2FmdGVyX2lmX2Vsc2VAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIGludGNfMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X2JvdW50eV9pbmZvX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNTQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfYm91bnR5X2luZm8KICAgIHN3YXAKICAgIGl0b2IKICAgIHN3YXAKICAgIGl0b2IKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX2FuZF9jbG9zZV9yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTMyCiAgICAvLyBAYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgRGVsZXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBhcHByb3ZlX2FuZF9jbG9zZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfcm91dGVAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjExOQogICAgLy8gQGFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIHB1c2hpbnQgNSAvLyBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZGVsZXRlCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3Jlb3Blbl9yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTAzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNAogICAgLy8gY2xhc3MgQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTAzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVvcGVuCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NhbmNlbF9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6ODgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGNhbmNlbAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9hcHByb3ZlX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgYXBwcm92ZQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jbGFpbV9hbmRfc3VibWl0X3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xhaW1fYW5kX3N1Ym1pdAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zdWJtaXRfd29ya19yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NTUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHN1Ym1pdF93b3JrCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2NsYWltX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo0NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY2xhaW0KICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX2JvdW50eV9yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0CiAgICAvLyBjbGFzcyBCb3VudHkoQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozMgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9ib3VudHkKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDIxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNAogICAgLy8gY2xhc3MgQm91bnR5KEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIzCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl90ZXJuYXJ5X2ZhbHNlQDc6CiAgICBkdXAKICAgIGIgbWFpbl90ZXJuYXJ5X21lcmdlQDgKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5jcmVhdGVfYm91bnR5KHBheW1lbnQ6IHVpbnQ2NCwgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CmNyZWF0ZV9ib3VudHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjMyLTMzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfYm91bnR5KHNlbGYsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCBhbW91bnQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNAogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTozNQogICAgLy8gYXNzZXJ0IHNlbGYuYW1vdW50ID09IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzYKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjM4CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MzkKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPT0gYW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQxCiAgICAvLyBhc3NlcnQgYW1vdW50ID49IFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1JTl9CT1VOVFlfQU1PVU5UIikKICAgIGZyYW1lX2RpZyAtMQogICAgaW50YyA0IC8vIFRNUExfTUlOX0JPVU5UWV9BTU9VTlQKICAgID49CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDMKICAgIC8vIHNlbGYuYW1vdW50ID0gYW1vdW50CiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKGFtb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY2xhaW0oKSAtPiB2b2lkOgpjbGFpbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NDgKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciAhPSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAhPQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLndvcmtlciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUyCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgxKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjUzCiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHNlbGYuYW1vdW50KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICBjYWxsc3ViIF9lbWl0X3N0YXR1c19jaGFuZ2VkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5zdWJtaXRfd29yaygpIC0+IHZvaWQ6CnN1Ym1pdF93b3JrOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi53b3JrZXIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo1OAogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MAogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMikKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGludGNfMiAvLyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo2MQogICAgLy8gc2VsZi5fZW1pdF9zdGF0dXNfY2hhbmdlZChzZWxmLmFtb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuY2xhaW1fYW5kX3N1Ym1pdCgpIC0+IHZvaWQ6CmNsYWltX2FuZF9zdWJtaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjY1LTY2CiAgICAvLyAjIEZhc3QgcGF0aCBmb3IgYSB3b3JrZXIgd2hvIGFscmVhZHkgaGFzIHRoZSBkZWxpdmVyYWJsZTogY2xhaW0gYW5kIHN1Ym1pdCBpbiBvbmUgY2FsbC4KICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjY3CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciAhPSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAhPQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjY5CiAgICAvLyBzZWxmLndvcmtlciA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIHR4biBTZW5kZXIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgyKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18yIC8vIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjcxCiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHNlbGYuYW1vdW50KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICBjYWxsc3ViIF9lbWl0X3N0YXR1c19jaGFuZ2VkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5hcHByb3ZlKCkgLT4gdm9pZDoKYXBwcm92ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzUKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvcgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzYKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMikKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuc3RhdHVzIGV4aXN0cwogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzcKICAgIC8vIHBhaWQgPSBzZWxmLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojc5LTgyCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi53b3JrZXIsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo4MAogICAgLy8gcmVjZWl2ZXI9c2VsZi53b3JrZXIsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAid29ya2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndvcmtlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6ODEKICAgIC8vIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYW1vdW50IGV4aXN0cwogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6NzkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo3OS04MgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYud29ya2VyLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCgzKQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgaW50Y18zIC8vIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKHBhaWQpCiAgICBjYWxsc3ViIF9lbWl0X3N0YXR1c19jaGFuZ2VkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5jYW5jZWwoKSAtPiB2b2lkOgpjYW5jZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjkwCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBhc3NlcnQgc2VsZi5zdGF0dXMgPT0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weTo5MgogICAgLy8gcmVmdW5kZWQgPSBzZWxmLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojk0LTk3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5jcmVhdG9yLAogICAgLy8gICAgIGFtb3VudD1zZWxmLmFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6OTUKICAgIC8vIHJlY2VpdmVyPXNlbGYuY3JlYXRvciwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBhbW91bnQ9c2VsZi5hbW91bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFtb3VudCBleGlzdHMKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6OTQtOTcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmNyZWF0b3IsCiAgICAvLyAgICAgYW1vdW50PXNlbGYuYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6OTkKICAgIC8vIHNlbGYuYW1vdW50ID0gVUludDY0KDApCiAgICBieXRlY18xIC8vICJhbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTAwCiAgICAvLyBzZWxmLnN0YXR1cyA9IFVJbnQ2NCg0KQogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgcHVzaGludCA0IC8vIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gc2VsZi5fZW1pdF9zdGF0dXNfY2hhbmdlZChyZWZ1bmRlZCkKICAgIGNhbGxzdWIgX2VtaXRfc3RhdHVzX2NoYW5nZWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LnJlb3BlbihwYXltZW50OiB1aW50NjQsIGFtb3VudDogdWludDY0KSAtPiB2b2lkOgpyZW9wZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEwMy0xMDQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlb3BlbihzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTA1LTEwNgogICAgLy8gIyBTdGFydHMgYSBuZXcgYm91bnR5IGluIGEgZmluaXNoZWQgYXBwLCBzYXZpbmcgYW4gYXBwIGNyZWF0aW9uIGFuZCBmdW5kaW5nIHJvdW5kLgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMDcKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGludGNfMyAvLyAzCiAgICA9PQogICAgYm56IHJlb3Blbl9ib29sX3RydWVAMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGJ6IHJlb3Blbl9ib29sX2ZhbHNlQDMKCnJlb3Blbl9ib29sX3RydWVAMjoKICAgIGludGNfMSAvLyAxCgpyZW9wZW5fYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMDcKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTA5CiAgICAvLyBhc3NlcnQgcGF5bWVudC5zZW5kZXIgPT0gc2VsZi5jcmVhdG9yCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzIgLy8gImNyZWF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY3JlYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTEwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMTEKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA9PSBhbW91bnQKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQW1vdW50CiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTEyCiAgICAvLyBhc3NlcnQgYW1vdW50ID49IFRlbXBsYXRlVmFyW1VJbnQ2NF0oIk1JTl9CT1VOVFlfQU1PVU5UIikKICAgIGZyYW1lX2RpZyAtMQogICAgaW50YyA0IC8vIFRNUExfTUlOX0JPVU5UWV9BTU9VTlQKICAgID49CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTE0CiAgICAvLyBzZWxmLndvcmtlciA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjXzMgLy8gIndvcmtlciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTE1CiAgICAvLyBzZWxmLmFtb3VudCA9IGFtb3VudAogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMTYKICAgIC8vIHNlbGYuc3RhdHVzID0gVUludDY0KDApCiAgICBieXRlY18wIC8vICJzdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTE3CiAgICAvLyBzZWxmLl9lbWl0X3N0YXR1c19jaGFuZ2VkKGFtb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZW1pdF9zdGF0dXNfY2hhbmdlZAogICAgcmV0c3ViCgpyZW9wZW5fYm9vbF9mYWxzZUAzOgogICAgaW50Y18wIC8vIDAKICAgIGIgcmVvcGVuX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmRlbGV0ZSgpIC0+IHZvaWQ6CmRlbGV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTIxLTEyMwogICAgLy8gIyBSZW1vdmVzIGEgZmluaXNoZWQgYm91bnR5IGZyb20gaXRzIGNyZWF0b3IncyBhY2NvdW50OyB0aGUgYXBwIGFjY291bnQncyByZW1haW5pbmcKICAgIC8vICMgYmFsYW5jZSBnb2VzIGJhY2sgdG8gdGhlIGFwcCBjcmVhdG9yLCB3aG8gZnVuZGVkIGl0cyBtaW5pbXVtIGJhbGFuY2UuCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3Igb3IgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAiY3JlYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jcmVhdG9yIGV4aXN0cwogICAgPT0KICAgIGJueiBkZWxldGVfYm9vbF90cnVlQDIKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGJ6IGRlbGV0ZV9ib29sX2ZhbHNlQDMKCmRlbGV0ZV9ib29sX3RydWVAMjoKICAgIGludGNfMSAvLyAxCgpkZWxldGVfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjEtMTIzCiAgICAvLyAjIFJlbW92ZXMgYSBmaW5pc2hlZCBib3VudHkgZnJvbSBpdHMgY3JlYXRvcidzIGFjY291bnQ7IHRoZSBhcHAgYWNjb3VudCdzIHJlbWFpbmluZwogICAgLy8gIyBiYWxhbmNlIGdvZXMgYmFjayB0byB0aGUgYXBwIGNyZWF0b3IsIHdobyBmdW5kZWQgaXRzIG1pbmltdW0gYmFsYW5jZS4KICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuY3JlYXRvciBvciBUeG4uc2VuZGVyID09IEdsb2JhbC5jcmVhdG9yX2FkZHJlc3MKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjQKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGludGNfMyAvLyAzCiAgICA9PQogICAgYm56IGRlbGV0ZV9ib29sX3RydWVANgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBwdXNoaW50IDQgLy8gNAogICAgPT0KICAgIGJ6IGRlbGV0ZV9ib29sX2ZhbHNlQDcKCmRlbGV0ZV9ib29sX3RydWVANjoKICAgIGludGNfMSAvLyAxCgpkZWxldGVfYm9vbF9tZXJnZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjQKICAgIC8vIGFzc2VydCBzZWxmLnN0YXR1cyA9PSBVSW50NjQoMykgb3Igc2VsZi5zdGF0dXMgPT0gVUludDY0KDQpCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTI2LTEzMAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEyNwogICAgLy8gcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMjgKICAgIC8vIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIENsb3NlUmVtYWluZGVyVG8KICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTI2CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEyOQogICAgLy8gZmVlPTAsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTI2LTEzMAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgpkZWxldGVfYm9vbF9mYWxzZUA3OgogICAgaW50Y18wIC8vIDAKICAgIGIgZGVsZXRlX2Jvb2xfbWVyZ2VAOAoKZGVsZXRlX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIGRlbGV0ZV9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYm91bnR5LmNvbnRyYWN0LkJvdW50eS5hcHByb3ZlX2FuZF9jbG9zZSgpIC0+IHZvaWQ6CmFwcHJvdmVfYW5kX2Nsb3NlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMzQtMTM1CiAgICAvLyAjIGFwcHJvdmUgZm9sbG93ZWQgYnkgZGVsZXRlIGluIG9uZSBjYWxsOyB0aGUgY2FsbCBwYXlzIHRoZSBmZWVzIG9mIGJvdGggaW5uZXIgcGF5bWVudHMuCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmNyZWF0b3IKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzNgogICAgLy8gYXNzZXJ0IHNlbGYuc3RhdHVzID09IFVJbnQ2NCgyKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxMzcKICAgIC8vIHBhaWQgPSBzZWxmLmFtb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzOS0xNDMKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIC8vICAgICBhbW91bnQ9cGFpZCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQwCiAgICAvLyByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzOQogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNDIKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjEzOS0xNDMKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLndvcmtlciwKICAgIC8vICAgICBhbW91bnQ9cGFpZCwKICAgIC8vICAgICBmZWU9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0NC0xNDgKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNDUKICAgIC8vIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTQ2CiAgICAvLyBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGR1cAogICAgaXR4bl9maWVsZCBDbG9zZVJlbWFpbmRlclRvCiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNDcKICAgIC8vIGZlZT0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE0NC0xNDgKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLmFtb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAiYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE1MQogICAgLy8gc2VsZi5zdGF0dXMgPSBVSW50NjQoMykKICAgIGJ5dGVjXzAgLy8gInN0YXR1cyIKICAgIGludGNfMyAvLyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNTIKICAgIC8vIHNlbGYuX2VtaXRfc3RhdHVzX2NoYW5nZWQocGFpZCkKICAgIGNhbGxzdWIgX2VtaXRfc3RhdHVzX2NoYW5nZWQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5ib3VudHkuY29udHJhY3QuQm91bnR5LmdldF9ib3VudHlfaW5mbygpIC0+IGJ5dGVzLCBieXRlcywgdWludDY0LCB1aW50NjQ6CmdldF9ib3VudHlfaW5mbzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTU3CiAgICAvLyBhcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE1OAogICAgLy8gYXJjNC5BZGRyZXNzKHNlbGYud29ya2VyKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ3b3JrZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYud29ya2VyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNTkKICAgIC8vIHNlbGYuYW1vdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFtb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hbW91bnQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2MAogICAgLy8gc2VsZi5zdGF0dXMsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTU2LTE2MQogICAgLy8gcmV0dXJuICgKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIC8vICAgICBhcmM0LkFkZHJlc3Moc2VsZi53b3JrZXIpLAogICAgLy8gICAgIHNlbGYuYW1vdW50LAogICAgLy8gICAgIHNlbGYuc3RhdHVzLAogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmJvdW50eS5jb250cmFjdC5Cb3VudHkuX2VtaXRfc3RhdHVzX2NoYW5nZWQoYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6Cl9lbWl0X3N0YXR1c19jaGFuZ2VkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNjMtMTY0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9lbWl0X3N0YXR1c19jaGFuZ2VkKHNlbGYsIGFtb3VudDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2OAogICAgLy8gY3JlYXRvcj1hcmM0LkFkZHJlc3Moc2VsZi5jcmVhdG9yKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJjcmVhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNyZWF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2OQogICAgLy8gd29ya2VyPWFyYzQuQWRkcmVzcyhzZWxmLndvcmtlciksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAid29ya2VyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLndvcmtlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTcwCiAgICAvLyBhbW91bnQ9YXJjNC5VSW50NjQoYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2JvdW50eS9jb250cmFjdC5weToxNzEKICAgIC8vIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMCAvLyAic3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1cyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9ib3VudHkvY29udHJhY3QucHk6MTY3LTE3MgogICAgLy8gQm91bnR5U3RhdHVzQ2hhbmdlZCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgLy8gICAgIHdvcmtlcj1hcmM0LkFkZHJlc3Moc2VsZi53b3JrZXIpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChhbW91bnQpLAogICAgLy8gICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYm91bnR5L2NvbnRyYWN0LnB5OjE2Ni0xNzMKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBCb3VudHlTdGF0dXNDaGFuZ2VkKAogICAgLy8gICAgICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhzZWxmLmNyZWF0b3IpLAogICAgLy8gICAgICAgICB3b3JrZXI9YXJjNC5BZGRyZXNzKHNlbGYud29ya2VyKSwKICAgIC8vICAgICAgICAgYW1vdW50PWFyYzQuVUludDY0KGFtb3VudCksCiAgICAvLyAgICAgICAgIHN0YXR1cz1hcmM0LlVJbnQ2NChzZWxmLnN0YXR1cyksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4OTZmM2NkNzYgLy8gbWV0aG9kICJCb3VudHlTdGF0dXNDaGFuZ2VkKGFkZHJlc3MsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIK","clear":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"byteCode":{"approval":"CiAFAAECA4niruWn/+X41wEmBQZzdGF0dXMGYW1vdW50B2NyZWF0b3IGd29ya2VyIDAuUi9wABlmicbv3sPCy9jv2oQ/y330bQgawoFVmJL3IjEYQAAaJwRJRQIyAxJBAR0xACpMZysyA2cpImcoImcxG0EA/oIKBIemS6wE8Vd3JgTrJGf2BEBMaLAE1hHb2AQx8mqbBDy7iowEJDeNPATpmMIgBO0V7bY2GgCOCgCXAIsAfwBzAGcAWwBBADMAJQACIkMxGRREMRhEiAJ/TBZMFk8DTwNQTwJQTFCABBUffHVMULAjQzEZgQUSRDEYRIgCHCNDMRmBBRJEMRhEiAHNI0MxGRREMRhEMRYjCUk4ECMSRDYaAReIAV4jQzEZFEQxGESIASEjQzEZFEQxGESIAOQjQzEZFEQxGESIALsjQzEZFEQxGESIAJUjQzEZFEQxGESIAGwjQzEZFEQxGEQxFiMJSTgQIxJENhoBF4gAESNDMRlA/0oxGBREI0NJQv7higIAMQAiKmVEEkQiKWVEFEQiKGVEFESL/jgAIiplRBJEi/44BzIKEkSL/jgIi/8SRIv/IQQPRCmL/2eL/4gBnIkiKGVEFEQxACIqZUQTRCsxAGcoI2ciKWVEiAF/iTEAIitlRBJEIihlRCMSRCgkZyIpZUSIAWWJIihlRBREMQAiKmVEE0QrMQBnKCRnIillRIgBSIkxACIqZUQSRCIoZUQkEkQiKWVEsSIrZUQiKWVEsgiyByOyECKyAbMpImcoJWeIAReJMQAiKmVEEkQiKGVEFEQiKWVEsSIqZUQiKWVEsgiyByOyECKyAbMpImcogQRniADmiYoCADEAIiplRBJEIihlRCUSQAAKIihlRIEEEkEAMyNEi/44ACIqZUQSRIv+OAcyChJEi/44CIv/EkSL/yEED0QrMgNnKYv/ZygiZ4v/iACViSJC/8oxACIqZUQSQAAIMQAyCRJBACsjRCIoZUQlEkAACiIoZUSBBBJBABIjRLEyCUmyCbIHI7IQIrIBs4kiQv/rIkL/0jEAIiplRBJEIihlRCQSRCIpZUSxIitlREsBsgiyByOyECKyAbOxMglJsgmyByOyECKyAbMpImcoJWeIABKJIiplRCIrZUQiKWVEIihlRImKAQAiKmVEIitlRIv/FiIoZUQWTwNPA1BPAlBMUIAElvPNdkxQsIk=","clear":"CoEBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":4,"minor":7,"patch":0}},"events":[{"name":"BountyStatusChanged","args":[{"type":"address","name":"creator"},{"type":"address","name":"worker"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"status"}],"desc":"ARC-28 event emitted by every bounty state transition, with the new status."}],"templateVariables":{"MIN_BOUNTY_AMOUNT":{"type":"AVMUint64","value":"1/GX+nyrsQk="},"FIXED_CREATOR":{"type":"address","value":"MC5SL3AAGWaJxu/ew8LL2O/ahD/LffRtCBrCgVWYkvc="}}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -77,8 +79,15 @@ export type BountyArgs = {
     }
     'claim()void': Record<string, never>
     'submit_work()void': Record<string, never>
+    'claim_and_submit()void': Record<string, never>
     'approve()void': Record<string, never>
     'cancel()void': Record<string, never>
+    'reopen(pay,uint64)void': {
+      payment: AppMethodCallTransactionArgument
+      amount: bigint | number
+    }
+    'delete()void': Record<string, never>
+    'approve_and_close()void': Record<string, never>
     'get_bounty_info()(address,address,uint64,uint64)': Record<string, never>
   }
   /**
@@ -88,8 +97,12 @@ export type BountyArgs = {
     'create_bounty(pay,uint64)void': [payment: AppMethodCallTransactionArgument, amount: bigint | number]
     'claim()void': []
     'submit_work()void': []
+    'claim_and_submit()void': []
     'approve()void': []
     'cancel()void': []
+    'reopen(pay,uint64)void': [payment: AppMethodCallTransactionArgument, amount: bigint | number]
+    'delete()void': []
+    'approve_and_close()void': []
     'get_bounty_info()(address,address,uint64,uint64)': []
   }
 }
@@ -101,8 +114,12 @@ export type BountyReturns = {
   'create_bounty(pay,uint64)void': void
   'claim()void': void
   'submit_work()void': void
+  'claim_and_submit()void': void
   'approve()void': void
   'cancel()void': void
+  'reopen(pay,uint64)void': void
+  'delete()void': void
+  'approve_and_close()void': void
   'get_bounty_info()(address,address,uint64,uint64)': [string, string, bigint, bigint]
 }
 
@@ -129,6 +146,11 @@ export type BountyTypes = {
       argsTuple: BountyArgs['tuple']['submit_work()void']
       returns: BountyReturns['submit_work()void']
     }>
+    & Record<'claim_and_submit()void' | 'claim_and_submit', {
+      argsObj: BountyArgs['obj']['claim_and_submit()void']
+      argsTuple: BountyArgs['tuple']['claim_and_submit()void']
+      returns: BountyReturns['claim_and_submit()void']
+    }>
     & Record<'approve()void' | 'approve', {
       argsObj: BountyArgs['obj']['approve()void']
       argsTuple: BountyArgs['tuple']['approve()void']
@@ -139,6 +161,21 @@ export type BountyTypes = {
       argsTuple: BountyArgs['tuple']['cancel()void']
       returns: BountyReturns['cancel()void']
     }>
+    & Record<'reopen(pay,uint64)void' | 'reopen', {
+      argsObj: BountyArgs['obj']['reopen(pay,uint64)void']
+      argsTuple: BountyArgs['tuple']['reopen(pay,uint64)void']
+      returns: BountyReturns['reopen(pay,uint64)void']
+    }>
+    & Record<'delete()void' | 'delete', {
+      argsObj: BountyArgs['obj']['delete()void']
+      argsTuple: BountyArgs['tuple']['delete()void']
+      returns: BountyReturns['delete()void']
+    }>
+    & Record<'approve_and_close()void' | 'approve_and_close', {
+      argsObj: BountyArgs['obj']['approve_and_close()void']
+      argsTuple: BountyArgs['tuple']['approve_and_close()void']
+      returns: BountyReturns['approve_and_close()void']
+    }>
     & Record<'get_bounty_info()(address,address,uint64,uint64)' | 'get_bounty_info', {
       argsObj: BountyArgs['obj']['get_bounty_info()(address,address,uint64,uint64)']
       argsTuple: BountyArgs['tuple']['get_bounty_info()(address,address,uint64,uint64)']
@@ -198,6 +235,14 @@ export type GlobalKeysState = BountyTypes['state']['global']['keys']
  */
 export type BountyCreateCallParams =
   | Expand<AppClientBareCallParams & {method?: never} & {onComplete?: OnApplicationComplete.NoOpOC} & CreateSchema>
+/**
+ * Defines supported delete method params for this smart contract
+ */
+export type BountyDeleteCallParams =
+  | Expand<CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']> & {method: 'delete'}>
+  | Expand<CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']> & {method: 'delete()void'}>
+  | Expand<CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']> & {method: 'approve_and_close'}>
+  | Expand<CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']> & {method: 'approve_and_close()void'}>
 /**
  * Defines arguments required for the deploy method.
  */
@@ -206,6 +251,10 @@ export type BountyDeployParams = Expand<Omit<AppFactoryDeployParams, 'createPara
    * Create transaction parameters to use if a create needs to be issued as part of deployment; use `method` to define ABI call (if available) or leave out for a bare call (if available)
    */
   createParams?: BountyCreateCallParams
+  /**
+   * Delete transaction parameters to use if a create needs to be issued as part of deployment; use `method` to define ABI call (if available) or leave out for a bare call (if available)
+   */
+  deleteParams?: BountyDeleteCallParams
 }>
 
 
@@ -213,6 +262,52 @@ export type BountyDeployParams = Expand<Omit<AppFactoryDeployParams, 'createPara
  * Exposes methods for constructing `AppClient` params objects for ABI calls to the Bounty smart contract
  */
 export abstract class BountyParamsFactory {
+  /**
+   * Gets available delete ABI call param factories
+   */
+  static get delete() {
+    return {
+      _resolveByMethod<TParams extends BountyDeleteCallParams & {method: string}>(params: TParams) {
+        switch(params.method) {
+          case 'delete':
+          case 'delete()void':
+            return BountyParamsFactory.delete.delete(params)
+          case 'approve_and_close':
+          case 'approve_and_close()void':
+            return BountyParamsFactory.delete.approveAndClose(params)
+        }
+        throw new Error(`Unknown delete method`)
+      },
+
+      /**
+       * Constructs delete ABI call params for the Bounty smart contract using the delete()void ABI method
+       *
+       * @param params Parameters for the call
+       * @returns An `AppClientMethodCallParams` object for the call
+       */
+      delete(params: CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']>): AppClientMethodCallParams {
+        return {
+          ...params,
+          method: 'delete()void' as const,
+          args: Array.isArray(params.args) ? params.args : [],
+        }
+      },
+      /**
+       * Constructs delete ABI call params for the Bounty smart contract using the approve_and_close()void ABI method
+       *
+       * @param params Parameters for the call
+       * @returns An `AppClientMethodCallParams` object for the call
+       */
+      approveAndClose(params: CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']>): AppClientMethodCallParams {
+        return {
+          ...params,
+          method: 'approve_and_close()void' as const,
+          args: Array.isArray(params.args) ? params.args : [],
+        }
+      },
+    }
+  }
+
   /**
    * Constructs a no op call for the create_bounty(pay,uint64)void ABI method
    *
@@ -252,6 +347,19 @@ export abstract class BountyParamsFactory {
       args: Array.isArray(params.args) ? params.args : [],
     }
   }
+  /**
+   * Constructs a no op call for the claim_and_submit()void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static claimAndSubmit(params: CallParams<BountyArgs['obj']['claim_and_submit()void'] | BountyArgs['tuple']['claim_and_submit()void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'claim_and_submit()void' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
   /**
    * Constructs a no op call for the approve()void ABI method
    *
@@ -278,6 +386,19 @@ export abstract class BountyParamsFactory {
       args: Array.isArray(params.args) ? params.args : [],
     }
   }
+  /**
+   * Constructs a no op call for the reopen(pay,uint64)void ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static reopen(params: CallParams<BountyArgs['obj']['reopen(pay,uint64)void'] | BountyArgs['tuple']['reopen(pay,uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'reopen(pay,uint64)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.payment, params.args.amount],
+    }
+  }
   /**
    * Constructs a no op call for the get_bounty_info()(address,address,uint64,uint64) ABI method
    *
@@ -365,6 +486,7 @@ export class BountyFactory {
   public async deploy(params: BountyDeployParams = {}) {
     const result = await this.appFactory.deploy({
       ...params,
+      deleteParams: params.deleteParams?.method ? BountyParamsFactory.delete._resolveByMethod(params.deleteParams) : params.deleteParams ? params.deleteParams as (BountyDeleteCallParams & { args: Uint8Array[] }) : undefined,
     })
     return { result: result.result, appClient: new BountyClient(result.appClient) }
   }
@@ -521,6 +643,31 @@ export class BountyClient {
    * Get parameters to create transactions for the current app. A good mental model for this is that these parameters represent a deferred transaction creation.
    */
   readonly params = {
+    /**
+     * Gets available delete methods
+     */
+    delete: {
+      /**
+       * Deletes an existing instance of the Bounty smart contract using the `delete()void` ABI method.
+       *
+       * @param params The params for the smart contract call
+       * @returns The delete params
+       */
+      delete: (params: CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']> = {args: []}) => {
+        return this.appClient.params.delete(BountyParamsFactory.delete.delete(params))
+      },
+      /**
+       * Deletes an existing instance of the Bounty smart contract using the `approve_and_close()void` ABI method.
+       *
+       * @param params The params for the smart contract call
+       * @returns The delete params
+       */
+      approveAndClose: (params: CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']> = {args: []}) => {
+        return this.appClient.params.delete(BountyParamsFactory.delete.approveAndClose(params))
+      },
+
+    },
+
     /**
      * Makes a clear_state call to an existing instance of the Bounty smart contract.
      *
@@ -561,6 +708,16 @@ export class BountyClient {
       return this.appClient.params.call(BountyParamsFactory.submitWork(params))
     },
 
+    /**
+     * Makes a call to the Bounty smart contract using the `claim_and_submit()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    claimAndSubmit: (params: CallParams<BountyArgs['obj']['claim_and_submit()void'] | BountyArgs['tuple']['claim_and_submit()void']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(BountyParamsFactory.claimAndSubmit(params))
+    },
+
     /**
      * Makes a call to the Bounty smart contract using the `approve()void` ABI method.
      *
@@ -581,6 +738,16 @@ export class BountyClient {
       return this.appClient.params.call(BountyParamsFactory.cancel(params))
     },
 
+    /**
+     * Makes a call to the Bounty smart contract using the `reopen(pay,uint64)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    reopen: (params: CallParams<BountyArgs['obj']['reopen(pay,uint64)void'] | BountyArgs['tuple']['reopen(pay,uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(BountyParamsFactory.reopen(params))
+    },
+
     /**
      * Makes a call to the Bounty smart contract using the `get_bounty_info()(address,address,uint64,uint64)` ABI method.
      * 
@@ -599,6 +766,31 @@ export class BountyClient {
    * Create transactions for the current app
    */
   readonly createTransaction = {
+    /**
+     * Gets available delete methods
+     */
+    delete: {
+      /**
+       * Deletes an existing instance of the Bounty smart contract using the `delete()void` ABI method.
+       *
+       * @param params The params for the smart contract call
+       * @returns The delete transaction
+       */
+      delete: (params: CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']> = {args: []}) => {
+        return this.appClient.createTransaction.delete(BountyParamsFactory.delete.delete(params))
+      },
+      /**
+       * Deletes an existing instance of the Bounty smart contract using the `approve_and_close()void` ABI method.
+       *
+       * @param params The params for the smart contract call
+       * @returns The delete transaction
+       */
+      approveAndClose: (params: CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']> = {args: []}) => {
+        return this.appClient.createTransaction.delete(BountyParamsFactory.delete.approveAndClose(params))
+      },
+
+    },
+
     /**
      * Makes a clear_state call to an existing instance of the Bounty smart contract.
      *
@@ -639,6 +831,16 @@ export class BountyClient {
       return this.appClient.createTransaction.call(BountyParamsFactory.submitWork(params))
     },
 
+    /**
+     * Makes a call to the Bounty smart contract using the `claim_and_submit()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    claimAndSubmit: (params: CallParams<BountyArgs['obj']['claim_and_submit()void'] | BountyArgs['tuple']['claim_and_submit()void']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(BountyParamsFactory.claimAndSubmit(params))
+    },
+
     /**
      * Makes a call to the Bounty smart contract using the `approve()void` ABI method.
      *
@@ -659,6 +861,16 @@ export class BountyClient {
       return this.appClient.createTransaction.call(BountyParamsFactory.cancel(params))
     },
 
+    /**
+     * Makes a call to the Bounty smart contract using the `reopen(pay,uint64)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    reopen: (params: CallParams<BountyArgs['obj']['reopen(pay,uint64)void'] | BountyArgs['tuple']['reopen(pay,uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(BountyParamsFactory.reopen(params))
+    },
+
     /**
      * Makes a call to the Bounty smart contract using the `get_bounty_info()(address,address,uint64,uint64)` ABI method.
      * 
@@ -677,6 +889,33 @@ export class BountyClient {
    * Send calls to the current app
    */
   readonly send = {
+    /**
+     * Gets available delete methods
+     */
+    delete: {
+      /**
+       * Deletes an existing instance of the Bounty smart contract using the `delete()void` ABI method.
+       *
+       * @param params The params for the smart contract call
+       * @returns The delete result
+       */
+      delete: async (params: CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']> & SendParams = {args: []}) => {
+        const result = await this.appClient.send.delete(BountyParamsFactory.delete.delete(params))
+        return {...result, return: result.return as unknown as (undefined | BountyReturns['delete()void'])}
+      },
+      /**
+       * Deletes an existing instance of the Bounty smart contract using the `approve_and_close()void` ABI method.
+       *
+       * @param params The params for the smart contract call
+       * @returns The delete result
+       */
+      approveAndClose: async (params: CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']> & SendParams = {args: []}) => {
+        const result = await this.appClient.send.delete(BountyParamsFactory.delete.approveAndClose(params))
+        return {...result, return: result.return as unknown as (undefined | BountyReturns['approve_and_close()void'])}
+      },
+
+    },
+
     /**
      * Makes a clear_state call to an existing instance of the Bounty smart contract.
      *
@@ -720,6 +959,17 @@ export class BountyClient {
       return {...result, return: result.return as unknown as (undefined | BountyReturns['submit_work()void'])}
     },
 
+    /**
+     * Makes a call to the Bounty smart contract using the `claim_and_submit()void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    claimAndSubmit: async (params: CallParams<BountyArgs['obj']['claim_and_submit()void'] | BountyArgs['tuple']['claim_and_submit()void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(BountyParamsFactory.claimAndSubmit(params))
+      return {...result, return: result.return as unknown as (undefined | BountyReturns['claim_and_submit()void'])}
+    },
+
     /**
      * Makes a call to the Bounty smart contract using the `approve()void` ABI method.
      *
@@ -742,6 +992,17 @@ export class BountyClient {
       return {...result, return: result.return as unknown as (undefined | BountyReturns['cancel()void'])}
     },
 
+    /**
+     * Makes a call to the Bounty smart contract using the `reopen(pay,uint64)void` ABI method.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    reopen: async (params: CallParams<BountyArgs['obj']['reopen(pay,uint64)void'] | BountyArgs['tuple']['reopen(pay,uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(BountyParamsFactory.reopen(params))
+      return {...result, return: result.return as unknown as (undefined | BountyReturns['reopen(pay,uint64)void'])}
+    },
+
     /**
      * Makes a call to the Bounty smart contract using the `get_bounty_info()(address,address,uint64,uint64)` ABI method.
      * 
@@ -849,6 +1110,14 @@ export class BountyClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a claim_and_submit()void method call against the Bounty contract
+       */
+      claimAndSubmit(params: CallParams<BountyArgs['obj']['claim_and_submit()void'] | BountyArgs['tuple']['claim_and_submit()void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.claimAndSubmit(params)))
+        resultMappers.push(undefined)
+        return this
+      },
       /**
        * Add a approve()void method call against the Bounty contract
        */
@@ -865,6 +1134,14 @@ export class BountyClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a reopen(pay,uint64)void method call against the Bounty contract
+       */
+      reopen(params: CallParams<BountyArgs['obj']['reopen(pay,uint64)void'] | BountyArgs['tuple']['reopen(pay,uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.reopen(params)))
+        resultMappers.push(undefined)
+        return this
+      },
       /**
        * Add a get_bounty_info()(address,address,uint64,uint64) method call against the Bounty contract
        */
@@ -873,6 +1150,20 @@ export class BountyClient {
         resultMappers.push((v) => client.decodeReturnValue('get_bounty_info()(address,address,uint64,uint64)', v))
         return this
       },
+      get delete() {
+        return {
+          delete: (params?: CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']>) => {
+            promiseChain = promiseChain.then(async () => composer.addAppDeleteMethodCall(await client.params.delete.delete(params)))
+            resultMappers.push(undefined)
+            return this
+          },
+          approveAndClose: (params?: CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']>) => {
+            promiseChain = promiseChain.then(async () => composer.addAppDeleteMethodCall(await client.params.delete.approveAndClose(params)))
+            resultMappers.push(undefined)
+            return this
+          },
+        }
+      },
       /**
        * Add a clear state call to the Bounty contract
        */
@@ -935,6 +1226,15 @@ export type BountyComposer<TReturns extends [...any[]] = []> = {
    */
   submitWork(params?: CallParams<BountyArgs['obj']['submit_work()void'] | BountyArgs['tuple']['submit_work()void']>): BountyComposer<[...TReturns, BountyReturns['submit_work()void'] | undefined]>
 
+  /**
+   * Calls the claim_and_submit()void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  claimAndSubmit(params?: CallParams<BountyArgs['obj']['claim_and_submit()void'] | BountyArgs['tuple']['claim_and_submit()void']>): BountyComposer<[...TReturns, BountyReturns['claim_and_submit()void'] | undefined]>
+
   /**
    * Calls the approve()void ABI method.
    *
@@ -953,6 +1253,15 @@ export type BountyComposer<TReturns extends [...any[]] = []> = {
    */
   cancel(params?: CallParams<BountyArgs['obj']['cancel()void'] | BountyArgs['tuple']['cancel()void']>): BountyComposer<[...TReturns, BountyReturns['cancel()void'] | undefined]>
 
+  /**
+   * Calls the reopen(pay,uint64)void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  reopen(params?: CallParams<BountyArgs['obj']['reopen(pay,uint64)void'] | BountyArgs['tuple']['reopen(pay,uint64)void']>): BountyComposer<[...TReturns, BountyReturns['reopen(pay,uint64)void'] | undefined]>
+
   /**
    * Calls the get_bounty_info()(address,address,uint64,uint64) ABI method.
    *
@@ -962,6 +1271,28 @@ export type BountyComposer<TReturns extends [...any[]] = []> = {
    */
   getBountyInfo(params?: CallParams<BountyArgs['obj']['get_bounty_info()(address,address,uint64,uint64)'] | BountyArgs['tuple']['get_bounty_info()(address,address,uint64,uint64)']>): BountyComposer<[...TReturns, BountyReturns['get_bounty_info()(address,address,uint64,uint64)'] | undefined]>
 
+  /**
+   * Gets available delete methods
+   */
+  readonly delete: {
+    /**
+     * Deletes an existing instance of the Bounty smart contract using the delete()void ABI method.
+     *
+     * @param args The arguments for the smart contract call
+     * @param params Any additional parameters for the call
+     * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+     */
+    delete(params?: CallParams<BountyArgs['obj']['delete()void'] | BountyArgs['tuple']['delete()void']>): BountyComposer<[...TReturns, BountyReturns['delete()void'] | undefined]>
+    /**
+     * Deletes an existing instance of the Bounty smart contract using the approve_and_close()void ABI method.
+     *
+     * @param args The arguments for the smart contract call
+     * @param params Any additional parameters for the call
+     * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+     */
+    approveAndClose(params?: CallParams<BountyArgs['obj']['approve_and_close()void'] | BountyArgs['tuple']['approve_and_close()void']>): BountyComposer<[...TReturns, BountyReturns['approve_and_close()void'] | undefined]>
+  }
+
   /**
    * Makes a clear_state call to an existing instance of the Bounty smart contract.
    *
@@ -4,6 +4,7 @@ import { AlgorandClient, microAlgos } from '@algorandfoundation/algokit-utils'
 import { makePaymentTxnWithSuggestedParamsFromObject, getApplicationAddress } from 'algosdk'
 import { BountyClient, BountyFactory } from '../contracts/Bounty'
 import { getAlgodConfigFromViteEnvironment } from '../utils/network/getAlgoClientConfigs'
+import { BOUNTY_DEPLOY_TIME_PARAMS } from '../utils/bountyService'
 
 // ── On-chain status codes ──
 export const BOUNTY_STATUS = {
@@ -103,7 +104,7 @@ export function useBountyContract() {
       const amountMicroAlgos = Math.round(meta.rewardAlgos * 1_000_000)
 
       // 1. Deploy (bare create)
-      const factory = new BountyFactory({ defaultSender: activeAddress, algorand })
+      const factory = new BountyFactory({ defaultSender: activeAddress, algorand, deployTimeParams: BOUNTY_DEPLOY_TIME_PARAMS })
       const { appClient } = await factory.send.create.bare()
       const appId = Number(appClient.appId)
       const appAddr = getApplicationAddress(appId)
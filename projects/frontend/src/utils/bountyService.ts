@@ -7,6 +7,15 @@ import { makePaymentTxnWithSuggestedParamsFromObject, getApplicationAddress } fr
 const ALGOD_SERVER = "https://testnet-api.algonode.cloud";
 const ALGOD_TOKEN = "";
 
+/**
+ * Template variable values for new Bounty apps: a zero FIXED_CREATOR makes the
+ * app creator the bounty creator, and any bounty amount is accepted.
+ */
+export const BOUNTY_DEPLOY_TIME_PARAMS = {
+  FIXED_CREATOR: new Uint8Array(32),
+  MIN_BOUNTY_AMOUNT: 0,
+};
+
 /** Status codes: 0=Open, 1=Claimed, 2=Submitted, 3=Approved, 4=Cancelled */
 export interface OnChainBountyInfo {
   creator: string;
@@ -59,7 +68,11 @@ export async function createBountyWithWallet(
 
     // Step 1: Deploy the real Bounty contract (bare create)
     console.log("📍 Step 1: Deploying Bounty ARC4 contract...");
-    const factory = new BountyFactory({ defaultSender: creatorAddress, algorand });
+    const factory = new BountyFactory({
+      defaultSender: creatorAddress,
+      algorand,
+      deployTimeParams: BOUNTY_DEPLOY_TIME_PARAMS,
+    });
     const { appClient } = await factory.send.create.bare();
     const appId = Number(appClient.appId);
     const appAddr = getApplicationAddress(appId);
@@ -187,6 +200,35 @@ export async function callClaimMethod(
   return result.transaction.txID();
 }
 
+/**
+ * Call the claim_and_submit method on the bounty contract.
+ * Claims the bounty and submits the work in one transaction, for workers
+ * who already have the deliverable.
+ */
+export async function callClaimAndSubmitMethod(
+  appId: number,
+  sender: string,
+  transactionSigner: (
+    txnGroup: algosdk.Transaction[],
+    indexesToSign: number[]
+  ) => Promise<Uint8Array[]>
+): Promise<string> {
+  const algorand = AlgorandClient.fromConfig({ algodConfig: getAlgodConfigFromViteEnvironment() });
+  algorand.setDefaultSigner(transactionSigner);
+  const client = new BountyClient({
+    appId: BigInt(appId),
+    algorand,
+    defaultSigner: transactionSigner,
+  });
+  console.log("Sending claim_and_submit transaction for appId:", appId);
+  const result = await client.send.claimAndSubmit({
+    args: [],
+    sender,
+  });
+  console.log("Claim and submit confirmed:", result);
+  return result.transaction.txID();
+}
+
 /**
  * Call the submit_work method on the bounty contract
  * Uses typed BountyClient for proper ARC4 ABI encoding
@@ -247,3 +289,37 @@ export async function callApproveMethod(
   console.log("Approve confirmed:", result);
   return result.transaction.txID();
 }
+
+/**
+ * Call the approve_and_close method on the bounty contract.
+ * Pays the worker like approve(), then closes the app account's remaining
+ * balance to the app creator and deletes the app, all in one transaction.
+ * extraFee covers both inner payment fees, and workerAddress is passed as an
+ * account reference so the payout's receiver is available to the app.
+ */
+export async function callApproveAndCloseMethod(
+  appId: number,
+  sender: string,
+  transactionSigner: (
+    txnGroup: algosdk.Transaction[],
+    indexesToSign: number[]
+  ) => Promise<Uint8Array[]>,
+  workerAddress: string
+): Promise<string> {
+  const algorand = AlgorandClient.fromConfig({ algodConfig: getAlgodConfigFromViteEnvironment() });
+  algorand.setDefaultSigner(transactionSigner);
+  const client = new BountyClient({
+    appId: BigInt(appId),
+    algorand,
+    defaultSigner: transactionSigner,
+  });
+  console.log("Sending approve_and_close transaction for appId:", appId);
+  const result = await client.send.delete.approveAndClose({
+    args: [],
+    sender,
+    accountReferences: [workerAddress], // The payout's inner payment receiver
+    extraFee: microAlgos(2000), // Cover the payout and closing inner payment fees
+  });
+  console.log("Approve and close confirmed:", result);
+  return result.transaction.txID();
+}